@@ -21,8 +21,8 @@ def main():
     # 1. Documents 확인
     print("\n[1] playbook_documents")
     try:
-        result = supabase.client.table('playbook_documents').select('id, title').limit(5).execute()
-        print(f"   총 문서 수: {len(result.data) if result.data else 0}")
+        print(f"   총 문서 수: {supabase.count_rows('playbook_documents')}")
+        result = supabase.client.table('playbook_documents').select('id, title').limit(3).execute()
         if result.data:
             print("   최근 문서:")
             for doc in result.data[:3]:
@@ -33,22 +33,20 @@ def main():
     # 2. Chunks 확인
     print("\n[2] playbook_chunks")
     try:
-        result = supabase.client.table('playbook_chunks').select('id, doc_id', count='exact').limit(1).execute()
-        print(f"   총 청크 수: {result.count if hasattr(result, 'count') else 'N/A'}")
+        print(f"   총 청크 수: {supabase.count_rows('playbook_chunks')}")
     except Exception as e:
         print(f"   ❌ 오류: {e}")
 
     # 3. Semantic Terms 확인
     print("\n[3] playbook_semantic_terms")
     try:
+        print(f"   총 시맨틱 용어 수: {supabase.count_rows('playbook_semantic_terms')}")
+
         result = supabase.client.table('playbook_semantic_terms')\
-            .select('id, doc_id, term, category, raw_relations', count='exact')\
-            .limit(5)\
+            .select('id, doc_id, term, category, raw_relations')\
+            .limit(3)\
             .execute()
 
-        total_count = result.count if hasattr(result, 'count') else len(result.data) if result.data else 0
-        print(f"   총 시맨틱 용어 수: {total_count}")
-
         if result.data:
             print("   최근 용어:")
             for term in result.data[:3]:
@@ -67,14 +65,13 @@ def main():
     # 4. Ontology Rules 확인
     print("\n[4] playbook_ontology_rules")
     try:
+        print(f"   총 규칙 수: {supabase.count_rows('playbook_ontology_rules')}")
+
         result = supabase.client.table('playbook_ontology_rules')\
-            .select('subject_type, predicate, object_type', count='exact')\
+            .select('subject_type, predicate, object_type')\
             .limit(3)\
             .execute()
 
-        total_count = result.count if hasattr(result, 'count') else len(result.data) if result.data else 0
-        print(f"   총 규칙 수: {total_count}")
-
         if result.data:
             print("   예시 규칙:")
             for rule in result.data[:3]:
@@ -85,14 +82,13 @@ def main():
     # 5. Semantic Relations 확인
     print("\n[5] playbook_semantic_relations")
     try:
+        print(f"   총 관계 수: {supabase.count_rows('playbook_semantic_relations')}")
+
         result = supabase.client.table('playbook_semantic_relations')\
-            .select('source_term_id, predicate, target_term_id', count='exact')\
+            .select('source_term_id, predicate, target_term_id')\
             .limit(3)\
             .execute()
 
-        total_count = result.count if hasattr(result, 'count') else len(result.data) if result.data else 0
-        print(f"   총 관계 수: {total_count}")
-
         if result.data:
             print("   예시 관계:")
             for rel in result.data[:3]:
@@ -102,6 +98,26 @@ def main():
     except Exception as e:
         print(f"   ❌ 오류: {e}")
 
+    # 6. 고아/중복 통계 (playbook_table_stats 뷰)
+    print("\n[6] 고아/중복 통계")
+    stats = supabase.get_detailed_stats()
+    if stats['orphans']:
+        orphans = stats['orphans']
+        print(f"   청크 없는 문서: {orphans['documents_without_chunks']}")
+        print(f"   용어 없는 문서: {orphans['documents_without_terms']}")
+        print(f"   임베딩 없는 청크: {orphans['chunks_without_embedding']}")
+        print(f"   관계 없는 용어: {orphans['orphan_terms']}")
+    else:
+        print("   ⚠️  playbook_table_stats 뷰 없음 (20261016_stats_views.sql 실행 필요)")
+    if stats['categories']:
+        print("   카테고리별 용어 수:")
+        for row in stats['categories']:
+            print(f"     - {row['category']}: {row['term_count']}")
+    if stats['predicates']:
+        print("   관계 타입별 관계 수 (상위 10개):")
+        for row in stats['predicates'][:10]:
+            print(f"     - {row['predicate']}: {row['relation_count']}")
+
     print("\n" + "=" * 70)
     print("확인 완료")
     print("=" * 70)
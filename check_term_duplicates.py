@@ -3,15 +3,85 @@
 시맨틱 용어 중복 분석 스크립트
 """
 import sys
-from pathlib import Path
 from collections import defaultdict
+from pathlib import Path
 
 # Add project root to path
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
+from src.core.loaders.pagination import iter_rows
 from src.core.loaders.supabase_loader import SupabaseLoader
 
+STATS_MIGRATION = "supabase/migrations/20261016_stats_views.sql"
+
+
+def load_view_summary(client):
+    """서버 집계 뷰로 중복 요약 조회 (테이블 전체를 내려받지 않음)"""
+    counts = client.table('playbook_table_stats')\
+        .select('total_semantic_terms, unique_terms, same_doc_duplicate_terms')\
+        .limit(1)\
+        .execute()
+    totals = counts.data[0] if counts.data else {}
+
+    cross_doc = client.table('playbook_term_duplicate_stats')\
+        .select('term, occurrence_count, doc_count', count='exact')\
+        .order('occurrence_count', desc=True)\
+        .limit(10)\
+        .execute()
+
+    conflicts = client.table('playbook_term_duplicate_stats')\
+        .select('term, categories', count='exact')\
+        .gt('category_count', 1)\
+        .order('occurrence_count', desc=True)\
+        .limit(5)\
+        .execute()
+
+    return {
+        'total_terms': totals.get('total_semantic_terms', 0),
+        'unique_terms': totals.get('unique_terms', 0),
+        'same_doc_duplicates': totals.get('same_doc_duplicate_terms', 0),
+        'cross_doc_count': cross_doc.count or 0,
+        'cross_doc_top': [
+            (row['term'], row['occurrence_count'], row['doc_count']) for row in cross_doc.data or []
+        ],
+        'conflict_count': conflicts.count or 0,
+        'conflict_top': [(row['term'], row['categories']) for row in conflicts.data or []],
+    }
+
+
+def compute_client_summary(client):
+    """집계 뷰가 없을 때: 용어 테이블을 페이지 단위로 읽어 같은 요약을 계산"""
+    doc_term_counts = defaultdict(int)
+    occurrences = defaultdict(int)
+    term_docs = defaultdict(set)
+    term_categories = defaultdict(set)
+
+    total_terms = 0
+    for term in iter_rows(client, 'playbook_semantic_terms', 'id, doc_id, term, category'):
+        total_terms += 1
+        doc_term_counts[(term['doc_id'], term['term'])] += 1
+        occurrences[term['term']] += 1
+        term_docs[term['term']].add(term['doc_id'])
+        term_categories[term['term']].add(term['category'])
+
+    duplicated = sorted(
+        (name for name, count in occurrences.items() if count > 1),
+        key=lambda name: occurrences[name], reverse=True
+    )
+    conflicts = [name for name in duplicated if len(term_categories[name]) > 1]
+
+    return {
+        'total_terms': total_terms,
+        'unique_terms': len(occurrences),
+        'same_doc_duplicates': sum(1 for count in doc_term_counts.values() if count > 1),
+        'cross_doc_count': len(duplicated),
+        'cross_doc_top': [(name, occurrences[name], len(term_docs[name])) for name in duplicated[:10]],
+        'conflict_count': len(conflicts),
+        'conflict_top': [(name, sorted(term_categories[name], key=str)) for name in conflicts[:5]],
+    }
+
+
 def main():
     print("=" * 70)
     print("시맨틱 용어 중복 분석")
@@ -19,69 +89,49 @@ def main():
 
     supabase = SupabaseLoader()
 
-    # 모든 시맨틱 용어 가져오기
-    result = supabase.client.table('playbook_semantic_terms')\
-        .select('id, doc_id, term, category')\
-        .execute()
+    # 서버 집계 뷰 우선 (20261016_stats_views.sql), 없으면 클라이언트에서 계산
+    try:
+        summary = load_view_summary(supabase.client)
+    except Exception as e:
+        print(f"\n⚠️  집계 뷰를 조회할 수 없습니다 ({e})")
+        print(f"   빠른 조회를 위해 마이그레이션 적용 필요: {STATS_MIGRATION}")
+        print("   용어 테이블 전체를 읽어 계산합니다...")
+        summary = compute_client_summary(supabase.client)
 
-    terms = result.data if result.data else []
-    print(f"\n총 {len(terms)}개의 시맨틱 용어")
+    total_terms = summary['total_terms']
+    print(f"\n총 {total_terms}개의 시맨틱 용어")
 
     # 중복 분석 1: 같은 문서 내 중복 (UNIQUE 제약 위반)
-    doc_term_map = defaultdict(list)
-    for term in terms:
-        key = f"{term['doc_id']}:{term['term']}"
-        doc_term_map[key].append(term)
-
-    same_doc_duplicates = {k: v for k, v in doc_term_map.items() if len(v) > 1}
+    same_doc_duplicates = summary['same_doc_duplicates']
 
-    print(f"\n[1] 같은 문서 내 중복 (UNIQUE 제약 위반): {len(same_doc_duplicates)}개")
+    print(f"\n[1] 같은 문서 내 중복 (UNIQUE 제약 위반): {same_doc_duplicates}개")
     if same_doc_duplicates:
         print("   ⚠️  문제 발견! UNIQUE(doc_id, term) 제약이 작동하지 않음")
-        for key, dups in list(same_doc_duplicates.items())[:3]:
-            print(f"   - {key}: {len(dups)}개")
     else:
         print("   ✓ 문제 없음")
 
     # 중복 분석 2: 다른 문서 간 같은 용어 (정상)
-    term_only_map = defaultdict(list)
-    for term in terms:
-        term_only_map[term['term']].append(term)
-
-    cross_doc_duplicates = {k: v for k, v in term_only_map.items() if len(v) > 1}
-
-    print(f"\n[2] 다른 문서 간 같은 용어 (정상적인 중복): {len(cross_doc_duplicates)}개")
+    print(f"\n[2] 다른 문서 간 같은 용어 (정상적인 중복): {summary['cross_doc_count']}개")
     print("   상위 10개:")
-    sorted_dups = sorted(cross_doc_duplicates.items(), key=lambda x: len(x[1]), reverse=True)
-    for term_name, instances in sorted_dups[:10]:
-        doc_count = len(set(t['doc_id'] for t in instances))
-        print(f"   - '{term_name}': {len(instances)}개 (문서 {doc_count}개)")
+    for term_name, occurrence_count, doc_count in summary['cross_doc_top']:
+        print(f"   - '{term_name}': {occurrence_count}개 (문서 {doc_count}개)")
 
     # 중복 분석 3: 같은 용어 + 다른 카테고리 (문제 가능성)
-    term_category_map = defaultdict(lambda: defaultdict(list))
-    for term in terms:
-        term_category_map[term['term']][term['category']].append(term)
-
-    category_conflicts = {}
-    for term_name, categories in term_category_map.items():
-        if len(categories) > 1:
-            category_conflicts[term_name] = categories
-
-    print(f"\n[3] 같은 용어, 다른 카테고리 (문제 가능성): {len(category_conflicts)}개")
-    if category_conflicts:
+    print(f"\n[3] 같은 용어, 다른 카테고리 (문제 가능성): {summary['conflict_count']}개")
+    if summary['conflict_top']:
         print("   상위 5개:")
-        for term_name, categories in list(category_conflicts.items())[:5]:
-            cat_summary = ", ".join([f"{cat}({len(terms)})" for cat, terms in categories.items()])
-            print(f"   - '{term_name}': {cat_summary}")
+        for term_name, categories in summary['conflict_top']:
+            print(f"   - '{term_name}': {', '.join(map(str, categories))}")
     else:
         print("   ✓ 문제 없음")
 
     # 중복 분석 4: 총 용어 수 vs 유니크 용어 수
-    unique_terms = set(t['term'] for t in terms)
+    unique_terms = summary['unique_terms']
     print(f"\n[4] 전체 통계")
-    print(f"   - 총 용어 수: {len(terms)}")
-    print(f"   - 유니크 용어 수: {len(unique_terms)}")
-    print(f"   - 평균 중복도: {len(terms) / len(unique_terms):.2f}x")
+    print(f"   - 총 용어 수: {total_terms}")
+    print(f"   - 유니크 용어 수: {unique_terms}")
+    if unique_terms:
+        print(f"   - 평균 중복도: {total_terms / unique_terms:.2f}x")
 
     print("\n" + "=" * 70)
     print("분석 완료")
@@ -4,55 +4,46 @@
 - 관계가 전혀 없는 용어들을 찾아서 분석
 - 더미 데이터 vs 실제 중요 용어 구분
 """
-
-from src.infrastructure.supabase_client import SupabaseClient
+import sys
+from pathlib import Path
 from collections import defaultdict
-import json
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.shared.config import Config
+from src.core.loaders import SupabaseLoader, fetch_all, iter_rows
 
 def analyze_orphan_terms():
     """고아 용어 분석"""
-    supabase = SupabaseClient()
+    supabase = SupabaseLoader()
 
     print("=" * 70)
     print("고아 용어(Orphan Terms) 분석")
     print("=" * 70)
     print()
 
-    # 1. 전체 용어 로드 (페이지네이션)
+    # 1. 전체 용어 로드 (키셋 페이지네이션)
     print("📊 용어 데이터 로딩 중...")
-    all_terms = []
-    page = 0
-    page_size = 1000
-
-    while True:
-        response = supabase.client.table('playbook_semantic_terms').select(
-            'id,doc_id,term,category,definition,frequency,confidence,raw_relations'
-        ).range(page * page_size, (page + 1) * page_size - 1).execute()
-
-        if not response.data:
-            break
-
-        all_terms.extend(response.data)
-        page += 1
-
-        if len(response.data) < page_size:
-            break
+    all_terms = fetch_all(
+        supabase.client,
+        Config.TABLE_SEMANTIC,
+        'id,doc_id,term,category,definition,frequency,confidence,raw_relations'
+    )
 
     print(f"✓ 로드 완료: {len(all_terms)}개 용어\n")
 
-    # 2. 관계 데이터 로드
+    # 2-3. 관계 데이터 스트리밍 (관계가 있는 용어 ID 집합만 유지)
     print("🔗 관계 데이터 로딩 중...")
-    relations = supabase.client.table('playbook_graph_relations').select(
-        'source_term_id,target_term_id'
-    ).execute()
-
-    print(f"✓ 로드 완료: {len(relations.data)}개 관계\n")
-
-    # 3. 관계가 있는 용어 ID 집합
     connected_term_ids = set()
-    for rel in relations.data:
+    relation_count = 0
+    for rel in iter_rows(supabase.client, Config.TABLE_RELATIONS, 'source_term_id,target_term_id'):
         connected_term_ids.add(rel['source_term_id'])
         connected_term_ids.add(rel['target_term_id'])
+        relation_count += 1
+
+    print(f"✓ 로드 완료: {relation_count}개 관계\n")
 
     # 4. 고아 용어 필터링
     orphan_terms = []
@@ -165,12 +156,12 @@ def analyze_orphan_terms():
     print("📊 품질 메트릭")
     print("=" * 70)
     print(f"전체 raw_relations: {total_raw_relations:,}개")
-    print(f"성공적으로 변환: {len(relations.data):,}개")
-    print(f"변환 실패: {total_raw_relations - len(relations.data):,}개")
-    print(f"변환율: {len(relations.data)/total_raw_relations*100:.1f}%")
+    print(f"성공적으로 변환: {relation_count:,}개")
+    print(f"변환 실패: {total_raw_relations - relation_count:,}개")
+    print(f"변환율: {relation_count/total_raw_relations*100:.1f}%")
     print()
     print(f"목표 변환율: 30-50%")
-    print(f"현재 갭: {30 - len(relations.data)/total_raw_relations*100:.1f}%p")
+    print(f"현재 갭: {30 - relation_count/total_raw_relations*100:.1f}%p")
     print()
 
 if __name__ == '__main__':
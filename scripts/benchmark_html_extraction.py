@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Benchmark Confluence HTML-to-text extraction: streaming lxml vs BeautifulSoup
+
+Usage:
+    python scripts/benchmark_html_extraction.py                  # fixtures in tests/fixtures/confluence
+    python scripts/benchmark_html_extraction.py --page-ids 123 456   # live pages (needs Confluence credentials)
+"""
+import sys
+import time
+import argparse
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.core.processors.confluence_processor import ConfluenceProcessor
+from src.core.processors.semantic_processor import ImprovedChunker
+from src.core.processors.storage_text import storage_to_text
+
+FIXTURE_DIR = project_root / "tests" / "fixtures" / "confluence"
+
+
+def load_fixtures():
+    return [(path.stem, path.read_text(encoding='utf-8')) for path in sorted(FIXTURE_DIR.glob("*.html"))]
+
+
+def load_live_pages(page_ids):
+    confluence = ConfluenceProcessor()
+    pages = []
+    for page_id in page_ids:
+        page = confluence.get_page(page_id)
+        if page:
+            pages.append((f"{page_id} {page.get('title', '')[:30]}", page['body']['storage']['value']))
+    confluence.close()
+    return pages
+
+
+def time_per_call(func, html, repeat):
+    func(html)  # warm up
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func(html)
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark HTML-to-text extraction")
+    parser.add_argument("--page-ids", nargs="*", help="Fetch these Confluence pages instead of fixtures")
+    parser.add_argument("--repeat", type=int, default=50, help="Runs per page")
+    args = parser.parse_args()
+
+    pages = load_live_pages(args.page_ids) if args.page_ids else load_fixtures()
+    if not pages:
+        print("No pages to benchmark")
+        sys.exit(1)
+
+    # Legacy extractor without credentials
+    legacy = ConfluenceProcessor.__new__(ConfluenceProcessor)
+    chunker = ImprovedChunker()
+
+    print("=" * 78)
+    print(f"{'page':<32}{'KB':>7}{'soup ms':>10}{'lxml ms':>10}{'speedup':>9}{'sections':>10}")
+    print("-" * 78)
+
+    total_soup = total_lxml = 0.0
+    for name, html in pages:
+        soup_ms = time_per_call(legacy._extract_text_soup, html, args.repeat)
+        lxml_ms = time_per_call(storage_to_text, html, args.repeat)
+        total_soup += soup_ms
+        total_lxml += lxml_ms
+
+        sections_before = len(chunker.extract_sections(legacy._extract_text_soup(html)))
+        sections_after = len(chunker.extract_sections(storage_to_text(html)))
+
+        print(
+            f"{name[:31]:<32}{len(html.encode('utf-8')) / 1024:>7.1f}{soup_ms:>10.2f}{lxml_ms:>10.2f}"
+            f"{soup_ms / lxml_ms:>8.1f}x{f'{sections_before}->{sections_after}':>10}"
+        )
+
+    print("-" * 78)
+    print(f"{'total':<39}{total_soup:>10.2f}{total_lxml:>10.2f}{total_soup / total_lxml:>8.1f}x")
+    print("=" * 78)
+
+
+if __name__ == "__main__":
+    main()
@@ -26,10 +26,10 @@ print("=" * 70)
 print()
 
 # 현재 통계
-terms = supabase.table('playbook_semantic_terms').select('id', count='exact').execute()
-relations = supabase.table('playbook_semantic_relations').select('id', count='exact').execute()
-rules = supabase.table('playbook_ontology_rules').select('id', count='exact').execute()
-docs = supabase.table('playbook_documents').select('id', count='exact').execute()
+terms = supabase.table('playbook_semantic_terms').select('*', count='exact', head=True).execute()
+relations = supabase.table('playbook_semantic_relations').select('*', count='exact', head=True).execute()
+rules = supabase.table('playbook_ontology_rules').select('*', count='exact', head=True).execute()
+docs = supabase.table('playbook_documents').select('*', count='exact', head=True).execute()
 
 print("현재 데이터:")
 print(f"  📄 문서: {docs.count:,}개")
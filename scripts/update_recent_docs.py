@@ -18,8 +18,15 @@ if os.path.exists(env_path):
                 key, value = line.split('=', 1)
                 os.environ[key] = value.strip('"').strip("'")
 
+from pathlib import Path
+
 from supabase import create_client
 
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.core.loaders.pagination import fetch_all, iter_rows
+
 # Supabase 연결
 url = os.environ.get('SUPABASE_URL')
 key = os.environ.get('SUPABASE_KEY')
@@ -43,25 +50,12 @@ print()
 
 # 최근 문서 조회
 print("📄 최근 문서 조회 중...")
-all_docs = []
-page = 0
-page_size = 1000
-
-while True:
-    response = supabase.table('playbook_documents')\
-        .select('id,title,last_updated')\
-        .gte('last_updated', cutoff_str)\
-        .range(page * page_size, (page + 1) * page_size - 1)\
-        .execute()
-
-    if not response.data:
-        break
-
-    all_docs.extend(response.data)
-    page += 1
-
-    if len(response.data) < page_size:
-        break
+all_docs = fetch_all(
+    supabase,
+    'playbook_documents',
+    'id,title,last_updated',
+    filters=lambda query: query.gte('last_updated', cutoff_str)
+)
 
 print(f"✅ {len(all_docs):,}개 최근 문서 발견")
 print()
@@ -91,24 +85,14 @@ deleted_count = 0
 
 try:
     # 문서 ID 목록으로 용어 조회
-    all_terms = []
-    page = 0
-
-    while True:
-        response = supabase.table('playbook_semantic_terms')\
-            .select('id')\
-            .in_('doc_id', doc_ids)\
-            .range(page * page_size, (page + 1) * page_size - 1)\
-            .execute()
-
-        if not response.data:
-            break
-
-        all_terms.extend([t['id'] for t in response.data])
-        page += 1
-
-        if len(response.data) < page_size:
-            break
+    all_terms = [
+        t['id'] for t in iter_rows(
+            supabase,
+            'playbook_semantic_terms',
+            'id',
+            filters=lambda query: query.in_('doc_id', doc_ids)
+        )
+    ]
 
     print(f"  해당 문서의 용어: {len(all_terms):,}개")
 
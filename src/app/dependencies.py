@@ -5,11 +5,14 @@ FastAPI 의존성 주입 컨테이너
 """
 import logging
 import os
+from typing import Optional
 from openai import OpenAI
 
+from src.shared.config import Config
 from src.core.loaders.supabase_loader import SupabaseLoader
-from src.core.traversal import GraphTraversal, SubgraphExtractor
-from src.entities.term import TermRepository
+from src.core.rules.prompts import SYNONYM_DICTIONARY
+from src.core.traversal import GraphSnapshot, GraphTraversal, SubgraphExtractor, TermIndex
+from src.entities.term import TermRepository, TermCatalog
 from src.entities.relation import RelationRepository
 from src.features.chat import ChatService
 
@@ -18,6 +21,9 @@ logger = logging.getLogger(__name__)
 # Global singletons
 _supabase_loader = None
 _openai_client = None
+_graph_snapshot = None
+_term_index = None
+_term_catalog = None
 _graph_traversal = None
 _subgraph_extractor = None
 
@@ -47,12 +53,45 @@ def get_openai_client() -> OpenAI:
     return _openai_client
 
 
+def get_graph_snapshot() -> Optional[GraphSnapshot]:
+    """
+    Graph Snapshot 싱글톤 (GRAPH_SNAPSHOT_ENABLED=true 일 때만 생성)
+
+    최초 호출 시 전체 그래프를 메모리에 로드하고 백그라운드 갱신 시작
+    (GRAPH_SNAPSHOT_REFRESH_SECONDS 주기로 변경 감지 → 재로드)
+    """
+    global _graph_snapshot
+    if _graph_snapshot is None and Config.GRAPH_SNAPSHOT_ENABLED:
+        supabase_loader = get_supabase_loader()
+        _graph_snapshot = GraphSnapshot(supabase_loader.client).load()
+        _graph_snapshot.start_background_refresh()
+    return _graph_snapshot
+
+
+def get_term_index() -> TermIndex:
+    """
+    Term Index 싱글톤
+
+    용어명 → 관계 수 순으로 정렬된 term ID 인덱스 (시작 노드 조회용)
+    Phase 2 결과는 TERM_INDEX_REFRESH_SECONDS 주기의 백그라운드 증분 갱신으로 반영
+    """
+    global _term_index
+    if _term_index is None:
+        supabase_loader = get_supabase_loader()
+        _term_index = TermIndex(supabase_loader.client).load()
+    return _term_index
+
+
 def get_graph_traversal() -> GraphTraversal:
     """Graph Traversal 싱글톤"""
     global _graph_traversal
     if _graph_traversal is None:
         supabase_loader = get_supabase_loader()
-        _graph_traversal = GraphTraversal(supabase_loader.client)
+        _graph_traversal = GraphTraversal(
+            supabase_loader.client,
+            snapshot=get_graph_snapshot(),
+            term_index=get_term_index()
+        )
     return _graph_traversal
 
 
@@ -61,10 +100,32 @@ def get_subgraph_extractor() -> SubgraphExtractor:
     global _subgraph_extractor
     if _subgraph_extractor is None:
         supabase_loader = get_supabase_loader()
-        _subgraph_extractor = SubgraphExtractor(supabase_loader.client)
+        _subgraph_extractor = SubgraphExtractor(
+            supabase_loader.client,
+            term_index=get_term_index()
+        )
     return _subgraph_extractor
 
 
+def get_term_catalog() -> TermCatalog:
+    """
+    Term Catalog 싱글톤
+
+    최초 호출 시 전체 용어/룰을 로드하고 백그라운드 갱신 시작
+    """
+    global _term_catalog
+    if _term_catalog is None:
+        supabase_loader = get_supabase_loader()
+        _term_catalog = TermCatalog(
+            supabase_loader.client,
+            refresh_interval=Config.TERM_CATALOG_REFRESH_SECONDS,
+            max_age=Config.TERM_CATALOG_MAX_AGE_SECONDS,
+            synonyms=SYNONYM_DICTIONARY
+        ).load()
+        _term_catalog.start_background_refresh()
+    return _term_catalog
+
+
 def get_term_repository() -> TermRepository:
     """Term Repository"""
     supabase_loader = get_supabase_loader()
@@ -90,7 +151,8 @@ def get_chat_service() -> ChatService:
         openai_client=openai_client,
         term_repo=term_repo,
         relation_repo=relation_repo,
-        subgraph_extractor=subgraph_extractor
+        subgraph_extractor=subgraph_extractor,
+        term_catalog=get_term_catalog()
     )
 
 
@@ -105,10 +167,17 @@ def init_dependencies():
     logger.info("✅ Supabase connection established")
 
     # Graph services 초기화
+    if get_graph_snapshot() is not None:
+        logger.info("✅ Graph snapshot loaded into memory (background refresh started)")
+    get_term_index()
     get_graph_traversal()
     get_subgraph_extractor()
     logger.info("✅ Graph services initialized")
 
+    # Chat 용어/룰 카탈로그 초기화
+    get_term_catalog()
+    logger.info("✅ Term catalog loaded (background refresh started)")
+
     # OpenAI 초기화 (선택적)
     try:
         openai_client = get_openai_client()
@@ -118,3 +187,16 @@ def init_dependencies():
         logger.warning("⚠️ OPENAI_API_KEY not found - chat endpoint will be unavailable")
 
     logger.info("✅ All dependencies initialized")
+
+
+def shutdown_dependencies():
+    """
+    의존성 정리 (Shutdown 이벤트)
+    """
+    if _term_catalog is not None:
+        _term_catalog.stop()
+        logger.info("✅ Term catalog background refresh stopped")
+
+    if _graph_snapshot is not None:
+        _graph_snapshot.stop()
+        logger.info("✅ Graph snapshot background refresh stopped")
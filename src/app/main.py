@@ -48,6 +48,12 @@ async def startup_event():
         raise
 
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Stop background services on shutdown"""
+    dependencies.shutdown_dependencies()
+
+
 # Register routers
 # Override chat router's DI function
 app.dependency_overrides[chat_routes.get_chat_service] = dependencies.get_chat_service
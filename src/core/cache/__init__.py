@@ -0,0 +1,6 @@
+# Local caches for external API results
+from .embedding_cache import EmbeddingCache
+from .llm_cache import LLMResponseCache
+from .page_cache import PageCache
+
+__all__ = ['EmbeddingCache', 'LLMResponseCache', 'PageCache']
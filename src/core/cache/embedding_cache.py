@@ -0,0 +1,148 @@
+"""
+Content-addressed embedding cache (SQLite, float32 blobs)
+"""
+import hashlib
+import logging
+import sqlite3
+import threading
+from array import array
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+
+logger = logging.getLogger("playbook_nexus.cache")
+
+
+class EmbeddingCache:
+    """
+    Persistent embedding cache keyed by (model, sha256(text))
+
+    Vectors are stored as packed float32 blobs (4 bytes per dimension),
+    which is the precision OpenAI embeddings carry anyway. Safe to share
+    between pipeline worker threads.
+    """
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path: SQLite file path (parent directory is created)
+        """
+        self.path = path
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS embeddings (
+                model TEXT NOT NULL,
+                text_hash BLOB NOT NULL,
+                vector BLOB NOT NULL,
+                PRIMARY KEY (model, text_hash)
+            ) WITHOUT ROWID
+            """
+        )
+        self._conn.commit()
+
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def text_hash(text: str) -> bytes:
+        """sha256 digest of the UTF-8 text"""
+        return hashlib.sha256(text.encode('utf-8')).digest()
+
+    @staticmethod
+    def _pack(vector: Sequence[float]) -> bytes:
+        return array('f', vector).tobytes()
+
+    @staticmethod
+    def _unpack(blob: bytes) -> List[float]:
+        vector = array('f')
+        vector.frombytes(blob)
+        return vector.tolist()
+
+    def get_many(self, model: str, texts: List[str]) -> List[Optional[List[float]]]:
+        """
+        Look up embeddings
+
+        Args:
+            model: Embedding model name
+            texts: Texts exactly as they are sent to the API
+
+        Returns:
+            Embedding per text (None for cache misses)
+        """
+        if not texts:
+            return []
+
+        hashes = [self.text_hash(text) for text in texts]
+        found: Dict[bytes, List[float]] = {}
+
+        with self._lock:
+            unique = list(dict.fromkeys(hashes))
+            # SQLite default variable limit is 999
+            for start in range(0, len(unique), 900):
+                batch = unique[start:start + 900]
+                placeholders = ','.join('?' * len(batch))
+                rows = self._conn.execute(
+                    f"SELECT text_hash, vector FROM embeddings "
+                    f"WHERE model = ? AND text_hash IN ({placeholders})",
+                    [model, *batch]
+                ).fetchall()
+                for text_hash, blob in rows:
+                    found[bytes(text_hash)] = self._unpack(blob)
+
+            results = [found.get(text_hash) for text_hash in hashes]
+            hit_count = sum(1 for vector in results if vector is not None)
+            self.hits += hit_count
+            self.misses += len(results) - hit_count
+
+        return results
+
+    def put_many(self, model: str, texts: List[str], vectors: List[Optional[List[float]]]):
+        """
+        Store embeddings (None vectors are skipped)
+
+        Args:
+            model: Embedding model name
+            texts: Texts exactly as they were sent to the API
+            vectors: Embedding per text
+        """
+        rows = [
+            (model, self.text_hash(text), self._pack(vector))
+            for text, vector in zip(texts, vectors)
+            if vector
+        ]
+        if not rows:
+            return
+
+        with self._lock:
+            try:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO embeddings (model, text_hash, vector) VALUES (?, ?, ?)",
+                    rows
+                )
+                self._conn.commit()
+            except sqlite3.Error as e:
+                logger.error(f"Failed to write embedding cache: {e}")
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+
+    def get_stats(self) -> Dict[str, float]:
+        """Hit/miss counters since startup"""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': round(self.hits / total, 3) if total else 0.0,
+            }
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,187 @@
+"""
+Disk-backed LLM response cache (SQLite, size-bounded LRU)
+"""
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+
+logger = logging.getLogger("playbook_nexus.cache")
+
+
+def _sha256(text: str) -> str:
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+class LLMResponseCache:
+    """
+    Chat completion cache keyed by (model, system prompt hash, user prompt hash, params)
+
+    Only deterministic-enough requests should go through it (low temperature,
+    fixed prompt). When the stored responses exceed max_bytes, the least
+    recently used entries are evicted down to 90% of the limit.
+    """
+
+    def __init__(self, path: str, max_bytes: int = 256 * 1024 * 1024):
+        """
+        Args:
+            path: SQLite file path (parent directory is created)
+            max_bytes: Total response size limit
+        """
+        self.path = path
+        self.max_bytes = max_bytes
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                model TEXT NOT NULL,
+                response TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                created_at REAL NOT NULL,
+                last_used REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS responses_last_used ON responses (last_used)")
+        self._conn.commit()
+
+        self._total_size = self._conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()[0]
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def make_key(system_prompt: str, user_prompt: str, model: str, **params: Any) -> str:
+        """
+        Cache key for one chat completion request
+
+        Args:
+            system_prompt: System message
+            user_prompt: User message
+            model: Model name
+            **params: Other request parameters that change the output
+                (temperature, max_tokens, ...)
+
+        Returns:
+            Hex digest
+        """
+        key = {
+            'model': model,
+            'system': _sha256(system_prompt),
+            'user': _sha256(user_prompt),
+            'params': params,
+        }
+        return _sha256(json.dumps(key, sort_keys=True))
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Look up a response (marks it as recently used)
+
+        Args:
+            key: Key from make_key
+
+        Returns:
+            Cached response text or None
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT response FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+
+            if row is None:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            self._conn.execute(
+                "UPDATE responses SET last_used = ? WHERE key = ?", (time.time(), key)
+            )
+            self._conn.commit()
+            return row[0]
+
+    def put(self, key: str, model: str, response: str):
+        """
+        Store a response, evicting least recently used entries if over max_bytes
+
+        Args:
+            key: Key from make_key
+            model: Model name (for inspection/cleanup)
+            response: Raw response text
+        """
+        size = len(response.encode('utf-8'))
+        now = time.time()
+
+        with self._lock:
+            try:
+                previous = self._conn.execute(
+                    "SELECT size FROM responses WHERE key = ?", (key,)
+                ).fetchone()
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO responses (key, model, response, size, created_at, last_used) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (key, model, response, size, now, now)
+                )
+                self._total_size += size - (previous[0] if previous else 0)
+
+                if self._total_size > self.max_bytes:
+                    self._evict(int(self.max_bytes * 0.9))
+
+                self._conn.commit()
+            except sqlite3.Error as e:
+                logger.error(f"Failed to write LLM response cache: {e}")
+
+    def _evict(self, target_bytes: int):
+        """Delete least recently used entries until total size <= target_bytes"""
+        rows = self._conn.execute(
+            "SELECT key, size FROM responses ORDER BY last_used"
+        ).fetchall()
+
+        evicted = []
+        for key, size in rows:
+            if self._total_size <= target_bytes:
+                break
+            evicted.append((key,))
+            self._total_size -= size
+
+        self._conn.executemany("DELETE FROM responses WHERE key = ?", evicted)
+        self.evictions += len(evicted)
+        logger.debug(f"LLM response cache: evicted {len(evicted)} entries")
+
+    @property
+    def total_size(self) -> int:
+        """Total stored response size in bytes"""
+        return self._total_size
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Hit/miss/eviction counters since startup"""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': round(self.hits / total, 3) if total else 0.0,
+                'evictions': self.evictions,
+                'size_mb': round(self._total_size / (1024 * 1024), 2),
+            }
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
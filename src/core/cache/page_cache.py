@@ -0,0 +1,194 @@
+"""
+Raw Confluence page cache (SQLite, zlib-compressed JSON, size-bounded LRU)
+"""
+import json
+import logging
+import sqlite3
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+
+logger = logging.getLogger("playbook_nexus.cache")
+
+
+class PageCache:
+    """
+    get_page JSON cache keyed by (page_id, version number)
+
+    A page version never changes once published, so an entry stays valid
+    until it is evicted. Pages are stored as zlib-compressed JSON; when the
+    compressed total exceeds max_bytes, the least recently used entries are
+    evicted down to 90% of the limit.
+    """
+
+    def __init__(self, path: str, max_bytes: int = 512 * 1024 * 1024):
+        """
+        Args:
+            path: SQLite file path (parent directory is created)
+            max_bytes: Total compressed size limit
+        """
+        self.path = path
+        self.max_bytes = max_bytes
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS pages (
+                page_id TEXT NOT NULL,
+                version INTEGER NOT NULL,
+                data BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                last_used REAL NOT NULL,
+                PRIMARY KEY (page_id, version)
+            )
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS pages_last_used ON pages (last_used)")
+        self._conn.commit()
+
+        self._total_size = self._conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM pages"
+        ).fetchone()[0]
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, page_id: str, version: Optional[int] = None) -> Optional[Dict[str, Any]]:
+        """
+        Look up a page (marks it as recently used)
+
+        Args:
+            page_id: Confluence page ID
+            version: Version number (None = newest cached version)
+
+        Returns:
+            Raw page JSON or None
+        """
+        with self._lock:
+            if version is None:
+                row = self._conn.execute(
+                    "SELECT version, data FROM pages WHERE page_id = ? ORDER BY version DESC LIMIT 1",
+                    (page_id,)
+                ).fetchone()
+            else:
+                row = self._conn.execute(
+                    "SELECT version, data FROM pages WHERE page_id = ? AND version = ?",
+                    (page_id, version)
+                ).fetchone()
+
+            if row is None:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            self._conn.execute(
+                "UPDATE pages SET last_used = ? WHERE page_id = ? AND version = ?",
+                (time.time(), page_id, row[0])
+            )
+            self._conn.commit()
+
+        return json.loads(zlib.decompress(row[1]).decode('utf-8'))
+
+    def put(self, page_id: str, page: Dict[str, Any]):
+        """
+        Store a page under its version number, dropping older versions of it
+
+        Args:
+            page_id: Confluence page ID
+            page: Raw page JSON (must include version.number)
+        """
+        version = (page.get('version') or {}).get('number')
+        if version is None:
+            logger.debug(f"Page {page_id} has no version number, not cached")
+            return
+
+        data = zlib.compress(json.dumps(page, ensure_ascii=False).encode('utf-8'), 6)
+
+        with self._lock:
+            try:
+                previous = self._conn.execute(
+                    "SELECT COALESCE(SUM(size), 0) FROM pages WHERE page_id = ?", (page_id,)
+                ).fetchone()[0]
+                # Older versions are never requested again
+                self._conn.execute("DELETE FROM pages WHERE page_id = ?", (page_id,))
+                self._conn.execute(
+                    "INSERT INTO pages (page_id, version, data, size, last_used) VALUES (?, ?, ?, ?, ?)",
+                    (page_id, version, data, len(data), time.time())
+                )
+                self._total_size += len(data) - previous
+
+                if self._total_size > self.max_bytes:
+                    self._evict(int(self.max_bytes * 0.9))
+
+                self._conn.commit()
+            except sqlite3.Error as e:
+                logger.error(f"Failed to write page cache: {e}")
+
+    def _evict(self, target_bytes: int):
+        """Delete least recently used pages until total size <= target_bytes"""
+        rows = self._conn.execute(
+            "SELECT page_id, version, size FROM pages ORDER BY last_used"
+        ).fetchall()
+
+        evicted = []
+        for page_id, version, size in rows:
+            if self._total_size <= target_bytes:
+                break
+            evicted.append((page_id, version))
+            self._total_size -= size
+
+        self._conn.executemany("DELETE FROM pages WHERE page_id = ? AND version = ?", evicted)
+        self.evictions += len(evicted)
+        logger.debug(f"Page cache: evicted {len(evicted)} pages")
+
+    def versions(self, page_ids: Optional[List[str]] = None) -> Dict[str, int]:
+        """
+        Cached version per page
+
+        Args:
+            page_ids: Pages to look up (None = all cached pages)
+
+        Returns:
+            page_id -> version number
+        """
+        with self._lock:
+            rows = self._conn.execute("SELECT page_id, MAX(version) FROM pages GROUP BY page_id").fetchall()
+
+        versions = dict(rows)
+        if page_ids is not None:
+            wanted = set(page_ids)
+            versions = {page_id: v for page_id, v in versions.items() if page_id in wanted}
+        return versions
+
+    @property
+    def total_size(self) -> int:
+        """Total compressed size in bytes"""
+        return self._total_size
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM pages").fetchone()[0]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Hit/miss/eviction counters since startup"""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': round(self.hits / total, 3) if total else 0.0,
+                'evictions': self.evictions,
+                'size_mb': round(self._total_size / (1024 * 1024), 2),
+            }
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
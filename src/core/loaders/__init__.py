@@ -1,4 +1,9 @@
 # Data loaders
 from .supabase_loader import SupabaseLoader
+from .vector_codec import encode_vector, decode_vector, embedding_payload
+from .pagination import KeysetPaginator, iter_rows, fetch_all, chunked, IN_FILTER_CHUNK_SIZE
 
-__all__ = ['SupabaseLoader']
+__all__ = [
+    'SupabaseLoader', 'encode_vector', 'decode_vector', 'embedding_payload',
+    'KeysetPaginator', 'iter_rows', 'fetch_all', 'chunked', 'IN_FILTER_CHUNK_SIZE',
+]
@@ -0,0 +1,244 @@
+"""
+Keyset-paginated table scans for Supabase (PostgREST)
+
+OFFSET paging (range(page * size, ...)) makes the server skip all earlier
+rows on every request, and an unpaginated select() is silently cut off at
+the server's max-rows. Keyset paging asks for "the next page_size rows
+after the last key seen" instead, which is an index range scan no matter
+how deep into the table the scan is, and stays consistent while rows are
+being inserted.
+"""
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, TypeVar
+
+from src.shared.config import Config
+
+logger = logging.getLogger("playbook_nexus.supabase")
+
+T = TypeVar("T")
+
+# in_() filters are sent in the query string; 100 UUIDs keep the URL well under 8KB
+IN_FILTER_CHUNK_SIZE = 100
+
+
+def chunked(items: Iterable[T], size: int = IN_FILTER_CHUNK_SIZE) -> List[List[T]]:
+    """
+    Split a list of filter values into URL-safe chunks for in_() filters
+
+    Args:
+        items: Values (e.g. IDs) to filter on
+        size: Values per chunk
+
+    Returns:
+        List of chunks, in input order
+    """
+    items = list(items)
+    return [items[i:i + size] for i in range(0, len(items), size)]
+
+
+def _quote(value: Any) -> str:
+    """Quote a value for a PostgREST logic tree (timestamps contain reserved characters)"""
+    text = str(value).replace('\\', '\\\\').replace('"', '\\"')
+    return f'"{text}"'
+
+
+_clamped_sizes = set()
+
+
+def _clamp_page_size(page_size: int, max_rows: int) -> int:
+    """Limit page_size to the server's max-rows (warns once per configured size)"""
+    if page_size <= 0 or max_rows <= 0:
+        raise ValueError(f"page_size ({page_size}) and max_rows ({max_rows}) must be positive")
+
+    if page_size > max_rows:
+        if (page_size, max_rows) not in _clamped_sizes:
+            _clamped_sizes.add((page_size, max_rows))
+            logger.warning(
+                f"Page size {page_size} exceeds PostgREST max-rows {max_rows}; "
+                f"using {max_rows} (see SUPABASE_MAX_ROWS)"
+            )
+        return max_rows
+    return page_size
+
+
+class KeysetPaginator:
+    """
+    Stream the rows of a table in key order, one page per request
+
+    order_by lists the sort columns; the last one must be unique (e.g.
+    ('id',) or ('created_at', 'id')) and never NULL; leading columns may be
+    NULL (e.g. a nullable created_at) and are scanned NULLS LAST. Each
+    request filters on the last row of the previous page, so the key
+    columns are always fetched; columns that were not asked for are removed
+    from the yielded rows.
+
+    A page shorter than page_size ends the scan, so page_size is clamped to
+    the server's max-rows (Config.SUPABASE_MAX_ROWS): a larger request would
+    come back cut short after the first page and look like the end of the
+    table.
+
+    With prefetch enabled the next page is requested on a background thread
+    while the caller is still working through the current one.
+    """
+
+    def __init__(
+        self,
+        client,
+        table: str,
+        columns: str = "*",
+        order_by: Sequence[str] = ("id",),
+        page_size: Optional[int] = None,
+        filters: Optional[Callable[[Any], Any]] = None,
+        prefetch: bool = True,
+        max_rows: Optional[int] = None
+    ):
+        """
+        Args:
+            client: Supabase client
+            table: Table (or view) name
+            columns: Column projection, as for select()
+            order_by: Keyset columns, unique as a whole, last one unique on its own
+            page_size: Rows per request (None = Config.SUPABASE_PAGE_SIZE)
+            filters: Applies extra filters to each query (e.g. lambda q: q.in_(...))
+            prefetch: Fetch the next page while the current one is consumed
+            max_rows: Server's PostgREST max-rows (None = Config.SUPABASE_MAX_ROWS)
+
+        Raises:
+            ValueError: If page_size or max_rows is not positive
+        """
+        self.client = client
+        self.table = table
+        self.order_by = list(order_by)
+        self.page_size = _clamp_page_size(
+            page_size or Config.SUPABASE_PAGE_SIZE,
+            Config.SUPABASE_MAX_ROWS if max_rows is None else max_rows
+        )
+        self.filters = filters
+        self.prefetch = prefetch
+
+        requested = [c.strip() for c in columns.split(',')]
+        if '*' in requested:
+            self._select = columns
+            self._strip = []
+        else:
+            self._strip = [c for c in self.order_by if c not in requested]
+            self._select = ','.join(requested + self._strip)
+
+    def _after(self, query, cursor: Sequence[Any]):
+        """
+        Restrict a query to rows strictly after the cursor
+
+        Ascending order puts NULLs last (PostgreSQL default), so a NULL key
+        is matched with is.null and sorts after every non-NULL value.
+        """
+        if cursor[-1] is None:
+            raise ValueError(
+                f"{self.table}: last keyset column '{self.order_by[-1]}' is NULL; "
+                f"it must be unique and non-null"
+            )
+
+        if len(self.order_by) == 1:
+            return query.gt(self.order_by[0], cursor[0])
+
+        # (a, b) > (x, y)  <=>  a > x OR (a = x AND b > y), where "a > x" also
+        # matches a IS NULL, and nothing is greater than a NULL x
+        branches = []
+        for i, column in enumerate(self.order_by):
+            if cursor[i] is None:
+                continue
+            conditions = [self._equals(c, v) for c, v in zip(self.order_by[:i], cursor[:i])]
+            greater = f"{column}.gt.{_quote(cursor[i])}"
+            if i < len(self.order_by) - 1:
+                greater = f"or({greater},{column}.is.null)"
+            conditions.append(greater)
+            branches.append(conditions[0] if len(conditions) == 1 else f"and({','.join(conditions)})")
+        return query.or_(','.join(branches))
+
+    @staticmethod
+    def _equals(column: str, value: Any) -> str:
+        """Equality condition for one key column (is.null for NULL)"""
+        return f"{column}.is.null" if value is None else f"{column}.eq.{_quote(value)}"
+
+    def _fetch(self, cursor: Optional[Sequence[Any]]) -> List[Dict[str, Any]]:
+        query = self.client.table(self.table).select(self._select)
+        if self.filters:
+            query = self.filters(query)
+        if cursor is not None:
+            query = self._after(query, cursor)
+        for column in self.order_by:
+            query = query.order(column)
+        response = query.limit(self.page_size).execute()
+        return response.data or []
+
+    def _cursor(self, page: List[Dict[str, Any]]) -> List[Any]:
+        last = page[-1]
+        return [last[column] for column in self.order_by]
+
+    def _finish(self, page: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        for row in page:
+            for column in self._strip:
+                row.pop(column, None)
+        return page
+
+    def pages(self) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Yield the table one page at a time
+
+        Returns:
+            Iterator of row lists (the last one may be shorter than page_size)
+        """
+        page = self._fetch(None)
+        if not self.prefetch:
+            while page:
+                full = len(page) == self.page_size
+                cursor = self._cursor(page) if full else None
+                yield self._finish(page)
+                page = self._fetch(cursor) if full else []
+            return
+
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"scan-{self.table}")
+        try:
+            while page:
+                upcoming = None
+                if len(page) == self.page_size:
+                    upcoming = executor.submit(self._fetch, self._cursor(page))
+                yield self._finish(page)
+                page = upcoming.result() if upcoming else []
+        finally:
+            # Abandoned scans: do not wait for a prefetch nobody will read
+            executor.shutdown(wait=False)
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        for page in self.pages():
+            yield from page
+
+
+def iter_rows(client, table: str, columns: str = "*", **kwargs) -> Iterator[Dict[str, Any]]:
+    """
+    Stream every row of a table (see KeysetPaginator for keyword arguments)
+
+    Args:
+        client: Supabase client
+        table: Table name
+        columns: Column projection
+
+    Returns:
+        Row iterator
+    """
+    return iter(KeysetPaginator(client, table, columns, **kwargs))
+
+
+def fetch_all(client, table: str, columns: str = "*", **kwargs) -> List[Dict[str, Any]]:
+    """
+    Read every row of a table into a list (see KeysetPaginator for keyword arguments)
+
+    Args:
+        client: Supabase client
+        table: Table name
+        columns: Column projection
+
+    Returns:
+        All rows, in key order
+    """
+    return list(KeysetPaginator(client, table, columns, **kwargs))
@@ -1,12 +1,15 @@
 """
 Supabase data loader for storing documents and chunks
 """
+import json
 import logging
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 
 from supabase import create_client, Client
 
 from src.shared.config import Config
+from .pagination import IN_FILTER_CHUNK_SIZE, chunked
+from .vector_codec import embedding_payload
 
 logger = logging.getLogger("playbook_nexus.supabase")
 
@@ -14,6 +17,20 @@ logger = logging.getLogger("playbook_nexus.supabase")
 class SupabaseLoader:
     """Load data into Supabase tables"""
 
+    # Server-side aggregate views (supabase/migrations)
+    VIEW_TABLE_STATS = "playbook_table_stats"
+    VIEW_CATEGORY_STATS = "playbook_category_stats"
+    VIEW_PREDICATE_STATS = "playbook_predicate_stats"
+
+    COUNT_COLUMNS = (
+        'total_documents', 'total_chunks', 'total_semantic_terms', 'unique_terms',
+        'total_relations', 'total_ontology_rules',
+    )
+    ORPHAN_COLUMNS = (
+        'documents_without_chunks', 'documents_without_terms', 'chunks_without_embedding',
+        'orphan_terms', 'same_doc_duplicate_terms',
+    )
+
     def __init__(self, url: str = None, key: str = None):
         """
         Initialize Supabase loader
@@ -34,6 +51,13 @@ class SupabaseLoader:
         self.table_documents = Config.TABLE_DOCUMENTS
         self.table_chunks = Config.TABLE_CHUNKS
         self.table_semantic = Config.TABLE_SEMANTIC
+        self.table_relations = Config.TABLE_RELATIONS
+
+        # Chunk upsert payload limit
+        self.chunk_batch_bytes = Config.SUPABASE_CHUNK_BATCH_BYTES
+        # Embeddings as pgvector text (~18KB per 1536-dim vector) instead of JSON floats (~34KB)
+        self.embedding_format = Config.EMBEDDING_UPLOAD_FORMAT
+        self.embedding_half_precision = Config.EMBEDDING_HALF_PRECISION
 
     def load_document(self, page_data: Dict[str, Any]) -> bool:
         """
@@ -47,6 +71,7 @@ class SupabaseLoader:
                 - url: document URL
                 - content: full content text
                 - last_updated: last update timestamp
+                - version: Confluence version number
 
         Returns:
             True if successful, False otherwise
@@ -58,7 +83,8 @@ class SupabaseLoader:
                 "space": page_data.get("space_key", "unknown"),
                 "url": page_data.get("url", ""),
                 "content_length": len(page_data["content"]),
-                "last_updated": page_data.get("last_updated")
+                "last_updated": page_data.get("last_updated"),
+                "version": page_data.get("version")
             }).execute()
 
             logger.info(f"Successfully loaded document {page_data['page_id']}")
@@ -68,10 +94,15 @@ class SupabaseLoader:
             logger.error(f"Error loading document {page_data.get('page_id', 'unknown')}: {e}")
             raise
 
-    def load_chunks(self, chunks_data: List[Dict[str, Any]]) -> int:
+    def load_chunks(self, chunks_data: List[Dict[str, Any]], delete_stale: bool = False) -> int:
         """
         Load chunks into playbook_chunks table (청크 + 임베딩 저장)
 
+        Rows are upserted on (doc_id, chunk_index), so re-loading a page
+        overwrites its chunks instead of duplicating them. Batches are sized
+        by JSON payload bytes (SUPABASE_CHUNK_BATCH_BYTES); a failed batch is
+        split in half and retried until single rows fail on their own.
+
         Args:
             chunks_data: List of chunk dictionaries with keys:
                 - doc_id: document ID
@@ -80,6 +111,8 @@ class SupabaseLoader:
                 - metadata: JSONB metadata (title, chunk_index, total_chunks, doc_type)
                 - embedding: embedding vector
                 - char_count: character count
+            delete_stale: After a complete load, delete each document's chunks
+                past its last chunk_index (the page got shorter)
 
         Returns:
             Number of successfully loaded chunks
@@ -88,35 +121,135 @@ class SupabaseLoader:
             logger.warning("No chunks to load")
             return 0
 
-        # Prepare batch data with new schema
-        batch = []
+        # Prepare rows with new schema
+        rows = []
         for chunk in chunks_data:
-            batch.append({
+            rows.append({
                 "doc_id": chunk["doc_id"],
                 "chunk_index": chunk["chunk_index"],
                 "content": chunk["content"],  # Pure text
                 "metadata": chunk["metadata"],  # JSONB
-                "embedding": chunk["embedding"],
+                "embedding": embedding_payload(
+                    chunk["embedding"], self.embedding_format, self.embedding_half_precision
+                ),
                 "char_count": chunk.get("char_count", len(chunk["content"]))
             })
 
-        # Insert in batches of 50 for safety
         total_loaded = 0
-        batch_size = 50
+        batches = self._split_by_bytes(rows, self.chunk_batch_bytes)
+        for i, batch in enumerate(batches, 1):
+            loaded = self._upsert_chunks(batch)
+            total_loaded += loaded
+            logger.info(f"Loaded batch {i}/{len(batches)}: {loaded}/{len(batch)} chunks")
+
+        logger.info(f"Total loaded: {total_loaded}/{len(chunks_data)} chunks")
+
+        if delete_stale:
+            if total_loaded == len(rows):
+                last_index: Dict[str, int] = {}
+                for row in rows:
+                    last_index[row["doc_id"]] = max(last_index.get(row["doc_id"], -1), row["chunk_index"])
+                for doc_id, index in last_index.items():
+                    self.delete_chunks(doc_id, from_index=index + 1)
+            else:
+                logger.warning("Some chunks failed to load, keeping existing chunks")
+
+        return total_loaded
+
+    @staticmethod
+    def _split_by_bytes(rows: List[Dict[str, Any]], max_bytes: int) -> List[List[Dict[str, Any]]]:
+        """Group rows into batches whose JSON payload stays under max_bytes"""
+        batches: List[List[Dict[str, Any]]] = []
+        current: List[Dict[str, Any]] = []
+        current_bytes = 2  # []
+
+        for row in rows:
+            row_bytes = len(json.dumps(row, ensure_ascii=False, separators=(',', ':')).encode('utf-8')) + 1
+            if current and current_bytes + row_bytes > max_bytes:
+                batches.append(current)
+                current, current_bytes = [], 2
+            current.append(row)
+            current_bytes += row_bytes
+
+        if current:
+            batches.append(current)
+        return batches
+
+    def _upsert_chunks(self, rows: List[Dict[str, Any]]) -> int:
+        """
+        Upsert a batch, bisecting on failure
 
+        Returns:
+            Number of rows written (rows that fail alone are logged and skipped)
+        """
         try:
-            for i in range(0, len(batch), batch_size):
-                sub_batch = batch[i:i + batch_size]
-                self.client.table(self.table_chunks).insert(sub_batch).execute()
-                total_loaded += len(sub_batch)
-                logger.info(f"Loaded batch {i//batch_size + 1}: {len(sub_batch)} chunks")
+            self.client.table(self.table_chunks).upsert(rows, on_conflict="doc_id,chunk_index").execute()
+            return len(rows)
 
-            logger.info(f"Total loaded: {total_loaded}/{len(chunks_data)} chunks")
-            return total_loaded
+        except Exception as e:
+            if len(rows) == 1:
+                row = rows[0]
+                logger.error(f"Error loading chunk {row['doc_id']}#{row['chunk_index']}: {e}")
+                return 0
+
+            logger.warning(f"Chunk batch of {len(rows)} failed, retrying in halves: {e}")
+            middle = len(rows) // 2
+            return self._upsert_chunks(rows[:middle]) + self._upsert_chunks(rows[middle:])
+
+    def delete_chunks(self, doc_id: str, from_index: int = 0) -> bool:
+        """
+        Delete a document's chunks (all, or those from chunk_index onward)
+
+        Args:
+            doc_id: Document ID
+            from_index: First chunk_index to delete (0 = all chunks)
+
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            query = self.client.table(self.table_chunks).delete().eq('doc_id', doc_id)
+            if from_index > 0:
+                query = query.gte('chunk_index', from_index)
+            result = query.execute()
+
+            deleted = len(result.data) if result.data else 0
+            if deleted:
+                logger.info(f"Deleted {deleted} stale chunks for document {doc_id}")
+            return True
 
         except Exception as e:
-            logger.error(f"Error loading chunks: {e}")
-            raise
+            logger.error(f"Error deleting chunks for document {doc_id}: {e}")
+            return False
+
+    def get_document_versions(
+        self,
+        doc_ids: List[str],
+        batch_size: int = IN_FILTER_CHUNK_SIZE
+    ) -> Dict[str, Optional[int]]:
+        """
+        Get stored Confluence version numbers
+
+        Args:
+            doc_ids: Document IDs to look up
+            batch_size: IDs per query (keeps the URL short)
+
+        Returns:
+            doc_id -> stored version (None if loaded before versions were tracked);
+            documents that are not stored are missing from the result
+        """
+        versions: Dict[str, Optional[int]] = {}
+
+        for batch in chunked(doc_ids, batch_size):
+            response = self.client.table(self.table_documents)\
+                .select('id, version')\
+                .in_('id', batch)\
+                .execute()
+
+            for row in response.data or []:
+                versions[row['id']] = row.get('version')
+
+        return versions
 
     def test_connection(self) -> bool:
         """
@@ -198,6 +331,19 @@ class SupabaseLoader:
             logger.error(f"Error loading semantic terms: {e}")
             raise
 
+    def count_rows(self, table: str) -> int:
+        """
+        Count rows in a table without transferring them
+
+        Args:
+            table: Table or view name
+
+        Returns:
+            Exact row count (HEAD request, Content-Range header only)
+        """
+        response = self.client.table(table).select('*', count='exact', head=True).execute()
+        return response.count or 0
+
     def get_stats(self) -> Dict[str, Any]:
         """
         Get statistics about stored data
@@ -206,25 +352,11 @@ class SupabaseLoader:
             Dictionary with statistics
         """
         try:
-            # Count documents
-            doc_response = self.client.table(self.table_documents).select(
-                'id', count='exact'
-            ).execute()
-
-            # Count chunks
-            chunk_response = self.client.table(self.table_chunks).select(
-                'id', count='exact'
-            ).execute()
-
-            # Count semantic terms
-            terms_response = self.client.table(self.table_semantic).select(
-                'id', count='exact'
-            ).execute()
-
             return {
-                'total_documents': doc_response.count if hasattr(doc_response, 'count') else 0,
-                'total_chunks': chunk_response.count if hasattr(chunk_response, 'count') else 0,
-                'total_semantic_terms': terms_response.count if hasattr(terms_response, 'count') else 0,
+                'total_documents': self.count_rows(self.table_documents),
+                'total_chunks': self.count_rows(self.table_chunks),
+                'total_semantic_terms': self.count_rows(self.table_semantic),
+                'total_relations': self.count_rows(self.table_relations),
             }
 
         except Exception as e:
@@ -233,4 +365,46 @@ class SupabaseLoader:
                 'total_documents': 0,
                 'total_chunks': 0,
                 'total_semantic_terms': 0,
+                'total_relations': 0,
+            }
+
+    def get_detailed_stats(self) -> Dict[str, Any]:
+        """
+        Get counts, orphan counts and category/predicate histograms
+
+        Reads the server-side aggregate views (see
+        supabase/migrations/20261016_stats_views.sql), three small requests
+        in total. Falls back to per-table HEAD counts when the table stats
+        view is not installed.
+
+        Returns:
+            Dictionary with 'counts', 'orphans', 'categories', 'predicates'
+        """
+        stats = {'counts': {}, 'orphans': {}, 'categories': [], 'predicates': []}
+
+        try:
+            response = self.client.table(self.VIEW_TABLE_STATS).select('*').limit(1).execute()
+            row = response.data[0] if response.data else {}
+            stats['counts'] = {key: row.get(key, 0) for key in self.COUNT_COLUMNS}
+            stats['orphans'] = {key: row.get(key, 0) for key in self.ORPHAN_COLUMNS}
+        except Exception as e:
+            logger.warning(f"{self.VIEW_TABLE_STATS} unavailable ({e}), falling back to row counts")
+            basic = self.get_stats()
+            stats['counts'] = {
+                'total_documents': basic['total_documents'],
+                'total_chunks': basic['total_chunks'],
+                'total_semantic_terms': basic['total_semantic_terms'],
+                'total_relations': basic['total_relations'],
             }
+
+        for key, view, order_by in (
+            ('categories', self.VIEW_CATEGORY_STATS, 'term_count'),
+            ('predicates', self.VIEW_PREDICATE_STATS, 'relation_count'),
+        ):
+            try:
+                response = self.client.table(view).select('*').order(order_by, desc=True).execute()
+                stats[key] = response.data or []
+            except Exception as e:
+                logger.error(f"Failed to read {view}: {e}")
+
+        return stats
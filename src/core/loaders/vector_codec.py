@@ -0,0 +1,90 @@
+"""
+Compact embedding serialization for PostgREST uploads
+
+pgvector parses vectors from their text form ("[0.1,-0.2,...]"), so an
+embedding can be sent as one JSON string instead of a JSON array of Python
+floats. Python's float repr uses 17 significant digits; the vector column
+stores float32 or, for halfvec columns, float16, so anything past the
+digits needed to identify the stored value is wasted bytes.
+
+Components are rounded to the column type first and then printed with
+enough digits to round-trip that type, so the database stores exactly the
+value it would have stored from the full-precision JSON float.
+"""
+import struct
+from functools import lru_cache
+from typing import List, Sequence, Union
+
+
+# Significant digits that round-trip every value of the column type exactly
+FLOAT32_DIGITS = 9
+FLOAT16_DIGITS = 5
+
+# struct codes of the column types, keyed by their round-trip digits
+_STORAGE_CODES = {FLOAT32_DIGITS: 'f', FLOAT16_DIGITS: 'e'}
+
+
+@lru_cache(maxsize=8)
+def _vector_format(dims: int, digits: int) -> str:
+    # One %-format for the whole vector: a single C-level call per encode
+    return '[' + ','.join([f'%.{digits}g'] * dims) + ']'
+
+
+def _round_to_storage(values: Sequence[float], code: str) -> tuple:
+    """Round components to float32 ('f') or float16 ('e') in one C-level pass"""
+    fmt = f'{len(values)}{code}'
+    return struct.unpack(fmt, struct.pack(fmt, *values))
+
+
+def encode_vector(values: Sequence[float], digits: int = FLOAT32_DIGITS) -> str:
+    """
+    Encode a vector in pgvector text form
+
+    With FLOAT32_DIGITS / FLOAT16_DIGITS the components are first rounded to
+    float32 / float16, so the text parses back to exactly that value.
+
+    Args:
+        values: Vector components
+        digits: Significant digits per component
+
+    Returns:
+        Text such as "[0.0123456791,-0.00234567886]"
+    """
+    code = _STORAGE_CODES.get(digits)
+    components = _round_to_storage(values, code) if code else tuple(values)
+    return _vector_format(len(values), digits) % components
+
+
+def decode_vector(text: str) -> List[float]:
+    """
+    Parse pgvector text form (as returned by PostgREST for vector columns)
+
+    Args:
+        text: "[x,y,...]"
+
+    Returns:
+        Vector components
+    """
+    text = text.strip()[1:-1]
+    return [float(value) for value in text.split(',')] if text else []
+
+
+def embedding_payload(
+    values: Sequence[float],
+    upload_format: str = "text",
+    half_precision: bool = False
+) -> Union[str, List[float]]:
+    """
+    Value to send for a vector column
+
+    Args:
+        values: Embedding
+        upload_format: "text" (pgvector text form) or "json" (list of floats)
+        half_precision: Encode at float16 precision (halfvec columns)
+
+    Returns:
+        Encoded text, or the list itself for "json"
+    """
+    if upload_format == "json":
+        return list(values)
+    return encode_vector(values, FLOAT16_DIGITS if half_precision else FLOAT32_DIGITS)
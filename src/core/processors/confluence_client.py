@@ -0,0 +1,219 @@
+"""
+Async Confluence REST client (httpx keep-alive pool, bounded concurrency)
+"""
+import asyncio
+import logging
+import threading
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple, TypeVar
+
+import httpx
+
+from src.shared.rate_limit import ServiceLimiter, is_rate_limited, retry_after_from_error
+
+
+logger = logging.getLogger("playbook_nexus.confluence")
+
+T = TypeVar("T")
+
+# (page_id, raw page JSON) -> processed page dict
+PageBuilder = Callable[[str, Dict[str, Any]], Optional[Dict[str, Any]]]
+
+PAGE_EXPAND = "body.storage,version,space,ancestors"
+
+
+class AsyncConfluenceClient:
+    """
+    asyncio Confluence client
+
+    One httpx.AsyncClient (HTTP/1.1 keep-alive pool sized to max_concurrency)
+    is shared by all requests; a semaphore bounds in-flight requests. A 429
+    waits for the server's Retry-After (falling back to exponential backoff)
+    and is reported to the shared rate limiter, if any.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        email: str,
+        api_token: str,
+        max_concurrency: int = 4,
+        max_retries: int = 3,
+        backoff_base: float = 0.5,
+        timeout: float = 30.0,
+        rate_limiter: Optional[ServiceLimiter] = None,
+        page_builder: Optional[PageBuilder] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None
+    ):
+        """
+        Args:
+            base_url: Confluence base URL (e.g. https://x.atlassian.net/wiki)
+            email: User email for authentication
+            api_token: API token for authentication
+            max_concurrency: Maximum in-flight requests (also the pool size)
+            max_retries: Attempts per request
+            backoff_base: Backoff unit in seconds (2 ** attempt * backoff_base)
+            timeout: Request timeout in seconds
+            rate_limiter: Shared limiter (acquired before each request, adapts on 429)
+            page_builder: Converts raw page JSON for fetch_pages, run in a worker
+                thread (e.g. ConfluenceProcessor.build_page_data; None = yield raw JSON)
+            transport: Custom httpx transport (tests)
+        """
+        self.base_url = base_url.rstrip('/')
+        self.max_concurrency = max(1, max_concurrency)
+        self.max_retries = max(1, max_retries)
+        self.backoff_base = backoff_base
+        self.rate_limiter = rate_limiter
+        self.page_builder = page_builder
+
+        self._client = httpx.AsyncClient(
+            auth=httpx.BasicAuth(email, api_token),
+            timeout=timeout,
+            limits=httpx.Limits(
+                max_connections=self.max_concurrency,
+                max_keepalive_connections=self.max_concurrency
+            ),
+            transport=transport
+        )
+        # Created lazily: must belong to the loop that runs the requests
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphore
+
+    async def get_json(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        label: str = "resource",
+        timeout: Optional[float] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        GET a Confluence REST endpoint with retry logic
+
+        Args:
+            url: Endpoint URL
+            params: Query parameters
+            label: What is being fetched (for log messages)
+            timeout: Per-request timeout override
+
+        Returns:
+            Response JSON or None if failed
+        """
+        request_timeout = timeout if timeout is not None else httpx.USE_CLIENT_DEFAULT
+
+        for attempt in range(self.max_retries):
+            try:
+                async with self._get_semaphore():
+                    if self.rate_limiter:
+                        await asyncio.to_thread(self.rate_limiter.acquire)
+                    response = await self._client.get(url, params=params, timeout=request_timeout)
+                    response.raise_for_status()
+
+                if self.rate_limiter:
+                    self.rate_limiter.on_success()
+                return response.json()
+
+            except httpx.HTTPError as e:
+                logger.warning(
+                    f"Attempt {attempt + 1}/{self.max_retries} failed for {label}: {e}"
+                )
+                retry_after = None
+                if is_rate_limited(e):
+                    retry_after = retry_after_from_error(e)
+                    if self.rate_limiter:
+                        # The limiter blocks the next acquire() until Retry-After
+                        self.rate_limiter.on_rate_limited(retry_after)
+                        retry_after = 0.0
+
+                if attempt < self.max_retries - 1:
+                    # Exponential backoff (or server-provided Retry-After)
+                    wait_time = retry_after if retry_after is not None else (2 ** attempt) * self.backoff_base
+                    logger.debug(f"Waiting {wait_time:.2f}s before retry...")
+                    await asyncio.sleep(wait_time)
+                else:
+                    logger.error(f"Failed to fetch {label} after {self.max_retries} attempts")
+                    return None
+
+            except Exception as e:
+                logger.error(f"Unexpected error fetching {label}: {e}")
+                return None
+
+        return None
+
+    async def get_page(self, page_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Fetch raw page JSON (body, version, space, ancestors)
+
+        Args:
+            page_id: Confluence page ID
+
+        Returns:
+            Page JSON or None if failed
+        """
+        return await self.get_json(
+            f"{self.base_url}/rest/api/content/{page_id}",
+            {"expand": PAGE_EXPAND},
+            f"page {page_id}"
+        )
+
+    async def fetch_pages(
+        self,
+        page_ids: List[str]
+    ) -> AsyncIterator[Tuple[str, Optional[Dict[str, Any]]]]:
+        """
+        Fetch pages concurrently, yielding as each completes
+
+        Args:
+            page_ids: Confluence page IDs
+
+        Yields:
+            (page_id, processed page dict or None if failed) in completion order
+            (raw page JSON when no page_builder is set)
+        """
+        async def fetch(page_id: str) -> Tuple[str, Optional[Dict[str, Any]]]:
+            raw = await self.get_page(page_id)
+            if raw is None or self.page_builder is None:
+                return page_id, raw
+            # Parsing and caching are CPU/disk work: keep them off the event loop
+            return page_id, await asyncio.to_thread(self.page_builder, page_id, raw)
+
+        # Semaphore bounds the requests; tasks are cheap
+        tasks = [asyncio.ensure_future(fetch(page_id)) for page_id in page_ids]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def aclose(self):
+        await self._client.aclose()
+
+
+class EventLoopThread:
+    """
+    Background event loop for calling async code from synchronous threads
+
+    Many threads may call run() at once; they share the loop (and therefore
+    one connection pool).
+    """
+
+    def __init__(self, name: str = "confluence-io"):
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name=name, daemon=True)
+        self._thread.start()
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        return self._loop
+
+    def run(self, coro: Awaitable[T]) -> T:
+        """Run a coroutine on the loop and wait for its result"""
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+
+    def stop(self):
+        if self._loop.is_running():
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join(timeout=5)
@@ -1,28 +1,45 @@
 """
 Confluence API processor for downloading and converting pages
 """
+import asyncio
 import logging
-import time
-import requests
-from typing import Dict, Optional, Any
+import queue
+from typing import Dict, Iterator, List, Optional, Any, Tuple
 from bs4 import BeautifulSoup
-from requests.auth import HTTPBasicAuth
 
 from src.shared.config import Config
+from src.shared.rate_limit import ServiceLimiter
+from src.core.cache import PageCache
+from .confluence_client import AsyncConfluenceClient, EventLoopThread
+from .storage_text import storage_to_text
 
 
 logger = logging.getLogger("playbook_nexus.confluence")
 
 
 class ConfluenceProcessor:
-    """Process Confluence pages via REST API"""
+    """
+    Process Confluence pages via REST API
+
+    Synchronous wrapper around AsyncConfluenceClient: requests run on a
+    background event loop, so every thread calling get_page/process_page
+    shares one keep-alive connection pool and concurrency limit.
+
+    Raw page JSON is cached on disk by (page_id, version). Versions become
+    known through list_page_versions; in offline mode pages are served from
+    the cache only and Confluence is never contacted.
+    """
 
     def __init__(
         self,
         base_url: str = None,
         email: str = None,
         api_token: str = None,
-        max_retries: int = None
+        max_retries: int = None,
+        rate_limiter: Optional[ServiceLimiter] = None,
+        max_concurrency: int = None,
+        page_cache: Optional[PageCache] = None,
+        offline: bool = None
     ):
         """
         Initialize Confluence processor
@@ -32,19 +49,74 @@ class ConfluenceProcessor:
             email: User email for authentication
             api_token: API token for authentication
             max_retries: Maximum number of retries on failure
+            rate_limiter: Shared limiter (acquired before each request, adapts on 429)
+            max_concurrency: Maximum in-flight requests (None = Config.CONFLUENCE_CONCURRENCY)
+            page_cache: Raw page cache (None = Config.PAGE_CACHE_FILE if
+                PAGE_CACHE_ENABLED)
+            offline: Serve pages from page_cache only (None = Config.CONFLUENCE_OFFLINE)
         """
         self.base_url = (base_url or Config.CONFLUENCE_URL).rstrip('/')
         self.email = email or Config.CONFLUENCE_EMAIL
         self.api_token = api_token or Config.CONFLUENCE_API_TOKEN
         self.max_retries = max_retries or Config.CONFLUENCE_MAX_RETRIES
         self.rate_limit_delay = Config.CONFLUENCE_RATE_LIMIT_DELAY
+        self.rate_limiter = rate_limiter
+        self.text_extractor = Config.CONFLUENCE_TEXT_EXTRACTOR
+        self.offline = Config.CONFLUENCE_OFFLINE if offline is None else offline
 
-        if not all([self.base_url, self.email, self.api_token]):
+        if not self.offline and not all([self.base_url, self.email, self.api_token]):
             raise ValueError("Confluence credentials not properly configured")
 
-        self.auth = HTTPBasicAuth(self.email, self.api_token)
-        self.session = requests.Session()
-        self.session.auth = self.auth
+        if page_cache is None and Config.PAGE_CACHE_ENABLED:
+            try:
+                page_cache = PageCache(
+                    Config.PAGE_CACHE_FILE,
+                    max_bytes=Config.PAGE_CACHE_MAX_MB * 1024 * 1024
+                )
+            except Exception as e:
+                logger.warning(f"Page cache disabled: {e}")
+        self.page_cache = page_cache
+        if self.offline and self.page_cache is None:
+            logger.warning("Offline mode without a page cache: no pages can be loaded")
+
+        # page_id -> current version number (filled by list_page_versions)
+        self.known_versions: Dict[str, int] = {}
+
+        self.client = AsyncConfluenceClient(
+            self.base_url,
+            self.email or '',
+            self.api_token or '',
+            max_concurrency=max_concurrency or Config.CONFLUENCE_CONCURRENCY,
+            max_retries=self.max_retries,
+            backoff_base=self.rate_limit_delay,
+            rate_limiter=rate_limiter,
+            page_builder=self._cache_and_build
+        )
+        self._io = EventLoopThread()
+
+    def close(self):
+        """Close the connection pool and stop the background event loop"""
+        self._io.run(self.client.aclose())
+        self._io.stop()
+        if self.page_cache is not None:
+            self.page_cache.close()
+
+    def _get_cached(self, page_id: str) -> Optional[Dict[str, Any]]:
+        """Cached page JSON for the known version (newest cached version when offline)"""
+        if self.page_cache is None:
+            return None
+
+        version = self.known_versions.get(page_id)
+        if version is None and not self.offline:
+            # Unknown current version: a cached copy may be stale
+            return None
+        return self.page_cache.get(page_id, version)
+
+    def _cache_and_build(self, page_id: str, page_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """page_builder for the async client: cache the raw page, then convert it"""
+        if self.page_cache is not None:
+            self.page_cache.put(page_id, page_data)
+        return self.build_page_data(page_id, page_data)
 
     def get_page(self, page_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -56,39 +128,135 @@ class ConfluenceProcessor:
         Returns:
             Page data dictionary or None if failed
         """
-        url = f"{self.base_url}/rest/api/content/{page_id}"
-        params = {
-            "expand": "body.storage,version,space,ancestors"
-        }
+        cached = self._get_cached(page_id)
+        if cached is not None:
+            return cached
+
+        if self.offline:
+            logger.warning(f"Page {page_id} is not in the page cache (offline mode)")
+            return None
+
+        page_data = self._io.run(self.client.get_page(page_id))
+        if page_data is not None and self.page_cache is not None:
+            self.page_cache.put(page_id, page_data)
+        return page_data
+
+    def _get_json(self, url: str, params: Dict[str, Any], label: str) -> Optional[Dict[str, Any]]:
+        """GET a Confluence REST endpoint with retry logic (None if failed)"""
+        return self._io.run(self.client.get_json(url, params, label))
+
+    def fetch_pages(self, page_ids: List[str]) -> Iterator[Tuple[str, Optional[Dict[str, Any]]]]:
+        """
+        Fetch and process pages concurrently, yielding as each completes
+
+        Args:
+            page_ids: Confluence page IDs
 
-        for attempt in range(self.max_retries):
+        Yields:
+            (page_id, processed page data or None if failed); cached pages
+            first, then downloads in completion order
+        """
+        missing = []
+        for page_id in page_ids:
+            cached = self._get_cached(page_id)
+            if cached is not None:
+                yield page_id, self.build_page_data(page_id, cached)
+            else:
+                missing.append(page_id)
+
+        if self.offline:
+            for page_id in missing:
+                logger.warning(f"Page {page_id} is not in the page cache (offline mode)")
+                yield page_id, None
+            return
+
+        results: queue.Queue = queue.Queue()
+        done = object()
+
+        async def produce():
             try:
-                response = self.session.get(url, params=params, timeout=30)
-                response.raise_for_status()
-                return response.json()
+                async for item in self.client.fetch_pages(missing):
+                    results.put(item)
+            finally:
+                results.put(done)
+
+        future = asyncio.run_coroutine_threadsafe(produce(), self._io.loop)
+        try:
+            while True:
+                item = results.get()
+                if item is done:
+                    break
+                yield item
+        finally:
+            future.cancel()
+
+    def list_page_versions(
+        self,
+        page_ids: List[str],
+        modified_since: Optional[str] = None,
+        batch_size: int = 50
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Fetch version numbers for many pages via CQL search (no page bodies)
 
-            except requests.exceptions.RequestException as e:
-                logger.warning(
-                    f"Attempt {attempt + 1}/{self.max_retries} failed for page {page_id}: {e}"
+        Args:
+            page_ids: Confluence page IDs
+            modified_since: Optional "yyyy-MM-dd" lower bound on lastmodified
+                (pages not modified since are omitted)
+            batch_size: Page IDs per CQL query
+
+        Returns:
+            page_id -> {'version': number, 'when': timestamp}; pages that were
+            not found (deleted, no access) are missing from the result.
+            Offline, the cached versions are returned.
+        """
+        if self.offline:
+            cached = self.page_cache.versions(page_ids) if self.page_cache is not None else {}
+            self.known_versions.update(cached)
+            return {page_id: {'version': version, 'when': ''} for page_id, version in cached.items()}
+
+        url = f"{self.base_url}/rest/api/content/search"
+        versions: Dict[str, Dict[str, Any]] = {}
+
+        for i in range(0, len(page_ids), batch_size):
+            batch = page_ids[i:i + batch_size]
+            cql = f"id in ({','.join(batch)})"
+            if modified_since:
+                cql += f' and lastmodified >= "{modified_since}"'
+
+            start = 0
+            while True:
+                data = self._get_json(
+                    url,
+                    {"cql": cql, "expand": "version", "limit": batch_size, "start": start},
+                    f"page versions (batch {i // batch_size + 1})"
                 )
-                if attempt < self.max_retries - 1:
-                    # Exponential backoff with rate limit delay
-                    wait_time = (2 ** attempt) * self.rate_limit_delay
-                    logger.debug(f"Waiting {wait_time:.2f}s before retry...")
-                    time.sleep(wait_time)
-                else:
-                    logger.error(f"Failed to fetch page {page_id} after {self.max_retries} attempts")
-                    return None
+                if data is None:
+                    raise RuntimeError(f"Failed to list page versions (batch {i // batch_size + 1})")
 
-            except Exception as e:
-                logger.error(f"Unexpected error fetching page {page_id}: {e}")
-                return None
+                results = data.get('results', [])
+                for page in results:
+                    version = page.get('version', {})
+                    versions[str(page.get('id'))] = {
+                        'version': version.get('number', 0),
+                        'when': version.get('when', ''),
+                    }
+
+                if not results or not data.get('_links', {}).get('next'):
+                    break
+                start += len(results)
 
-        return None
+        self.known_versions.update({page_id: v['version'] for page_id, v in versions.items()})
+        logger.info(f"Fetched versions for {len(versions)}/{len(page_ids)} pages")
+        return versions
 
     def extract_text_from_html(self, html: str) -> str:
         """
-        Extract clean text from Confluence HTML (basic version)
+        Extract clean text from Confluence HTML
+
+        Uses BeautifulSoup by default. With CONFLUENCE_TEXT_EXTRACTOR=lxml the
+        streaming lxml converter is used instead (Markdown headings, one line
+        per table row), falling back to BeautifulSoup if it fails.
 
         Args:
             html: HTML content
@@ -99,6 +267,16 @@ class ConfluenceProcessor:
         if not html:
             return ""
 
+        if self.text_extractor == 'lxml':
+            try:
+                return storage_to_text(html)
+            except Exception as e:
+                logger.warning(f"Streaming HTML extraction failed, falling back to BeautifulSoup: {e}")
+
+        return self._extract_text_soup(html)
+
+    def _extract_text_soup(self, html: str) -> str:
+        """Extract text with BeautifulSoup (basic version)"""
         try:
             soup = BeautifulSoup(html, 'html.parser')
 
@@ -135,6 +313,19 @@ class ConfluenceProcessor:
         if not page_data:
             return None
 
+        return self.build_page_data(page_id, page_data)
+
+    def build_page_data(self, page_id: str, page_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Convert raw page JSON into processed page data
+
+        Args:
+            page_id: Confluence page ID
+            page_data: Page JSON from get_page
+
+        Returns:
+            Processed page data or None if failed
+        """
         try:
             # Extract basic metadata
             title = page_data.get('title', '')
@@ -191,12 +382,18 @@ class ConfluenceProcessor:
         Returns:
             True if connection successful, False otherwise
         """
+        if self.offline:
+            cached = len(self.page_cache) if self.page_cache is not None else 0
+            logger.info(f"Confluence offline mode: {cached} pages in page cache")
+            return cached > 0
+
         try:
             url = f"{self.base_url}/rest/api/content"
             params = {"limit": 1}
 
-            response = self.session.get(url, params=params, timeout=10)
-            response.raise_for_status()
+            data = self._io.run(self.client.get_json(url, params, "connection test", timeout=10))
+            if data is None:
+                raise RuntimeError("no response")
 
             logger.info("Confluence API connection successful")
             return True
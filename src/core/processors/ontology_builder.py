@@ -14,26 +14,30 @@ playbook_ontology_rules와 대조하여 검증된 관계를 playbook_semantic_re
 """
 import sys
 import logging
+import threading
 import time
 import re
 from typing import List, Dict, Any, Tuple, Optional
-from collections import defaultdict
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 import json
 
 from src.shared.config import Config
 from src.shared.utils import setup_logging
 from src.core.loaders.supabase_loader import SupabaseLoader
+from src.core.loaders.pagination import KeysetPaginator, chunked, fetch_all, iter_rows
 from src.core.rules.relation_classifier import RelationClassifier
+from src.core.rules.ontology import CompiledOntology
+from src.shared.term_spotter import AhoCorasick
 
 logger = setup_logging()
 
-
 # ============================================================================
 # [v3.1] Document Recency Weight Calculation
 # ============================================================================
 
-def calculate_recency_weight(last_updated: str) -> float:
+def calculate_recency_weight(last_updated: str, reference_time: Optional[datetime] = None) -> float:
     """
     문서 최신성 기반 가중치 계산 (2026-02-01 기준 최근 1년)
 
@@ -41,6 +45,7 @@ def calculate_recency_weight(last_updated: str) -> float:
 
     Args:
         last_updated: ISO 8601 형식의 문서 업데이트 일자
+        reference_time: 기준 시각 (None = 현재 시각, 한 번의 실행에서는 같은 값을 넘겨 결과 고정)
 
     Returns:
         가중치 (1.0 ~ 1.5)
@@ -53,7 +58,7 @@ def calculate_recency_weight(last_updated: str) -> float:
         - 1년 이상 (74.2%): 1.0x (기본값)
     """
     try:
-        now = datetime.now(timezone.utc)
+        now = reference_time or datetime.now(timezone.utc)
 
         # ISO 8601 파싱
         doc_date = datetime.fromisoformat(last_updated.replace('Z', '+00:00'))
@@ -115,17 +120,25 @@ def normalize_term(term: str) -> str:
     return normalized
 
 
-def fuzzy_match_term(query_term: str, candidate_terms: Dict[str, Any]) -> Optional[Dict]:
+def fuzzy_match_term(
+    query_term: str,
+    candidate_terms: Dict[str, Any],
+    index: Optional["CandidateIndex"] = None
+) -> Optional[Dict]:
     """
     Fuzzy matching으로 가장 유사한 용어 찾기
 
     Args:
         query_term: 찾고자 하는 용어
         candidate_terms: {normalized_key: term_object} 딕셔너리
+        index: candidate_terms로 만든 CandidateIndex (있으면 선형 탐색 대신 사용, 결과 동일)
 
     Returns:
         매칭된 term object 또는 None
     """
+    if index is not None and index.is_current(candidate_terms):
+        return index.match(query_term)[0]
+
     normalized_query = normalize_term(query_term)
 
     # 1. Exact match (normalized)
@@ -141,16 +154,126 @@ def fuzzy_match_term(query_term: str, candidate_terms: Dict[str, Any]) -> Option
     return None
 
 
+class CandidateIndex:
+    """
+    Index-backed fuzzy_match_term over a fixed candidate dictionary
+
+    fuzzy_match_term returns the exact key, else the first key (in
+    dictionary order) that contains the query or is contained in it. Both
+    directions are answered without scanning every key:
+
+    - query in key: 1-gram/2-gram postings (key positions, ascending); the
+      smallest posting list of the query's n-grams is verified in order, so
+      the first hit is the earliest containing key
+    - key in query: Aho-Corasick automaton over all keys, one pass over the
+      query; the smallest matching key position wins
+
+    The earlier of the two positions is the linear scan's answer. Values are
+    read from the dictionary at match time, so replacing a candidate under
+    an existing key needs no rebuild; adding keys does (see is_current).
+    """
+
+    def __init__(self, candidate_terms: Dict[str, Any]):
+        """
+        Args:
+            candidate_terms: {normalized_key: term_object} dictionary
+        """
+        self.candidate_terms = candidate_terms
+        self.keys: List[str] = list(candidate_terms)
+
+        self._postings: Dict[str, List[int]] = defaultdict(list)
+        for position, key in enumerate(self.keys):
+            grams = set(key) | {key[i:i + 2] for i in range(len(key) - 1)}
+            for gram in grams:
+                self._postings[gram].append(position)
+
+        self._automaton = AhoCorasick(self.keys)
+
+        # Match method -> count (exact / query_in_candidate / candidate_in_query / miss)
+        self.hits: Counter = Counter()
+        self._hits_lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def is_current(self, candidate_terms: Dict[str, Any]) -> bool:
+        """True if built over this dictionary and no keys were added since"""
+        return candidate_terms is self.candidate_terms and len(candidate_terms) == len(self.keys)
+
+    def _first_containing(self, query: str) -> Optional[int]:
+        """Position of the first key that contains query"""
+        if len(query) == 1:
+            grams = [query]
+        else:
+            grams = [query[i:i + 2] for i in range(len(query) - 1)]
+
+        postings = []
+        for gram in grams:
+            posting = self._postings.get(gram)
+            if not posting:
+                return None
+            postings.append(posting)
+
+        for position in min(postings, key=len):
+            if query in self.keys[position]:
+                return position
+        return None
+
+    def _first_contained(self, query: str) -> Optional[int]:
+        """Position of the first key that occurs in query"""
+        return min((key_id for _, key_id in self._automaton.iter_matches(query)), default=None)
+
+    def match(self, query_term: str) -> Tuple[Optional[Dict], str]:
+        """
+        Find the candidate fuzzy_match_term would return
+
+        Args:
+            query_term: 찾고자 하는 용어
+
+        Returns:
+            (matched term object or None, match method)
+        """
+        normalized_query = normalize_term(query_term)
+
+        if normalized_query in self.candidate_terms:
+            result, method = self.candidate_terms[normalized_query], "exact"
+        elif not self.keys:
+            result, method = None, "miss"
+        elif not normalized_query:
+            # An empty query is a substring of every key
+            result, method = self.candidate_terms[self.keys[0]], "query_in_candidate"
+        else:
+            containing = self._first_containing(normalized_query)
+            contained = self._first_contained(normalized_query)
+            if containing is None and contained is None:
+                result, method = None, "miss"
+            elif contained is None or (containing is not None and containing < contained):
+                result, method = self.candidate_terms[self.keys[containing]], "query_in_candidate"
+            else:
+                result, method = self.candidate_terms[self.keys[contained]], "candidate_in_query"
+
+        with self._hits_lock:
+            self.hits[method] += 1
+        return result, method
+
+
 class OntologyBuilder:
     """Build knowledge graph from semantic terms with ontology validation"""
 
-    def __init__(self):
-        """Initialize ontology builder"""
-        self.supabase = SupabaseLoader()
+    def __init__(self, supabase: Optional[SupabaseLoader] = None):
+        """
+        Initialize ontology builder
+
+        Args:
+            supabase: Loader to read and write through (None = new SupabaseLoader())
+        """
+        self.supabase = supabase or SupabaseLoader()
 
         # Cache for ontology rules and terms
         self.ontology_rules: Dict[Tuple[str, str, str], Dict] = {}
         self.valid_predicates: set = set()
+        # Compiled from ontology_rules (predicate -> subject -> object, wildcards, aliases)
+        self.ontology: Optional[CompiledOntology] = None
         self.terms_by_doc: Dict[str, List[Dict]] = defaultdict(list)
         self.terms_by_id: Dict[str, Dict] = {}
         self.terms_by_name: Dict[str, Dict] = {}  # doc_id:term -> term object mapping
@@ -158,6 +281,13 @@ class OntologyBuilder:
         # [FIX 2C] Global term candidates (normalized_term -> term_object)
         # 문서 간 연결을 위해 전체 문서의 자주 등장하는 용어를 글로벌 후보로 관리
         self.global_term_candidates: Dict[str, Dict] = {}  # normalized_term -> term object
+        self.global_candidate_index: Optional[CandidateIndex] = None
+
+        # [v3.1] Document metadata for recency weighting (doc_id -> value)
+        # build_graph 시작 시 한 번에 조회, 모든 문서를 같은 기준 시각으로 계산
+        self.doc_last_updated: Dict[str, Optional[str]] = {}
+        self.doc_recency_weights: Dict[str, float] = {}
+        self.reference_time: Optional[datetime] = None
 
         logger.info("OntologyBuilder initialized")
 
@@ -169,11 +299,11 @@ class OntologyBuilder:
             Number of rules loaded
         """
         try:
-            response = self.supabase.client.table('playbook_ontology_rules').select(
+            rules = fetch_all(
+                self.supabase.client,
+                'playbook_ontology_rules',
                 'id,subject_type,predicate,object_type,description'
-            ).execute()
-
-            rules = response.data if hasattr(response, 'data') else []
+            )
 
             for rule in rules:
                 key = (
@@ -184,6 +314,8 @@ class OntologyBuilder:
                 self.ontology_rules[key] = rule
                 self.valid_predicates.add(rule['predicate'].lower())
 
+            self.ontology = CompiledOntology(rules, derive_aliases=Config.ONTOLOGY_PREDICATE_ALIASES)
+
             logger.info(f"Loaded {len(rules)} ontology rules")
             logger.debug(f"Valid predicates: {sorted(self.valid_predicates)}")
             return len(rules)
@@ -196,6 +328,11 @@ class OntologyBuilder:
         """
         Load semantic terms from playbook_semantic_terms table
 
+        With doc_ids, only those documents' terms are loaded for processing,
+        but global candidates still come from every document (see
+        load_global_candidates), so their relations can target terms of
+        documents outside the scope.
+
         Args:
             doc_ids: Optional list of document IDs to filter
 
@@ -203,63 +340,143 @@ class OntologyBuilder:
             Number of terms loaded
         """
         try:
-            # Load all terms with pagination to avoid 1000 record limit
-            all_terms = []
-            page_size = 1000
-            page = 0
-
             logger.info("Loading semantic terms with pagination...")
 
-            while True:
-                query = self.supabase.client.table('playbook_semantic_terms').select(
-                    'id,doc_id,term,category,definition,frequency,confidence,raw_relations'
-                ).range(page * page_size, (page + 1) * page_size - 1)
-
-                if doc_ids:
-                    query = query.in_('doc_id', doc_ids)
-
-                response = query.execute()
-                batch = response.data if hasattr(response, 'data') else []
-
-                if not batch:
-                    break
-
-                all_terms.extend(batch)
-                logger.info(f"Loaded page {page + 1}: {len(batch)} terms (total: {len(all_terms)})")
-                page += 1
-
-                # Stop if we got less than a full page (means we're done)
-                if len(batch) < page_size:
-                    break
-
-            # Index by document, ID, and term name
-            for term in all_terms:
-                self.terms_by_doc[term['doc_id']].append(term)
-                self.terms_by_id[term['id']] = term
-
-                # Also index by term name (lowercase) for lookup
-                term_name_key = f"{term['doc_id']}:{term['term'].lower()}"
-                self.terms_by_name[term_name_key] = term
-
-                # [FIX 2C] Build global term candidates (normalized)
-                # 빈도가 높거나 confidence가 높은 용어를 글로벌 후보로 추가
-                if term.get('frequency', 0) >= 2 or term.get('confidence', 0) >= 0.8:
-                    normalized_term = normalize_term(term['term'])
-                    if normalized_term:
-                        # 같은 normalized term이 여러 문서에 있을 수 있으므로,
-                        # frequency가 더 높은 것을 우선 선택
-                        existing = self.global_term_candidates.get(normalized_term)
-                        if not existing or term.get('frequency', 0) > existing.get('frequency', 0):
-                            self.global_term_candidates[normalized_term] = term
-
-            logger.info(f"Loaded {len(all_terms)} semantic terms from {len(self.terms_by_doc)} documents")
+            # One scan per chunk of documents (keeps the in_() filter URL short)
+            doc_chunks = chunked(doc_ids) if doc_ids else [None]
+
+            total = 0
+            page_number = 0
+            for chunk in doc_chunks:
+                scan = KeysetPaginator(
+                    self.supabase.client,
+                    'playbook_semantic_terms',
+                    'id,doc_id,term,category,definition,frequency,confidence,raw_relations',
+                    filters=(lambda query, chunk=chunk: query.in_('doc_id', chunk)) if chunk else None
+                )
+                for page in scan.pages():
+                    page_number += 1
+                    total += len(page)
+                    self._index_terms(page, global_candidates=not doc_ids)
+                    logger.info(f"Loaded page {page_number}: {len(page)} terms (total: {total})")
+
+            logger.info(f"Loaded {total} semantic terms from {len(self.terms_by_doc)} documents")
+            if doc_ids:
+                self.load_global_candidates()
             logger.info(f"Built {len(self.global_term_candidates)} global term candidates for cross-document matching")
-            return len(all_terms)
+            return total
 
         except Exception as e:
             logger.error(f"Failed to load semantic terms: {e}")
             raise
 
+    def load_global_candidates(self) -> int:
+        """
+        Build global term candidates from the terms of all documents
+
+        Used when only some documents are processed: one scan without
+        raw_relations, in the same key order as the full load, so the
+        candidates are identical to those of an unscoped run.
+
+        Returns:
+            Number of terms scanned
+        """
+        scan = KeysetPaginator(
+            self.supabase.client,
+            'playbook_semantic_terms',
+            'id,doc_id,term,category,definition,frequency,confidence'
+        )
+
+        total = 0
+        for page in scan.pages():
+            total += len(page)
+            for term in page:
+                self._add_global_candidate(term)
+        return total
+
+    def _index_terms(self, terms: List[Dict], global_candidates: bool = True):
+        """Index a page of semantic terms by document, ID, and term name"""
+        for term in terms:
+            self.terms_by_doc[term['doc_id']].append(term)
+            self.terms_by_id[term['id']] = term
+
+            # Also index by term name (lowercase) for lookup
+            term_name_key = f"{term['doc_id']}:{term['term'].lower()}"
+            self.terms_by_name[term_name_key] = term
+
+            if global_candidates:
+                self._add_global_candidate(term)
+
+    def _add_global_candidate(self, term: Dict):
+        """Add a term to global_term_candidates if it qualifies"""
+        # [FIX 2C] Build global term candidates (normalized)
+        # 빈도가 높거나 confidence가 높은 용어를 글로벌 후보로 추가
+        if term.get('frequency', 0) >= 2 or term.get('confidence', 0) >= 0.8:
+            normalized_term = normalize_term(term['term'])
+            if normalized_term:
+                # 같은 normalized term이 여러 문서에 있을 수 있으므로,
+                # frequency가 더 높은 것을 우선 선택
+                existing = self.global_term_candidates.get(normalized_term)
+                if not existing or term.get('frequency', 0) > existing.get('frequency', 0):
+                    self.global_term_candidates[normalized_term] = term
+
+    def load_document_metadata(self, doc_ids: List[str] = None) -> int:
+        """
+        Load last_updated of documents and precompute their recency weights
+
+        One paginated scan of playbook_documents; weights are computed
+        against self.reference_time (set once per run, so repeated documents
+        and reruns within a build get identical weights).
+
+        Args:
+            doc_ids: Optional list of document IDs to load (None = all documents)
+
+        Returns:
+            Number of documents loaded
+        """
+        if self.reference_time is None:
+            self.reference_time = datetime.now(timezone.utc)
+
+        if doc_ids:
+            # Chunked in_() filters (keeps the URL short for large scoped runs)
+            rows = (
+                row
+                for chunk in chunked(doc_ids)
+                for row in iter_rows(
+                    self.supabase.client, 'playbook_documents', 'id,last_updated',
+                    filters=lambda query, chunk=chunk: query.in_('id', chunk)
+                )
+            )
+        else:
+            rows = iter_rows(self.supabase.client, 'playbook_documents', 'id,last_updated')
+
+        loaded = 0
+        weight_counts = defaultdict(int)
+        for row in rows:
+            last_updated = row.get('last_updated')
+            weight = calculate_recency_weight(last_updated, self.reference_time) if last_updated else 1.0
+            self.doc_last_updated[row['id']] = last_updated
+            self.doc_recency_weights[row['id']] = weight
+            weight_counts[weight] += 1
+            loaded += 1
+
+        # Requested documents without a row get the default weight (no retries per document)
+        for doc_id in doc_ids or []:
+            self.doc_recency_weights.setdefault(doc_id, 1.0)
+
+        logger.info(
+            f"Loaded metadata for {loaded} documents "
+            f"(recency weights: {dict(sorted(weight_counts.items(), reverse=True))})"
+        )
+        return loaded
+
+    def _global_index(self) -> CandidateIndex:
+        """CandidateIndex over global_term_candidates (rebuilt when candidates were added)"""
+        index = self.global_candidate_index
+        if index is None or not index.is_current(self.global_term_candidates):
+            index = self.global_candidate_index = CandidateIndex(self.global_term_candidates)
+        return index
+
     def validate_relationship(
         self,
         source_term: Dict,
@@ -270,6 +487,9 @@ class OntologyBuilder:
         """
         Validate relationship against ontology rules
 
+        Uses the compiled rules (wildcard categories; predicate aliases only
+        with ONTOLOGY_PREDICATE_ALIASES).
+
         Args:
             source_term: Source term dictionary
             predicate: Relationship predicate
@@ -279,24 +499,24 @@ class OntologyBuilder:
         Returns:
             Tuple of (is_valid, reason)
         """
-        source_cat = source_term.get('category', '').lower()
-        target_cat = target_term.get('category', '').lower()
-        pred = predicate.lower()
-
-        # Check if predicate is valid
-        if pred not in self.valid_predicates:
-            return False, f"Invalid predicate '{predicate}'"
-
-        # Check if relationship matches ontology rules
-        rule_key = (source_cat, pred, target_cat)
-        if rule_key not in self.ontology_rules:
-            return False, f"No rule for {source_cat} -{pred}-> {target_cat}"
-
-        # Confidence check (minimum threshold 0.5)
-        if confidence < 0.5:
-            return False, f"Confidence {confidence:.2f} below minimum threshold 0.5"
+        return self._compiled_ontology().validate(
+            source_term.get('category', ''),
+            predicate,
+            target_term.get('category', ''),
+            confidence
+        )
 
-        return True, "Valid"
+    def _compiled_ontology(self) -> CompiledOntology:
+        """Compiled rules (compiled from ontology_rules if they were set directly)"""
+        if self.ontology is None:
+            self.ontology = CompiledOntology(
+                (
+                    dict(rule, subject_type=subject, predicate=predicate, object_type=obj)
+                    for (subject, predicate, obj), rule in self.ontology_rules.items()
+                ),
+                derive_aliases=Config.ONTOLOGY_PREDICATE_ALIASES
+            )
+        return self.ontology
 
     def build_graph_for_document(self, doc_id: str) -> int:
         """
@@ -308,33 +528,48 @@ class OntologyBuilder:
         Returns:
             Number of relationships created
         """
+        validated_relations = self.collect_relations_for_document(doc_id)
+
+        # Insert validated relationships
+        if validated_relations:
+            loaded_count = self.load_relations(validated_relations)
+            logger.info(f"✓ Loaded {loaded_count}/{len(validated_relations)} relationships for document {doc_id}")
+            return loaded_count
+        else:
+            if len(self.terms_by_doc.get(doc_id, [])) >= 2:
+                logger.warning(f"No valid relationships to load for document {doc_id}")
+            return 0
+
+    def collect_relations_for_document(self, doc_id: str) -> List[Dict]:
+        """
+        Match and validate raw_relations of a document (no writes)
+
+        Args:
+            doc_id: Document ID
+
+        Returns:
+            Validated relationship dictionaries, ready for load_relations()
+        """
         terms_in_doc = self.terms_by_doc.get(doc_id, [])
         if len(terms_in_doc) < 2:
             logger.debug(f"Document {doc_id} has fewer than 2 terms, skipping")
-            return 0
+            return []
 
         logger.info(f"Building graph for document {doc_id} ({len(terms_in_doc)} terms)")
 
-        # [v3.1] Get document last_updated for recency weighting
-        doc_last_updated = None
-        recency_weight = 1.0
-        try:
-            response = self.supabase.client.table('playbook_documents')\
-                .select('last_updated')\
-                .eq('id', doc_id)\
-                .single()\
-                .execute()
-
-            if response.data and response.data.get('last_updated'):
-                doc_last_updated = response.data['last_updated']
-                recency_weight = calculate_recency_weight(doc_last_updated)
+        # [v3.1] Recency weight (precomputed by load_document_metadata)
+        if doc_id not in self.doc_recency_weights:
+            try:
+                self.load_document_metadata([doc_id])
+            except Exception as e:
+                logger.warning(f"Failed to get last_updated for doc {doc_id}: {e}")
 
-                # 가중치가 기본값(1.0)이 아닌 경우에만 로그
-                if recency_weight > 1.0:
-                    logger.info(f"Document {doc_id} recency weight: {recency_weight:.2f}x (updated: {doc_last_updated[:10]})")
+        recency_weight = self.doc_recency_weights.get(doc_id, 1.0)
 
-        except Exception as e:
-            logger.warning(f"Failed to get last_updated for doc {doc_id}: {e}")
+        # 가중치가 기본값(1.0)이 아닌 경우에만 로그
+        if recency_weight > 1.0:
+            doc_last_updated = self.doc_last_updated.get(doc_id) or ''
+            logger.info(f"Document {doc_id} recency weight: {recency_weight:.2f}x (updated: {doc_last_updated[:10]})")
 
         # [FIX 2B] Build local normalized candidate dict for current document
         local_candidates = {}
@@ -385,7 +620,9 @@ class OntologyBuilder:
                         match_methods[match_method] += 1
                     else:
                         # Method 3: Fuzzy match in global candidates (cross-document)
-                        target_term = fuzzy_match_term(target_term_name, self.global_term_candidates)
+                        target_term = fuzzy_match_term(
+                            target_term_name, self.global_term_candidates, self._global_index()
+                        )
                         if target_term:
                             match_method = "fuzzy_global"
                             match_methods[match_method] += 1
@@ -449,7 +686,7 @@ class OntologyBuilder:
                 # Prepare validated relation for insertion
                 validated_relations.append({
                     'source_term_id': source_term['id'],
-                    'predicate': predicate,
+                    'predicate': self.ontology.canonical_predicate(predicate),
                     'target_term_id': target_term['id'],
                     'confidence': weighted_confidence,  # 최신성 가중치 적용
                     'evidence_chunk_id': None,  # Can be enriched later if needed
@@ -478,16 +715,100 @@ class OntologyBuilder:
         if skipped_count:
             logger.info(f"Skipped relationships breakdown: {dict(skipped_count)}")
 
-        # Insert validated relationships
-        if validated_relations:
-            loaded_count = self.load_relations(validated_relations)
-            logger.info(f"✓ Loaded {loaded_count}/{len(validated_relations)} relationships for document {doc_id}")
-            return loaded_count
+        return validated_relations
+
+    # Unique key of playbook_semantic_relations (used for bulk upsert)
+    RELATION_KEY_COLUMNS = "source_term_id,target_term_id,predicate"
+
+    @staticmethod
+    def _relation_key(rel: Dict) -> Tuple[str, str, str]:
+        return (rel['source_term_id'], rel['target_term_id'], rel['predicate'])
+
+    @staticmethod
+    def _reinforce(old_record: Dict, rel: Dict) -> Tuple[Dict, float, Optional[int]]:
+        """
+        Apply the reinforcement formula to an existing relationship
+
+        Args:
+            old_record: Stored relationship row
+            rel: Newly observed relationship
+
+        Returns:
+            (update_data, new_conf, occurrence_count or None)
+        """
+        old_conf = old_record['confidence']
+        input_conf = rel['confidence']
+
+        # Reinforcement formula: gradual confidence increase
+        # new_conf = old_conf + (1.0 - old_conf) * (input_conf * 0.2)
+        new_conf = min(1.0, old_conf + (1.0 - old_conf) * (input_conf * 0.2))
+
+        # Parse existing evidence
+        try:
+            if isinstance(old_record['evidence'], str):
+                # Try to parse as JSON array
+                evidence_list = json.loads(old_record['evidence'])
+                if not isinstance(evidence_list, list):
+                    evidence_list = [old_record['evidence']]
+            elif isinstance(old_record['evidence'], list):
+                evidence_list = old_record['evidence']
+            else:
+                evidence_list = [str(old_record['evidence'])]
+        except (json.JSONDecodeError, TypeError):
+            evidence_list = [old_record['evidence']]
+
+        # Add new evidence (keep up to 3 most recent)
+        new_evidence = rel.get('evidence', '')
+        if new_evidence and new_evidence not in evidence_list:
+            evidence_list.append(new_evidence)
+            evidence_list = evidence_list[-3:]  # Keep last 3
+
+        # Build update data (only include columns that exist)
+        update_data = {
+            'confidence': new_conf,
+            'evidence': json.dumps(evidence_list, ensure_ascii=False)
+        }
+
+        # Add optional reinforcement columns if they exist
+        if 'occurrence_count' in old_record:
+            occurrence_count = old_record.get('occurrence_count', 1) + 1
+            update_data['occurrence_count'] = occurrence_count
         else:
-            logger.warning(f"No valid relationships to load for document {doc_id}")
-            return 0
+            occurrence_count = None
+
+        if 'last_verified_at' in old_record:
+            update_data['last_verified_at'] = 'now()'
+
+        return update_data, new_conf, occurrence_count
+
+    @staticmethod
+    def _new_relation_record(rel: Dict) -> Dict:
+        """Build the insert row for a relationship seen for the first time"""
+        insert_data = rel.copy()
+        # Wrap evidence in JSON array for consistency
+        if 'evidence' in insert_data:
+            insert_data['evidence'] = json.dumps([insert_data['evidence']], ensure_ascii=False)
+
+        # Reinforcement columns start at their initial values
+        insert_data['occurrence_count'] = 1
+        insert_data['last_verified_at'] = 'now()'
+        return insert_data
+
+    @staticmethod
+    def _log_reinforced(rel: Dict, old_conf: float, new_conf: float, occurrence_count: Optional[int]):
+        if occurrence_count:
+            logger.debug(
+                f"Reinforced: {rel['predicate']} "
+                f"(conf: {old_conf:.3f} → {new_conf:.3f}, "
+                f"count: {occurrence_count})"
+            )
+        else:
+            logger.debug(
+                f"Reinforced: {rel['predicate']} "
+                f"(conf: {old_conf:.3f} → {new_conf:.3f})"
+            )
 
-    def load_relations(self, relations: List[Dict]) -> int:
+    def load_relations(self, relations: List[Dict], bulk: Optional[bool] = None) -> int:
         """
         Load relationships with confidence reinforcement logic.
 
@@ -498,6 +819,7 @@ class OntologyBuilder:
 
         Args:
             relations: List of relationship dictionaries
+            bulk: Use set-based prefetch + upsert (None = Config.RELATION_BULK_LOAD)
 
         Returns:
             Number of relationships loaded (new + updated)
@@ -505,6 +827,11 @@ class OntologyBuilder:
         if not relations:
             return 0
 
+        if bulk is None:
+            bulk = Config.RELATION_BULK_LOAD
+        if bulk:
+            return self.load_relations_bulk(relations)
+
         try:
             total_loaded = 0
             reinforced_count = 0
@@ -520,82 +847,18 @@ class OntologyBuilder:
                 if existing.data and len(existing.data) > 0:
                     # Relationship exists - Apply reinforcement
                     old_record = existing.data[0]
-                    old_conf = old_record['confidence']
-                    input_conf = rel['confidence']
-
-                    # Reinforcement formula: gradual confidence increase
-                    # new_conf = old_conf + (1.0 - old_conf) * (input_conf * 0.2)
-                    new_conf = min(1.0, old_conf + (1.0 - old_conf) * (input_conf * 0.2))
-
-                    # Parse existing evidence
-                    try:
-                        if isinstance(old_record['evidence'], str):
-                            # Try to parse as JSON array
-                            evidence_list = json.loads(old_record['evidence'])
-                            if not isinstance(evidence_list, list):
-                                evidence_list = [old_record['evidence']]
-                        elif isinstance(old_record['evidence'], list):
-                            evidence_list = old_record['evidence']
-                        else:
-                            evidence_list = [str(old_record['evidence'])]
-                    except (json.JSONDecodeError, TypeError):
-                        evidence_list = [old_record['evidence']]
-
-                    # Add new evidence (keep up to 3 most recent)
-                    new_evidence = rel.get('evidence', '')
-                    if new_evidence and new_evidence not in evidence_list:
-                        evidence_list.append(new_evidence)
-                        evidence_list = evidence_list[-3:]  # Keep last 3
-
-                    # Build update data (only include columns that exist)
-                    update_data = {
-                        'confidence': new_conf,
-                        'evidence': json.dumps(evidence_list, ensure_ascii=False)
-                    }
-
-                    # Add optional reinforcement columns if they exist
-                    if 'occurrence_count' in old_record:
-                        occurrence_count = old_record.get('occurrence_count', 1) + 1
-                        update_data['occurrence_count'] = occurrence_count
-                    else:
-                        occurrence_count = None
-
-                    if 'last_verified_at' in old_record:
-                        update_data['last_verified_at'] = 'now()'
+                    update_data, new_conf, occurrence_count = self._reinforce(old_record, rel)
 
                     self.supabase.client.table('playbook_semantic_relations').update(
                         update_data
                     ).eq('id', old_record['id']).execute()
 
                     reinforced_count += 1
-                    if occurrence_count:
-                        logger.debug(
-                            f"Reinforced: {rel['predicate']} "
-                            f"(conf: {old_conf:.3f} → {new_conf:.3f}, "
-                            f"count: {occurrence_count})"
-                        )
-                    else:
-                        logger.debug(
-                            f"Reinforced: {rel['predicate']} "
-                            f"(conf: {old_conf:.3f} → {new_conf:.3f})"
-                        )
+                    self._log_reinforced(rel, old_record['confidence'], new_conf, occurrence_count)
                 else:
                     # New relationship - Insert with initial values
-                    insert_data = rel.copy()
-                    # Wrap evidence in JSON array for consistency
-                    if 'evidence' in insert_data:
-                        insert_data['evidence'] = json.dumps([insert_data['evidence']], ensure_ascii=False)
-
-                    # Add optional reinforcement columns if table supports them
-                    # Try to add them, but don't fail if columns don't exist
-                    try:
-                        insert_data['occurrence_count'] = 1
-                        insert_data['last_verified_at'] = 'now()'
-                    except:
-                        pass
-
                     self.supabase.client.table('playbook_semantic_relations').insert(
-                        insert_data
+                        self._new_relation_record(rel)
                     ).execute()
 
                     logger.debug(f"Inserted new: {rel['predicate']} (conf: {rel['confidence']:.3f})")
@@ -611,17 +874,147 @@ class OntologyBuilder:
             logger.error(f"Failed to load relationships: {e}", exc_info=True)
             raise
 
-    def build_graph(self, doc_ids: List[str] = None, max_docs: int = None) -> Dict[str, Any]:
+    def _fetch_existing_relations(
+        self,
+        keys: List[Tuple[str, str, str]],
+        chunk_size: int = 50
+    ) -> Dict[Tuple[str, str, str], Dict]:
+        """
+        Prefetch stored relationships for many (source, target, predicate) keys
+
+        Keys are queried in chunks with in_() filters on source and target
+        (a superset of the wanted rows) and filtered to exact keys in memory.
+        """
+        wanted = set(keys)
+        existing = {}
+
+        for chunk in chunked(keys, chunk_size):
+            source_ids = sorted({key[0] for key in chunk})
+            target_ids = sorted({key[1] for key in chunk})
+
+            rows = iter_rows(
+                self.supabase.client,
+                'playbook_semantic_relations',
+                filters=lambda query: query.in_('source_term_id', source_ids).in_('target_term_id', target_ids)
+            )
+            for row in rows:
+                key = self._relation_key(row)
+                if key in wanted:
+                    existing[key] = row
+
+        return existing
+
+    def load_relations_bulk(self, relations: List[Dict]) -> int:
+        """
+        Set-based variant of load_relations
+
+        1. Prefetch existing rows for all keys in a few in_() queries
+        2. Fold every relationship into its record in memory, in input order
+           (same reinforcement formula, evidence merge and occurrence_count
+           as load_relations, including repeats within the batch)
+        3. Write the records back with chunked upserts on the unique key
+
+        Args:
+            relations: List of relationship dictionaries
+
+        Returns:
+            Number of relationships loaded (new + updated)
+        """
+        if not relations:
+            return 0
+
+        try:
+            keys = list(dict.fromkeys(self._relation_key(rel) for rel in relations))
+            existing = self._fetch_existing_relations(keys)
+
+            # key -> current record; stored rows are only written back partially
+            records: Dict[Tuple[str, str, str], Dict] = {}
+            updates: Dict[Tuple[str, str, str], Dict] = {}
+            reinforced_count = 0
+
+            for rel in relations:
+                key = self._relation_key(rel)
+                record = records.get(key)
+                if record is None and key in existing:
+                    record = records[key] = dict(existing[key])
+
+                if record is not None:
+                    update_data, new_conf, occurrence_count = self._reinforce(record, rel)
+                    self._log_reinforced(rel, record['confidence'], new_conf, occurrence_count)
+                    record.update(update_data)
+                    if key in existing:
+                        updates.setdefault(key, {}).update(update_data)
+                    reinforced_count += 1
+                else:
+                    records[key] = self._new_relation_record(rel)
+                    logger.debug(f"Inserted new: {rel['predicate']} (conf: {rel['confidence']:.3f})")
+
+            # Stored rows: upsert only the reinforced columns
+            update_rows = [
+                dict(zip(('source_term_id', 'target_term_id', 'predicate'), key), **changes)
+                for key, changes in updates.items()
+            ]
+            # New rows: full insert data (ids and timestamps from column defaults)
+            insert_rows = [records[key] for key in keys if key not in existing]
+
+            written = self._upsert_relations(update_rows) + self._upsert_relations(insert_rows)
+
+            if reinforced_count > 0:
+                logger.info(f"✓ Reinforced {reinforced_count}/{len(relations)} existing relationships")
+            logger.debug(
+                f"Bulk relation load: {len(relations)} relations -> {written} rows "
+                f"({len(update_rows)} updated, {len(insert_rows)} inserted)"
+            )
+
+            return len(relations)
+
+        except Exception as e:
+            logger.error(f"Failed to bulk load relationships: {e}", exc_info=True)
+            raise
+
+    def _upsert_relations(self, rows: List[Dict]) -> int:
+        """Upsert rows in chunks; rows of one request share the same columns"""
+        batch_size = Config.SUPABASE_BATCH_SIZE
+
+        # PostgREST bulk requests use one column list for all rows
+        groups: Dict[Tuple[str, ...], List[Dict]] = defaultdict(list)
+        for row in rows:
+            groups[tuple(sorted(row))].append(row)
+
+        written = 0
+        for group in groups.values():
+            for i in range(0, len(group), batch_size):
+                batch = group[i:i + batch_size]
+                self.supabase.client.table('playbook_semantic_relations').upsert(
+                    batch,
+                    on_conflict=self.RELATION_KEY_COLUMNS,
+                    default_to_null=False
+                ).execute()
+                written += len(batch)
+
+        return written
+
+    def build_graph(
+        self,
+        doc_ids: List[str] = None,
+        max_docs: int = None,
+        workers: int = None
+    ) -> Dict[str, Any]:
         """
         Build knowledge graph for multiple documents
 
         Args:
-            doc_ids: Optional list of document IDs to process
+            doc_ids: Optional list of document IDs to process (targets are still
+                matched against global candidates from all documents)
             max_docs: Optional maximum number of documents to process
+            workers: Number of parallel workers (None = Config.PHASE2_WORKERS, 1 = serial)
 
         Returns:
             Statistics dictionary
         """
+        if workers is None:
+            workers = Config.PHASE2_WORKERS
+
         logger.info("=" * 70)
         logger.info("Starting Knowledge Graph Construction (Phase 2)")
         logger.info("=" * 70)
@@ -643,23 +1036,43 @@ class OntologyBuilder:
         if max_docs:
             docs_to_process = docs_to_process[:max_docs]
 
+        # Load document metadata (recency weights against one reference time)
+        self.reference_time = datetime.now(timezone.utc)
+        self.doc_last_updated = {}
+        self.doc_recency_weights = {}
+        try:
+            self.load_document_metadata(doc_ids=doc_ids)
+        except Exception as e:
+            logger.warning(f"Failed to load document metadata, recency weights default to 1.0: {e}")
+            self.doc_recency_weights = {doc_id: 1.0 for doc_id in docs_to_process}
+
+        # Index global candidates once (Phase 2 workers share it read-only)
+        self.global_candidate_index = None
+        global_index = self._global_index()
+
         logger.info(f"Processing {len(docs_to_process)} documents")
 
         # Process each document
         total_relations = 0
         success_count = 0
+        worker_stats = None
         start_time = time.time()
 
-        for idx, doc_id in enumerate(docs_to_process):
-            logger.info(f"\n[{idx+1}/{len(docs_to_process)}] Processing document: {doc_id}")
-
-            try:
-                relations_count = self.build_graph_for_document(doc_id)
-                total_relations += relations_count
-                success_count += 1
-            except Exception as e:
-                logger.error(f"Failed to process document {doc_id}: {e}")
-                continue
+        if workers > 1:
+            success_count, total_relations, worker_stats = self._build_graph_concurrent(
+                docs_to_process, workers
+            )
+        else:
+            for idx, doc_id in enumerate(docs_to_process):
+                logger.info(f"\n[{idx+1}/{len(docs_to_process)}] Processing document: {doc_id}")
+
+                try:
+                    relations_count = self.build_graph_for_document(doc_id)
+                    total_relations += relations_count
+                    success_count += 1
+                except Exception as e:
+                    logger.error(f"Failed to process document {doc_id}: {e}")
+                    continue
 
         # Final statistics
         elapsed_time = time.time() - start_time
@@ -670,14 +1083,117 @@ class OntologyBuilder:
         logger.info(f"Documents processed: {success_count}/{len(docs_to_process)}")
         logger.info(f"Relationships created: {total_relations}")
         logger.info(f"Average: {total_relations/success_count:.1f} relations per document" if success_count > 0 else "")
+        logger.info(f"Global candidate matching ({len(global_index)} candidates): {dict(global_index.hits)}")
         logger.info("=" * 70)
 
-        return {
+        stats = {
             'total_documents': len(docs_to_process),
             'processed_documents': success_count,
             'total_relationships': total_relations,
-            'elapsed_time': elapsed_time
+            'elapsed_time': elapsed_time,
+            'global_match_methods': dict(global_index.hits)
         }
+        if worker_stats is not None:
+            stats['workers'] = worker_stats
+        return stats
+
+    def _build_graph_concurrent(
+        self,
+        docs_to_process: List[str],
+        workers: int
+    ) -> Tuple[int, int, Dict[str, Dict[str, Any]]]:
+        """
+        Concurrent Phase 2: parallel validation, then parallel key-sharded loading
+
+        1. Documents are validated in a thread pool; results are kept in
+           document order.
+        2. All validated relations are concatenated in document order and
+           sharded by (source, target, predicate) key, round-robin over the
+           keys in order of first appearance. Each shard is loaded by its own
+           worker. Shards never share a key and keep the input order per key,
+           so reinforcement gives the same rows as the serial run.
+
+        Returns:
+            (processed documents, loaded relationships, per-worker statistics)
+        """
+        worker_stats: Dict[str, Dict[str, Any]] = defaultdict(
+            lambda: {'documents': 0, 'relations_validated': 0, 'relations_loaded': 0, 'busy_time': 0.0}
+        )
+        stats_lock = threading.Lock()
+
+        def record(busy_time: float, **counts: int):
+            with stats_lock:
+                worker = worker_stats[threading.current_thread().name]
+                worker['busy_time'] += busy_time
+                for field_name, count in counts.items():
+                    worker[field_name] += count
+
+        def collect(doc_id: str) -> List[Dict]:
+            started = time.time()
+            relations = self.collect_relations_for_document(doc_id)
+            record(time.time() - started, documents=1, relations_validated=len(relations))
+            return relations
+
+        def load(shard: List[Dict]) -> int:
+            started = time.time()
+            loaded = self.load_relations(shard)
+            record(time.time() - started, relations_loaded=loaded)
+            return loaded
+
+        logger.info(f"Concurrent build: {workers} workers")
+
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="phase2") as executor:
+            # Step 1: validate documents in parallel (results in document order)
+            futures = [executor.submit(collect, doc_id) for doc_id in docs_to_process]
+
+            all_relations: List[Dict] = []
+            success_count = 0
+            for idx, (doc_id, future) in enumerate(zip(docs_to_process, futures)):
+                try:
+                    relations = future.result()
+                    all_relations.extend(relations)
+                    success_count += 1
+                    logger.info(
+                        f"[{idx+1}/{len(docs_to_process)}] Validated document {doc_id}: "
+                        f"{len(relations)} relationships"
+                    )
+                except Exception as e:
+                    logger.error(f"Failed to process document {doc_id}: {e}")
+
+            # Step 2: shard by relation key and load shards in parallel
+            shard_of_key: Dict[Tuple[str, str, str], int] = {}
+            shards: List[List[Dict]] = [[] for _ in range(workers)]
+            for rel in all_relations:
+                key = self._relation_key(rel)
+                if key not in shard_of_key:
+                    shard_of_key[key] = len(shard_of_key) % workers
+                shards[shard_of_key[key]].append(rel)
+
+            logger.info(
+                f"Loading {len(all_relations)} relationships "
+                f"({len(shard_of_key)} unique keys) in {workers} shards"
+            )
+
+            total_relations = 0
+            load_futures = [executor.submit(load, shard) for shard in shards if shard]
+            for future in load_futures:
+                try:
+                    total_relations += future.result()
+                except Exception as e:
+                    logger.error(f"Failed to load relationship shard: {e}")
+
+        # Per-worker throughput
+        for name in sorted(worker_stats):
+            worker = worker_stats[name]
+            busy = worker['busy_time']
+            rate = (worker['documents'] / busy) if busy > 0 else 0.0
+            logger.info(
+                f"Worker {name}: {worker['documents']} docs, "
+                f"{worker['relations_validated']} validated, {worker['relations_loaded']} loaded, "
+                f"busy {busy:.2f}s ({rate:.2f} docs/s)"
+            )
+
+        return success_count, total_relations, dict(worker_stats)
 
 
 def main():
@@ -698,6 +1214,12 @@ def main():
         type=int,
         help='Maximum number of documents to process'
     )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=None,
+        help='Number of parallel workers (default: PHASE2_WORKERS, 1 = serial)'
+    )
 
     args = parser.parse_args()
 
@@ -708,7 +1230,8 @@ def main():
     try:
         stats = builder.build_graph(
             doc_ids=args.doc_ids,
-            max_docs=args.max_docs
+            max_docs=args.max_docs,
+            workers=args.workers
         )
 
         logger.info("Knowledge graph construction completed successfully!")
@@ -6,12 +6,17 @@ import hashlib
 import re
 import json
 from typing import List, Dict, Any, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
 from dataclasses import dataclass
 
 from openai import OpenAI
 
 from src.shared.config import Config
 from src.core.rules.prompts import get_prompt, get_synonyms, is_synonym
+from src.shared.term_spotter import TermSpotter
+from src.shared.rate_limit import ServiceLimiter, is_rate_limited, retry_after_from_error
+from src.core.cache import EmbeddingCache, LLMResponseCache
 
 
 logger = logging.getLogger("playbook_nexus.semantic")
@@ -77,6 +82,11 @@ class ImprovedChunker:
             # No headers found, treat entire text as one section
             return [("", text, 0)]
 
+        # Text before the first header (intro paragraphs)
+        preamble = text[:matches[0].start()].strip()
+        if preamble:
+            sections.append(("", preamble, 0))
+
         for i, match in enumerate(matches):
             header_level = len(match.group(1))
             header_text = match.group(2).strip()
@@ -261,6 +271,65 @@ class ImprovedChunker:
         return all_chunks
 
 
+def _relation_target(rel: Dict[str, Any]) -> str:
+    """Relation target as written by the LLM ('term' or 'target'), normalized"""
+    target = rel.get('term') if isinstance(rel.get('term'), str) else rel.get('target', '')
+    return (target or '').lower().strip()
+
+
+def merge_extracted_terms(window_terms: List[List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+    """
+    Merge per-window LLM extraction results into one term list
+
+    Terms are deduplicated by normalized name (lower-cased, stripped) in order
+    of first appearance. Confidence is the maximum over windows; category,
+    definition and context come from the first window that has them; relations
+    are unioned by (target, type), keeping the highest confidence. Evidence is
+    not merged here: it is recomputed over all chunks afterwards.
+
+    Args:
+        window_terms: Extracted term dictionaries per window, in document order
+
+    Returns:
+        Merged term dictionaries (same shape as a single LLM response)
+    """
+    merged: Dict[str, Dict[str, Any]] = {}
+    relation_index: Dict[str, Dict[Tuple[str, str], Dict[str, Any]]] = {}
+
+    for terms in window_terms:
+        for term_data in terms:
+            key = (term_data.get('term') or '').lower().strip()
+            if not key:
+                continue
+
+            entry = merged.get(key)
+            if entry is None:
+                entry = dict(term_data)
+                entry['relations'] = []
+                merged[key] = entry
+                relation_index[key] = {}
+            else:
+                if 'confidence' in term_data:
+                    entry['confidence'] = max(
+                        float(entry.get('confidence', 0.0)), float(term_data['confidence'])
+                    )
+                for field_name in ('category', 'definition', 'context'):
+                    if not entry.get(field_name) and term_data.get(field_name):
+                        entry[field_name] = term_data[field_name]
+
+            relations = relation_index[key]
+            for rel in term_data.get('relations') or []:
+                rel_key = (_relation_target(rel), rel.get('type', 'related_to'))
+                existing = relations.get(rel_key)
+                if existing is None:
+                    relations[rel_key] = dict(rel)
+                    entry['relations'].append(relations[rel_key])
+                elif rel.get('confidence', 0.8) > existing.get('confidence', 0.8):
+                    existing.update(rel)
+
+    return list(merged.values())
+
+
 class SemanticProcessor:
     """Process text into chunks and generate embeddings"""
 
@@ -269,7 +338,11 @@ class SemanticProcessor:
         min_chunk_size: int = None,
         max_chunk_size: int = None,
         embedding_model: str = None,
-        api_key: str = None
+        api_key: str = None,
+        rate_limiter: Optional[ServiceLimiter] = None,
+        embedding_cache: Optional[EmbeddingCache] = None,
+        llm_cache: Optional[LLMResponseCache] = None,
+        llm_cache_bypass: bool = None
     ):
         """
         Initialize semantic processor
@@ -279,12 +352,44 @@ class SemanticProcessor:
             max_chunk_size: Maximum chunk size in characters
             embedding_model: OpenAI embedding model name
             api_key: OpenAI API key
+            rate_limiter: Shared limiter (acquired before each OpenAI call, adapts on 429;
+                term extraction requests also take one of its concurrency slots each)
+            embedding_cache: Embedding cache (None = Config.EMBEDDING_CACHE_FILE if
+                EMBEDDING_CACHE_ENABLED)
+            llm_cache: Term extraction response cache (None = Config.LLM_CACHE_FILE if
+                LLM_CACHE_ENABLED)
+            llm_cache_bypass: Ignore cached responses and re-extract (fresh responses
+                still overwrite the cache; None = Config.LLM_CACHE_BYPASS)
         """
         self.min_chunk_size = min_chunk_size or 100
         self.max_chunk_size = max_chunk_size or 2000
         self.embedding_model = embedding_model or Config.EMBEDDING_MODEL
         self.embedding_batch_size = Config.EMBEDDING_BATCH_SIZE
         self.max_retries = Config.EMBEDDING_MAX_RETRIES
+        self.rate_limiter = rate_limiter
+
+        if embedding_cache is None and Config.EMBEDDING_CACHE_ENABLED:
+            try:
+                embedding_cache = EmbeddingCache(Config.EMBEDDING_CACHE_FILE)
+            except Exception as e:
+                logger.warning(f"Embedding cache disabled: {e}")
+        self.embedding_cache = embedding_cache
+
+        if llm_cache is None and Config.LLM_CACHE_ENABLED:
+            try:
+                llm_cache = LLMResponseCache(
+                    Config.LLM_CACHE_FILE,
+                    max_bytes=Config.LLM_CACHE_MAX_MB * 1024 * 1024
+                )
+            except Exception as e:
+                logger.warning(f"LLM response cache disabled: {e}")
+        self.llm_cache = llm_cache
+        self.llm_cache_bypass = Config.LLM_CACHE_BYPASS if llm_cache_bypass is None else llm_cache_bypass
+
+        # Term extraction: single prompt over the first window, or map-reduce over all windows
+        self.extraction_map_reduce = Config.EXTRACTION_MAP_REDUCE
+        self.extraction_window_chars = Config.EXTRACTION_WINDOW_CHARS
+        self.extraction_workers = Config.EXTRACTION_WORKERS
 
         # Initialize improved chunker
         self.chunker = ImprovedChunker(
@@ -303,6 +408,34 @@ class SemanticProcessor:
         else:
             self.client = OpenAI(api_key=api_key)
 
+    def _call_openai(self, create, **kwargs):
+        """
+        Call an OpenAI endpoint through the shared rate limiter
+
+        Args:
+            create: SDK method (e.g. self.client.embeddings.create)
+            **kwargs: Request parameters
+
+        Returns:
+            SDK response (exceptions are re-raised after 429 accounting)
+        """
+        if not self.rate_limiter:
+            return create(**kwargs)
+
+        self.rate_limiter.acquire()
+        try:
+            response = create(**kwargs)
+        except Exception as e:
+            if is_rate_limited(e):
+                self.rate_limiter.on_rate_limited(retry_after_from_error(e))
+            raise
+        self.rate_limiter.on_success()
+        return response
+
+    def _openai_slot(self):
+        """Concurrency slot of the shared limiter (no-op without a limiter)"""
+        return self.rate_limiter.slot() if self.rate_limiter else nullcontext()
+
     def chunk_text(self, text: str, page_id: str) -> List[TextChunk]:
         """
         Split text into chunks using improved chunking logic
@@ -327,6 +460,9 @@ class SemanticProcessor:
         """
         Generate embeddings for multiple texts in batches with retry logic
 
+        Texts already in the embedding cache (same model, same text) are
+        served locally; only misses are sent to OpenAI.
+
         Args:
             texts: List of texts to embed
 
@@ -336,6 +472,31 @@ class SemanticProcessor:
         if not texts:
             return []
 
+        # Truncate texts if too long (max 8191 tokens)
+        # Rough estimate: 1 token ≈ 4 characters
+        max_chars = 8191 * 4
+        texts = [text[:max_chars] if len(text) > max_chars else text for text in texts]
+
+        if self.embedding_cache is None:
+            return self._request_embeddings(texts)
+
+        all_embeddings = self.embedding_cache.get_many(self.embedding_model, texts)
+        missing = [idx for idx, embedding in enumerate(all_embeddings) if embedding is None]
+
+        if len(missing) < len(texts):
+            logger.debug(f"Embedding cache: {len(texts) - len(missing)}/{len(texts)} hits")
+
+        if missing:
+            missing_texts = [texts[idx] for idx in missing]
+            fetched = self._request_embeddings(missing_texts)
+            self.embedding_cache.put_many(self.embedding_model, missing_texts, fetched)
+            for idx, embedding in zip(missing, fetched):
+                all_embeddings[idx] = embedding
+
+        return all_embeddings
+
+    def _request_embeddings(self, texts: List[str]) -> List[Optional[List[float]]]:
+        """Call the embeddings API in batches with retry logic"""
         all_embeddings = []
 
         # Process in batches
@@ -346,19 +507,10 @@ class SemanticProcessor:
             batch_embeddings = None
             for attempt in range(self.max_retries):
                 try:
-                    # Truncate texts if too long (max 8191 tokens)
-                    # Rough estimate: 1 token ≈ 4 characters
-                    max_chars = 8191 * 4
-                    processed_texts = []
-                    for text in batch:
-                        if len(text) > max_chars:
-                            processed_texts.append(text[:max_chars])
-                        else:
-                            processed_texts.append(text)
-
-                    response = self.client.embeddings.create(
+                    response = self._call_openai(
+                        self.client.embeddings.create,
                         model=self.embedding_model,
-                        input=processed_texts
+                        input=batch
                     )
 
                     batch_embeddings = [item.embedding for item in response.data]
@@ -383,6 +535,159 @@ class SemanticProcessor:
 
         return all_embeddings
 
+    def _request_terms(self, system_prompt: str, user_prompt: str) -> Optional[List[Dict[str, Any]]]:
+        """
+        Run the term extraction prompt and parse the JSON response
+
+        Responses are served from / stored in the LLM response cache (only
+        responses that parse are stored). Exceptions from the API call or
+        JSON parsing propagate to the caller.
+
+        Args:
+            system_prompt: Extraction system prompt
+            user_prompt: Document prompt
+
+        Returns:
+            Extracted term dictionaries, or None for an unexpected JSON shape
+        """
+        params = {
+            'model': "gpt-4o-mini",  # Using fast, cost-effective model
+            'temperature': 0.1,
+            'max_tokens': 2000,
+        }
+
+        cache_key = None
+        result_text = None
+        if self.llm_cache is not None:
+            cache_key = LLMResponseCache.make_key(system_prompt, user_prompt, **params)
+            if not self.llm_cache_bypass:
+                result_text = self.llm_cache.get(cache_key)
+
+        from_cache = result_text is not None
+        if not from_cache:
+            # One concurrency slot per request, so map-reduce windows share the
+            # OPENAI_CONCURRENCY cap with every other page in flight
+            with self._openai_slot():
+                response = self._call_openai(
+                    self.client.chat.completions.create,
+                    messages=[
+                        {"role": "system", "content": system_prompt},
+                        {"role": "user", "content": user_prompt}
+                    ],
+                    **params
+                )
+            result_text = response.choices[0].message.content.strip()
+        else:
+            logger.debug("Term extraction response served from LLM cache")
+
+        raw_text = result_text
+
+        # [DEBUG] Log raw LLM response for debugging
+        logger.debug(f"Raw LLM response (first 500 chars): {result_text[:500]}")
+
+        # Remove markdown code blocks if present
+        if result_text.startswith("```"):
+            result_text = result_text.split("```")[1]
+            if result_text.startswith("json"):
+                result_text = result_text[4:]
+            result_text = result_text.strip()
+
+        # Parse JSON
+        extracted_data = json.loads(result_text)
+
+        # [FIX] Handle both formats: {"nodes": [...]} or direct [...]
+        if isinstance(extracted_data, dict):
+            extracted_terms = extracted_data.get('nodes', [])
+        elif isinstance(extracted_data, list):
+            extracted_terms = extracted_data
+        else:
+            logger.error(f"Unexpected JSON format: {type(extracted_data)}")
+            return None
+
+        if cache_key and not from_cache:
+            self.llm_cache.put(cache_key, params['model'], raw_text)
+
+        return extracted_terms
+
+    @staticmethod
+    def _extraction_prompt(title: str, content: str) -> str:
+        """User prompt for one extraction window"""
+        return f"""Document Title: {title}
+
+Content:
+{content}
+
+Extract semantic terms from this document."""
+
+    def _split_windows(self, chunk_texts: List[str]) -> List[str]:
+        """
+        Pack consecutive chunks into windows of at most extraction_window_chars
+
+        A document that fits in one window yields exactly the single-prompt
+        content (so map-reduce and single mode share LLM cache entries).
+        """
+        limit = self.extraction_window_chars
+        windows = []
+        current: List[str] = []
+        current_len = 0
+
+        for text in chunk_texts:
+            text = text[:limit]
+            added = len(text) + (2 if current else 0)  # "\n\n" separator
+            if current and current_len + added > limit:
+                windows.append("\n\n".join(current))
+                current, current_len = [], 0
+                added = len(text)
+            current.append(text)
+            current_len += added
+
+        if current:
+            windows.append("\n\n".join(current))
+        return windows
+
+    def _extract_terms_map_reduce(
+        self,
+        system_prompt: str,
+        title: str,
+        chunk_texts: List[str]
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Extract terms from every window concurrently and merge the results
+
+        Args:
+            system_prompt: Extraction system prompt
+            title: Document title
+            chunk_texts: Chunk contents in document order
+
+        Returns:
+            Merged term dictionaries, or None if every window failed
+        """
+        windows = self._split_windows(chunk_texts)
+        prompts = [self._extraction_prompt(title, window) for window in windows]
+
+        def map_window(user_prompt: str) -> Optional[List[Dict[str, Any]]]:
+            try:
+                return self._request_terms(system_prompt, user_prompt)
+            except Exception as e:
+                logger.warning(f"Term extraction failed for one window of '{title}': {e}")
+                return None
+
+        if len(prompts) == 1:
+            results = [map_window(prompts[0])]
+        else:
+            workers = max(1, min(self.extraction_workers, len(prompts)))
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="extract") as executor:
+                results = list(executor.map(map_window, prompts))
+
+        succeeded = [terms for terms in results if terms is not None]
+        logger.info(
+            f"Map-reduce extraction: {len(succeeded)}/{len(windows)} windows succeeded for '{title}'"
+        )
+        if not succeeded:
+            return None
+
+        return merge_extracted_terms(succeeded)
+
     def extract_semantic_terms(
         self,
         chunks: List[Dict[str, Any]],
@@ -428,52 +733,21 @@ class SemanticProcessor:
             # Get system prompt from prompts.py (pokopoko for game logic extraction)
             system_prompt = get_prompt("pokopoko")
 
-            user_prompt = f"""Document Title: {title}
-
-Content:
-{full_text[:8000]}
-
-Extract semantic terms from this document."""
-
-            response = self.client.chat.completions.create(
-                model="gpt-4o-mini",  # Using fast, cost-effective model
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt}
-                ],
-                temperature=0.1,
-                max_tokens=2000
-            )
-
-            result_text = response.choices[0].message.content.strip()
-
-            # Parse JSON response
-            import json
-
-            # [DEBUG] Log raw LLM response for debugging
-            logger.debug(f"Raw LLM response (first 500 chars): {result_text[:500]}")
-
-            # Remove markdown code blocks if present
-            if result_text.startswith("```"):
-                result_text = result_text.split("```")[1]
-                if result_text.startswith("json"):
-                    result_text = result_text[4:]
-                result_text = result_text.strip()
-
-            # Parse JSON
-            extracted_data = json.loads(result_text)
-
-            # [FIX] Handle both formats: {"nodes": [...]} or direct [...]
-            if isinstance(extracted_data, dict):
-                extracted_terms = extracted_data.get('nodes', [])
-            elif isinstance(extracted_data, list):
-                extracted_terms = extracted_data
+            if self.extraction_map_reduce:
+                extracted_terms = self._extract_terms_map_reduce(system_prompt, title, chunk_texts)
             else:
-                logger.error(f"Unexpected JSON format: {type(extracted_data)}")
+                user_prompt = self._extraction_prompt(title, full_text[:self.extraction_window_chars])
+                extracted_terms = self._request_terms(system_prompt, user_prompt)
+
+            if extracted_terms is None:
                 return []
 
             logger.info(f"Extracted {len(extracted_terms)} terms from LLM response")
 
+            # Spot every extracted term in every chunk with one pass per chunk
+            spotter = TermSpotter(term_data.get('term', '') for term_data in extracted_terms)
+            chunk_hits = [spotter.spot(chunk_text, include_synonyms=False) for chunk_text in chunk_texts]
+
             # Process extracted terms
             semantic_terms = []
             all_extracted_terms = []  # For cross-term relation analysis
@@ -493,13 +767,14 @@ Extract semantic terms from this document."""
                 evidence = []
                 frequency = 0
 
-                for chunk_id, chunk_text in zip(chunk_ids, chunk_texts):
-                    if term in chunk_text.lower():
+                for chunk_id, hits in zip(chunk_ids, chunk_hits):
+                    occurrences = hits.get(term)
+                    if occurrences:
                         evidence.append({
                             "chunk_id": chunk_id,
-                            "position": chunk_text.lower().find(term)
+                            "position": occurrences.first_position
                         })
-                        frequency += chunk_text.lower().count(term)
+                        frequency += occurrences.count
 
                 if frequency > 0:
                     # Build raw_relations array (저장용 - JSONB 형식)
@@ -554,8 +829,8 @@ Extract semantic terms from this document."""
                             # Last resort: use first evidence chunk snippet
                             if evidence and len(chunk_texts) > 0:
                                 first_evidence_idx = 0
-                                for idx, chunk_text in enumerate(chunk_texts):
-                                    if term in chunk_text.lower():
+                                for idx, hits in enumerate(chunk_hits):
+                                    if term in hits:
                                         first_evidence_idx = idx
                                         break
                                 chunk_snippet = chunk_texts[first_evidence_idx][:100]
@@ -609,37 +884,29 @@ Extract semantic terms from this document."""
             logger.error(f"Failed to extract semantic terms for page {page_id}: {e}", exc_info=True)
             return []
 
-    def process_page(
-        self, page_data: Dict[str, Any]
-    ) -> Dict[str, Any]:
+    def embed_page(self, page_data: Dict[str, Any]) -> List[Dict[str, Any]]:
         """
-        Process a complete page: chunk and embed
+        Chunk a page and embed the chunks (first half of process_page)
 
         Args:
             page_data: Page data dictionary from Confluence processor
 
         Returns:
-            Dictionary with chunks and embeddings
+            Chunk rows with embeddings (chunks whose embedding failed are dropped)
         """
         page_id = page_data.get('page_id', '')
         content = page_data.get('content', '')
 
-        result = {
-            'page_id': page_id,
-            'chunks': [],
-            'semantic_terms': []
-        }
-
         if not content:
             logger.warning(f"No content found for page {page_id}")
-            return result
+            return []
 
         # Create chunks
         chunks = self.chunk_text(content, page_id)
 
         if not chunks:
             logger.warning(f"No chunks created for page {page_id}")
-            return result
+            return []
 
         # Generate embeddings
         chunk_texts = [chunk.content for chunk in chunks]
@@ -666,17 +933,48 @@ Extract semantic terms from this document."""
                     'char_count': len(chunk.content)
                 })
 
-        result['chunks'] = chunk_data
+        return chunk_data
+
+    def extract_page_terms(
+        self,
+        chunk_data: List[Dict[str, Any]],
+        page_data: Dict[str, Any]
+    ) -> List[Dict[str, Any]]:
+        """
+        Extract semantic terms from embedded chunks (second half of process_page)
 
-        # Extract semantic terms from chunks
+        Args:
+            chunk_data: Chunk rows from embed_page
+            page_data: Page data dictionary from Confluence processor
+
+        Returns:
+            Semantic terms (empty on failure)
+        """
         try:
-            semantic_terms = self.extract_semantic_terms(chunk_data, page_data)
-            result['semantic_terms'] = semantic_terms
+            return self.extract_semantic_terms(chunk_data, page_data)
         except Exception as e:
-            logger.error(f"Failed to extract semantic terms for page {page_id}: {e}")
-            result['semantic_terms'] = []
+            logger.error(f"Failed to extract semantic terms for page {page_data.get('page_id', '')}: {e}")
+            return []
+
+    def process_page(
+        self, page_data: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Process a complete page: chunk and embed
 
-        return result
+        Args:
+            page_data: Page data dictionary from Confluence processor
+
+        Returns:
+            Dictionary with chunks and embeddings
+        """
+        chunk_data = self.embed_page(page_data)
+
+        return {
+            'page_id': page_data.get('page_id', ''),
+            'chunks': chunk_data,
+            'semantic_terms': self.extract_page_terms(chunk_data, page_data)
+        }
 
     def test_connection(self) -> bool:
         """
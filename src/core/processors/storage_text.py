@@ -0,0 +1,310 @@
+"""
+Confluence storage format to plain text (streaming lxml parser)
+
+The document is parsed with an lxml parser target: start/end/data events are
+handled as they are produced, without building a tree. Output is line based:
+
+- Headings become Markdown markers ("## Title") so ImprovedChunker can split sections
+- Table rows become one line each ("cell | cell | cell")
+- Lists become "- item" / "1. item" lines, tasks "- [ ] item" / "- [x] item"
+- Code/noformat macros keep their line breaks; status macros render as "[TITLE]";
+  titles of panel-like macros become their own line; navigation macros are dropped
+"""
+import html
+import re
+from typing import List, Optional
+
+from lxml import etree
+
+
+# Elements whose whole subtree carries no readable text
+SKIP_TAGS = {
+    'script', 'style', 'meta', 'link', 'head', 'title',
+    'ac:image', 'ac:emoticon', 'ac:placeholder', 'ac:task-id', 'ac:inline-comment-marker-ref',
+}
+
+# Macros rendered as nothing (navigation, embeds, dynamic content)
+SKIP_MACROS = {
+    'toc', 'children', 'anchor', 'pagetree', 'recently-updated', 'attachments',
+    'jira', 'include', 'excerpt-include', 'contentbylabel', 'livesearch',
+    'gallery', 'viewfile', 'view-file', 'drawio', 'gliffy', 'widget', 'iframe',
+}
+
+# Macros whose body is preformatted text
+PREFORMATTED_MACROS = {'code', 'noformat'}
+
+# Macros whose "title" parameter is shown
+TITLED_MACROS = {'expand', 'panel', 'info', 'note', 'warning', 'tip', 'details', 'status'}
+
+BLOCK_TAGS = {
+    'p', 'div', 'section', 'article', 'header', 'footer', 'blockquote', 'hr',
+    'table', 'thead', 'tbody', 'tfoot', 'dl', 'dt', 'dd', 'figure', 'figcaption',
+    'ac:rich-text-body', 'ac:layout', 'ac:layout-section', 'ac:layout-cell',
+}
+
+HEADING_TAGS = {'h1': 1, 'h2': 2, 'h3': 3, 'h4': 4, 'h5': 5, 'h6': 6}
+
+CDATA_PATTERN = re.compile(r'<!\[CDATA\[(.*?)\]\]>', re.DOTALL)
+
+
+def _escape_cdata(match: re.Match) -> str:
+    # The HTML parser drops CDATA sections; code macro bodies live in them
+    return html.escape(match.group(1), quote=False)
+
+
+def _collapse(text: str) -> str:
+    return ' '.join(text.split())
+
+
+class _TextTarget:
+    """lxml parser target that writes lines as events arrive"""
+
+    def __init__(self):
+        self.lines: List[str] = []
+        self.parts: List[str] = []
+        self.prefix = ''
+        self.skip_depth = 0
+
+        self.lists: List[List] = []        # [ordered, counter] per open list
+        self.rows: List[List[str]] = []    # cells of each open table row
+        self.cells: List[List[str]] = []   # text parts of each open cell
+        self.macros: List[str] = []        # names of open macros
+
+        self.pre: Optional[List[str]] = None
+        self.param: Optional[List[str]] = None
+        self.link_title: Optional[str] = None
+        self.task_status: Optional[List[str]] = None
+
+    # Output helpers
+
+    def _write(self, text: str):
+        if self.param is not None:
+            self.param.append(text)
+        elif self.task_status is not None:
+            self.task_status.append(text)
+        elif self.pre is not None:
+            self.pre.append(text)
+        elif self.cells:
+            self.cells[-1].append(text)
+        else:
+            self.parts.append(text)
+
+    def _break(self):
+        """End the current line (a space inside table cells)"""
+        if self.cells:
+            self.cells[-1].append(' ')
+            return
+
+        text = _collapse(''.join(self.parts))
+        self.parts = []
+        if text:
+            self.lines.append(self.prefix + text)
+            self.prefix = ''
+
+    def _emit_line(self, text: str):
+        if not text:
+            return
+        if self.cells:
+            self.cells[-1].append(f" {text} ")
+        else:
+            self._break()
+            self.lines.append(text)
+
+    # Parser target interface
+
+    def start(self, tag: str, attrib):
+        if self.skip_depth:
+            self.skip_depth += 1
+            return
+
+        if tag in SKIP_TAGS:
+            self.skip_depth = 1
+            return
+
+        if tag in ('ac:structured-macro', 'ac:macro'):
+            name = attrib.get('ac:name', '')
+            if name in SKIP_MACROS:
+                self.skip_depth = 1
+                return
+            self.macros.append(name)
+            if name in PREFORMATTED_MACROS:
+                self._break()
+            return
+
+        if tag == 'ac:parameter':
+            macro = self.macros[-1] if self.macros else ''
+            if macro in TITLED_MACROS and attrib.get('ac:name') == 'title':
+                self.param = []
+            else:
+                self.skip_depth = 1
+            return
+
+        if tag == 'ac:plain-text-body':
+            self.pre = []
+            return
+
+        if tag in HEADING_TAGS:
+            self._break()
+            if not self.cells:
+                self.prefix = '#' * HEADING_TAGS[tag] + ' '
+            return
+
+        if tag in ('ul', 'ol', 'ac:task-list'):
+            self._break()
+            self.lists.append([tag == 'ol', 0])
+            return
+
+        if tag in ('li', 'ac:task'):
+            self._break()
+            if not self.cells:
+                depth = max(len(self.lists), 1)
+                ordered, counter = self.lists[-1] if self.lists else (False, 0)
+                if self.lists:
+                    self.lists[-1][1] = counter + 1
+                marker = f"{counter + 1}." if ordered else '-'
+                if tag == 'ac:task':
+                    marker = '- [ ]'
+                self.prefix = '  ' * (depth - 1) + marker + ' '
+            return
+
+        if tag == 'ac:task-status':
+            self.task_status = []
+            return
+
+        if tag == 'tr':
+            self._break()
+            self.rows.append([])
+            return
+
+        if tag in ('td', 'th'):
+            self.cells.append([])
+            return
+
+        if tag == 'ac:link':
+            self.link_title = None
+            return
+
+        if tag in ('ri:page', 'ri:blog-post', 'ri:attachment', 'ri:space'):
+            self.link_title = (
+                attrib.get('ri:content-title') or attrib.get('ri:filename') or attrib.get('ri:space-key')
+            )
+            return
+
+        if tag in ('ac:link-body', 'ac:plain-text-link-body'):
+            # The link body provides its own text
+            self.link_title = None
+            return
+
+        if tag == 'time' and attrib.get('datetime'):
+            self._write(f" {attrib['datetime']} ")
+            return
+
+        if tag in ('br', 'pre') or tag in BLOCK_TAGS:
+            if self.pre is None:
+                self._break()
+
+    def end(self, tag: str):
+        if self.skip_depth:
+            self.skip_depth -= 1
+            return
+
+        if tag in ('ac:structured-macro', 'ac:macro'):
+            if self.macros:
+                self.macros.pop()
+            return
+
+        if tag == 'ac:parameter':
+            title = _collapse(''.join(self.param or []))
+            macro = self.macros[-1] if self.macros else ''
+            self.param = None
+            if title and macro == 'status':
+                self._write(f" [{title}] ")
+            else:
+                self._emit_line(title)
+            return
+
+        if tag == 'ac:plain-text-body':
+            text = ''.join(self.pre or [])
+            self.pre = None
+            for line in text.split('\n'):
+                line = line.rstrip()
+                if line.strip():
+                    self._emit_line(line)
+            return
+
+        if tag == 'ac:task-status':
+            status = ''.join(self.task_status or []).strip()
+            self.task_status = None
+            if status == 'complete' and self.prefix.endswith('[ ] '):
+                self.prefix = self.prefix[:-4] + '[x] '
+            return
+
+        if tag in HEADING_TAGS or tag in ('li', 'ac:task'):
+            self._break()
+            if not self.cells:
+                self.prefix = ''
+            return
+
+        if tag in ('ul', 'ol', 'ac:task-list'):
+            self._break()
+            if self.lists:
+                self.lists.pop()
+            return
+
+        if tag in ('td', 'th'):
+            if self.cells:
+                cell = _collapse(''.join(self.cells.pop()))
+                if self.rows:
+                    self.rows[-1].append(cell)
+                else:
+                    self._write(f" {cell} ")
+            return
+
+        if tag == 'tr':
+            if self.rows:
+                cells = self.rows.pop()
+                while cells and not cells[-1]:
+                    cells.pop()
+                self._emit_line(' | '.join(cells))
+            return
+
+        if tag == 'ac:link':
+            if self.link_title:
+                self._write(self.link_title)
+            self.link_title = None
+            return
+
+        if tag == 'pre' or tag in BLOCK_TAGS:
+            if self.pre is None:
+                self._break()
+
+    def data(self, text: str):
+        if not self.skip_depth:
+            self._write(text)
+
+    def comment(self, text: str):
+        pass
+
+    def close(self) -> str:
+        self._break()
+        return '\n'.join(self.lines)
+
+
+def storage_to_text(storage_html: str) -> str:
+    """
+    Convert Confluence storage format (XHTML + ac:/ri: elements) to text
+
+    Args:
+        storage_html: body.storage.value of a page
+
+    Returns:
+        Text with one block per line and Markdown heading markers
+
+    Raises:
+        lxml.etree.ParserError: If the document cannot be parsed
+    """
+    if not storage_html or not storage_html.strip():
+        return ""
+
+    parser = etree.HTMLParser(target=_TextTarget())
+    return etree.fromstring(CDATA_PATTERN.sub(_escape_cdata, storage_html), parser)
@@ -1,5 +1,6 @@
 # Rules and prompts
 from .rules import classify_document
 from .prompts import get_prompt
+from .ontology import CompiledOntology
 
-__all__ = ['classify_document', 'get_prompt']
+__all__ = ['classify_document', 'get_prompt', 'CompiledOntology']
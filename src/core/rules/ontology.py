@@ -0,0 +1,233 @@
+"""
+Compiled ontology rules for relation validation
+
+playbook_ontology_rules rows (subject_type, predicate, object_type) are
+compiled once into predicate -> subject category -> object category
+dictionaries, so checking a candidate relation is a few dictionary lookups
+however many rules there are. Phase 2 (OntologyBuilder) and the chat rule
+context use the same structure.
+"""
+import re
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+
+# Category values matching every category
+WILDCARD_CATEGORIES = frozenset({'*', 'any'})
+WILDCARD = '*'
+
+# Minimum extraction confidence for a relation to be accepted
+MIN_CONFIDENCE = 0.5
+
+
+def normalize_category(category: Optional[str]) -> str:
+    """Lower-cased category; wildcard spellings collapse to '*'"""
+    key = (category or '').strip().lower()
+    return WILDCARD if key in WILDCARD_CATEGORIES else key
+
+
+def normalize_predicate(predicate: Optional[str]) -> str:
+    """Lower-cased, trimmed predicate (the exact form rules are matched on)"""
+    return (predicate or '').strip().lower()
+
+
+def _spelling_key(predicate: str) -> str:
+    """Spaces/hyphens as underscores ("converts to" -> "converts_to"), for derived aliases"""
+    return re.sub(r'[\s\-]+', '_', predicate)
+
+
+def _base_forms(predicate: str) -> List[str]:
+    """Base verb forms of a third-person predicate ("causes" -> "cause", "diversifies" -> "diversify")"""
+    head, sep, tail = predicate.partition('_')
+    if len(head) <= 3 or not head.endswith('s') or head.endswith('ss'):
+        return []
+
+    forms = [head[:-1]]
+    if head.endswith('ies'):
+        forms = [head[:-3] + 'y']
+    return [form + sep + tail for form in forms]
+
+
+class CompiledOntology:
+    """
+    Ontology rules indexed by predicate, subject category and object category
+
+    A subject_type or object_type of '*' (or 'any') matches every category;
+    an exact category rule wins over a wildcard rule. Predicates match the
+    rule predicate exactly (case-insensitive), like the former rule dict.
+
+    Aliases are opt-in: explicit aliases map extra spellings to a rule
+    predicate, and derive_aliases=True also accepts base verb forms and
+    space/hyphen spellings of the rule predicates ("trigger" or "trigger s"
+    for "triggers", "convert to" for "converts_to"). Aliased relations are
+    stored under the rule predicate.
+
+    Example:
+        >>> ontology = CompiledOntology([
+        ...     {'subject_type': 'Mechanic', 'predicate': 'triggers', 'object_type': 'GameObject'},
+        ... ])
+        >>> ontology.validate('mechanic', 'triggers', 'gameobject', 0.9)
+        (True, 'Valid')
+        >>> ontology.validate('mechanic', 'trigger', 'gameobject', 0.9)
+        (False, "Invalid predicate 'trigger'")
+    """
+
+    def __init__(
+        self,
+        rules: Iterable[Dict[str, Any]],
+        aliases: Optional[Dict[str, str]] = None,
+        derive_aliases: bool = False
+    ):
+        """
+        Args:
+            rules: Ontology rule rows (subject_type, predicate, object_type, ...)
+            aliases: Extra predicate aliases (alias -> rule predicate)
+            derive_aliases: Also accept base verb forms and space/hyphen
+                spellings of the rule predicates
+        """
+        self.rules: List[Dict[str, Any]] = list(rules)
+        self.derive_aliases = derive_aliases
+
+        # predicate -> subject category -> object category -> rule
+        self._index: Dict[str, Dict[str, Dict[str, Dict[str, Any]]]] = defaultdict(lambda: defaultdict(dict))
+        for rule in self.rules:
+            predicate = normalize_predicate(rule.get('predicate'))
+            if not predicate:
+                continue
+            by_object = self._index[predicate][normalize_category(rule.get('subject_type'))]
+            # Last rule for a key wins (same as the former dict of keys)
+            by_object[normalize_category(rule.get('object_type'))] = rule
+
+        self.predicates = frozenset(self._index)
+
+        self._aliases: Dict[str, str] = {}
+        if derive_aliases:
+            for predicate in sorted(self.predicates):
+                for form in [_spelling_key(predicate)] + _base_forms(_spelling_key(predicate)):
+                    if form not in self.predicates:
+                        self._aliases.setdefault(form, predicate)
+        for alias, predicate in (aliases or {}).items():
+            alias, predicate = normalize_predicate(alias), normalize_predicate(predicate)
+            if alias not in self.predicates and predicate in self.predicates:
+                self._aliases[alias] = predicate
+
+    def __len__(self) -> int:
+        return len(self.rules)
+
+    def canonical_predicate(self, predicate: str) -> str:
+        """
+        Resolve a predicate or alias to the rule predicate
+
+        Args:
+            predicate: Predicate as extracted
+
+        Returns:
+            Rule predicate, or the normalized input if unknown
+        """
+        key = normalize_predicate(predicate)
+        if key in self.predicates:
+            return key
+        if key in self._aliases:
+            return self._aliases[key]
+        if self.derive_aliases:
+            spelled = _spelling_key(key)
+            if spelled in self.predicates:
+                return spelled
+            return self._aliases.get(spelled, key)
+        return key
+
+    def is_valid_predicate(self, predicate: str) -> bool:
+        """True if any rule uses the predicate (or its alias)"""
+        return self.canonical_predicate(predicate) in self.predicates
+
+    def find_rule(self, subject_type: str, predicate: str, object_type: str) -> Optional[Dict[str, Any]]:
+        """
+        Find the rule allowing subject -predicate-> object
+
+        Args:
+            subject_type: Subject category
+            predicate: Predicate (or alias)
+            object_type: Object category
+
+        Returns:
+            Most specific matching rule, or None
+        """
+        by_subject = self._index.get(self.canonical_predicate(predicate))
+        if not by_subject:
+            return None
+
+        subject, obj = normalize_category(subject_type), normalize_category(object_type)
+        for subject_key in (subject, WILDCARD):
+            by_object = by_subject.get(subject_key)
+            if by_object:
+                rule = by_object.get(obj) or by_object.get(WILDCARD)
+                if rule is not None:
+                    return rule
+        return None
+
+    def validate(
+        self,
+        subject_type: str,
+        predicate: str,
+        object_type: str,
+        confidence: float
+    ) -> Tuple[bool, str]:
+        """
+        Validate a relationship against the rules
+
+        Args:
+            subject_type: Source term category
+            predicate: Relationship predicate
+            object_type: Target term category
+            confidence: Extraction confidence
+
+        Returns:
+            Tuple of (is_valid, reason)
+        """
+        source_cat = (subject_type or '').lower()
+        target_cat = (object_type or '').lower()
+        pred = self.canonical_predicate(predicate)
+
+        if pred not in self.predicates:
+            return False, f"Invalid predicate '{predicate}'"
+
+        if self.find_rule(source_cat, pred, target_cat) is None:
+            return False, f"No rule for {source_cat} -{pred}-> {target_cat}"
+
+        if confidence < MIN_CONFIDENCE:
+            return False, f"Confidence {confidence:.2f} below minimum threshold {MIN_CONFIDENCE}"
+
+        return True, "Valid"
+
+    def relevant_rules(
+        self,
+        relations: Sequence[Tuple[str, str, str]],
+        limit: int = 15
+    ) -> List[Dict[str, Any]]:
+        """
+        Rules governing the given relations first, then the others in order
+
+        Args:
+            relations: (subject category, predicate, object category) triples
+            limit: Maximum number of rules
+
+        Returns:
+            Up to limit rule rows
+        """
+        selected: List[Dict[str, Any]] = []
+        seen = set()
+
+        for subject_type, predicate, object_type in relations:
+            rule = self.find_rule(subject_type, predicate, object_type)
+            if rule is not None and id(rule) not in seen:
+                seen.add(id(rule))
+                selected.append(rule)
+
+        for rule in self.rules:
+            if len(selected) >= limit:
+                break
+            if id(rule) not in seen:
+                seen.add(id(rule))
+                selected.append(rule)
+
+        return selected[:limit]
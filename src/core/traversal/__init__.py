@@ -1,7 +1,9 @@
 """
 Graph traversal module for knowledge graph exploration
 """
+from .graph_snapshot import GraphSnapshot
 from .graph_traversal import GraphTraversal, TraversalPath
 from .subgraph_extractor import SubgraphExtractor
+from .term_index import TermIndex
 
-__all__ = ['GraphTraversal', 'TraversalPath', 'SubgraphExtractor']
+__all__ = ['GraphSnapshot', 'GraphTraversal', 'TraversalPath', 'SubgraphExtractor', 'TermIndex']
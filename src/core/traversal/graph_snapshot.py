@@ -0,0 +1,367 @@
+"""
+In-memory graph snapshot for fast knowledge graph traversal
+"""
+import logging
+import threading
+import time
+from array import array
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+from supabase import Client
+
+from src.shared.config import Config
+from src.core.loaders.pagination import fetch_all
+
+logger = logging.getLogger("playbook_nexus.traversal")
+
+
+@dataclass
+class _CSRGraph:
+    """
+    Immutable CSR (compressed sparse row) view of the graph
+
+    Layout (per direction):
+        offsets[i]..offsets[i+1]  edge slots of node i
+        neighbors[slot]           neighbor node index
+        predicates[slot]          index into predicate_names
+        confidences[slot]         edge confidence
+    """
+    term_ids: List[str] = field(default_factory=list)
+    term_rows: List[Dict] = field(default_factory=list)
+    index_by_id: Dict[str, int] = field(default_factory=dict)
+    predicate_names: List[str] = field(default_factory=list)
+
+    out_offsets: array = field(default_factory=lambda: array('l', [0]))
+    out_neighbors: array = field(default_factory=lambda: array('l'))
+    out_predicates: array = field(default_factory=lambda: array('H'))
+    out_confidences: array = field(default_factory=lambda: array('d'))
+
+    in_offsets: array = field(default_factory=lambda: array('l', [0]))
+    in_neighbors: array = field(default_factory=lambda: array('l'))
+    in_predicates: array = field(default_factory=lambda: array('H'))
+    in_confidences: array = field(default_factory=lambda: array('d'))
+
+
+class GraphSnapshot:
+    """
+    Compact in-process copy of the knowledge graph
+
+    Loads playbook_semantic_terms and playbook_semantic_relations once and
+    keeps the edges as CSR arrays of term indices, predicate codes and
+    confidences. GraphTraversal uses it to expand nodes without a Supabase
+    round trip per hop.
+
+    Edges of a node are sorted by confidence (descending), so confidence
+    filtering stops at the first edge below the threshold.
+
+    A background thread (start_background_refresh) checks both tables for
+    changes and reloads only when they differ, so a running API picks up
+    Phase 2 results without a restart. Terms are compared by row count +
+    latest created_at; relations by row count + latest last_verified_at,
+    which Phase 2 reinforcement bumps together with confidence. A reload is
+    forced after max_age for writes that touch neither.
+    """
+
+    def __init__(
+        self,
+        supabase_client: Client,
+        page_size: int = 1000,
+        refresh_interval: Optional[float] = None,
+        max_age: Optional[float] = None
+    ):
+        """
+        Initialize graph snapshot (call load() to populate)
+
+        Args:
+            supabase_client: Initialized Supabase client
+            page_size: Rows per request when scanning tables
+            refresh_interval: Seconds between change checks in the background
+                (None = Config.GRAPH_SNAPSHOT_REFRESH_SECONDS, 0 = never)
+            max_age: Seconds after which a reload is forced even without a
+                detected change (None = Config.GRAPH_SNAPSHOT_MAX_AGE_SECONDS)
+        """
+        self.client = supabase_client
+        self.table_terms = Config.TABLE_SEMANTIC
+        self.table_relations = Config.TABLE_RELATIONS
+        self.page_size = page_size
+        self.refresh_interval = (
+            Config.GRAPH_SNAPSHOT_REFRESH_SECONDS if refresh_interval is None else refresh_interval
+        )
+        self.max_age = Config.GRAPH_SNAPSHOT_MAX_AGE_SECONDS if max_age is None else max_age
+
+        # Replaced as a whole on refresh, so readers always see one consistent graph
+        self._graph = _CSRGraph()
+        self._refresh_lock = threading.Lock()
+        self._signature: Optional[Tuple] = None
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.loaded_at: Optional[float] = None
+
+    @property
+    def is_loaded(self) -> bool:
+        """True once load() has completed"""
+        return self.loaded_at is not None
+
+    @property
+    def node_count(self) -> int:
+        return len(self._graph.term_ids)
+
+    @property
+    def edge_count(self) -> int:
+        return len(self._graph.out_neighbors)
+
+    def _fetch_all(self, table: str, columns: str) -> List[Dict]:
+        """Fetch every row of a table with keyset pagination"""
+        return fetch_all(self.client, table, columns, page_size=self.page_size)
+
+    def _table_signature(self, table: str, column: str = "created_at") -> Tuple[int, Optional[str]]:
+        """(row count, latest value of a timestamp column) of a table, for change detection"""
+        result = self.client.table(table)\
+            .select(column, count="exact")\
+            .order(column, desc=True, nullsfirst=False)\
+            .limit(1)\
+            .execute()
+
+        latest = result.data[0][column] if result.data else None
+        return (result.count or 0, latest)
+
+    def _current_signature(self) -> Tuple:
+        return (
+            self._table_signature(self.table_terms),
+            # Reinforcement updates confidence in place and only moves last_verified_at
+            self._table_signature(self.table_relations, "last_verified_at")
+        )
+
+    def load(self) -> "GraphSnapshot":
+        """
+        Load (or reload) the snapshot from Supabase
+
+        Returns:
+            self, for chaining
+        """
+        with self._refresh_lock:
+            start = time.time()
+
+            # Taken before the scan: rows written during the scan trigger another reload
+            signature = self._current_signature()
+            terms = self._fetch_all(self.table_terms, "id, term, category, definition")
+            relations = self._fetch_all(
+                self.table_relations,
+                "source_term_id, target_term_id, predicate, confidence"
+            )
+
+            self._graph = self.build_graph(terms, relations)
+            self._signature = signature
+            self.loaded_at = time.time()
+
+            logger.info(
+                f"Graph snapshot loaded: {self.node_count} nodes, {self.edge_count} edges "
+                f"({self.loaded_at - start:.2f}s)"
+            )
+        return self
+
+    def refresh(self) -> "GraphSnapshot":
+        """Rebuild the snapshot from the current database state"""
+        logger.info("Refreshing graph snapshot...")
+        return self.load()
+
+    def refresh_if_changed(self) -> bool:
+        """
+        Reload only if terms or relations changed since the last load
+        (or max_age has passed)
+
+        Returns:
+            True if the snapshot was reloaded
+        """
+        if self.is_loaded:
+            expired = time.time() - self.loaded_at >= self.max_age
+            if not expired and self._current_signature() == self._signature:
+                return False
+        self.refresh()
+        return True
+
+    def _refresh_loop(self):
+        """Background change check (keeps the current graph on errors)"""
+        while not self._stop_event.wait(self.refresh_interval):
+            try:
+                self.refresh_if_changed()
+            except Exception as e:
+                logger.error(f"Failed to refresh graph snapshot: {e}")
+
+    def start_background_refresh(self):
+        """Start the background refresh thread (if refresh_interval > 0)"""
+        if self.refresh_interval <= 0 or (self._thread and self._thread.is_alive()):
+            return
+
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._refresh_loop,
+            name="graph-snapshot-refresh",
+            daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        """Stop the background refresh thread"""
+        self._stop_event.set()
+        if self._thread:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    @classmethod
+    def build_graph(cls, terms: List[Dict], relations: List[Dict]) -> _CSRGraph:
+        """
+        Build CSR arrays from raw term and relation rows
+
+        Args:
+            terms: Rows with id, term, category, definition
+            relations: Rows with source_term_id, target_term_id, predicate, confidence
+
+        Returns:
+            Populated _CSRGraph
+        """
+        graph = _CSRGraph()
+        graph.term_ids = [t['id'] for t in terms]
+        graph.term_rows = terms
+        graph.index_by_id = {term_id: idx for idx, term_id in enumerate(graph.term_ids)}
+
+        predicate_codes: Dict[str, int] = {}
+        out_edges: Dict[int, List[Tuple[float, int, int]]] = defaultdict(list)
+        in_edges: Dict[int, List[Tuple[float, int, int]]] = defaultdict(list)
+        skipped = 0
+
+        for rel in relations:
+            src = graph.index_by_id.get(rel['source_term_id'])
+            dst = graph.index_by_id.get(rel['target_term_id'])
+            if src is None or dst is None:
+                skipped += 1
+                continue
+
+            predicate = rel['predicate']
+            code = predicate_codes.get(predicate)
+            if code is None:
+                code = len(graph.predicate_names)
+                predicate_codes[predicate] = code
+                graph.predicate_names.append(predicate)
+
+            confidence = float(rel['confidence'] or 0.0)
+            out_edges[src].append((confidence, dst, code))
+            in_edges[dst].append((confidence, src, code))
+
+        if skipped:
+            logger.warning(f"Graph snapshot skipped {skipped} relations with unknown terms")
+
+        node_count = len(graph.term_ids)
+        (graph.out_offsets, graph.out_neighbors,
+         graph.out_predicates, graph.out_confidences) = cls._to_csr(node_count, out_edges)
+        (graph.in_offsets, graph.in_neighbors,
+         graph.in_predicates, graph.in_confidences) = cls._to_csr(node_count, in_edges)
+
+        return graph
+
+    @staticmethod
+    def _to_csr(
+        node_count: int,
+        edges: Dict[int, List[Tuple[float, int, int]]]
+    ) -> Tuple[array, array, array, array]:
+        """Convert per-node edge lists into CSR arrays"""
+        offsets = array('l', [0])
+        neighbors = array('l')
+        predicate_codes = array('H')
+        confidences = array('d')
+
+        for node in range(node_count):
+            node_edges = edges.get(node)
+            if node_edges:
+                # Highest confidence first (stable for equal confidences)
+                node_edges.sort(key=lambda e: e[0], reverse=True)
+                for confidence, neighbor, code in node_edges:
+                    neighbors.append(neighbor)
+                    predicate_codes.append(code)
+                    confidences.append(confidence)
+            offsets.append(len(neighbors))
+
+        return offsets, neighbors, predicate_codes, confidences
+
+    def get_term_data(self, term_id: str) -> Optional[Dict]:
+        """
+        Get term row by ID
+
+        Returns:
+            Dictionary with id, term, category, definition (or None)
+        """
+        graph = self._graph
+        idx = graph.index_by_id.get(term_id)
+        if idx is None:
+            return None
+        return graph.term_rows[idx]
+
+    def get_outgoing_relations(self, term_id: str, min_confidence: float) -> List[Dict]:
+        """
+        Get outgoing edges of a node
+
+        Returns:
+            Relation dictionaries shaped like GraphTraversal._get_outgoing_relations
+        """
+        graph = self._graph
+        idx = graph.index_by_id.get(term_id)
+        if idx is None:
+            return []
+
+        relations = []
+        for slot in range(graph.out_offsets[idx], graph.out_offsets[idx + 1]):
+            confidence = graph.out_confidences[slot]
+            if confidence < min_confidence:
+                # Edges are sorted by confidence, the rest are lower
+                break
+
+            target = graph.term_rows[graph.out_neighbors[slot]]
+            relations.append({
+                'target_term_id': target['id'],
+                'target_term': target['term'],
+                'target_category': target['category'],
+                'predicate': graph.predicate_names[graph.out_predicates[slot]],
+                'confidence': confidence
+            })
+
+        return relations
+
+    def get_incoming_relations(self, term_id: str, min_confidence: float) -> List[Dict]:
+        """
+        Get incoming edges of a node
+
+        Returns:
+            Relation dictionaries with source term data
+        """
+        graph = self._graph
+        idx = graph.index_by_id.get(term_id)
+        if idx is None:
+            return []
+
+        relations = []
+        for slot in range(graph.in_offsets[idx], graph.in_offsets[idx + 1]):
+            confidence = graph.in_confidences[slot]
+            if confidence < min_confidence:
+                break
+
+            source = graph.term_rows[graph.in_neighbors[slot]]
+            relations.append({
+                'source_term_id': source['id'],
+                'source_term': source['term'],
+                'source_category': source['category'],
+                'predicate': graph.predicate_names[graph.in_predicates[slot]],
+                'confidence': confidence
+            })
+
+        return relations
+
+    def degree(self, term_id: str) -> int:
+        """Total number of incoming + outgoing edges of a node"""
+        graph = self._graph
+        idx = graph.index_by_id.get(term_id)
+        if idx is None:
+            return 0
+        return (graph.out_offsets[idx + 1] - graph.out_offsets[idx]) + \
+               (graph.in_offsets[idx + 1] - graph.in_offsets[idx])
@@ -9,6 +9,8 @@ from dataclasses import dataclass
 from supabase import Client
 
 from src.shared.config import Config
+from src.core.traversal.graph_snapshot import GraphSnapshot
+from src.core.traversal.term_index import TermIndex
 
 logger = logging.getLogger("playbook_nexus.traversal")
 
@@ -44,20 +46,36 @@ class GraphTraversal:
 
     Provides BFS, DFS, and other graph algorithms to explore relationships
     in the knowledge graph stored in Supabase.
+
+    When a loaded GraphSnapshot is attached, node expansion runs entirely
+    in memory instead of issuing one Supabase query per visited node.
     """
 
-    def __init__(self, supabase_client: Client):
+    def __init__(
+        self,
+        supabase_client: Client,
+        snapshot: Optional[GraphSnapshot] = None,
+        term_index: Optional[TermIndex] = None
+    ):
         """
         Initialize graph traversal
 
         Args:
             supabase_client: Initialized Supabase client
+            snapshot: Optional in-memory graph snapshot (used once loaded)
+            term_index: Optional term name index for start node resolution
         """
         self.client = supabase_client
         self.table_terms = Config.TABLE_SEMANTIC
         self.table_relations = Config.TABLE_RELATIONS
+        self.snapshot = snapshot
+        self.term_index = term_index
+
+        logger.info(f"GraphTraversal initialized (snapshot={'on' if snapshot else 'off'})")
 
-        logger.info("GraphTraversal initialized")
+    def _use_snapshot(self) -> bool:
+        """True if traversal should read from the in-memory snapshot"""
+        return self.snapshot is not None and self.snapshot.is_loaded
 
     def bfs_traversal(
         self,
@@ -225,6 +243,8 @@ class GraphTraversal:
         Get term ID by term name
 
         If multiple terms exist, prefer the one that has relations.
+        Uses the term index when loaded; falls back to querying Supabase
+        for names the index does not know yet.
 
         Args:
             term: Term name to look up
@@ -232,6 +252,11 @@ class GraphTraversal:
         Returns:
             Term UUID or None if not found
         """
+        if self.term_index is not None and self.term_index.is_loaded:
+            term_id = self.term_index.resolve(term)
+            if term_id:
+                return term_id
+
         try:
             # Get all matching terms
             result = self.client.table(self.table_terms)\
@@ -276,6 +301,9 @@ class GraphTraversal:
         Returns:
             Dictionary with id, term, category, definition
         """
+        if self._use_snapshot():
+            return self.snapshot.get_term_data(term_id)
+
         try:
             result = self.client.table(self.table_terms)\
                 .select("id, term, category, definition")\
@@ -306,6 +334,9 @@ class GraphTraversal:
         Returns:
             List of relation dictionaries with target term data
         """
+        if self._use_snapshot():
+            return self.snapshot.get_outgoing_relations(term_id, min_confidence)
+
         try:
             # Query relations first
             result = self.client.table(self.table_relations)\
@@ -3,11 +3,12 @@ Subgraph extraction for visualization and focused analysis
 """
 import logging
 from typing import Dict, List, Optional, Set
-from collections import deque
 
 from supabase import Client
 
 from src.shared.config import Config
+from src.core.loaders.pagination import KeysetPaginator, chunked
+from src.core.traversal.term_index import TermIndex
 
 logger = logging.getLogger("playbook_nexus.traversal")
 
@@ -20,16 +21,18 @@ class SubgraphExtractor:
     for visualization, analysis, or export.
     """
 
-    def __init__(self, supabase_client: Client):
+    def __init__(self, supabase_client: Client, term_index: Optional[TermIndex] = None):
         """
         Initialize subgraph extractor
 
         Args:
             supabase_client: Initialized Supabase client
+            term_index: Optional term name index for center node resolution
         """
         self.client = supabase_client
         self.table_terms = Config.TABLE_SEMANTIC
         self.table_relations = Config.TABLE_RELATIONS
+        self.term_index = term_index
 
         logger.info("SubgraphExtractor initialized")
 
@@ -84,109 +87,126 @@ class SubgraphExtractor:
             logger.warning(f"Center term '{center_term}' not found")
             return {'nodes': [], 'edges': []}
 
-        # BFS to collect nodes within radius
+        # Level-synchronous BFS: each hop fetches node rows and in/out edges
+        # for the whole frontier at once (≈3 round trips per level)
         nodes: Dict[str, Dict] = {}
         edges: List[Dict] = []
         visited: Set[str] = set()
-        queue = deque([(center_id, 0)])
+        term_cache: Dict[str, Dict] = {}
+        frontier: List[str] = [center_id]
+        depth = 0
         traversal_log: List[str] = []  # Track all traversal steps
 
-        while queue:
-            current_id, depth = queue.popleft()
+        while frontier and depth <= radius:
+            # Deduplicate while keeping BFS order
+            level_nodes = []
+            for node_id in frontier:
+                if node_id not in visited:
+                    visited.add(node_id)
+                    level_nodes.append(node_id)
 
-            if current_id in visited:
-                continue
+            if not level_nodes:
+                break
 
-            if depth > radius:
-                continue
-
-            visited.add(current_id)
-
-            # Add node data
-            node_data = self._get_term_data(current_id)
-            if node_data:
-                nodes[current_id] = node_data
-                current_term = node_data['term']
-
-                # Log node visit
-                if depth == 0:
-                    traversal_log.append(f"🎯 시작: {current_term} (중심 노드)")
-                else:
-                    traversal_log.append(f"📍 Hop {depth}: {current_term} 방문")
+            # Node rows are usually cached from the previous level's neighbor fetch
+            missing_ids = [node_id for node_id in level_nodes if node_id not in term_cache]
+            term_cache.update(self._get_terms_data(missing_ids))
 
             # Get outgoing AND incoming edges for bidirectional traversal
-            out_relations = self._get_outgoing_relations(
-                current_id,
-                min_confidence
-            )
-            in_relations = self._get_incoming_relations(
-                current_id,
-                min_confidence
-            )
-
-            all_relations = out_relations + in_relations
-
-            if not all_relations and depth == 0:
-                traversal_log.append(f"  ⚠️ {current_term}에 연결된 관계가 없습니다")
-
-            for rel in all_relations:
-                # Determine next node (outgoing: target, incoming: source)
-                if 'target_term_id' in rel and 'source_term_id' not in rel:
-                    # Outgoing relation
-                    next_id = rel['target_term_id']
-                    edge_source = current_id
-                    edge_target = next_id
-                elif 'source_term_id' in rel and 'target_term_id' not in rel:
-                    # Incoming relation
-                    next_id = rel['source_term_id']
-                    edge_source = next_id
-                    edge_target = current_id
-                else:
-                    # Skip malformed relation
-                    continue
-
-                # Get next term name for logging
-                next_data = self._get_term_data(next_id)
-                next_term = next_data['term'] if next_data else next_id
-
-                # Filter by predicate if specified
-                if predicates and rel['predicate'] not in predicates:
-                    traversal_log.append(f"  ⏭️ {next_term}: predicate '{rel['predicate']}' 필터링됨")
-                    continue
-
-                # Check confidence
-                if rel['confidence'] < min_confidence:
-                    traversal_log.append(f"  ⏭️ {next_term}: 신뢰도 {rel['confidence']:.2f} < {min_confidence}")
-                    continue
-
-                # Add edge (preserve original direction)
-                edges.append({
-                    'source': edge_source,
-                    'target': edge_target,
-                    'predicate': rel['predicate'],
-                    'confidence': rel['confidence'],
-                    'evidence': rel.get('evidence')
-                })
+            out_by_node = self._get_outgoing_relations_batch(level_nodes, min_confidence)
+            in_by_node = self._get_incoming_relations_batch(level_nodes, min_confidence)
+
+            # Fetch neighbor rows (for logging and as the next level's node rows)
+            neighbor_ids = set()
+            for rels in out_by_node.values():
+                neighbor_ids.update(rel['target_term_id'] for rel in rels)
+            for rels in in_by_node.values():
+                neighbor_ids.update(rel['source_term_id'] for rel in rels)
+            term_cache.update(self._get_terms_data(
+                [node_id for node_id in neighbor_ids if node_id not in term_cache]
+            ))
+
+            next_frontier: List[str] = []
+
+            for current_id in level_nodes:
+                # Add node data
+                node_data = term_cache.get(current_id)
+                current_term = node_data['term'] if node_data else current_id
+                if node_data:
+                    nodes[current_id] = node_data
 
-                # Log edge discovery
-                if node_data and next_data:
-                    source_term = node_data['term']
-                    if edge_source == current_id:
-                        traversal_log.append(
-                            f"  ✅ {source_term} → [{rel['predicate']}] → {next_term} "
-                            f"(conf={rel['confidence']:.2f})"
-                        )
+                    # Log node visit
+                    if depth == 0:
+                        traversal_log.append(f"🎯 시작: {current_term} (중심 노드)")
                     else:
-                        traversal_log.append(
-                            f"  ✅ {next_term} → [{rel['predicate']}] → {source_term} "
-                            f"(conf={rel['confidence']:.2f})"
-                        )
+                        traversal_log.append(f"📍 Hop {depth}: {current_term} 방문")
+
+                all_relations = out_by_node.get(current_id, []) + in_by_node.get(current_id, [])
+
+                if not all_relations and depth == 0:
+                    traversal_log.append(f"  ⚠️ {current_term}에 연결된 관계가 없습니다")
+
+                for rel in all_relations:
+                    # Determine next node (outgoing: target, incoming: source)
+                    if 'target_term_id' in rel and 'source_term_id' not in rel:
+                        # Outgoing relation
+                        next_id = rel['target_term_id']
+                        edge_source = current_id
+                        edge_target = next_id
+                    elif 'source_term_id' in rel and 'target_term_id' not in rel:
+                        # Incoming relation
+                        next_id = rel['source_term_id']
+                        edge_source = next_id
+                        edge_target = current_id
+                    else:
+                        # Skip malformed relation
+                        continue
+
+                    # Get next term name for logging
+                    next_data = term_cache.get(next_id)
+                    next_term = next_data['term'] if next_data else next_id
+
+                    # Filter by predicate if specified
+                    if predicates and rel['predicate'] not in predicates:
+                        traversal_log.append(f"  ⏭️ {next_term}: predicate '{rel['predicate']}' 필터링됨")
+                        continue
+
+                    # Check confidence
+                    if rel['confidence'] < min_confidence:
+                        traversal_log.append(f"  ⏭️ {next_term}: 신뢰도 {rel['confidence']:.2f} < {min_confidence}")
+                        continue
+
+                    # Add edge (preserve original direction)
+                    edges.append({
+                        'source': edge_source,
+                        'target': edge_target,
+                        'predicate': rel['predicate'],
+                        'confidence': rel['confidence'],
+                        'evidence': rel.get('evidence')
+                    })
+
+                    # Log edge discovery
+                    if node_data and next_data:
+                        source_term = node_data['term']
+                        if edge_source == current_id:
+                            traversal_log.append(
+                                f"  ✅ {source_term} → [{rel['predicate']}] → {next_term} "
+                                f"(conf={rel['confidence']:.2f})"
+                            )
+                        else:
+                            traversal_log.append(
+                                f"  ✅ {next_term} → [{rel['predicate']}] → {source_term} "
+                                f"(conf={rel['confidence']:.2f})"
+                            )
+
+                    # Queue next node for next level
+                    if depth < radius:
+                        next_frontier.append(next_id)
+                    else:
+                        traversal_log.append(f"  ⏭️ {next_term}: radius 제한 도달 (depth {depth + 1} > {radius})")
 
-                # Queue next node for next level
-                if depth < radius:
-                    queue.append((next_id, depth + 1))
-                else:
-                    traversal_log.append(f"  ⏭️ {next_term}: radius 제한 도달 (depth {depth + 1} > {radius})")
+            frontier = next_frontier
+            depth += 1
 
         logger.info(f"Extracted subgraph: {len(nodes)} nodes, {len(edges)} edges")
 
@@ -367,7 +387,13 @@ class SubgraphExtractor:
         Get term ID by term name
 
         If multiple terms with same name exist, prefer the one with most relations
+        (precomputed by the term index when loaded)
         """
+        if self.term_index is not None and self.term_index.is_loaded:
+            term_id = self.term_index.resolve(term)
+            if term_id:
+                return term_id
+
         try:
             # Get all terms with this name
             result = self.client.table(self.table_terms)\
@@ -477,3 +503,123 @@ class SubgraphExtractor:
         except Exception as e:
             logger.error(f"Error getting incoming relations for '{term_id}': {e}")
             return []
+
+    def _select_in(
+        self,
+        table: str,
+        columns: str,
+        column: str,
+        ids: List[str],
+        min_confidence: Optional[float] = None,
+        page_size: Optional[int] = None
+    ) -> List[Dict]:
+        """
+        Select rows whose column is in ids (chunked, keyset-paginated by id)
+
+        Relation rows are returned in descending confidence order (ties by id).
+        """
+        rows: List[Dict] = []
+
+        for chunk in chunked(ids):
+            def filters(query, chunk=chunk):
+                query = query.in_(column, chunk)
+                if min_confidence is not None:
+                    query = query.gte("confidence", min_confidence)
+                return query
+
+            rows.extend(KeysetPaginator(
+                self.client, table, columns,
+                order_by=("id",),
+                page_size=page_size,
+                filters=filters
+            ))
+
+        if min_confidence is not None:
+            # Stable sort keeps the id order among equal confidences
+            rows.sort(key=lambda row: -row['confidence'])
+
+        return rows
+
+    def _get_terms_data(self, term_ids: List[str]) -> Dict[str, Dict]:
+        """Get term data for many IDs at once (id -> term data)"""
+        if not term_ids:
+            return {}
+
+        try:
+            rows = self._select_in(
+                self.table_terms,
+                "id, term, category, definition",
+                "id",
+                term_ids
+            )
+            return {row['id']: row for row in rows}
+
+        except Exception as e:
+            logger.error(f"Error getting term data for {len(term_ids)} terms: {e}")
+            return {}
+
+    def _get_outgoing_relations_batch(
+        self,
+        term_ids: List[str],
+        min_confidence: float
+    ) -> Dict[str, List[Dict]]:
+        """
+        Get outgoing edges for many nodes at once
+
+        Returns:
+            source term ID -> relations shaped like _get_outgoing_relations()
+        """
+        relations: Dict[str, List[Dict]] = {}
+        if not term_ids:
+            return relations
+
+        try:
+            rows = self._select_in(
+                self.table_relations,
+                "source_term_id, target_term_id, predicate, confidence, evidence",
+                "source_term_id",
+                term_ids,
+                min_confidence=min_confidence
+            )
+        except Exception as e:
+            logger.error(f"Error getting outgoing relations for {len(term_ids)} terms: {e}")
+            return relations
+
+        for row in rows:
+            source_id = row.pop('source_term_id')
+            relations.setdefault(source_id, []).append(row)
+
+        return relations
+
+    def _get_incoming_relations_batch(
+        self,
+        term_ids: List[str],
+        min_confidence: float
+    ) -> Dict[str, List[Dict]]:
+        """
+        Get incoming edges for many nodes at once
+
+        Returns:
+            target term ID -> relations shaped like _get_incoming_relations()
+        """
+        relations: Dict[str, List[Dict]] = {}
+        if not term_ids:
+            return relations
+
+        try:
+            rows = self._select_in(
+                self.table_relations,
+                "source_term_id, target_term_id, predicate, confidence, evidence",
+                "target_term_id",
+                term_ids,
+                min_confidence=min_confidence
+            )
+        except Exception as e:
+            logger.error(f"Error getting incoming relations for {len(term_ids)} terms: {e}")
+            return relations
+
+        for row in rows:
+            target_id = row.pop('target_term_id')
+            relations.setdefault(target_id, []).append(row)
+
+        return relations
@@ -0,0 +1,283 @@
+"""
+Term name resolution index for picking traversal start nodes
+"""
+import logging
+import threading
+import time
+import unicodedata
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+from supabase import Client
+
+from src.shared.config import Config
+from src.core.loaders.pagination import fetch_all
+
+logger = logging.getLogger("playbook_nexus.traversal")
+
+
+def normalize_term_name(term: str) -> str:
+    """Normalize a term name for index lookups (NFC, trimmed, case-folded)"""
+    return unicodedata.normalize("NFC", term or "").strip().casefold()
+
+
+@dataclass
+class _TermIndexState:
+    """Index contents, replaced as a whole on full rebuilds"""
+    # normalized name -> term rows ({'id', 'term'}) of every instance
+    instances: Dict[str, List[Dict]] = field(default_factory=lambda: defaultdict(list))
+    # term id -> incoming + outgoing relation count
+    degrees: Dict[str, int] = field(default_factory=lambda: defaultdict(int))
+    term_count: int = 0
+    relation_count: int = 0
+    terms_watermark: Optional[str] = None
+    relations_watermark: Optional[str] = None
+
+
+class TermIndex:
+    """
+    Normalized term name -> ranked term IDs
+
+    Several rows of playbook_semantic_terms can share a name (one per
+    document). Traversal starts from the instance with the most relations,
+    so degrees are precomputed from playbook_semantic_relations and start
+    node resolution becomes a dictionary lookup.
+
+    refresh() is incremental: rows created after the last seen created_at
+    are folded in, and a full rebuild happens only when row counts show
+    deletions (or anything else the watermark cannot explain). Automatic
+    refreshes run on a background thread; lookups never wait for them.
+    """
+
+    def __init__(
+        self,
+        supabase_client: Client,
+        refresh_interval: Optional[float] = None,
+        page_size: int = 1000
+    ):
+        """
+        Initialize term index (call load() to populate)
+
+        Args:
+            supabase_client: Initialized Supabase client
+            refresh_interval: Seconds between automatic incremental refreshes
+                (None = Config.TERM_INDEX_REFRESH_SECONDS, 0 = manual only)
+            page_size: Rows per request when scanning tables
+        """
+        self.client = supabase_client
+        self.table_terms = Config.TABLE_SEMANTIC
+        self.table_relations = Config.TABLE_RELATIONS
+        self.refresh_interval = (
+            Config.TERM_INDEX_REFRESH_SECONDS if refresh_interval is None else refresh_interval
+        )
+        self.page_size = page_size
+
+        self._state = _TermIndexState()
+        self._ranked: Dict[str, List[str]] = {}
+        self._lock = threading.Lock()
+        # Held while a background refresh runs, so only one caller starts it
+        self._refresh_guard = threading.Lock()
+        self.loaded_at: Optional[float] = None
+
+    @property
+    def is_loaded(self) -> bool:
+        """True once load() has completed"""
+        return self.loaded_at is not None
+
+    @property
+    def term_count(self) -> int:
+        return self._state.term_count
+
+    def _fetch_rows(self, table: str, columns: str, since: Optional[str] = None) -> List[Dict]:
+        """Fetch rows of a table in creation order (optionally only those created after since)"""
+        return fetch_all(
+            self.client, table, columns,
+            order_by=("created_at", "id"),
+            page_size=self.page_size,
+            filters=(lambda query: query.gt("created_at", since)) if since is not None else None
+        )
+
+    def _count_rows(self, table: str) -> int:
+        """Exact row count of a table"""
+        result = self.client.table(table)\
+            .select("id", count="exact")\
+            .limit(1)\
+            .execute()
+        return result.count or 0
+
+    @staticmethod
+    def _apply(state: _TermIndexState, terms: List[Dict], relations: List[Dict]):
+        """Fold new term and relation rows into the index state"""
+        for row in terms:
+            state.instances[normalize_term_name(row['term'])].append(
+                {'id': row['id'], 'term': row['term']}
+            )
+            state.term_count += 1
+            if row.get('created_at'):
+                state.terms_watermark = max(state.terms_watermark or '', row['created_at'])
+
+        for rel in relations:
+            state.degrees[rel['source_term_id']] += 1
+            state.degrees[rel['target_term_id']] += 1
+            state.relation_count += 1
+            if rel.get('created_at'):
+                state.relations_watermark = max(state.relations_watermark or '', rel['created_at'])
+
+    def _rank(self, state: _TermIndexState) -> Dict[str, List[str]]:
+        """Order instances of each name by degree (ties keep creation order)"""
+        ranked = {}
+        for name, rows in state.instances.items():
+            ordered = sorted(rows, key=lambda r: state.degrees.get(r['id'], 0), reverse=True)
+            ranked[name] = [r['id'] for r in ordered]
+        return ranked
+
+    def load(self) -> "TermIndex":
+        """
+        Build the index from scratch
+
+        Returns:
+            self, for chaining
+        """
+        with self._lock:
+            start = time.time()
+
+            state = _TermIndexState()
+            self._apply(
+                state,
+                self._fetch_rows(self.table_terms, "id, term, created_at"),
+                self._fetch_rows(self.table_relations, "id, source_term_id, target_term_id, created_at")
+            )
+
+            self._ranked = self._rank(state)
+            self._state = state
+            self.loaded_at = time.time()
+
+            logger.info(
+                f"Term index built: {len(self._ranked)} names, {state.term_count} terms, "
+                f"{state.relation_count} relations ({self.loaded_at - start:.2f}s)"
+            )
+        return self
+
+    def refresh(self) -> "TermIndex":
+        """
+        Incrementally pick up terms and relations added since the last load
+
+        Falls back to a full rebuild when row counts do not match (e.g. rows
+        were deleted or the index was never loaded).
+
+        Returns:
+            self, for chaining
+        """
+        if not self.is_loaded:
+            return self.load()
+
+        with self._lock:
+            state = self._state
+            new_terms = self._fetch_rows(self.table_terms, "id, term, created_at", state.terms_watermark)
+            new_relations = self._fetch_rows(
+                self.table_relations,
+                "id, source_term_id, target_term_id, created_at",
+                state.relations_watermark
+            )
+
+            expected_terms = state.term_count + len(new_terms)
+            expected_relations = state.relation_count + len(new_relations)
+            consistent = (
+                self._count_rows(self.table_terms) == expected_terms and
+                self._count_rows(self.table_relations) == expected_relations
+            )
+
+            if consistent:
+                if new_terms or new_relations:
+                    self._apply(state, new_terms, new_relations)
+                    self._ranked = self._rank(state)
+                    logger.info(
+                        f"Term index refreshed: +{len(new_terms)} terms, "
+                        f"+{len(new_relations)} relations"
+                    )
+                self.loaded_at = time.time()
+                return self
+
+        logger.info("Term index out of sync with database, rebuilding...")
+        return self.load()
+
+    def maybe_refresh(self) -> bool:
+        """
+        Start a background incremental refresh if the refresh interval has elapsed
+
+        Never blocks: callers keep reading the current index while the
+        refresh runs, and at most one refresh is in flight.
+
+        Returns:
+            True if a refresh thread was started
+        """
+        if not self.refresh_interval or not self.is_loaded:
+            return False
+        if time.time() - self.loaded_at < self.refresh_interval:
+            return False
+        if not self._refresh_guard.acquire(blocking=False):
+            return False
+
+        thread = threading.Thread(
+            target=self._background_refresh,
+            name="term-index-refresh",
+            daemon=True
+        )
+        thread.start()
+        return True
+
+    def _background_refresh(self):
+        """Refresh body for maybe_refresh (releases the refresh guard when done)"""
+        try:
+            self.refresh()
+        except Exception as e:
+            # Keep serving the current index; retry after the next interval
+            self.loaded_at = time.time()
+            logger.error(f"Error refreshing term index: {e}")
+        finally:
+            self._refresh_guard.release()
+
+    def get_term_ids(self, term: str) -> List[str]:
+        """
+        Get all instance IDs of a term, best first
+
+        Args:
+            term: Term name to look up
+
+        Returns:
+            Term UUIDs ordered by relation count (descending)
+        """
+        self.maybe_refresh()
+        return list(self._ranked.get(normalize_term_name(term), []))
+
+    def resolve(self, term: str) -> Optional[str]:
+        """
+        Get the best term ID for a term name
+
+        An instance whose stored name matches exactly wins over instances
+        that only match after normalization; otherwise the one with the most
+        relations is returned.
+
+        Args:
+            term: Term name to look up
+
+        Returns:
+            Term UUID or None if not indexed
+        """
+        ids = self.get_term_ids(term)
+        if not ids:
+            return None
+
+        exact_ids = {
+            row['id'] for row in self._state.instances.get(normalize_term_name(term), [])
+            if row['term'] == term
+        }
+        for term_id in ids:
+            if term_id in exact_ids:
+                return term_id
+        return ids[0]
+
+    def degree(self, term_id: str) -> int:
+        """Total number of incoming + outgoing relations of a term"""
+        return self._state.degrees.get(term_id, 0)
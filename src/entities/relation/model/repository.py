@@ -6,6 +6,8 @@ Relation Entity - Repository Layer
 from typing import List, Optional, Dict, Any
 import logging
 
+from src.core.loaders.pagination import fetch_all
+
 logger = logging.getLogger(__name__)
 
 
@@ -21,7 +23,7 @@ class RelationRepository:
 
     def find_all(self, min_confidence: float = 0.0) -> List[Dict[str, Any]]:
         """
-        모든 관계 조회
+        모든 관계 조회 (키셋 페이지네이션, 서버 행 수 제한 없이 전체)
 
         Args:
             min_confidence: 최소 신뢰도 (기본: 0.0)
@@ -30,11 +32,11 @@ class RelationRepository:
             관계 리스트
         """
         try:
-            result = self.client.table('playbook_semantic_relations')\
-                .select('*')\
-                .gte('confidence', min_confidence)\
-                .execute()
-            return result.data if result.data else []
+            return fetch_all(
+                self.client,
+                'playbook_semantic_relations',
+                filters=lambda query: query.gte('confidence', min_confidence)
+            )
         except Exception as e:
             logger.error(f"Failed to fetch all relations: {e}")
             return []
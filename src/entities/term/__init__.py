@@ -1,11 +1,14 @@
 """Term Entity - Public API"""
-from .model import Term, TermRepository
-from .lib import normalize_korean_text, fuzzy_similarity, find_matching_terms
+from .model import Term, TermRepository, TermCatalog, CatalogSnapshot
+from .lib import normalize_korean_text, fuzzy_similarity, find_matching_terms, TermNgramIndex
 
 __all__ = [
     'Term',
     'TermRepository',
+    'TermCatalog',
+    'CatalogSnapshot',
     'normalize_korean_text',
     'fuzzy_similarity',
-    'find_matching_terms'
+    'find_matching_terms',
+    'TermNgramIndex'
 ]
@@ -0,0 +1,10 @@
+"""Term Entity - Library"""
+from .fuzzy_matching import normalize_korean_text, fuzzy_similarity, find_matching_terms
+from .ngram_index import TermNgramIndex
+
+__all__ = [
+    'normalize_korean_text',
+    'fuzzy_similarity',
+    'find_matching_terms',
+    'TermNgramIndex'
+]
@@ -0,0 +1,218 @@
+"""
+Term Entity - Fuzzy Matching
+
+사용자 질문에서 용어 찾기 (띄어쓰기/오탈자/조사 보정)
+자세한 동작은 FUZZY_MATCHING_GUIDE.md 참고
+"""
+import re
+from difflib import SequenceMatcher
+from typing import Any, Dict, Iterable, List, Optional, Set, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .ngram_index import TermNgramIndex
+
+# 단어 끝에서만 제거 (긴 조사부터 확인)
+KOREAN_PARTICLES = [
+    '에서는', '에서도', '으로는', '으로도', '에게서',
+    '에서', '에게', '으로', '부터', '까지', '처럼', '보다', '한테', '와는', '과는',
+    '은', '는', '이', '가', '을', '를', '와', '과', '의', '에', '로', '도', '만',
+]
+
+# 길이 차이 1 이하 + 첫 글자 같음 → 보너스
+FIRST_CHAR_BONUS = 0.15
+
+# 짧은 단어(3글자 이하) 보정: 다른 글자 수 → 최소 유사도
+SHORT_WORD_MAX_LENGTH = 3
+SHORT_WORD_FLOOR = {1: 0.8, 2: 0.6}
+
+# Fuzzy 매칭 대상 최소 길이 (1글자 용어는 정확 매칭만)
+MIN_FUZZY_LENGTH = 2
+
+# 동의어 사전(SYNONYM_DICTIONARY)으로 찾은 용어의 신뢰도
+SYNONYM_MATCH_CONFIDENCE = 0.9
+
+_PUNCTUATION = re.compile(r'[^\w\s]')
+
+
+def _strip_particle(word: str) -> str:
+    """단어 끝 조사 1개 제거 (제거 후 2글자 미만이 되면 유지)"""
+    for particle in KOREAN_PARTICLES:
+        if word.endswith(particle) and len(word) - len(particle) >= 2:
+            return word[:-len(particle)]
+    return word
+
+
+def _normalize_words(text: str) -> List[str]:
+    """소문자 변환, 문장부호 제거, 단어별 조사 제거"""
+    if not text:
+        return []
+    cleaned = _PUNCTUATION.sub(' ', text.lower())
+    return [_strip_particle(word) for word in cleaned.split()]
+
+
+def normalize_korean_text(text: str) -> str:
+    """
+    한국어 텍스트 정규화
+
+    Args:
+        text: 원본 텍스트
+
+    Returns:
+        소문자 변환, 조사 제거, 띄어쓰기 제거된 텍스트
+
+    Example:
+        >>> normalize_korean_text("클로버를")
+        '클로버'
+        >>> normalize_korean_text("포 코 코 로")
+        '포코코로'
+    """
+    return ''.join(_normalize_words(text))
+
+
+def fuzzy_similarity(str1: str, str2: str) -> float:
+    """
+    두 문자열의 유사도 (0.0 ~ 1.0)
+
+    SequenceMatcher 유사도에 첫 글자 보너스와 짧은 단어 보정을 적용
+
+    Args:
+        str1: 비교 문자열 1 (정규화된 텍스트)
+        str2: 비교 문자열 2 (정규화된 텍스트)
+
+    Returns:
+        유사도
+
+    Example:
+        >>> round(fuzzy_similarity("클로바", "클로버"), 2)
+        0.82
+    """
+    if not str1 or not str2:
+        return 0.0
+    if str1 == str2:
+        return 1.0
+
+    score = SequenceMatcher(None, str1, str2).ratio()
+
+    # 길이 보정: 길이 차이 1 이하 + 첫 글자 같음
+    if abs(len(str1) - len(str2)) <= 1 and str1[0] == str2[0]:
+        score = min(1.0, score + FIRST_CHAR_BONUS)
+
+    # 짧은 단어 보정: 한두 글자만 달라도 SequenceMatcher 점수가 크게 떨어짐
+    if len(str1) == len(str2) <= SHORT_WORD_MAX_LENGTH:
+        diff = sum(1 for a, b in zip(str1, str2) if a != b)
+        score = max(score, SHORT_WORD_FLOOR.get(diff, 0.0))
+
+    return score
+
+
+def query_units(user_query: str) -> List[str]:
+    """Fuzzy 비교 대상 질문 단어 (정규화, 중복 제거, 순서 유지)"""
+    units = []
+    for word in _normalize_words(user_query):
+        if len(word) >= MIN_FUZZY_LENGTH and word not in units:
+            units.append(word)
+    return units
+
+
+def _match_result(term: Dict[str, Any], match_type: str, confidence: float) -> Dict[str, Any]:
+    result = dict(term)
+    result['match_type'] = match_type
+    result['match_confidence'] = confidence
+    return result
+
+
+def _score_terms(
+    user_query: str,
+    normalized_query: str,
+    units: List[str],
+    candidates: Iterable[int],
+    terms: List[Dict[str, Any]],
+    keys: List[str],
+    exact_threshold: float,
+    fuzzy_threshold: float,
+    synonym_hits: Set[int]
+) -> List[Dict[str, Any]]:
+    """후보 용어 채점 (전체 스캔과 인덱스 조회가 같은 규칙을 쓰도록 공유)"""
+    matches = []
+
+    for idx in candidates:
+        term = terms[idx]
+        key = keys[idx]
+        if not key:
+            continue
+
+        # Method 1: 정확 매칭 (원본 포함 또는 정규화 후 포함)
+        if term['term'] in user_query or key in normalized_query:
+            matches.append((idx, _match_result(term, 'exact', 1.0)))
+            continue
+
+        # 동의어가 질문에 포함된 용어
+        if idx in synonym_hits:
+            matches.append((idx, _match_result(term, 'synonym', SYNONYM_MATCH_CONFIDENCE)))
+            continue
+
+        # Method 2: Fuzzy 매칭 (질문 단어별 최고 유사도)
+        if len(key) < MIN_FUZZY_LENGTH:
+            continue
+
+        best = max((fuzzy_similarity(key, unit) for unit in units), default=0.0)
+        if best >= exact_threshold:
+            matches.append((idx, _match_result(term, 'exact_fuzzy', best)))
+        elif best >= fuzzy_threshold:
+            matches.append((idx, _match_result(term, 'fuzzy', best)))
+
+    # 신뢰도 → 긴 용어(더 구체적) → 원래 순서
+    matches.sort(key=lambda m: (-m[1]['match_confidence'], -len(keys[m[0]]), m[0]))
+    return [match for _, match in matches]
+
+
+def find_matching_terms(
+    user_query: str,
+    all_terms: Optional[List[Dict[str, Any]]] = None,
+    exact_threshold: float = 0.85,
+    fuzzy_threshold: float = 0.65,
+    index: Optional["TermNgramIndex"] = None,
+    synonyms: Optional[Dict[str, List[str]]] = None
+) -> List[Dict[str, Any]]:
+    """
+    사용자 질문에서 관련 용어 찾기
+
+    Args:
+        user_query: 사용자 질문
+        all_terms: 전체 용어 리스트 (id, term, category, ...)
+        exact_threshold: 이 유사도 이상이면 exact_fuzzy
+        fuzzy_threshold: 이 유사도 이상이면 fuzzy
+        index: 미리 구축한 TermNgramIndex (주어지면 후보만 채점, all_terms/synonyms 무시)
+        synonyms: 용어 → 동의어 (질문에 동의어가 있으면 synonym 매칭)
+
+    Returns:
+        매칭된 용어 리스트 (match_type, match_confidence 포함, 신뢰도 순)
+    """
+    if not user_query:
+        return []
+
+    normalized_query = normalize_korean_text(user_query)
+    units = query_units(user_query)
+
+    if index is not None:
+        candidates, synonym_hits = index.candidates(user_query, normalized_query, units, fuzzy_threshold)
+        return _score_terms(
+            user_query, normalized_query, units, candidates,
+            index.terms, index.keys, exact_threshold, fuzzy_threshold, synonym_hits
+        )
+
+    terms = all_terms or []
+    keys = [normalize_korean_text(term['term']) for term in terms]
+
+    synonym_hits: Set[int] = set()
+    if synonyms:
+        lowered_query = user_query.lower()
+        for idx, term in enumerate(terms):
+            aliases = synonyms.get(term['term'].lower().strip(), [])
+            if any(alias.lower().strip() and alias.lower().strip() in lowered_query for alias in aliases):
+                synonym_hits.add(idx)
+
+    return _score_terms(
+        user_query, normalized_query, units, range(len(terms)),
+        terms, keys, exact_threshold, fuzzy_threshold, synonym_hits
+    )
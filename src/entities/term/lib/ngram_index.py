@@ -0,0 +1,170 @@
+"""
+Term Entity - N-gram Index
+
+find_matching_terms 후보 검색용 역색인 (용어 카탈로그와 함께 한 번 구축)
+"""
+import math
+from collections import Counter, defaultdict
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from src.shared.term_spotter import AhoCorasick, TermSpotter
+
+from .fuzzy_matching import (
+    FIRST_CHAR_BONUS,
+    MIN_FUZZY_LENGTH,
+    SHORT_WORD_FLOOR,
+    SHORT_WORD_MAX_LENGTH,
+    normalize_korean_text,
+)
+
+
+class TermNgramIndex:
+    """
+    정규화된 용어의 문자 n-gram 역색인
+
+    요청마다 전체 용어를 채점하는 대신 작은 후보 집합만 골라 채점합니다.
+    후보 검색은 채점 결과를 바꾸지 않습니다 (exact/fuzzy 임계값 의미 동일).
+
+    - 정확 매칭 후보: 용어/정규화 키 Aho-Corasick 오토마톤으로 질문을 한 번 스캔
+    - 동의어 후보: 동의어 사전 TermSpotter로 질문을 한 번 스캔
+    - Fuzzy 후보: 문자(1-gram) 포스팅으로 질문 단어와 겹치는 글자 수를 세고,
+      fuzzy_similarity가 임계값에 도달할 수 없는 용어는 제외
+      (SequenceMatcher 일치 길이는 공통 글자 수를 넘을 수 없음)
+
+    유사도 계산이 음절 단위이므로 음절 1-gram 색인만으로 후보 누락이 없습니다.
+    """
+
+    def __init__(
+        self,
+        terms: List[Dict[str, Any]],
+        synonyms: Optional[Dict[str, List[str]]] = None
+    ):
+        """
+        Args:
+            terms: 전체 용어 리스트 (id, term, category, ...)
+            synonyms: 용어 → 동의어 (예: SYNONYM_DICTIONARY)
+        """
+        self.terms = terms
+        self.keys: List[str] = [normalize_korean_text(term['term']) for term in terms]
+
+        # 정확 매칭: 정규화 키 / 원본 용어 → 용어 위치
+        self._by_key: Dict[str, List[int]] = defaultdict(list)
+        self._by_raw: Dict[str, List[int]] = defaultdict(list)
+
+        # Fuzzy 매칭: 글자 → (용어 위치, 글자 수), 길이 → 용어 위치
+        self._postings: Dict[str, List[Tuple[int, int]]] = defaultdict(list)
+        self._by_length: Dict[int, List[int]] = defaultdict(list)
+
+        for idx, (term, key) in enumerate(zip(terms, self.keys)):
+            if not key:
+                continue
+            self._by_key[key].append(idx)
+            self._by_raw[term['term']].append(idx)
+
+            if len(key) >= MIN_FUZZY_LENGTH:
+                self._by_length[len(key)].append(idx)
+                for char, count in Counter(key).items():
+                    self._postings[char].append((idx, count))
+
+        self._key_patterns = list(self._by_key)
+        self._key_automaton = AhoCorasick(self._key_patterns)
+        self._raw_patterns = list(self._by_raw)
+        self._raw_automaton = AhoCorasick(self._raw_patterns)
+
+        # 동의어: 소문자 용어 → 용어 위치
+        self._by_lowered: Dict[str, List[int]] = defaultdict(list)
+        if synonyms:
+            for idx, term in enumerate(terms):
+                if self.keys[idx]:
+                    self._by_lowered[term['term'].lower().strip()].append(idx)
+        self._synonym_spotter = TermSpotter(self._by_lowered, synonyms) if synonyms else None
+
+    def __len__(self) -> int:
+        return len(self.terms)
+
+    @staticmethod
+    def _substring_hits(
+        text: str,
+        automaton: AhoCorasick,
+        patterns: List[str],
+        table: Dict[str, List[int]]
+    ) -> Set[int]:
+        """text에 포함된 패턴의 용어 위치"""
+        hits: Set[int] = set()
+        for _, pattern_id in automaton.iter_matches(text):
+            hits.update(table[patterns[pattern_id]])
+        return hits
+
+    def synonym_hits(self, user_query: str) -> Set[int]:
+        """동의어가 질문에 포함된 용어 위치"""
+        if self._synonym_spotter is None:
+            return set()
+
+        hits: Set[int] = set()
+        for term in self._synonym_spotter.spot(user_query, include_terms=False):
+            hits.update(self._by_lowered[term])
+        return hits
+
+    @staticmethod
+    def _required_overlap(unit_length: int, key_length: int, threshold: float) -> int:
+        """fuzzy_similarity >= threshold 가 되기 위한 최소 공통 글자 수"""
+        bonus = FIRST_CHAR_BONUS if abs(unit_length - key_length) <= 1 else 0.0
+        need = math.ceil((threshold - bonus) * (unit_length + key_length) / 2 - 1e-9)
+
+        # 짧은 단어 보정으로 임계값에 도달하는 경우 (같은 위치 글자가 diff개만 다름)
+        if unit_length == key_length <= SHORT_WORD_MAX_LENGTH:
+            for diff, floor in SHORT_WORD_FLOOR.items():
+                if floor >= threshold:
+                    need = min(need, unit_length - diff)
+
+        return need
+
+    def _fuzzy_candidates(self, unit: str, threshold: float) -> Set[int]:
+        """질문 단어 하나에 대한 Fuzzy 후보"""
+        overlap: Dict[int, int] = defaultdict(int)
+        for char, unit_count in Counter(unit).items():
+            for idx, key_count in self._postings.get(char, ()):
+                overlap[idx] += min(unit_count, key_count)
+
+        candidates: Set[int] = set()
+        unit_length = len(unit)
+
+        # 공통 글자 없이도 임계값에 도달 가능한 길이는 통째로 후보
+        for key_length, indices in self._by_length.items():
+            if self._required_overlap(unit_length, key_length, threshold) <= 0:
+                candidates.update(indices)
+
+        for idx, shared in overlap.items():
+            if shared >= self._required_overlap(unit_length, len(self.keys[idx]), threshold):
+                candidates.add(idx)
+
+        return candidates
+
+    def candidates(
+        self,
+        user_query: str,
+        normalized_query: str,
+        units: List[str],
+        fuzzy_threshold: float
+    ) -> Tuple[List[int], Set[int]]:
+        """
+        채점할 후보 용어 위치
+
+        Args:
+            user_query: 원본 질문
+            normalized_query: 정규화된 질문
+            units: Fuzzy 비교 대상 질문 단어
+            fuzzy_threshold: Fuzzy 최소 유사도
+
+        Returns:
+            (후보 용어 위치 (원래 순서), 동의어로 찾은 용어 위치)
+        """
+        found = self._substring_hits(normalized_query, self._key_automaton, self._key_patterns, self._by_key)
+        found |= self._substring_hits(user_query, self._raw_automaton, self._raw_patterns, self._by_raw)
+
+        synonym_hits = self.synonym_hits(user_query)
+        found |= synonym_hits
+
+        for unit in units:
+            found |= self._fuzzy_candidates(unit, fuzzy_threshold)
+        return sorted(found), synonym_hits
@@ -1,5 +1,6 @@
 """Term Entity - Model Layer"""
 from .schemas import Term
 from .repository import TermRepository
+from .catalog import TermCatalog, CatalogSnapshot
 
-__all__ = ['Term', 'TermRepository']
+__all__ = ['Term', 'TermRepository', 'TermCatalog', 'CatalogSnapshot']
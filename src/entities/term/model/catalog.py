@@ -0,0 +1,187 @@
+"""
+Term Entity - Catalog
+
+용어/온톨로지 룰 인메모리 카탈로그 (Chat 요청마다 전체 테이블을 조회하지 않도록 공유)
+"""
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.core.loaders.pagination import fetch_all
+from src.core.rules.ontology import CompiledOntology
+
+from ..lib import TermNgramIndex
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class CatalogSnapshot:
+    """한 시점의 용어/룰 데이터 (갱신 시 통째로 교체)"""
+    terms: List[Dict[str, Any]] = field(default_factory=list)
+    rules: List[Dict[str, Any]] = field(default_factory=list)
+    signature: Optional[Tuple] = None
+    loaded_at: float = 0.0
+    # find_matching_terms 후보 검색용 (terms와 함께 구축)
+    term_index: Optional[TermNgramIndex] = None
+    # 룰 조회용 (rules와 함께 컴파일, Phase 2 검증과 같은 구조)
+    ontology: Optional[CompiledOntology] = None
+
+
+class TermCatalog:
+    """
+    용어/온톨로지 룰 카탈로그
+
+    시작 시 한 번 전체를 페이지 단위로 로드하고, 백그라운드 스레드가
+    주기적으로 변경 여부(행 수 + 최신 created_at)를 확인해 바뀐 경우에만
+    다시 로드합니다. max_age가 지나면 변경 감지와 무관하게 재로드합니다
+    (upsert로 정의만 바뀐 경우 대비).
+    """
+
+    TABLE_TERMS = 'playbook_semantic_terms'
+    TABLE_RULES = 'playbook_ontology_rules'
+    TERM_COLUMNS = "id, term, category, definition"
+    RULE_COLUMNS = "subject_type, predicate, object_type, description"
+
+    def __init__(
+        self,
+        supabase_client,
+        refresh_interval: float = 60.0,
+        max_age: float = 900.0,
+        page_size: int = 1000,
+        synonyms: Optional[Dict[str, List[str]]] = None
+    ):
+        """
+        Args:
+            supabase_client: Supabase 클라이언트
+            refresh_interval: 변경 감지 주기 (초, 0 = 자동 갱신 안 함)
+            max_age: 강제 재로드 주기 (초)
+            page_size: 페이지당 조회 행 수 (PostgREST max-rows 이하)
+            synonyms: 용어 인덱스에 포함할 동의어 사전 (예: SYNONYM_DICTIONARY)
+        """
+        self.client = supabase_client
+        self.refresh_interval = refresh_interval
+        self.max_age = max_age
+        self.page_size = page_size
+        self.synonyms = synonyms
+
+        self._snapshot = CatalogSnapshot()
+        self._load_lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def snapshot(self) -> CatalogSnapshot:
+        """현재 카탈로그 (읽기 전용, 용어와 룰이 항상 같은 시점)"""
+        return self._snapshot
+
+    @property
+    def terms(self) -> List[Dict[str, Any]]:
+        return self._snapshot.terms
+
+    @property
+    def rules(self) -> List[Dict[str, Any]]:
+        return self._snapshot.rules
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._snapshot.signature is not None
+
+    def _fetch_all(self, table: str, columns: str) -> List[Dict[str, Any]]:
+        """테이블 전체를 생성 순서대로 키셋 페이지네이션으로 조회 (PostgREST 행 수 제한 회피)"""
+        return fetch_all(
+            self.client, table, columns,
+            order_by=('created_at', 'id'),
+            page_size=self.page_size
+        )
+
+    def _table_signature(self, table: str) -> Tuple[int, Optional[str]]:
+        """변경 감지용 (행 수, 최신 created_at)"""
+        result = self.client.table(table)\
+            .select('created_at', count='exact')\
+            .order('created_at', desc=True)\
+            .limit(1)\
+            .execute()
+
+        latest = result.data[0]['created_at'] if result.data else None
+        return (result.count or 0, latest)
+
+    def _signature(self) -> Tuple:
+        return (self._table_signature(self.TABLE_TERMS), self._table_signature(self.TABLE_RULES))
+
+    def load(self) -> "TermCatalog":
+        """
+        전체 용어/룰 로드
+
+        Returns:
+            self (체이닝용)
+        """
+        with self._load_lock:
+            start = time.time()
+
+            signature = self._signature()
+            terms = self._fetch_all(self.TABLE_TERMS, self.TERM_COLUMNS)
+            rules = self._fetch_all(self.TABLE_RULES, self.RULE_COLUMNS)
+
+            self._snapshot = CatalogSnapshot(
+                terms=terms,
+                rules=rules,
+                signature=signature,
+                loaded_at=time.time(),
+                term_index=TermNgramIndex(terms, synonyms=self.synonyms),
+                ontology=CompiledOntology(rules)
+            )
+
+            logger.info(
+                f"Term catalog loaded: 용어 {len(terms)}개, 룰 {len(rules)}개 "
+                f"({time.time() - start:.2f}s)"
+            )
+        return self
+
+    def refresh_if_changed(self) -> bool:
+        """
+        변경이 감지되었거나 max_age가 지난 경우에만 재로드
+
+        Returns:
+            재로드 여부
+        """
+        if not self.is_loaded:
+            self.load()
+            return True
+
+        expired = time.time() - self._snapshot.loaded_at >= self.max_age
+        if not expired and self._signature() == self._snapshot.signature:
+            return False
+
+        self.load()
+        return True
+
+    def _refresh_loop(self):
+        """백그라운드 갱신 루프 (실패 시 기존 카탈로그 유지)"""
+        while not self._stop_event.wait(self.refresh_interval):
+            try:
+                self.refresh_if_changed()
+            except Exception as e:
+                logger.error(f"Failed to refresh term catalog: {e}")
+
+    def start_background_refresh(self):
+        """백그라운드 갱신 스레드 시작 (refresh_interval > 0 일 때)"""
+        if self.refresh_interval <= 0 or (self._thread and self._thread.is_alive()):
+            return
+
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._refresh_loop,
+            name="term-catalog-refresh",
+            daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        """백그라운드 갱신 중지"""
+        self._stop_event.set()
+        if self._thread:
+            self._thread.join(timeout=5)
+            self._thread = None
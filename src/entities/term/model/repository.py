@@ -6,6 +6,8 @@ Term Entity - Repository Layer
 from typing import List, Optional, Dict, Any
 import logging
 
+from src.core.loaders.pagination import fetch_all
+
 logger = logging.getLogger(__name__)
 
 
@@ -21,16 +23,13 @@ class TermRepository:
 
     def find_all(self) -> List[Dict[str, Any]]:
         """
-        모든 용어 조회
+        모든 용어 조회 (키셋 페이지네이션, 서버 행 수 제한 없이 전체)
 
         Returns:
             용어 리스트
         """
         try:
-            result = self.client.table('playbook_semantic_terms')\
-                .select('id, term, category, document_id')\
-                .execute()
-            return result.data if result.data else []
+            return fetch_all(self.client, 'playbook_semantic_terms', 'id, term, category, document_id:doc_id')
         except Exception as e:
             logger.error(f"Failed to fetch all terms: {e}")
             return []
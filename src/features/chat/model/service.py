@@ -7,7 +7,7 @@ import logging
 from typing import Dict, Any, List, Optional
 from openai import OpenAI
 
-from src.entities.term import TermRepository, find_matching_terms
+from src.entities.term import TermRepository, TermCatalog, CatalogSnapshot, find_matching_terms
 from src.entities.relation import RelationRepository
 from src.core.traversal import SubgraphExtractor
 
@@ -23,7 +23,8 @@ class ChatService:
         openai_client: OpenAI,
         term_repo: TermRepository,
         relation_repo: RelationRepository,
-        subgraph_extractor: SubgraphExtractor
+        subgraph_extractor: SubgraphExtractor,
+        term_catalog: Optional[TermCatalog] = None
     ):
         """
         Args:
@@ -32,12 +33,14 @@ class ChatService:
             term_repo: 용어 레포지토리
             relation_repo: 관계 레포지토리
             subgraph_extractor: 서브그래프 추출기
+            term_catalog: 공유 용어/룰 카탈로그 (없으면 요청마다 DB 조회)
         """
         self.supabase_client = supabase_client
         self.openai_client = openai_client
         self.term_repo = term_repo
         self.relation_repo = relation_repo
         self.subgraph_extractor = subgraph_extractor
+        self.term_catalog = term_catalog
 
     async def handle_chat(
         self,
@@ -79,20 +82,13 @@ class ChatService:
                 "description": "Supabase에서 모든 용어와 온톨로지 룰 로드 중..."
             })
 
-            # Load ALL terms
-            terms_result = self.supabase_client.table('playbook_semantic_terms')\
-                .select("id, term, category, definition")\
-                .execute()
-
-            # Load ontology rules
-            rules_result = self.supabase_client.table('playbook_ontology_rules')\
-                .select("subject_type, predicate, object_type, description")\
-                .execute()
+            catalog = self._load_catalog()
+            all_terms, all_rules = catalog.terms, catalog.rules
 
             search_process["steps"].append({
                 "step": 2,
                 "name": "데이터 로드 완료",
-                "description": f"용어 {len(terms_result.data)}개, 온톨로지 룰 {len(rules_result.data)}개 로드"
+                "description": f"용어 {len(all_terms)}개, 온톨로지 룰 {len(all_rules)}개 로드"
             })
 
             # Step 3: Find relevant terms using fuzzy matching
@@ -105,9 +101,10 @@ class ChatService:
             # Use fuzzy matching to find terms
             mentioned_terms = find_matching_terms(
                 user_query=user_message,
-                all_terms=terms_result.data,
+                all_terms=all_terms,
                 exact_threshold=0.85,
-                fuzzy_threshold=0.65
+                fuzzy_threshold=0.65,
+                index=catalog.term_index
             )
 
             # Update search process with found terms
@@ -203,10 +200,13 @@ class ChatService:
                 # Add reasoning chain to search process
                 search_process["reasoning_chain"] = reasoning_chain
 
+                # Rules behind the extracted relations first (compiled rule lookup)
+                context_rules = self._select_rules(catalog, subgraph)
+
                 # Build context for LLM
                 graph_context = self._build_graph_context(
                     center_term,
-                    rules_result.data,
+                    context_rules,
                     subgraph['nodes'],
                     unique_edges
                 )
@@ -257,6 +257,50 @@ class ChatService:
             "search_process": search_process
         }
 
+    def _load_catalog(self) -> CatalogSnapshot:
+        """
+        전체 용어와 온톨로지 룰 조회
+
+        카탈로그가 있으면 메모리에서 읽고, 없으면 DB를 페이지 단위로 조회
+
+        Returns:
+            용어/룰/용어 인덱스 스냅샷
+        """
+        catalog = self.term_catalog
+        if catalog is None or not catalog.is_loaded:
+            catalog = TermCatalog(self.supabase_client, refresh_interval=0).load()
+
+        return catalog.snapshot
+
+    def _select_rules(
+        self,
+        catalog: CatalogSnapshot,
+        subgraph: Dict[str, Any],
+        limit: int = 15
+    ) -> List[Dict[str, Any]]:
+        """
+        컨텍스트에 넣을 온톨로지 룰 선택
+
+        서브그래프 관계를 허용하는 룰을 먼저, 나머지는 원래 순서대로 채움
+
+        Args:
+            catalog: 카탈로그 스냅샷
+            subgraph: extract_subgraph 결과 (nodes, edges)
+            limit: 최대 룰 수
+
+        Returns:
+            룰 리스트
+        """
+        if catalog.ontology is None:
+            return catalog.rules[:limit]
+
+        categories = {node['id']: node.get('category') for node in subgraph['nodes']}
+        relations = [
+            (categories.get(edge['source']), edge['predicate'], categories.get(edge['target']))
+            for edge in subgraph['edges']
+        ]
+        return catalog.ontology.relevant_rules(relations, limit=limit)
+
     def _deduplicate_edges(
         self,
         edges: List[Dict[str, Any]],
@@ -5,14 +5,17 @@ Main pipeline for processing Confluence pages into Supabase
 import sys
 import time
 import logging
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from typing import Dict, List, Optional, Tuple
 
 from tqdm import tqdm
 
 from src.shared.config import Config
+from src.shared.rate_limit import ServiceLimiter
+from src.shared.streaming import Stage, StreamingPipeline
 from src.shared.utils import (
     setup_logging,
-    CheckpointManager,
+    create_checkpoint_manager,
     load_page_ids,
 )
 from src.core.processors.confluence_processor import ConfluenceProcessor
@@ -38,12 +41,33 @@ class Pipeline:
             logger.error(f"Configuration error: {e}")
             sys.exit(1)
 
+        # Per-service concurrency caps + adaptive rate limits (shared by all workers)
+        self.limiters: Dict[str, ServiceLimiter] = {
+            'confluence': ServiceLimiter(
+                'confluence',
+                max_concurrency=Config.CONFLUENCE_CONCURRENCY,
+                rate=1.0 / Config.CONFLUENCE_RATE_LIMIT_DELAY if Config.CONFLUENCE_RATE_LIMIT_DELAY > 0 else 0.0
+            ),
+            'openai': ServiceLimiter(
+                'openai',
+                max_concurrency=Config.OPENAI_CONCURRENCY,
+                rate=Config.OPENAI_REQUESTS_PER_SECOND
+            ),
+            'supabase': ServiceLimiter(
+                'supabase',
+                max_concurrency=Config.SUPABASE_CONCURRENCY,
+                rate=Config.SUPABASE_REQUESTS_PER_SECOND
+            ),
+        }
+
         # Initialize components
         try:
-            self.confluence = ConfluenceProcessor()
-            self.semantic = SemanticProcessor()
+            self.confluence = ConfluenceProcessor(rate_limiter=self.limiters['confluence'])
+            self.semantic = SemanticProcessor(rate_limiter=self.limiters['openai'])
             self.supabase = SupabaseLoader()
-            self.checkpoint = CheckpointManager()
+            self.checkpoint = create_checkpoint_manager()
+            # Delete a document's chunks past its new last chunk (incremental re-processing)
+            self.replace_chunks = False
 
             logger.info("Pipeline components initialized successfully")
 
@@ -81,6 +105,176 @@ class Pipeline:
 
         return all_passed
 
+    # Page steps: each takes the page's work dict (see _new_work), fills in its
+    # outputs and returns False to stop processing the page. process_page runs
+    # them in order; streaming mode runs each as a separate pipeline stage.
+
+    @staticmethod
+    def _new_work(page_id: str, index: int = -1) -> Dict:
+        """Per-page state passed between steps"""
+        return {
+            'page_id': page_id,
+            'index': index,
+            'start': time.time(),
+            'page_data': None,
+            'chunks': [],
+            'semantic_terms': [],
+            'timings': {},
+        }
+
+    def _fetch_step(self, work: Dict) -> bool:
+        """Step 1-2: Fetch page from Confluence and classify it"""
+        page_id = work['page_id']
+
+        # Step 1: Fetch page from Confluence
+        step_start = time.time()
+        with self.limiters['confluence'].slot():
+            page_data = self.confluence.process_page(page_id)
+        fetch_time = time.time() - step_start
+        work['timings']['fetch'] = fetch_time
+
+        if not page_data:
+            logger.error(f"Failed to fetch page {page_id}")
+            return False
+
+        logger.debug(f"Fetch time: {fetch_time:.2f}s")
+
+        # Step 2: Classify document
+        step_start = time.time()
+        category = classify_document(
+            page_data.get('title', ''),
+            page_data.get('content', '')
+        )
+        classify_time = time.time() - step_start
+        logger.info(f"Page {page_id} classified as: {category} ({classify_time:.2f}s)")
+
+        # Add category to page_data for use in metadata
+        page_data['doc_type'] = category
+        work['page_data'] = page_data
+        return True
+
+    def _load_document_step(self, work: Dict) -> bool:
+        """Step 3: Load document into Supabase"""
+        supabase = self.limiters['supabase']
+
+        step_start = time.time()
+        with supabase.slot():
+            supabase.acquire()
+            document_loaded = self.supabase.load_document(work['page_data'])
+        if not document_loaded:
+            logger.error(f"Failed to load document {work['page_id']}")
+            return False
+        doc_load_time = time.time() - step_start
+        logger.debug(f"Document load time: {doc_load_time:.2f}s")
+        return True
+
+    def _embed_step(self, work: Dict) -> bool:
+        """Step 4a: Chunk and embed"""
+        step_start = time.time()
+        with self.limiters['openai'].slot():
+            work['chunks'] = self.semantic.embed_page(work['page_data'])
+        work['timings']['embed'] = time.time() - step_start
+        return True
+
+    def _extract_step(self, work: Dict) -> bool:
+        """Step 4b: Extract semantic terms from the embedded chunks"""
+        step_start = time.time()
+        # No step-level slot: each extraction request (one per map-reduce window)
+        # takes its own OpenAI slot inside SemanticProcessor
+        work['semantic_terms'] = self.semantic.extract_page_terms(work['chunks'], work['page_data'])
+        work['timings']['extract'] = time.time() - step_start
+
+        semantic_time = work['timings'].get('embed', 0.0) + work['timings']['extract']
+        logger.info(
+            f"Created {len(work['chunks'])} chunks and {len(work['semantic_terms'])} semantic terms "
+            f"for page {work['page_id']} ({semantic_time:.2f}s)"
+        )
+        return True
+
+    def _load_results_step(self, work: Dict) -> bool:
+        """Step 5-6: Load chunks and semantic terms into Supabase"""
+        page_id = work['page_id']
+        chunks = work['chunks']
+        semantic_terms = work['semantic_terms']
+        supabase = self.limiters['supabase']
+
+        # Step 5: Load chunks into Supabase (if any); upserts are idempotent
+        loaded_count = 0
+        if chunks:
+            step_start = time.time()
+            with supabase.slot():
+                supabase.acquire()
+                loaded_count = self.supabase.load_chunks(chunks, delete_stale=self.replace_chunks)
+            chunk_load_time = time.time() - step_start
+
+            if loaded_count < len(chunks):
+                logger.error(f"Failed to load chunks for page {page_id} ({loaded_count}/{len(chunks)})")
+                return False
+
+            self.checkpoint.add_chunks(loaded_count)
+        else:
+            logger.warning(f"No chunks created for page {page_id} (content too short or empty)")
+            if self.replace_chunks:
+                with supabase.slot():
+                    supabase.acquire()
+                    self.supabase.delete_chunks(page_id)
+
+        # Step 6: Load semantic terms into Supabase (even if no chunks)
+        terms_loaded = 0
+        if semantic_terms:
+            step_start = time.time()
+            with supabase.slot():
+                supabase.acquire()
+                terms_loaded = self.supabase.load_semantic_terms(semantic_terms)
+            terms_load_time = time.time() - step_start
+            logger.info(f"Loaded {terms_loaded} semantic terms ({terms_load_time:.2f}s)")
+
+        # Final success summary
+        timings = work['timings']
+        total_time = time.time() - work['start']
+        semantic_time = timings.get('embed', 0.0) + timings.get('extract', 0.0)
+        logger.info(
+            f"Successfully processed page {page_id}: "
+            f"{loaded_count} chunks, {terms_loaded} terms in {total_time:.2f}s "
+            f"(fetch: {timings.get('fetch', 0.0):.1f}s, semantic: {semantic_time:.1f}s)"
+        )
+        return True
+
+    def select_changed_pages(self, page_ids: List[str]) -> List[str]:
+        """
+        Keep pages that are new or whose Confluence version is newer than the stored one
+
+        Args:
+            page_ids: Candidate page IDs
+
+        Returns:
+            Page IDs to (re-)process, in input order
+        """
+        remote = self.confluence.list_page_versions(page_ids)
+        stored = self.supabase.get_document_versions(page_ids)
+
+        changed = []
+        new_count = updated_count = missing_count = 0
+
+        for page_id in page_ids:
+            if page_id not in remote:
+                missing_count += 1
+                continue
+
+            if page_id not in stored:
+                new_count += 1
+                changed.append(page_id)
+            elif stored[page_id] is None or remote[page_id]['version'] > stored[page_id]:
+                updated_count += 1
+                changed.append(page_id)
+
+        logger.info(
+            f"Incremental sync: {new_count} new, {updated_count} changed, "
+            f"{len(page_ids) - len(changed) - missing_count} unchanged, "
+            f"{missing_count} not found in Confluence"
+        )
+        return changed
+
     def process_page(self, page_id: str) -> bool:
         """
         Process a single Confluence page with time measurements
@@ -91,94 +285,215 @@ class Pipeline:
         Returns:
             True if successful, False otherwise
         """
-        page_start = time.time()
+        work = self._new_work(page_id)
+        steps = [
+            self._fetch_step,
+            self._load_document_step,
+            self._embed_step,
+            self._extract_step,
+            self._load_results_step,
+        ]
 
         try:
-            # Step 1: Fetch page from Confluence
-            step_start = time.time()
-            page_data = self.confluence.process_page(page_id)
-            fetch_time = time.time() - step_start
+            return all(step(work) for step in steps)
 
-            if not page_data:
-                logger.error(f"Failed to fetch page {page_id}")
-                return False
+        except Exception as e:
+            logger.error(f"Error processing page {page_id}: {e}", exc_info=True)
+            return False
 
-            logger.debug(f"Fetch time: {fetch_time:.2f}s")
+    def _run_serial(self, page_ids: List[str]) -> Tuple[int, int]:
+        """
+        Process pages one at a time
 
-            # Step 2: Classify document
-            step_start = time.time()
-            category = classify_document(
-                page_data.get('title', ''),
-                page_data.get('content', '')
-            )
-            classify_time = time.time() - step_start
-            logger.info(f"Page {page_id} classified as: {category} ({classify_time:.2f}s)")
+        Args:
+            page_ids: Page IDs to process
 
-            # Add category to page_data for use in metadata
-            page_data['doc_type'] = category
+        Returns:
+            (success count, failure count)
+        """
+        success_count = 0
+        failure_count = 0
 
-            # Step 3: Load document into Supabase
-            step_start = time.time()
-            if not self.supabase.load_document(page_data):
-                logger.error(f"Failed to load document {page_id}")
-                return False
-            doc_load_time = time.time() - step_start
-            logger.debug(f"Document load time: {doc_load_time:.2f}s")
+        with tqdm(total=len(page_ids), desc="Processing pages", unit="page") as pbar:
+            for idx, page_id in enumerate(page_ids):
+                pbar.set_description(f"Processing page {page_id}")
 
-            # Step 4: Process chunks and embeddings + extract semantic terms
-            step_start = time.time()
-            result = self.semantic.process_page(page_data)
-            chunks = result.get('chunks', [])
-            semantic_terms = result.get('semantic_terms', [])
-            semantic_time = time.time() - step_start
+                try:
+                    success = self.process_page(page_id)
 
-            logger.info(
-                f"Created {len(chunks)} chunks and {len(semantic_terms)} semantic terms "
-                f"for page {page_id} ({semantic_time:.2f}s)"
-            )
+                    if success:
+                        self.checkpoint.mark_processed(page_id, idx)
+                        success_count += 1
+                    else:
+                        self.checkpoint.mark_failed(page_id)
+                        failure_count += 1
 
-            # Step 5: Load chunks into Supabase (if any)
-            loaded_count = 0
-            if chunks:
-                step_start = time.time()
-                loaded_count = self.supabase.load_chunks(chunks)
-                chunk_load_time = time.time() - step_start
-
-                if loaded_count == 0:
-                    logger.error(f"Failed to load chunks for page {page_id}")
-                    return False
-
-                self.checkpoint.add_chunks(loaded_count)
-            else:
-                logger.warning(f"No chunks created for page {page_id} (content too short or empty)")
-
-            # Step 6: Load semantic terms into Supabase (even if no chunks)
-            terms_loaded = 0
-            if semantic_terms:
-                step_start = time.time()
-                terms_loaded = self.supabase.load_semantic_terms(semantic_terms)
-                terms_load_time = time.time() - step_start
-                logger.info(f"Loaded {terms_loaded} semantic terms ({terms_load_time:.2f}s)")
+                    pbar.set_postfix({
+                        'success': success_count,
+                        'failed': failure_count
+                    })
 
-            # Final success summary
-            total_time = time.time() - page_start
-            logger.info(
-                f"Successfully processed page {page_id}: "
-                f"{loaded_count} chunks, {terms_loaded} terms in {total_time:.2f}s "
-                f"(fetch: {fetch_time:.1f}s, semantic: {semantic_time:.1f}s)"
-            )
-            return True
+                except KeyboardInterrupt:
+                    logger.info("\nProcessing interrupted by user")
+                    break
 
-        except Exception as e:
-            logger.error(f"Error processing page {page_id}: {e}", exc_info=True)
-            return False
+                except Exception as e:
+                    logger.error(f"Unexpected error for page {page_id}: {e}")
+                    self.checkpoint.mark_failed(page_id)
+                    failure_count += 1
+                    pbar.set_postfix({
+                        'success': success_count,
+                        'failed': failure_count
+                    })
+
+                finally:
+                    pbar.update(1)
+
+        return success_count, failure_count
+
+    def _run_concurrent(self, page_ids: List[str], workers: int) -> Tuple[int, int]:
+        """
+        Process pages with a worker pool
+
+        Each worker runs process_page end to end; the per-service limiters
+        bound how many workers are inside a Confluence / OpenAI / Supabase
+        step at once. At most 2 * workers pages are in flight, so an
+        interrupt only waits for pages already started. Checkpoint and
+        progress bar are updated on this thread as pages complete.
+
+        Args:
+            page_ids: Page IDs to process
+            workers: Number of worker threads
+
+        Returns:
+            (success count, failure count)
+        """
+        success_count = 0
+        failure_count = 0
+        max_in_flight = workers * 2
+
+        logger.info(
+            f"Concurrent mode: {workers} workers "
+            f"(confluence={self.limiters['confluence'].max_concurrency}, "
+            f"openai={self.limiters['openai'].max_concurrency}, "
+            f"supabase={self.limiters['supabase'].max_concurrency})"
+        )
+
+        executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="phase1")
+        pending = {}
+        next_idx = 0
+
+        with tqdm(total=len(page_ids), desc="Processing pages", unit="page") as pbar:
+            try:
+                while next_idx < len(page_ids) or pending:
+                    while next_idx < len(page_ids) and len(pending) < max_in_flight:
+                        page_id = page_ids[next_idx]
+                        pending[executor.submit(self.process_page, page_id)] = (next_idx, page_id)
+                        next_idx += 1
+
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+
+                    for future in done:
+                        idx, page_id = pending.pop(future)
+                        try:
+                            success = future.result()
+                        except Exception as e:
+                            logger.error(f"Unexpected error for page {page_id}: {e}")
+                            success = False
+
+                        if success:
+                            self.checkpoint.mark_processed(page_id, idx)
+                            success_count += 1
+                        else:
+                            self.checkpoint.mark_failed(page_id)
+                            failure_count += 1
+
+                        pbar.update(1)
+
+                    pbar.set_description(f"Processing pages ({len(pending)} in flight)")
+                    pbar.set_postfix({
+                        'success': success_count,
+                        'failed': failure_count
+                    })
+
+            except KeyboardInterrupt:
+                logger.info(f"\nProcessing interrupted by user (waiting for {len(pending)} in-flight pages)")
+                for future in pending:
+                    future.cancel()
+
+            finally:
+                executor.shutdown(wait=True)
+
+        return success_count, failure_count
+
+    def _run_streaming(self, page_ids: List[str]) -> Tuple[int, int]:
+        """
+        Process pages as a staged stream
+
+        fetch → load_document → embed → extract → load run as separate
+        worker stages joined by bounded queues (PIPELINE_QUEUE_SIZE), so
+        Confluence fetching runs ahead while embedding and extraction are
+        busy, and a slow stage applies backpressure instead of buffering
+        without limit. Checkpoint and progress bar are updated on this thread.
+
+        Args:
+            page_ids: Page IDs to process
+
+        Returns:
+            (success count, failure count)
+        """
+        success_count = 0
+        failure_count = 0
+
+        stream = StreamingPipeline(
+            [
+                Stage('fetch', self._fetch_step, workers=Config.CONFLUENCE_CONCURRENCY),
+                Stage('load_document', self._load_document_step, workers=Config.SUPABASE_CONCURRENCY),
+                Stage('embed', self._embed_step, workers=Config.OPENAI_CONCURRENCY),
+                Stage('extract', self._extract_step, workers=Config.OPENAI_CONCURRENCY),
+                Stage('load', self._load_results_step, workers=Config.SUPABASE_CONCURRENCY),
+            ],
+            queue_size=Config.PIPELINE_QUEUE_SIZE
+        )
+        works = (self._new_work(page_id, idx) for idx, page_id in enumerate(page_ids))
+
+        logger.info(f"Streaming mode: queue size {stream.queue_size}")
+
+        with tqdm(total=len(page_ids), desc="Processing pages", unit="page") as pbar:
+            try:
+                for result in stream.run(works):
+                    work = result.item
+                    if result.ok:
+                        self.checkpoint.mark_processed(work['page_id'], work['index'])
+                        success_count += 1
+                    else:
+                        logger.debug(f"Page {work['page_id']} failed at stage {result.failed_stage}")
+                        self.checkpoint.mark_failed(work['page_id'])
+                        failure_count += 1
+
+                    pbar.update(1)
+                    postfix = {'success': success_count, 'failed': failure_count}
+                    postfix.update({f"q_{name}": depth for name, depth in stream.queue_depths().items()})
+                    pbar.set_postfix(postfix)
+
+            except KeyboardInterrupt:
+                logger.info("\nProcessing interrupted by user (waiting for in-flight pages)")
+                stream.stop()
+
+        for name, metrics in stream.get_metrics().items():
+            logger.info(f"Stage [{name}]: {metrics}")
+
+        return success_count, failure_count
 
     def run(
         self,
         page_ids_file: str = None,
         skip_existing: bool = True,
         max_pages: Optional[int] = None,
-        run_phase2: bool = True  # Changed default to True
+        run_phase2: bool = True,  # Changed default to True
+        workers: Optional[int] = None,
+        streaming: Optional[bool] = None,
+        incremental: bool = False
     ):
         """
         Run the complete pipeline
@@ -188,7 +503,16 @@ class Pipeline:
             skip_existing: Skip pages that have been processed
             max_pages: Maximum number of pages to process (None = all)
             run_phase2: Run Phase 2 (ontology builder) after Phase 1
+            workers: Parallel page workers (None = Config.PIPELINE_WORKERS, 1 = serial)
+            streaming: Staged streaming mode (None = Config.PIPELINE_STREAMING; ignores workers)
+            incremental: Process only new/changed pages (remote version vs stored version,
+                ignores skip_existing) and scope Phase 2 to them
         """
+        if workers is None:
+            workers = Config.PIPELINE_WORKERS
+        if streaming is None:
+            streaming = Config.PIPELINE_STREAMING
+
         logger.info("=" * 70)
         logger.info("Starting Playbook Nexus Pipeline")
         logger.info("=" * 70)
@@ -206,8 +530,18 @@ class Pipeline:
             logger.error(f"Failed to load page IDs: {e}")
             sys.exit(1)
 
+        # Incremental sync: only pages whose Confluence version changed
+        if incremental:
+            try:
+                page_ids = self.select_changed_pages(page_ids)
+            except Exception as e:
+                logger.error(f"Failed to determine changed pages: {e}")
+                sys.exit(1)
+            # Changed pages replace their existing chunks
+            self.replace_chunks = True
+
         # Filter already processed pages if requested
-        if skip_existing:
+        elif skip_existing:
             processed_ids = self.checkpoint.get_processed_ids()
             original_count = len(page_ids)
             page_ids = [pid for pid in page_ids if pid not in processed_ids]
@@ -224,6 +558,18 @@ class Pipeline:
             logger.info("No pages to process")
             return
 
+        # Current versions let unchanged pages come from the page cache
+        # (incremental mode already fetched them)
+        if (
+            not incremental
+            and self.confluence.page_cache is not None
+            and not self.confluence.offline
+        ):
+            try:
+                self.confluence.list_page_versions(page_ids)
+            except Exception as e:
+                logger.warning(f"Could not fetch page versions, page cache not used: {e}")
+
         # Show initial statistics
         stats = self.checkpoint.get_stats()
         logger.info(f"Starting statistics: {stats}")
@@ -231,47 +577,14 @@ class Pipeline:
         # Process pages with progress bar
         logger.info(f"Processing {len(page_ids)} pages...")
 
-        success_count = 0
-        failure_count = 0
         pipeline_start = time.time()
 
-        with tqdm(total=len(page_ids), desc="Processing pages", unit="page") as pbar:
-            for idx, page_id in enumerate(page_ids):
-                pbar.set_description(f"Processing page {page_id}")
-
-                try:
-                    success = self.process_page(page_id)
-
-                    if success:
-                        self.checkpoint.mark_processed(page_id, idx)
-                        success_count += 1
-                    else:
-                        self.checkpoint.mark_failed(page_id)
-                        failure_count += 1
-
-                    pbar.set_postfix({
-                        'success': success_count,
-                        'failed': failure_count
-                    })
-
-                except KeyboardInterrupt:
-                    logger.info("\nProcessing interrupted by user")
-                    break
-
-                except Exception as e:
-                    logger.error(f"Unexpected error for page {page_id}: {e}")
-                    self.checkpoint.mark_failed(page_id)
-                    failure_count += 1
-                    pbar.set_postfix({
-                        'success': success_count,
-                        'failed': failure_count
-                    })
-
-                finally:
-                    pbar.update(1)
-
-                # Small delay to avoid rate limits
-                time.sleep(0.5)
+        if streaming:
+            success_count, failure_count = self._run_streaming(page_ids)
+        elif workers > 1:
+            success_count, failure_count = self._run_concurrent(page_ids, workers)
+        else:
+            success_count, failure_count = self._run_serial(page_ids)
 
         # Calculate final statistics
         pipeline_time = time.time() - pipeline_start
@@ -287,9 +600,21 @@ class Pipeline:
         logger.info(f"Failed: {failure_count} pages")
         logger.info(f"Success rate: {100*success_count/len(page_ids):.1f}%")
 
+        # Write the final snapshot (compacts the journal backend)
+        self.checkpoint.save()
         final_stats = self.checkpoint.get_stats()
         logger.info(f"Total statistics: {final_stats}")
 
+        for name, limiter in self.limiters.items():
+            logger.info(f"Rate limiter [{name}]: {limiter.get_stats()}")
+
+        if self.confluence.page_cache is not None:
+            logger.info(f"Page cache: {self.confluence.page_cache.get_stats()}")
+        if self.semantic.embedding_cache is not None:
+            logger.info(f"Embedding cache: {self.semantic.embedding_cache.get_stats()}")
+        if self.semantic.llm_cache is not None:
+            logger.info(f"LLM response cache: {self.semantic.llm_cache.get_stats()}")
+
         # Show Supabase stats
         try:
             supabase_stats = self.supabase.get_stats()
@@ -320,7 +645,8 @@ class Pipeline:
                 from src.core.processors.ontology_builder import OntologyBuilder
 
                 builder = OntologyBuilder()
-                phase2_stats = builder.build_graph()
+                # Incremental: rebuild relations of the re-processed documents only
+                phase2_stats = builder.build_graph(doc_ids=page_ids if incremental else None)
 
                 logger.info("=" * 70)
                 logger.info("Phase 2 Completed Successfully")
@@ -369,9 +695,38 @@ def main():
         action='store_true',
         help='Skip Phase 2 (Knowledge Graph Construction) after Phase 1'
     )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=None,
+        help='Number of parallel page workers (default: PIPELINE_WORKERS, 1 = serial)'
+    )
+    parser.add_argument(
+        '--refresh-llm-cache',
+        action='store_true',
+        help='Ignore cached LLM extraction responses and re-extract (default: LLM_CACHE_BYPASS)'
+    )
+    parser.add_argument(
+        '--incremental',
+        action='store_true',
+        help='Process only new/changed pages (by Confluence version) and scope Phase 2 to them'
+    )
+    parser.add_argument(
+        '--streaming',
+        action='store_true',
+        help='Run Phase 1 as a staged streaming pipeline (default: PIPELINE_STREAMING)'
+    )
+    parser.add_argument(
+        '--offline',
+        action='store_true',
+        help='Load pages from the local page cache only, without Confluence access (default: CONFLUENCE_OFFLINE)'
+    )
 
     args = parser.parse_args()
 
+    if args.offline:
+        Config.CONFLUENCE_OFFLINE = True
+
     # Create pipeline
     pipeline = Pipeline()
 
@@ -380,13 +735,20 @@ def main():
         logger.info("Resetting checkpoint...")
         pipeline.checkpoint.reset()
 
+    if args.refresh_llm_cache:
+        logger.info("Bypassing LLM response cache (re-extracting terms)")
+        pipeline.semantic.llm_cache_bypass = True
+
     # Run pipeline
     try:
         pipeline.run(
             page_ids_file=args.page_ids_file,
             skip_existing=not args.no_skip_existing,
             max_pages=args.max_pages,
-            run_phase2=not args.no_phase2  # Default True, unless --no-phase2 is specified
+            run_phase2=not args.no_phase2,  # Default True, unless --no-phase2 is specified
+            workers=args.workers,
+            streaming=True if args.streaming else None,
+            incremental=args.incremental
         )
     except KeyboardInterrupt:
         logger.info("\nPipeline interrupted by user")
@@ -1,5 +1,18 @@
 # Shared utilities and configuration
 from .config import Config
-from .utils import setup_logging, CheckpointManager, load_page_ids
+from .utils import (
+    setup_logging,
+    CheckpointManager,
+    JournalCheckpointManager,
+    create_checkpoint_manager,
+    load_page_ids,
+)
 
-__all__ = ['Config', 'setup_logging', 'CheckpointManager', 'load_page_ids']
+__all__ = [
+    'Config',
+    'setup_logging',
+    'CheckpointManager',
+    'JournalCheckpointManager',
+    'create_checkpoint_manager',
+    'load_page_ids',
+]
@@ -18,6 +18,14 @@ class Config:
     CONFLUENCE_BATCH_SIZE = int(os.getenv("CONFLUENCE_BATCH_SIZE", "10"))
     CONFLUENCE_RATE_LIMIT_DELAY = float(os.getenv("CONFLUENCE_RATE_LIMIT_DELAY", "0.5"))
     CONFLUENCE_MAX_RETRIES = int(os.getenv("CONFLUENCE_MAX_RETRIES", "3"))
+    # "soup" (BeautifulSoup get_text) or "lxml" (streaming, Markdown headings; opt-in because
+    # it changes the stored content, and so chunks and embeddings, of every page on the next run)
+    CONFLUENCE_TEXT_EXTRACTOR = os.getenv("CONFLUENCE_TEXT_EXTRACTOR", "soup")
+    # Raw get_page JSON cache keyed by (page_id, version); offline = serve pages from it only
+    PAGE_CACHE_ENABLED = os.getenv("PAGE_CACHE_ENABLED", "true").lower() == "true"
+    PAGE_CACHE_FILE = os.getenv("PAGE_CACHE_FILE", "data/cache/pages.sqlite")
+    PAGE_CACHE_MAX_MB = int(os.getenv("PAGE_CACHE_MAX_MB", "512"))
+    CONFLUENCE_OFFLINE = os.getenv("CONFLUENCE_OFFLINE", "false").lower() == "true"
 
     # OpenAI settings
     OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
@@ -31,6 +39,36 @@ class Config:
     SUPABASE_KEY = os.getenv("SUPABASE_KEY")
     SUPABASE_BATCH_SIZE = int(os.getenv("SUPABASE_BATCH_SIZE", "100"))
     SUPABASE_MAX_RETRIES = int(os.getenv("SUPABASE_MAX_RETRIES", "3"))
+    SUPABASE_CHUNK_BATCH_BYTES = int(os.getenv("SUPABASE_CHUNK_BATCH_BYTES", "2000000"))
+    # Rows per request for table scans; clamped to SUPABASE_MAX_ROWS, the server's
+    # PostgREST max-rows (Supabase default 1000), because a page cut short by the
+    # server would end a scan early
+    SUPABASE_PAGE_SIZE = int(os.getenv("SUPABASE_PAGE_SIZE", "1000"))
+    SUPABASE_MAX_ROWS = int(os.getenv("SUPABASE_MAX_ROWS", "1000"))
+    # "text" (pgvector text form, float32 round-trip digits) or "json" (list of floats)
+    EMBEDDING_UPLOAD_FORMAT = os.getenv("EMBEDDING_UPLOAD_FORMAT", "text")
+    # float16 round-trip digits; for halfvec columns (optional_halfvec_embeddings.sql)
+    EMBEDDING_HALF_PRECISION = os.getenv("EMBEDDING_HALF_PRECISION", "false").lower() == "true"
+    # Phase 2: prefetch + in-memory reinforcement + chunked upsert instead of per-relation queries
+    RELATION_BULK_LOAD = os.getenv("RELATION_BULK_LOAD", "true").lower() == "true"
+    # Phase 2: parallel document workers (1 = serial)
+    PHASE2_WORKERS = int(os.getenv("PHASE2_WORKERS", "1"))
+    # Phase 2 / chat: also accept base verb forms and space/hyphen spellings of
+    # rule predicates ("trigger" -> "triggers"); off = exact predicates only
+    ONTOLOGY_PREDICATE_ALIASES = os.getenv("ONTOLOGY_PREDICATE_ALIASES", "false").lower() == "true"
+
+    # Phase 1: parallel page workers (1 = serial) and per-service in-flight limits
+    PIPELINE_WORKERS = int(os.getenv("PIPELINE_WORKERS", "1"))
+    CONFLUENCE_CONCURRENCY = int(os.getenv("CONFLUENCE_CONCURRENCY", "4"))
+    OPENAI_CONCURRENCY = int(os.getenv("OPENAI_CONCURRENCY", "4"))
+    SUPABASE_CONCURRENCY = int(os.getenv("SUPABASE_CONCURRENCY", "4"))
+    # Adaptive token bucket ceilings in requests/second (halved on 429, 0 = unlimited);
+    # Confluence uses 1 / CONFLUENCE_RATE_LIMIT_DELAY
+    OPENAI_REQUESTS_PER_SECOND = float(os.getenv("OPENAI_REQUESTS_PER_SECOND", "5"))
+    SUPABASE_REQUESTS_PER_SECOND = float(os.getenv("SUPABASE_REQUESTS_PER_SECOND", "0"))
+    # Phase 1: staged streaming mode (fetch/embed/extract/load stages with bounded queues)
+    PIPELINE_STREAMING = os.getenv("PIPELINE_STREAMING", "false").lower() == "true"
+    PIPELINE_QUEUE_SIZE = int(os.getenv("PIPELINE_QUEUE_SIZE", "8"))
 
     # Table names
     TABLE_DOCUMENTS = os.getenv("TABLE_DOCUMENTS", "playbook_documents")
@@ -39,21 +77,56 @@ class Config:
     TABLE_RELATIONS = os.getenv("TABLE_RELATIONS", "playbook_semantic_relations")
     TABLE_ONTOLOGY_RULES = os.getenv("TABLE_ONTOLOGY_RULES", "playbook_ontology_rules")
 
+    # Local embedding cache keyed by (EMBEDDING_MODEL, sha256(text))
+    EMBEDDING_CACHE_ENABLED = os.getenv("EMBEDDING_CACHE_ENABLED", "true").lower() == "true"
+    EMBEDDING_CACHE_FILE = os.getenv("EMBEDDING_CACHE_FILE", "data/cache/embeddings.sqlite")
+    # Term extraction response cache (size-bounded LRU); BYPASS re-extracts and overwrites
+    LLM_CACHE_ENABLED = os.getenv("LLM_CACHE_ENABLED", "true").lower() == "true"
+    LLM_CACHE_FILE = os.getenv("LLM_CACHE_FILE", "data/cache/llm_responses.sqlite")
+    LLM_CACHE_MAX_MB = int(os.getenv("LLM_CACHE_MAX_MB", "256"))
+    LLM_CACHE_BYPASS = os.getenv("LLM_CACHE_BYPASS", "false").lower() == "true"
+
+    # Term extraction: map-reduce over all chunk windows (false = first window only)
+    EXTRACTION_MAP_REDUCE = os.getenv("EXTRACTION_MAP_REDUCE", "false").lower() == "true"
+    EXTRACTION_WINDOW_CHARS = int(os.getenv("EXTRACTION_WINDOW_CHARS", "8000"))
+    # Windows of one document submitted together (requests still share OPENAI_CONCURRENCY)
+    EXTRACTION_WORKERS = int(os.getenv("EXTRACTION_WORKERS", "4"))
+
     # Processing settings
     CHUNK_SIZE = int(os.getenv("CHUNK_SIZE", "1000"))
     CHUNK_OVERLAP = int(os.getenv("CHUNK_OVERLAP", "200"))
 
+    # Graph traversal settings
+    # Load the whole graph into memory at API startup (GraphTraversal runs without per-hop queries)
+    GRAPH_SNAPSHOT_ENABLED = os.getenv("GRAPH_SNAPSHOT_ENABLED", "false").lower() == "true"
+    # Seconds between background change checks that reload the snapshot (0 = never)
+    GRAPH_SNAPSHOT_REFRESH_SECONDS = int(os.getenv("GRAPH_SNAPSHOT_REFRESH_SECONDS", "120"))
+    # Seconds after which the snapshot is reloaded even if no change was detected
+    GRAPH_SNAPSHOT_MAX_AGE_SECONDS = int(os.getenv("GRAPH_SNAPSHOT_MAX_AGE_SECONDS", "900"))
+    # Seconds between incremental term index refreshes (picks up Phase 2 results; 0 = manual only)
+    TERM_INDEX_REFRESH_SECONDS = int(os.getenv("TERM_INDEX_REFRESH_SECONDS", "300"))
+
+    # Chat term/rule catalog (loaded once, refreshed in the background)
+    # Change check interval (count + latest created_at) and forced reload age, in seconds
+    TERM_CATALOG_REFRESH_SECONDS = int(os.getenv("TERM_CATALOG_REFRESH_SECONDS", "60"))
+    TERM_CATALOG_MAX_AGE_SECONDS = int(os.getenv("TERM_CATALOG_MAX_AGE_SECONDS", "900"))
+
     # File paths
     CONFLUENCE_IDS_FILE = os.getenv("CONFLUENCE_IDS_FILE", "confluence_ids.txt")
     CHECKPOINT_FILE = os.getenv("CHECKPOINT_FILE", "data/checkpoint.json")
+    # "journal" (append-only updates, periodic compaction) or "json" (rewrite per update)
+    CHECKPOINT_BACKEND = os.getenv("CHECKPOINT_BACKEND", "journal")
+    CHECKPOINT_COMPACT_EVERY = int(os.getenv("CHECKPOINT_COMPACT_EVERY", "1000"))
     LOG_FILE = os.getenv("LOG_FILE", "logs/playbook.log")
 
     @classmethod
     def validate(cls) -> bool:
         """Validate that all required environment variables are set"""
-        required = [
+        required = [] if cls.CONFLUENCE_OFFLINE else [
             ("CONFLUENCE_EMAIL", cls.CONFLUENCE_EMAIL),
             ("CONFLUENCE_API_TOKEN", cls.CONFLUENCE_API_TOKEN),
+        ]
+        required += [
             ("OPENAI_API_KEY", cls.OPENAI_API_KEY),
             ("SUPABASE_URL", cls.SUPABASE_URL),
             ("SUPABASE_KEY", cls.SUPABASE_KEY),
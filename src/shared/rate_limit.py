@@ -0,0 +1,247 @@
+"""
+Adaptive rate limiting for external services (Confluence, OpenAI, Supabase)
+"""
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from email.utils import parsedate_to_datetime
+from typing import Any, Iterator, Optional
+
+
+logger = logging.getLogger("playbook_nexus.rate_limit")
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header value
+
+    Args:
+        value: Header value (delay in seconds or an HTTP date)
+
+    Returns:
+        Seconds to wait, or None if missing/unparseable
+    """
+    if not value:
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def retry_after_from_error(error: Any) -> Optional[float]:
+    """
+    Retry-After delay carried by an HTTP error (requests or OpenAI SDK)
+
+    Args:
+        error: Exception or response object
+
+    Returns:
+        Seconds to wait, or None if the error has no Retry-After header
+    """
+    response = getattr(error, 'response', error)
+    headers = getattr(response, 'headers', None)
+    if not headers:
+        return None
+    return parse_retry_after(headers.get('Retry-After') or headers.get('retry-after'))
+
+
+def is_rate_limited(error: Any) -> bool:
+    """
+    Check whether an error (or response) is an HTTP 429
+
+    Args:
+        error: Exception or response object
+
+    Returns:
+        True for 429 Too Many Requests
+    """
+    status = getattr(error, 'status_code', None)
+    if status is None:
+        status = getattr(getattr(error, 'response', None), 'status_code', None)
+    return status == 429
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket with adaptive refill rate
+
+    Each acquire() takes one token; tokens refill at `rate` per second up to
+    `capacity`. A 429 halves the rate (down to min_rate) and, if the server
+    sent Retry-After, blocks every caller until that time. Each success
+    raises the rate again by `recovery` of the configured rate, back up to
+    the configured maximum (AIMD).
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: Optional[float] = None,
+        min_rate: Optional[float] = None,
+        recovery: float = 0.05
+    ):
+        """
+        Args:
+            rate: Maximum requests per second (<= 0 = unlimited)
+            capacity: Burst size (None = max(1, rate))
+            min_rate: Lowest rate after repeated 429s (None = rate / 16)
+            recovery: Fraction of `rate` restored per successful request
+        """
+        self.max_rate = rate
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self.min_rate = min_rate if min_rate is not None else rate / 16
+        self.recovery = recovery
+
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def unlimited(self) -> bool:
+        return self.max_rate <= 0
+
+    def _refill(self, now: float):
+        elapsed = now - self._updated
+        self._updated = now
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+
+    def acquire(self) -> float:
+        """
+        Take one token, blocking until available
+
+        Returns:
+            Seconds spent waiting
+        """
+        if self.unlimited and not self._blocked_until:
+            return 0.0
+
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                if now < self._blocked_until:
+                    wait = self._blocked_until - now
+                elif self.unlimited:
+                    return waited
+                else:
+                    self._refill(now)
+                    if self._tokens >= 1:
+                        self._tokens -= 1
+                        return waited
+                    wait = (1 - self._tokens) / self.rate
+
+            time.sleep(wait)
+            waited += wait
+
+    def on_success(self):
+        """Additive increase after a successful request"""
+        if self.unlimited:
+            return
+        with self._lock:
+            if self.rate < self.max_rate:
+                self.rate = min(self.max_rate, self.rate + self.max_rate * self.recovery)
+
+    def on_rate_limited(self, retry_after: Optional[float] = None):
+        """
+        Multiplicative decrease after a 429
+
+        Args:
+            retry_after: Server-provided delay in seconds (blocks all callers)
+        """
+        with self._lock:
+            now = time.monotonic()
+            if not self.unlimited:
+                self._refill(now)
+                self.rate = max(self.min_rate, self.rate / 2)
+                self._tokens = min(self._tokens, 0.0)
+            if retry_after:
+                self._blocked_until = max(self._blocked_until, now + retry_after)
+
+        logger.warning(
+            f"Rate limited: rate={self.rate:.2f}/s"
+            + (f", retry after {retry_after:.1f}s" if retry_after else "")
+        )
+
+
+class ServiceLimiter:
+    """
+    Concurrency cap + adaptive rate limit for one external service
+
+    Example:
+        >>> limiter = ServiceLimiter("openai", max_concurrency=4, rate=5.0)
+        >>> with limiter.slot():
+        ...     pass  # bounded number of in-flight calls
+        >>> limiter.acquire()  # one request's worth of rate budget
+        0.0
+    """
+
+    def __init__(self, name: str, max_concurrency: int = 1, rate: float = 0.0):
+        """
+        Args:
+            name: Service name (for logs/stats)
+            max_concurrency: Maximum in-flight calls (slot())
+            rate: Maximum requests per second (<= 0 = unlimited)
+        """
+        self.name = name
+        self.max_concurrency = max(1, max_concurrency)
+        self.bucket = TokenBucket(rate)
+
+        self._semaphore = threading.BoundedSemaphore(self.max_concurrency)
+        self._stats_lock = threading.Lock()
+        self.requests = 0
+        self.rate_limited = 0
+        self.wait_time = 0.0
+
+    @contextmanager
+    def slot(self) -> Iterator[None]:
+        """Hold one of max_concurrency slots for the duration of a step"""
+        start = time.monotonic()
+        self._semaphore.acquire()
+        waited = time.monotonic() - start
+        with self._stats_lock:
+            self.wait_time += waited
+        try:
+            yield
+        finally:
+            self._semaphore.release()
+
+    def acquire(self) -> float:
+        """
+        Take rate budget for one request (call before each HTTP request)
+
+        Returns:
+            Seconds spent waiting
+        """
+        waited = self.bucket.acquire()
+        with self._stats_lock:
+            self.requests += 1
+            self.wait_time += waited
+        return waited
+
+    def on_success(self):
+        self.bucket.on_success()
+
+    def on_rate_limited(self, retry_after: Optional[float] = None):
+        with self._stats_lock:
+            self.rate_limited += 1
+        logger.warning(f"{self.name}: HTTP 429 received")
+        self.bucket.on_rate_limited(retry_after)
+
+    def get_stats(self) -> dict:
+        """Request/429/wait counters"""
+        with self._stats_lock:
+            return {
+                'requests': self.requests,
+                'rate_limited': self.rate_limited,
+                'wait_time': round(self.wait_time, 2),
+                'current_rate': round(self.bucket.rate, 2),
+            }
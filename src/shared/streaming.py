@@ -0,0 +1,230 @@
+"""
+Staged streaming pipeline: worker stages connected by bounded queues
+"""
+import logging
+import queue
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+
+logger = logging.getLogger("playbook_nexus.streaming")
+
+# End-of-stream marker passed between stages
+_DONE = object()
+
+
+@dataclass
+class StageResult:
+    """Outcome of one item after leaving the pipeline"""
+    item: Any
+    ok: bool
+    # Stage that rejected the item (returned False or raised)
+    failed_stage: Optional[str] = None
+    error: Optional[BaseException] = None
+
+
+@dataclass
+class StageMetrics:
+    """Counters for one stage (updated by its workers)"""
+    processed: int = 0
+    failed: int = 0
+    busy_time: float = 0.0
+    max_latency: float = 0.0
+    max_queue_depth: int = 0
+
+    @property
+    def avg_latency(self) -> float:
+        handled = self.processed + self.failed
+        return self.busy_time / handled if handled else 0.0
+
+
+@dataclass
+class Stage:
+    """
+    One pipeline stage
+
+    `func(item)` processes an item in place; returning False rejects it
+    (the item skips the remaining stages and is reported as failed).
+    """
+    name: str
+    func: Callable[[Any], Any]
+    workers: int = 1
+    metrics: StageMetrics = field(default_factory=StageMetrics)
+
+
+class StreamingPipeline:
+    """
+    Run items through stages concurrently with backpressure
+
+    Every stage reads from its own bounded input queue, so a slow stage
+    blocks the stages before it once its queue is full instead of letting
+    work pile up in memory. Results come out in completion order.
+
+    Example:
+        >>> pipeline = StreamingPipeline([Stage("double", lambda item: item.append(item[0] * 2))])
+        >>> [result.item for result in pipeline.run([[1]])]
+        [[1, 2]]
+    """
+
+    def __init__(self, stages: List[Stage], queue_size: int = 8):
+        """
+        Args:
+            stages: Stages in processing order
+            queue_size: Capacity of each stage's input queue
+        """
+        if not stages:
+            raise ValueError("StreamingPipeline needs at least one stage")
+
+        self.stages = stages
+        self.queue_size = max(1, queue_size)
+        self._queues: List[queue.Queue] = []
+        self._results: queue.Queue = queue.Queue()
+        self._stop_event = threading.Event()
+        self._metrics_lock = threading.Lock()
+        self._threads: List[threading.Thread] = []
+
+    def _put(self, index: int, item: Any):
+        """Put into stage `index`'s queue (index == len(stages) -> results)"""
+        if index == len(self.stages):
+            self._results.put(item)
+            return
+
+        target = self._queues[index]
+        target.put(item)
+        depth = target.qsize()
+        metrics = self.stages[index].metrics
+        if depth > metrics.max_queue_depth:
+            with self._metrics_lock:
+                metrics.max_queue_depth = max(metrics.max_queue_depth, depth)
+
+    def _feed(self, items: Iterable[Any]):
+        """Feed input items into the first stage (blocks while it is full)"""
+        try:
+            for item in items:
+                if self._stop_event.is_set():
+                    break
+                self._put(0, item)
+        except Exception as e:
+            logger.error(f"Pipeline input failed: {e}", exc_info=True)
+        finally:
+            for _ in range(self.stages[0].workers):
+                self._put(0, _DONE)
+
+    def _work(self, index: int, remaining: List[int], lock: threading.Lock):
+        """Worker loop for stage `index`"""
+        stage = self.stages[index]
+        inbox = self._queues[index]
+
+        while True:
+            item = inbox.get()
+
+            if item is _DONE:
+                with lock:
+                    remaining[0] -= 1
+                    last = remaining[0] == 0
+                if last:
+                    # Last worker of this stage closes the next one
+                    downstream = 1 if index + 1 == len(self.stages) else self.stages[index + 1].workers
+                    for _ in range(downstream):
+                        self._put(index + 1, _DONE)
+                return
+
+            # Stopped: drop unprocessed items (they are never reported)
+            if self._stop_event.is_set():
+                continue
+
+            start = time.time()
+            error = None
+            try:
+                ok = stage.func(item) is not False
+            except Exception as e:
+                logger.error(f"Stage {stage.name} failed: {e}", exc_info=True)
+                ok = False
+                error = e
+            elapsed = time.time() - start
+
+            with self._metrics_lock:
+                stage.metrics.busy_time += elapsed
+                stage.metrics.max_latency = max(stage.metrics.max_latency, elapsed)
+                if ok:
+                    stage.metrics.processed += 1
+                else:
+                    stage.metrics.failed += 1
+
+            if ok:
+                self._put(index + 1, item)
+            else:
+                self._results.put(StageResult(item, False, stage.name, error))
+
+    def run(self, items: Iterable[Any]) -> Iterator[StageResult]:
+        """
+        Start all stages and yield results as items complete
+
+        Args:
+            items: Input items (consumed lazily by a feeder thread)
+
+        Yields:
+            StageResult per item that finished or was rejected
+        """
+        self._stop_event.clear()
+        self._queues = [queue.Queue(maxsize=self.queue_size) for _ in self.stages]
+        self._results = queue.Queue()
+        self._threads = [threading.Thread(target=self._feed, args=(items,), name="stream-feed", daemon=True)]
+
+        for index, stage in enumerate(self.stages):
+            remaining = [max(1, stage.workers)]
+            stage.workers = remaining[0]
+            lock = threading.Lock()
+            for n in range(stage.workers):
+                self._threads.append(threading.Thread(
+                    target=self._work,
+                    args=(index, remaining, lock),
+                    name=f"stream-{stage.name}-{n}",
+                    daemon=True
+                ))
+
+        for thread in self._threads:
+            thread.start()
+
+        try:
+            while True:
+                result = self._results.get()
+                if result is _DONE:
+                    break
+                if isinstance(result, StageResult):
+                    yield result
+                else:
+                    yield StageResult(result, True)
+        finally:
+            self.stop()
+
+    def stop(self):
+        """Stop feeding, drop queued items and wait for in-flight items to finish"""
+        self._stop_event.set()
+        for thread in self._threads:
+            thread.join()
+        self._threads = []
+
+    def queue_depths(self) -> Dict[str, int]:
+        """Current input queue depth per stage"""
+        return {stage.name: q.qsize() for stage, q in zip(self.stages, self._queues)}
+
+    def get_metrics(self) -> Dict[str, Dict[str, Any]]:
+        """Per-stage counters, latency and queue depth"""
+        depths = self.queue_depths()
+        with self._metrics_lock:
+            return {
+                stage.name: {
+                    'workers': stage.workers,
+                    'processed': stage.metrics.processed,
+                    'failed': stage.metrics.failed,
+                    'avg_latency': round(stage.metrics.avg_latency, 3),
+                    'max_latency': round(stage.metrics.max_latency, 3),
+                    'busy_time': round(stage.metrics.busy_time, 2),
+                    'queue_depth': depths.get(stage.name, 0),
+                    'max_queue_depth': stage.metrics.max_queue_depth,
+                }
+                for stage in self.stages
+            }
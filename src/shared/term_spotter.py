@@ -0,0 +1,210 @@
+"""
+Multi-pattern term spotting (Aho-Corasick automaton)
+"""
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+
+class AhoCorasick:
+    """
+    Aho-Corasick automaton over a fixed set of string patterns
+
+    Finds every (possibly overlapping) occurrence of every pattern in a
+    single pass over the text, independent of the number of patterns.
+    """
+
+    def __init__(self, patterns: Iterable[str] = ()):
+        """
+        Build the automaton
+
+        Args:
+            patterns: Patterns to search for (empty strings are ignored;
+                pattern IDs are positions in self.patterns)
+        """
+        self.patterns: List[str] = []
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[int]] = [[]]
+
+        for pattern in patterns:
+            self.patterns.append(pattern)
+            if pattern:
+                self._insert(pattern, len(self.patterns) - 1)
+
+        self._build_failure_links()
+
+    def __len__(self) -> int:
+        return len(self.patterns)
+
+    def _insert(self, pattern: str, pattern_id: int):
+        state = 0
+        for char in pattern:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+            state = next_state
+        self._output[state].append(pattern_id)
+
+    def _build_failure_links(self):
+        """BFS over the trie; each state inherits the outputs of its failure state"""
+        queue = deque(self._goto[0].values())
+
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[next_state] = self._goto[fallback].get(char, 0)
+                if self._fail[next_state] == next_state:
+                    self._fail[next_state] = 0
+
+                self._output[next_state] = (
+                    self._output[next_state] + self._output[self._fail[next_state]]
+                )
+
+    def iter_matches(self, text: str) -> Iterator[Tuple[int, int]]:
+        """
+        Iterate over all pattern occurrences
+
+        Args:
+            text: Text to scan
+
+        Yields:
+            (start position, pattern ID) in order of match end position
+        """
+        state = 0
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+        patterns = self.patterns
+
+        for end, char in enumerate(text, start=1):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+
+            for pattern_id in output[state]:
+                yield end - len(patterns[pattern_id]), pattern_id
+
+
+@dataclass
+class TermOccurrences:
+    """Occurrences of one term in a text"""
+    term: str
+    positions: List[int] = field(default_factory=list)
+    # Non-overlapping occurrences, counted left to right (same as str.count)
+    count: int = 0
+
+    @property
+    def first_position(self) -> int:
+        """Position of the first occurrence (same as str.find)"""
+        return self.positions[0]
+
+
+class TermSpotter:
+    """
+    Find vocabulary terms (and their synonyms) in text
+
+    Matching is case-insensitive: terms, synonyms and text are lower-cased.
+    A synonym occurrence is reported under its canonical vocabulary term.
+
+    Example:
+        >>> spotter = TermSpotter(["클로버", "체리"], synonyms={"클로버": ["하트"]})
+        >>> spotter.spot("하트와 체리")["클로버"].positions
+        [0]
+    """
+
+    def __init__(
+        self,
+        terms: Iterable[str],
+        synonyms: Optional[Dict[str, List[str]]] = None
+    ):
+        """
+        Args:
+            terms: Vocabulary terms
+            synonyms: Canonical term -> synonyms (e.g. SYNONYM_DICTIONARY);
+                only entries for vocabulary terms are used
+        """
+        # Pattern ID -> canonical term
+        self._canonical: List[str] = []
+        patterns: List[str] = []
+        seen = set()
+
+        vocabulary = []
+        for term in terms:
+            key = (term or '').lower().strip()
+            if key and (key, key) not in seen:
+                seen.add((key, key))
+                vocabulary.append(key)
+
+        for term in vocabulary:
+            patterns.append(term)
+            self._canonical.append(term)
+
+        for term in vocabulary:
+            for synonym in (synonyms or {}).get(term, []):
+                alias = synonym.lower().strip()
+                if alias and (alias, term) not in seen:
+                    seen.add((alias, term))
+                    patterns.append(alias)
+                    self._canonical.append(term)
+
+        self.terms = vocabulary
+        self._automaton = AhoCorasick(patterns)
+
+    def spot(
+        self,
+        text: str,
+        include_terms: bool = True,
+        include_synonyms: bool = True
+    ) -> Dict[str, TermOccurrences]:
+        """
+        Find all occurrences of vocabulary terms in one pass
+
+        Args:
+            text: Text to scan (lower-cased here)
+            include_terms: Report occurrences of the terms themselves
+            include_synonyms: Report synonym occurrences under their term
+
+        Returns:
+            Canonical term -> occurrences, for terms found at least once
+        """
+        if not text:
+            return {}
+
+        # Occurrences per pattern, sorted by start position
+        by_pattern: Dict[int, List[int]] = {}
+        for start, pattern_id in self._automaton.iter_matches(text.lower()):
+            is_synonym = pattern_id >= len(self.terms)
+            if (include_synonyms if is_synonym else include_terms):
+                by_pattern.setdefault(pattern_id, []).append(start)
+
+        found: Dict[str, TermOccurrences] = {}
+        patterns = self._automaton.patterns
+
+        for pattern_id, starts in by_pattern.items():
+            term = self._canonical[pattern_id]
+            occurrences = found.get(term)
+            if occurrences is None:
+                occurrences = found[term] = TermOccurrences(term=term)
+
+            length = len(patterns[pattern_id])
+            last_end = -1
+            for start in starts:
+                if start >= last_end:
+                    occurrences.count += 1
+                    last_end = start + length
+            occurrences.positions.extend(starts)
+
+        for occurrences in found.values():
+            occurrences.positions.sort()
+
+        return found
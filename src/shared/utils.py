@@ -4,8 +4,9 @@ Utility functions for configuration, logging, and checkpoint management
 import os
 import json
 import logging
+import threading
 from pathlib import Path
-from typing import Dict, Any, Set
+from typing import Dict, Any, Optional, Set, Union
 from dotenv import load_dotenv
 
 
@@ -44,6 +45,8 @@ class Config:
     # File paths
     CONFLUENCE_IDS_FILE = os.getenv("CONFLUENCE_IDS_FILE", "confluence_ids.txt")
     CHECKPOINT_FILE = os.getenv("CHECKPOINT_FILE", "data/checkpoint.json")
+    CHECKPOINT_BACKEND = os.getenv("CHECKPOINT_BACKEND", "journal")
+    CHECKPOINT_COMPACT_EVERY = int(os.getenv("CHECKPOINT_COMPACT_EVERY", "1000"))
     LOG_FILE = os.getenv("LOG_FILE", "logs/playbook.log")
 
     @classmethod
@@ -103,10 +106,12 @@ def setup_logging(log_file: str = None) -> logging.Logger:
 
 
 class CheckpointManager:
-    """Manage processing checkpoints to resume from failures"""
+    """Manage processing checkpoints to resume from failures (thread-safe)"""
 
     def __init__(self, checkpoint_file: str = None):
         self.checkpoint_file = checkpoint_file or Config.CHECKPOINT_FILE
+        # Pipeline workers update counters concurrently
+        self._lock = threading.RLock()
 
         # Ensure checkpoint directory exists
         checkpoint_dir = Path(self.checkpoint_file).parent
@@ -137,30 +142,34 @@ class CheckpointManager:
 
     def save(self):
         """Save checkpoint data to file"""
-        try:
-            with open(self.checkpoint_file, 'w', encoding='utf-8') as f:
-                json.dump(self.data, f, indent=2, ensure_ascii=False)
-        except Exception as e:
-            logging.error(f"Failed to save checkpoint: {e}")
+        with self._lock:
+            try:
+                with open(self.checkpoint_file, 'w', encoding='utf-8') as f:
+                    json.dump(self.data, f, indent=2, ensure_ascii=False)
+            except Exception as e:
+                logging.error(f"Failed to save checkpoint: {e}")
 
     def mark_processed(self, page_id: str, index: int):
         """Mark a page as successfully processed"""
-        if page_id not in self.data["processed_page_ids"]:
-            self.data["processed_page_ids"].append(page_id)
-        self.data["last_processed_index"] = index
-        self.data["total_documents"] += 1
-        self.save()
+        with self._lock:
+            if page_id not in self.data["processed_page_ids"]:
+                self.data["processed_page_ids"].append(page_id)
+            self.data["last_processed_index"] = index
+            self.data["total_documents"] += 1
+            self.save()
 
     def mark_failed(self, page_id: str):
         """Mark a page as failed"""
-        if page_id not in self.data["failed_page_ids"]:
-            self.data["failed_page_ids"].append(page_id)
-        self.save()
+        with self._lock:
+            if page_id not in self.data["failed_page_ids"]:
+                self.data["failed_page_ids"].append(page_id)
+            self.save()
 
     def add_chunks(self, count: int):
         """Increment total chunks counter"""
-        self.data["total_chunks"] += count
-        self.save()
+        with self._lock:
+            self.data["total_chunks"] += count
+            self.save()
 
     def is_processed(self, page_id: str) -> bool:
         """Check if a page has been processed"""
@@ -181,8 +190,205 @@ class CheckpointManager:
 
     def reset(self):
         """Reset checkpoint data"""
-        self.data = self._default_data()
-        self.save()
+        with self._lock:
+            self.data = self._default_data()
+            self.save()
+
+
+class JournalCheckpointManager:
+    """
+    Checkpoint backend with O(1) updates (thread-safe)
+
+    Page IDs are kept in insertion-ordered dicts (set semantics). Each update
+    appends one JSON line to a journal next to the checkpoint file instead of
+    rewriting it; every compact_every entries (and on save/close) the state
+    is written to the checkpoint file and the journal is truncated.
+
+    The checkpoint file has the same format as CheckpointManager's, so both
+    backends can resume from each other's snapshots.
+    """
+
+    def __init__(self, checkpoint_file: str = None, compact_every: int = None):
+        self.checkpoint_file = checkpoint_file or Config.CHECKPOINT_FILE
+        self.journal_file = self.checkpoint_file + ".journal"
+        self.compact_every = compact_every or Config.CHECKPOINT_COMPACT_EVERY
+        self._lock = threading.RLock()
+
+        # Ensure checkpoint directory exists
+        Path(self.checkpoint_file).parent.mkdir(parents=True, exist_ok=True)
+
+        self._processed: Dict[str, None] = {}
+        self._failed: Dict[str, None] = {}
+        self._last_index = -1
+        self._total_documents = 0
+        self._total_chunks = 0
+        # Sequence number of the last journal entry applied
+        self._seq = 0
+        self._pending = 0
+
+        self._load()
+        self._journal = open(self.journal_file, 'a', encoding='utf-8')
+        if self._pending:
+            self.save()
+
+    def _load(self):
+        """Load the snapshot, then replay journal entries written after it"""
+        if Path(self.checkpoint_file).exists():
+            try:
+                with open(self.checkpoint_file, 'r', encoding='utf-8') as f:
+                    snapshot = json.load(f)
+                self._processed = dict.fromkeys(snapshot.get("processed_page_ids", []))
+                self._failed = dict.fromkeys(snapshot.get("failed_page_ids", []))
+                self._last_index = snapshot.get("last_processed_index", -1)
+                self._total_documents = snapshot.get("total_documents", 0)
+                self._total_chunks = snapshot.get("total_chunks", 0)
+                self._seq = snapshot.get("journal_seq", 0)
+            except Exception as e:
+                logging.warning(f"Failed to load checkpoint: {e}")
+
+        if not Path(self.journal_file).exists():
+            return
+
+        with open(self.journal_file, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    # Torn final line from an interrupted write
+                    continue
+                # Entries up to journal_seq are already in the snapshot
+                if entry["seq"] > self._seq:
+                    self._apply(entry)
+                    self._seq = entry["seq"]
+                    self._pending += 1
+
+    def _apply(self, entry: Dict[str, Any]):
+        op = entry["op"]
+        if op == "processed":
+            self._processed[entry["id"]] = None
+            self._last_index = entry["index"]
+            self._total_documents += 1
+        elif op == "failed":
+            self._failed[entry["id"]] = None
+        elif op == "chunks":
+            self._total_chunks += entry["count"]
+
+    def _append(self, entry: Dict[str, Any]):
+        """Apply an update and journal it (caller holds the lock)"""
+        self._seq += 1
+        entry["seq"] = self._seq
+        self._apply(entry)
+        try:
+            self._journal.write(json.dumps(entry, ensure_ascii=False) + "\n")
+            self._journal.flush()
+        except Exception as e:
+            logging.error(f"Failed to write checkpoint journal: {e}")
+
+        self._pending += 1
+        if self._pending >= self.compact_every:
+            self.save()
+
+    @property
+    def data(self) -> Dict[str, Any]:
+        """Checkpoint state in the CheckpointManager data format"""
+        with self._lock:
+            return {
+                "processed_page_ids": list(self._processed),
+                "failed_page_ids": list(self._failed),
+                "last_processed_index": self._last_index,
+                "total_documents": self._total_documents,
+                "total_chunks": self._total_chunks,
+                "journal_seq": self._seq,
+            }
+
+    def save(self):
+        """Compact: write the snapshot atomically, then truncate the journal"""
+        with self._lock:
+            tmp_file = self.checkpoint_file + ".tmp"
+            try:
+                with open(tmp_file, 'w', encoding='utf-8') as f:
+                    json.dump(self.data, f, ensure_ascii=False)
+                os.replace(tmp_file, self.checkpoint_file)
+
+                # A crash before truncation is harmless: replay skips entries <= journal_seq
+                self._journal.seek(0)
+                self._journal.truncate()
+                self._pending = 0
+            except Exception as e:
+                logging.error(f"Failed to save checkpoint: {e}")
+
+    def mark_processed(self, page_id: str, index: int):
+        """Mark a page as successfully processed"""
+        with self._lock:
+            self._append({"op": "processed", "id": page_id, "index": index})
+
+    def mark_failed(self, page_id: str):
+        """Mark a page as failed"""
+        with self._lock:
+            if page_id not in self._failed:
+                self._append({"op": "failed", "id": page_id})
+
+    def add_chunks(self, count: int):
+        """Increment total chunks counter"""
+        with self._lock:
+            self._append({"op": "chunks", "count": count})
+
+    def is_processed(self, page_id: str) -> bool:
+        """Check if a page has been processed"""
+        return page_id in self._processed
+
+    def get_processed_ids(self) -> Set[str]:
+        """Get set of processed page IDs"""
+        with self._lock:
+            return set(self._processed)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get processing statistics"""
+        with self._lock:
+            return {
+                "processed": len(self._processed),
+                "failed": len(self._failed),
+                "total_documents": self._total_documents,
+                "total_chunks": self._total_chunks,
+            }
+
+    def reset(self):
+        """Reset checkpoint data"""
+        with self._lock:
+            self._processed = {}
+            self._failed = {}
+            self._last_index = -1
+            self._total_documents = 0
+            self._total_chunks = 0
+            self.save()
+
+    def close(self):
+        """Compact and close the journal"""
+        with self._lock:
+            if self._journal.closed:
+                return
+            self.save()
+            self._journal.close()
+
+
+def create_checkpoint_manager(
+    checkpoint_file: str = None,
+    backend: Optional[str] = None
+) -> Union[CheckpointManager, JournalCheckpointManager]:
+    """
+    Create the configured checkpoint backend
+
+    Args:
+        checkpoint_file: Checkpoint file path (None = Config.CHECKPOINT_FILE)
+        backend: "journal" (append-only, default) or "json" (full rewrite per update);
+            None = Config.CHECKPOINT_BACKEND
+    """
+    backend = (backend or Config.CHECKPOINT_BACKEND).lower()
+    if backend == "json":
+        return CheckpointManager(checkpoint_file)
+    if backend != "journal":
+        logging.warning(f"Unknown CHECKPOINT_BACKEND '{backend}', using journal")
+    return JournalCheckpointManager(checkpoint_file)
 
 
 def load_page_ids(file_path: str = None) -> list[str]:
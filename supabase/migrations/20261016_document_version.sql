@@ -0,0 +1,10 @@
+-- Migration: Track Confluence page version per document
+-- Purpose: Incremental sync (main.py --incremental) re-processes only pages
+--          whose remote version.number is newer than the stored one
+-- Date: 2026-10-16
+
+ALTER TABLE playbook_documents
+ADD COLUMN IF NOT EXISTS version INTEGER;
+
+COMMENT ON COLUMN playbook_documents.version IS
+'Confluence version.number at the time the document was loaded (NULL = loaded before version tracking)';
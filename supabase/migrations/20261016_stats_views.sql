@@ -0,0 +1,48 @@
+-- Migration: Server-side statistics views
+-- Purpose: SupabaseLoader.get_detailed_stats / check_db_data.py / check_term_duplicates.py
+--          read counts, orphan counts and duplicate summaries from these views
+--          instead of downloading whole tables
+-- Date: 2026-10-16
+
+-- 테이블별 행 수 + 고아/중복 수 (1행)
+CREATE OR REPLACE VIEW playbook_table_stats AS
+SELECT
+    (SELECT COUNT(*) FROM playbook_documents) AS total_documents,
+    (SELECT COUNT(*) FROM playbook_chunks) AS total_chunks,
+    (SELECT COUNT(*) FROM playbook_semantic_terms) AS total_semantic_terms,
+    (SELECT COUNT(DISTINCT term) FROM playbook_semantic_terms) AS unique_terms,
+    (SELECT COUNT(*) FROM playbook_semantic_relations) AS total_relations,
+    (SELECT COUNT(*) FROM playbook_ontology_rules) AS total_ontology_rules,
+
+    -- 청크가 없는 문서 (Phase 1 실패)
+    (SELECT COUNT(*) FROM playbook_documents d
+      WHERE NOT EXISTS (SELECT 1 FROM playbook_chunks c WHERE c.doc_id = d.id)) AS documents_without_chunks,
+    -- 용어가 없는 문서 (추출 실패)
+    (SELECT COUNT(*) FROM playbook_documents d
+      WHERE NOT EXISTS (SELECT 1 FROM playbook_semantic_terms t WHERE t.doc_id = d.id)) AS documents_without_terms,
+    (SELECT COUNT(*) FROM playbook_chunks WHERE embedding IS NULL) AS chunks_without_embedding,
+    -- 관계가 하나도 없는 용어 (고아 용어)
+    (SELECT COUNT(*) FROM playbook_semantic_terms t
+      WHERE NOT EXISTS (SELECT 1 FROM playbook_semantic_relations r WHERE r.source_term_id = t.id)
+        AND NOT EXISTS (SELECT 1 FROM playbook_semantic_relations r WHERE r.target_term_id = t.id)) AS orphan_terms,
+    -- 같은 문서 내 중복 용어 (UNIQUE(doc_id, term) 위반)
+    (SELECT COUNT(*) FROM (
+        SELECT 1 FROM playbook_semantic_terms GROUP BY doc_id, term HAVING COUNT(*) > 1
+    ) dup) AS same_doc_duplicate_terms;
+
+COMMENT ON VIEW playbook_table_stats IS '테이블별 행 수와 고아/중복 수 (통계 조회 1회 요청)';
+
+-- 여러 문서에 등장하는 용어 요약
+CREATE OR REPLACE VIEW playbook_term_duplicate_stats AS
+SELECT
+    term,
+    COUNT(*) AS occurrence_count,
+    COUNT(DISTINCT doc_id) AS doc_count,
+    COUNT(DISTINCT category) AS category_count,
+    ARRAY_AGG(DISTINCT category) AS categories
+FROM playbook_semantic_terms
+GROUP BY term
+HAVING COUNT(*) > 1
+ORDER BY occurrence_count DESC;
+
+COMMENT ON VIEW playbook_term_duplicate_stats IS '2회 이상 등장하는 용어별 문서 수/카테고리 수 (category_count > 1 = 카테고리 충돌)';
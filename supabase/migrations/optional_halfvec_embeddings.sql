@@ -0,0 +1,21 @@
+-- ============================================================
+-- Playbook Nexus - 임베딩 half-precision 저장 (선택)
+-- Description: playbook_chunks.embedding 을 halfvec(1536) 으로 변환
+--              (임베딩 저장 공간 약 1/2, pgvector 0.7.0 이상 필요)
+--
+-- 적용 후 .env 에 EMBEDDING_HALF_PRECISION=true 설정
+-- (업로드 시 유효숫자 4자리로 전송, float16 정밀도와 동일)
+--
+-- 되돌리기:
+--   ALTER TABLE playbook_chunks
+--     ALTER COLUMN embedding TYPE VECTOR(1536) USING embedding::vector(1536);
+-- ============================================================
+
+ALTER TABLE playbook_chunks
+  ALTER COLUMN embedding TYPE HALFVEC(1536) USING embedding::halfvec(1536);
+
+COMMENT ON COLUMN playbook_chunks.embedding IS 'OpenAI text-embedding-3-small (1536차원, half precision)';
+
+-- 벡터 인덱스를 만들 경우 halfvec 연산자 클래스 사용
+-- CREATE INDEX idx_playbook_chunks_vec ON playbook_chunks
+--   USING hnsw (embedding halfvec_cosine_ops);
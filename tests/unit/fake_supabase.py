@@ -0,0 +1,198 @@
+"""
+In-memory stand-in for the supabase-py query builder used by unit tests
+
+Supports the subset of PostgREST filters the repository code uses
+(select/eq/in_/gt/gte/or_ with is.null/order/range/limit with count='exact' and head=True),
+insert/update/upsert/delete writes and an optional server max-rows cap.
+"""
+import itertools
+
+
+def _split_top_level(text):
+    """Split a PostgREST logic tree on commas outside parentheses and quotes"""
+    parts, depth, quoted, current = [], 0, False, ''
+    for ch in text:
+        if ch == '"':
+            quoted = not quoted
+        elif not quoted and ch in '()':
+            depth += 1 if ch == '(' else -1
+        elif not quoted and ch == ',' and depth == 0:
+            parts.append(current)
+            current = ''
+            continue
+        current += ch
+    parts.append(current)
+    return parts
+
+
+def _matches(row, condition):
+    """Evaluate one or_() condition ("col.op.value", "and(...)" or "or(...)") against a row"""
+    if condition.startswith('and(') and condition.endswith(')'):
+        return all(_matches(row, part) for part in _split_top_level(condition[4:-1]))
+    if condition.startswith('or(') and condition.endswith(')'):
+        return any(_matches(row, part) for part in _split_top_level(condition[3:-1]))
+    column, op, value = condition.split('.', 2)
+    if value.startswith('"') and value.endswith('"'):
+        value = value[1:-1].replace('\\"', '"').replace('\\\\', '\\')
+    current = row.get(column)
+    if op == 'is' and value == 'null':
+        return current is None
+    if current is None:
+        return False
+    if isinstance(current, int):
+        value = int(value)
+    if op == 'eq':
+        return current == value
+    if op == 'gt':
+        return current > value
+    if op == 'gte':
+        return current >= value
+    raise ValueError(f"Unsupported or_ operator: {op}")
+
+
+class FakeResult:
+    def __init__(self, data, count=None):
+        self.data = data
+        self.count = count
+
+
+class FakeQuery:
+    def __init__(self, client, table):
+        self.client = client
+        self.table = table
+        self.rows = list(client.tables[table])
+        self.columns = None
+        self.count = None
+        self.orders = []
+        self.bounds = None
+        self.write = None
+        self.single_row = False
+        self.head = False
+
+    def select(self, columns, count=None, head=None, **kwargs):
+        self.columns = [c.strip() for c in columns.split(',')]
+        self.count = count
+        self.head = bool(head)
+        return self
+
+    def insert(self, rows, **kwargs):
+        self.write = ('insert', rows if isinstance(rows, list) else [rows], None)
+        return self
+
+    def update(self, data):
+        self.write = ('update', data, None)
+        return self
+
+    def delete(self):
+        self.write = ('delete', None, None)
+        return self
+
+    def upsert(self, rows, on_conflict='', default_to_null=True, **kwargs):
+        self.write = ('upsert', rows if isinstance(rows, list) else [rows], on_conflict)
+        return self
+
+    def eq(self, column, value):
+        self.rows = [r for r in self.rows if r.get(column) == value]
+        return self
+
+    def in_(self, column, values):
+        self.rows = [r for r in self.rows if r.get(column) in values]
+        return self
+
+    def gt(self, column, value):
+        self.rows = [r for r in self.rows if r.get(column) is not None and r[column] > value]
+        return self
+
+    def gte(self, column, value):
+        self.rows = [r for r in self.rows if r.get(column) is not None and r[column] >= value]
+        return self
+
+    def or_(self, filters):
+        self.rows = [r for r in self.rows if any(_matches(r, c) for c in _split_top_level(filters))]
+        return self
+
+    def order(self, column, desc=False, nullsfirst=None):
+        self.orders.append((column, desc, nullsfirst))
+        return self
+
+    def range(self, start, end):
+        self.bounds = (start, end)
+        return self
+
+    def single(self):
+        self.single_row = True
+        return self
+
+    def limit(self, n):
+        self.bounds = (0, n - 1)
+        return self
+
+    def _execute_write(self):
+        kind, payload, on_conflict = self.write
+        table = self.client.tables[self.table]
+
+        if kind == 'delete':
+            doomed = {id(r) for r in self.rows}
+            table[:] = [r for r in table if id(r) not in doomed]
+            return FakeResult([dict(r) for r in self.rows])
+
+        if kind == 'update':
+            for row in self.rows:
+                row.update(payload)
+            return FakeResult([dict(r) for r in self.rows])
+
+        written = []
+        key_columns = [c.strip() for c in on_conflict.split(',')] if on_conflict else ['id']
+        for new_row in payload:
+            match = None
+            if kind == 'upsert':
+                key = [new_row.get(c) for c in key_columns]
+                match = next((r for r in table if [r.get(c) for c in key_columns] == key), None)
+            if match is not None:
+                match.update(new_row)
+                written.append(dict(match))
+            else:
+                row = dict(new_row)
+                row.setdefault('id', f"gen-{next(self.client.id_counter)}")
+                table.append(row)
+                written.append(dict(row))
+        return FakeResult(written)
+
+    def execute(self):
+        self.client.calls.append(self.table)
+        if self.write:
+            return self._execute_write()
+        rows = self.rows
+        total = len(rows)
+        for column, desc, nullsfirst in reversed(self.orders):
+            # PostgreSQL default: NULLS LAST ascending, NULLS FIRST descending
+            nulls = [r for r in rows if r.get(column) is None]
+            values = sorted((r for r in rows if r.get(column) is not None), key=lambda r: r[column], reverse=desc)
+            rows = nulls + values if (desc if nullsfirst is None else nullsfirst) else values + nulls
+        if self.bounds:
+            rows = rows[self.bounds[0]:self.bounds[1] + 1]
+        if self.client.max_rows is not None:
+            # PostgREST max-rows: silently caps every response
+            rows = rows[:self.client.max_rows]
+        if self.columns and self.columns != ['*']:
+            rows = [{c: r.get(c) for c in self.columns} for r in rows]
+        else:
+            rows = [dict(r) for r in rows]
+        if self.single_row:
+            return FakeResult(rows[0] if rows else None)
+        if self.head:
+            return FakeResult([], total if self.count == 'exact' else None)
+        return FakeResult(rows, total if self.count == 'exact' else None)
+
+
+class FakeSupabaseClient:
+    """Holds table rows in memory and records one entry per executed request"""
+
+    def __init__(self, tables, max_rows=None):
+        self.tables = tables
+        self.max_rows = max_rows
+        self.calls = []
+        self.id_counter = itertools.count(1)
+
+    def table(self, name):
+        return FakeQuery(self, name)
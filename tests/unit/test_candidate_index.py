@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Unit tests for index-backed global term matching in OntologyBuilder
+"""
+import sys
+import random
+import logging
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.core.processors.ontology_builder import CandidateIndex, fuzzy_match_term, normalize_term
+
+# Set up logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+SYLLABLES = "포코숲리그클로버더블폭탄장애물스테이지"
+
+
+def _candidates(count, seed=0):
+    rng = random.Random(seed)
+    candidates = {}
+    while len(candidates) < count:
+        key = ''.join(rng.choice(SYLLABLES) for _ in range(rng.randint(1, 5)))
+        candidates.setdefault(key, {'id': f"t{len(candidates)}", 'term': key})
+    return candidates
+
+
+def test_same_result_as_linear_scan():
+    """Every query resolves to the same candidate as the dictionary scan"""
+    rng = random.Random(1)
+    candidates = _candidates(300)
+    index = CandidateIndex(candidates)
+
+    queries = [''.join(rng.choice(SYLLABLES) for _ in range(rng.randint(1, 8))) for _ in range(2000)]
+    queries += ["포코숲을", "은", "", "Stage", "없는용어"]
+    for query in queries:
+        assert index.match(query)[0] is fuzzy_match_term(query, candidates), query
+
+
+def test_match_methods_are_counted():
+    """Hit counts per method"""
+    candidates = {
+        normalize_term(term): {'term': term}
+        for term in ["포코숲 리그", "클로버", "더블폭탄", "폭탄"]
+    }
+    index = CandidateIndex(candidates)
+
+    assert index.match("클로버를") == (candidates["클로버"], "exact")
+    assert index.match("포코숲") == (candidates["포코숲리그"], "query_in_candidate")
+    assert index.match("슈퍼더블폭탄") == (candidates["더블폭탄"], "candidate_in_query")
+    assert index.match("스테이지") == (None, "miss")
+    assert dict(index.hits) == {'exact': 1, 'query_in_candidate': 1, 'candidate_in_query': 1, 'miss': 1}
+
+
+def test_index_is_ignored_when_stale():
+    """Keys added after indexing fall back to the scan (and is_current reports it)"""
+    candidates = {'클로버': {'term': '클로버'}}
+    index = CandidateIndex(candidates)
+    candidates['포코숲'] = {'term': '포코숲'}
+
+    assert not index.is_current(candidates)
+    assert fuzzy_match_term('포코숲리그', candidates, index) is candidates['포코숲']
+
+
+def main():
+    """Run all tests"""
+    tests = [
+        test_same_result_as_linear_scan,
+        test_match_methods_are_counted,
+        test_index_is_ignored_when_stale,
+    ]
+
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            logger.info(f"✅ PASS: {test.__name__}")
+        except AssertionError as e:
+            failed += 1
+            logger.error(f"❌ FAIL: {test.__name__}: {e}")
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the append-only journal checkpoint backend
+"""
+import sys
+import json
+import logging
+import tempfile
+import threading
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.shared.utils import CheckpointManager, JournalCheckpointManager, create_checkpoint_manager
+
+# Set up logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+def test_updates_append_to_journal_and_resume():
+    """Updates only append journal lines; a new manager (after a crash) replays them"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = str(Path(tmp) / "checkpoint.json")
+        checkpoint = JournalCheckpointManager(path, compact_every=1000)
+
+        checkpoint.mark_processed('1', 0)
+        checkpoint.add_chunks(5)
+        checkpoint.mark_failed('2')
+        checkpoint.mark_failed('2')
+        checkpoint.mark_processed('3', 2)
+
+        assert not Path(path).exists()
+        assert len(Path(path + ".journal").read_text().splitlines()) == 4
+
+        # Simulate a crash mid-write: torn final line
+        with open(path + ".journal", 'a') as f:
+            f.write('{"op": "chunks", "cou')
+
+        resumed = JournalCheckpointManager(path)
+        assert resumed.get_processed_ids() == {'1', '3'}
+        assert resumed.is_processed('3') and not resumed.is_processed('2')
+        assert resumed.get_stats() == {'processed': 2, 'failed': 1, 'total_documents': 2, 'total_chunks': 5}
+        assert resumed.data['last_processed_index'] == 2
+
+        # Loading compacted the journal into the snapshot
+        assert Path(path + ".journal").read_text() == ""
+        resumed.close()
+
+
+def test_compaction_is_idempotent():
+    """Compaction truncates the journal; replaying a journal already in the snapshot adds nothing"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = str(Path(tmp) / "checkpoint.json")
+        checkpoint = JournalCheckpointManager(path, compact_every=3)
+
+        for i in range(7):
+            checkpoint.mark_processed(str(i), i)
+        assert len(Path(path + ".journal").read_text().splitlines()) == 1
+        assert json.loads(Path(path).read_text())['total_documents'] == 6
+
+        # Crash between snapshot write and journal truncation
+        journal = Path(path + ".journal").read_text()
+        checkpoint.save()
+        Path(path + ".journal").write_text(journal)
+
+        resumed = JournalCheckpointManager(path)
+        assert resumed.get_stats()['total_documents'] == 7
+        resumed.close()
+
+
+def test_concurrent_updates():
+    """Worker threads can update the checkpoint concurrently"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = str(Path(tmp) / "checkpoint.json")
+        checkpoint = JournalCheckpointManager(path, compact_every=50)
+
+        def work(worker):
+            for i in range(200):
+                checkpoint.mark_processed(f"{worker}-{i}", i)
+                checkpoint.add_chunks(1)
+
+        threads = [threading.Thread(target=work, args=(w,)) for w in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert checkpoint.get_stats()['total_chunks'] == 800
+        resumed = JournalCheckpointManager(path)
+        assert resumed.get_stats() == checkpoint.get_stats()
+        resumed.close()
+        checkpoint.close()
+
+
+def test_reset_and_json_backend_compatibility():
+    """Both backends read each other's snapshot; reset clears everything"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = str(Path(tmp) / "checkpoint.json")
+
+        legacy = create_checkpoint_manager(path, backend="json")
+        assert isinstance(legacy, CheckpointManager)
+        legacy.mark_processed('a', 0)
+        legacy.add_chunks(3)
+
+        journal = create_checkpoint_manager(path, backend="journal")
+        assert isinstance(journal, JournalCheckpointManager)
+        assert journal.get_stats() == legacy.get_stats()
+        journal.mark_processed('b', 1)
+        journal.close()
+
+        assert CheckpointManager(path).get_processed_ids() == {'a', 'b'}
+
+        journal = JournalCheckpointManager(path)
+        journal.reset()
+        assert journal.get_stats() == {'processed': 0, 'failed': 0, 'total_documents': 0, 'total_chunks': 0}
+        journal.close()
+        assert JournalCheckpointManager(path).get_processed_ids() == set()
+
+
+def main():
+    """Run all tests"""
+    tests = [
+        test_updates_append_to_journal_and_resume,
+        test_compaction_is_idempotent,
+        test_concurrent_updates,
+        test_reset_and_json_backend_compatibility,
+    ]
+
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            logger.info(f"✅ PASS: {test.__name__}")
+        except AssertionError as e:
+            failed += 1
+            logger.error(f"❌ FAIL: {test.__name__}: {e}")
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
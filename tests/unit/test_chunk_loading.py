@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Unit tests for idempotent, byte-sized chunk loading (no Supabase required)
+"""
+import sys
+import json
+import logging
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.core.loaders.supabase_loader import SupabaseLoader
+from tests.unit.fake_supabase import FakeSupabaseClient, FakeQuery
+
+# Set up logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+class FlakyQuery(FakeQuery):
+    """Rejects upserts containing a poisoned row or more rows than max_rows"""
+
+    def execute(self):
+        if self.write and self.write[0] == 'upsert':
+            rows = self.write[1]
+            self.client.upsert_sizes.append(len(rows))
+            if len(rows) > self.client.max_rows or any(r['content'] == 'poison' for r in rows):
+                raise RuntimeError("payload rejected")
+        return super().execute()
+
+
+class FlakyClient(FakeSupabaseClient):
+    def __init__(self, tables, max_rows=1000):
+        super().__init__(tables)
+        self.max_rows = max_rows
+        self.upsert_sizes = []
+
+    def table(self, name):
+        return FlakyQuery(self, name)
+
+
+def _chunks(doc_id, count, dims=64, content=None):
+    return [
+        {
+            'doc_id': doc_id,
+            'chunk_index': i,
+            'content': content(i) if content else f"{doc_id} chunk {i}",
+            'metadata': {'chunk_index': i},
+            'embedding': [0.123456] * dims,
+        }
+        for i in range(count)
+    ]
+
+
+def _make_loader(client, batch_bytes=2_000_000):
+    loader = SupabaseLoader.__new__(SupabaseLoader)
+    loader.client = client
+    loader.table_chunks = 'playbook_chunks'
+    loader.chunk_batch_bytes = batch_bytes
+    loader.embedding_format = "json"
+    loader.embedding_half_precision = False
+    return loader
+
+
+def test_reload_is_idempotent():
+    """Loading the same page twice overwrites its chunks instead of duplicating them"""
+    loader = _make_loader(FlakyClient({'playbook_chunks': []}))
+
+    assert loader.load_chunks(_chunks('1', 5)) == 5
+    assert loader.load_chunks(_chunks('1', 5, content=lambda i: f"edited {i}")) == 5
+
+    rows = loader.client.tables['playbook_chunks']
+    assert len(rows) == 5
+    assert all(row['content'].startswith("edited") for row in rows)
+
+
+def test_batches_sized_by_bytes():
+    """Batch sizes follow payload bytes, not a fixed row count"""
+    row_bytes = len(json.dumps(_chunks('1', 1, dims=256)[0], separators=(',', ':')))
+    loader = _make_loader(FlakyClient({'playbook_chunks': []}), batch_bytes=row_bytes * 10)
+
+    assert loader.load_chunks(_chunks('1', 40, dims=256)) == 40
+    sizes = loader.client.upsert_sizes
+    assert len(sizes) >= 4 and sum(sizes) == 40
+    assert max(sizes) <= 10
+
+    batches = SupabaseLoader._split_by_bytes(_chunks('1', 40, dims=8), 10**9)
+    assert [len(batch) for batch in batches] == [40]
+
+
+def test_failed_batches_are_bisected():
+    """Oversized batches are split until they succeed; a bad row fails alone"""
+    client = FlakyClient({'playbook_chunks': []}, max_rows=3)
+    loader = _make_loader(client)
+    chunks = _chunks('1', 10, content=lambda i: 'poison' if i == 7 else f"chunk {i}")
+
+    assert loader.load_chunks(chunks) == 9
+    stored = sorted(row['chunk_index'] for row in client.tables['playbook_chunks'])
+    assert stored == [0, 1, 2, 3, 4, 5, 6, 8, 9]
+
+
+def test_delete_stale_trailing_chunks():
+    """A shorter page loses its trailing chunks; other documents are untouched"""
+    client = FlakyClient({'playbook_chunks': []})
+    loader = _make_loader(client)
+    loader.load_chunks(_chunks('1', 6) + _chunks('2', 2))
+
+    assert loader.load_chunks(_chunks('1', 4), delete_stale=True) == 4
+    rows = client.tables['playbook_chunks']
+    assert sorted(row['chunk_index'] for row in rows if row['doc_id'] == '1') == [0, 1, 2, 3]
+    assert len([row for row in rows if row['doc_id'] == '2']) == 2
+
+    # Incomplete load keeps the old tail
+    client.max_rows = 0
+    assert loader.load_chunks(_chunks('2', 1), delete_stale=True) == 0
+    assert len([row for row in rows if row['doc_id'] == '2']) == 2
+
+
+def main():
+    """Run all tests"""
+    tests = [
+        test_reload_is_idempotent,
+        test_batches_sized_by_bytes,
+        test_failed_batches_are_bisected,
+        test_delete_stale_trailing_chunks,
+    ]
+
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            logger.info(f"✅ PASS: {test.__name__}")
+        except AssertionError as e:
+            failed += 1
+            logger.error(f"❌ FAIL: {test.__name__}: {e}")
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
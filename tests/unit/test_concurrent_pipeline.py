@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Unit tests for adaptive rate limiting and the concurrent Phase 1 pipeline (no external services)
+"""
+import sys
+import time
+import logging
+import tempfile
+import threading
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.main import Pipeline
+from src.shared.rate_limit import (
+    ServiceLimiter,
+    TokenBucket,
+    is_rate_limited,
+    parse_retry_after,
+    retry_after_from_error,
+)
+from src.shared.utils import CheckpointManager
+
+# Set up logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+def test_retry_after_parsing():
+    """Retry-After as seconds / HTTP date / missing"""
+    assert parse_retry_after("3") == 3.0
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("garbage") is None
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+
+    error = SimpleNamespace(response=SimpleNamespace(status_code=429, headers={'Retry-After': '2'}))
+    assert is_rate_limited(error)
+    assert retry_after_from_error(error) == 2.0
+    assert not is_rate_limited(SimpleNamespace(status_code=500))
+
+
+def test_token_bucket_adapts():
+    """429 halves the rate and Retry-After blocks callers; successes recover the rate"""
+    bucket = TokenBucket(rate=100.0, capacity=1)
+    assert bucket.acquire() == 0.0
+
+    bucket.on_rate_limited()
+    assert bucket.rate == 50.0
+
+    bucket.on_rate_limited(retry_after=0.2)
+    assert bucket.rate == 25.0
+    start = time.monotonic()
+    bucket.acquire()
+    assert time.monotonic() - start >= 0.19
+
+    for _ in range(100):
+        bucket.on_success()
+    assert bucket.rate == 100.0
+
+    # Unlimited bucket never waits (except for Retry-After)
+    assert TokenBucket(rate=0).acquire() == 0.0
+
+
+def test_service_limiter_caps_concurrency():
+    """slot() never lets more than max_concurrency callers in"""
+    limiter = ServiceLimiter("test", max_concurrency=2)
+    active = []
+    peak = []
+    lock = threading.Lock()
+
+    def work():
+        with limiter.slot():
+            with lock:
+                active.append(1)
+                peak.append(len(active))
+            time.sleep(0.02)
+            with lock:
+                active.pop()
+
+    threads = [threading.Thread(target=work) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert max(peak) == 2
+
+
+def _make_pipeline(checkpoint_file: str, openai_concurrency: int):
+    """Pipeline with a fake process_page that uses the OpenAI limiter like the real one"""
+    pipeline = Pipeline.__new__(Pipeline)
+    pipeline.checkpoint = CheckpointManager(checkpoint_file)
+    pipeline.limiters = {
+        'confluence': ServiceLimiter('confluence', max_concurrency=4),
+        'openai': ServiceLimiter('openai', max_concurrency=openai_concurrency),
+        'supabase': ServiceLimiter('supabase', max_concurrency=4),
+    }
+
+    state = {'active': 0, 'peak': 0}
+    lock = threading.Lock()
+
+    def process_page(page_id):
+        if page_id == 'boom':
+            raise RuntimeError("unexpected")
+        with pipeline.limiters['openai'].slot():
+            with lock:
+                state['active'] += 1
+                state['peak'] = max(state['peak'], state['active'])
+            time.sleep(0.01)
+            with lock:
+                state['active'] -= 1
+        pipeline.checkpoint.add_chunks(2)
+        return not page_id.startswith('bad')
+
+    pipeline.process_page = process_page
+    return pipeline, state
+
+
+def test_concurrent_run_matches_serial_checkpoint():
+    """Concurrent mode records the same checkpoint as serial mode"""
+    page_ids = [f"p{i}" for i in range(20)] + ['bad1', 'boom', 'bad2']
+
+    with tempfile.TemporaryDirectory() as tmp:
+        serial, _ = _make_pipeline(str(Path(tmp) / "serial.json"), openai_concurrency=1)
+        concurrent, state = _make_pipeline(str(Path(tmp) / "concurrent.json"), openai_concurrency=3)
+
+        serial_counts = serial._run_serial(page_ids)
+        concurrent_counts = concurrent._run_concurrent(page_ids, workers=6)
+
+        assert serial_counts == concurrent_counts == (20, 3)
+        assert state['peak'] <= 3
+
+        serial_data = serial.checkpoint.data
+        concurrent_data = concurrent.checkpoint.data
+        assert set(concurrent_data['processed_page_ids']) == set(serial_data['processed_page_ids'])
+        assert set(concurrent_data['failed_page_ids']) == {'bad1', 'boom', 'bad2'}
+        assert concurrent_data['total_documents'] == serial_data['total_documents'] == 20
+        assert concurrent_data['total_chunks'] == serial_data['total_chunks'] == 44
+
+        # Saved file reflects the in-memory checkpoint
+        reloaded = CheckpointManager(str(Path(tmp) / "concurrent.json"))
+        assert reloaded.get_stats() == concurrent.checkpoint.get_stats()
+
+
+def main():
+    """Run all tests"""
+    tests = [
+        test_retry_after_parsing,
+        test_token_bucket_adapts,
+        test_service_limiter_caps_concurrency,
+        test_concurrent_run_matches_serial_checkpoint,
+    ]
+
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            logger.info(f"✅ PASS: {test.__name__}")
+        except AssertionError as e:
+            failed += 1
+            logger.error(f"❌ FAIL: {test.__name__}: {e}")
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
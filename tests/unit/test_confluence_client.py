@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the async Confluence client (httpx mock transport, no network)
+"""
+import sys
+import time
+import asyncio
+import logging
+import threading
+from pathlib import Path
+
+import httpx
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.core.processors.confluence_processor import ConfluenceProcessor
+from src.core.processors.confluence_client import AsyncConfluenceClient, EventLoopThread
+
+# Set up logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+BASE_URL = "https://example.atlassian.net/wiki"
+
+
+def _page_json(page_id):
+    return {
+        'id': page_id,
+        'title': f"Page {page_id}",
+        'space': {'key': 'DS', 'name': 'Design'},
+        'version': {'number': 2, 'when': '2026-10-01T00:00:00Z'},
+        'body': {'storage': {'value': f"<p>content {page_id}</p>"}},
+        'ancestors': [{'id': 'root', 'title': 'Root'}],
+    }
+
+
+class PageServer:
+    """Serves pages with a per-page delay and tracks in-flight requests"""
+
+    def __init__(self, delays=None, rate_limited=None):
+        self.delays = delays or {}
+        self.rate_limited = dict(rate_limited or {})  # page_id -> number of 429s left
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.calls = []
+        self._lock = threading.Lock()
+
+    async def __call__(self, request):
+        page_id = request.url.path.rsplit('/', 1)[-1]
+        with self._lock:
+            self.calls.append((page_id, time.monotonic()))
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delays.get(page_id, 0.01))
+            if self.rate_limited.get(page_id):
+                self.rate_limited[page_id] -= 1
+                return httpx.Response(429, headers={'Retry-After': '0.2'})
+            if page_id == 'missing':
+                return httpx.Response(404)
+            return httpx.Response(200, json=_page_json(page_id))
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+
+def _make_client(server, max_concurrency=2, max_retries=3, page_builder=None):
+    return AsyncConfluenceClient(
+        BASE_URL, "user@example.com", "token",
+        max_concurrency=max_concurrency,
+        max_retries=max_retries,
+        backoff_base=0.01,
+        page_builder=page_builder,
+        transport=httpx.MockTransport(server)
+    )
+
+
+def test_retry_after_is_honoured():
+    """A 429 waits for Retry-After, then the retry succeeds"""
+    server = PageServer(rate_limited={'1': 1})
+    client = _make_client(server)
+
+    page = asyncio.run(client.get_page('1'))
+
+    assert page['title'] == "Page 1"
+    assert len(server.calls) == 2
+    assert server.calls[1][1] - server.calls[0][1] >= 0.2
+
+
+def test_concurrency_is_bounded():
+    """No more than max_concurrency requests are in flight"""
+    server = PageServer()
+    client = _make_client(server, max_concurrency=3)
+
+    async def fetch_all():
+        return [item async for item in client.fetch_pages([str(i) for i in range(10)])]
+
+    results = asyncio.run(fetch_all())
+
+    assert len(results) == 10
+    assert server.max_in_flight == 3
+
+
+def test_fetch_pages_yields_in_completion_order():
+    """Slow pages do not hold back fast ones; failures yield None"""
+    server = PageServer(delays={'slow': 0.3, 'fast': 0.01})
+    client = _make_client(server, max_concurrency=4, max_retries=1)
+
+    async def fetch_all():
+        return [item async for item in client.fetch_pages(['slow', 'missing', 'fast'])]
+
+    results = asyncio.run(fetch_all())
+
+    assert [page_id for page_id, _ in results][-1] == 'slow'
+    assert dict(results)['missing'] is None
+
+
+def test_page_builder_runs_off_the_event_loop():
+    """A slow page_builder does not stall the other in-flight requests"""
+    server = PageServer(delays={'1': 0.01, '2': 0.2, '3': 0.2})
+    threads = set()
+
+    def slow_builder(page_id, raw):
+        threads.add(threading.current_thread())
+        time.sleep(0.3)
+        return raw
+
+    client = _make_client(server, max_concurrency=3, page_builder=slow_builder)
+
+    async def fetch_all():
+        loop_thread = threading.current_thread()
+        results = [item async for item in client.fetch_pages(['1', '2', '3'])]
+        return loop_thread, results
+
+    start = time.monotonic()
+    loop_thread, results = asyncio.run(fetch_all())
+
+    assert len(results) == 3
+    assert loop_thread not in threads
+    # Builds overlap the requests and each other instead of running back to back
+    assert time.monotonic() - start < 0.8
+
+
+def test_sync_wrapper_builds_page_data():
+    """ConfluenceProcessor keeps its sync API on top of the async client"""
+    server = PageServer()
+    confluence = ConfluenceProcessor.__new__(ConfluenceProcessor)
+    confluence.base_url = BASE_URL
+    confluence.page_cache = None
+    confluence.offline = False
+    confluence.text_extractor = "soup"
+    confluence.known_versions = {}
+    confluence.client = _make_client(server, page_builder=confluence.build_page_data)
+    confluence._io = EventLoopThread()
+
+    page = confluence.process_page('7')
+    assert page['page_id'] == '7'
+    assert page['content'] == "content 7"
+    assert page['path'] == "Root"
+
+    fetched = dict(confluence.fetch_pages(['1', '2', '3']))
+    assert sorted(fetched) == ['1', '2', '3']
+    assert fetched['2']['title'] == "Page 2"
+
+    confluence.close()
+
+
+def main():
+    """Run all tests"""
+    tests = [
+        test_retry_after_is_honoured,
+        test_concurrency_is_bounded,
+        test_fetch_pages_yields_in_completion_order,
+        test_page_builder_runs_off_the_event_loop,
+        test_sync_wrapper_builds_page_data,
+    ]
+
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            logger.info(f"✅ PASS: {test.__name__}")
+        except AssertionError as e:
+            failed += 1
+            logger.error(f"❌ FAIL: {test.__name__}: {e}")
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Unit tests for Phase 2 document metadata prefetch and recency weights
+"""
+import sys
+import logging
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.core.processors.ontology_builder import OntologyBuilder, calculate_recency_weight
+from tests.unit.fake_supabase import FakeSupabaseClient, FakeQuery
+
+# Set up logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+NOW = datetime.now(timezone.utc)
+
+
+def _days_ago(days):
+    return (NOW - timedelta(days=days)).isoformat()
+
+
+def _make_builder():
+    """Builder with 4 documents of different ages, each with one valid relation"""
+    ages = [10, 60, 400, None]
+    documents = [
+        {'id': f'd{i}', 'last_updated': _days_ago(age) if age is not None else None}
+        for i, age in enumerate(ages)
+    ]
+    client = FakeSupabaseClient({'playbook_documents': documents, 'playbook_semantic_relations': []})
+
+    builder = OntologyBuilder(SimpleNamespace(client=client))
+    builder.ontology_rules = {('mechanic', 'triggers', 'gameobject'): {}}
+    builder.valid_predicates = {'triggers'}
+
+    for i in range(len(ages)):
+        doc_id = f'd{i}'
+        source = {
+            'id': f's{i}', 'doc_id': doc_id, 'term': '매치', 'category': 'mechanic',
+            'raw_relations': [{'target': '더블폭탄', 'type': 'triggers', 'confidence': 0.5}]
+        }
+        target = {'id': f'g{i}', 'doc_id': doc_id, 'term': '더블폭탄', 'category': 'gameobject'}
+        for term in (source, target):
+            builder.terms_by_doc[doc_id].append(term)
+            builder.terms_by_name[f"{doc_id}:{term['term'].lower()}"] = term
+
+    builder.load_ontology_rules = lambda: 1
+    builder.load_semantic_terms = lambda doc_ids=None: 8
+    return builder, client
+
+
+class InSizeQuery(FakeQuery):
+    """Records the length of every in_() list"""
+
+    def in_(self, column, values):
+        self.client.in_sizes.append((self.table, column, len(values)))
+        return super().in_(column, values)
+
+
+class InSizeClient(FakeSupabaseClient):
+    def __init__(self, tables):
+        super().__init__(tables)
+        self.in_sizes = []
+
+    def table(self, name):
+        return InSizeQuery(self, name)
+
+
+def test_scoped_loads_chunk_id_lists():
+    """Hundreds of scoped document IDs are sent in URL-safe in_() chunks"""
+    builder, _ = _make_builder()
+    doc_ids = [f'd{i}' for i in range(250)]
+    client = InSizeClient({
+        'playbook_documents': [{'id': doc_id, 'last_updated': None} for doc_id in doc_ids],
+        'playbook_semantic_terms': [
+            {'id': f't{i:03d}', 'doc_id': doc_id, 'term': f'용어{i}', 'category': 'mechanic',
+             'definition': '', 'frequency': 1, 'confidence': 0.5, 'raw_relations': []}
+            for i, doc_id in enumerate(doc_ids)
+        ],
+    })
+    builder.supabase = SimpleNamespace(client=client)
+    builder.terms_by_doc = defaultdict(list)
+    del builder.load_semantic_terms  # use the real loader instead of the stub
+
+    assert builder.load_document_metadata(doc_ids) == 250
+    assert builder.load_semantic_terms(doc_ids) == 250
+    assert len(builder.terms_by_doc) == 250
+
+    sizes = [(table, size) for table, _, size in client.in_sizes]
+    assert sizes == [('playbook_documents', 100), ('playbook_documents', 100), ('playbook_documents', 50),
+                     ('playbook_semantic_terms', 100), ('playbook_semantic_terms', 100),
+                     ('playbook_semantic_terms', 50)]
+
+
+def test_weight_uses_reference_time():
+    """Weights depend only on the reference time passed in"""
+    reference = datetime(2026, 2, 1, tzinfo=timezone.utc)
+
+    assert calculate_recency_weight('2026-01-20T00:00:00Z', reference) == 1.5
+    assert calculate_recency_weight('2025-12-01T00:00:00', reference) == 1.3
+    assert calculate_recency_weight('2025-09-01T00:00:00+00:00', reference) == 1.2
+    assert calculate_recency_weight('2024-01-01T00:00:00Z', reference) == 1.0
+    assert calculate_recency_weight('not a date', reference) == 1.0
+
+
+def test_build_graph_prefetches_metadata_once():
+    """One documents request for the whole run, weights applied per document"""
+    builder, client = _make_builder()
+
+    builder.build_graph(workers=1)
+
+    assert client.calls.count('playbook_documents') == 1
+    assert builder.doc_recency_weights == {'d0': 1.5, 'd1': 1.3, 'd2': 1.0, 'd3': 1.0}
+
+    confidences = {
+        r['source_term_id']: round(r['confidence'], 6)
+        for r in client.tables['playbook_semantic_relations']
+    }
+    assert confidences == {'s0': 0.75, 's1': 0.65, 's2': 0.5, 's3': 0.5}
+
+
+def test_uncached_document_is_looked_up():
+    """Direct calls outside build_graph still get the document's weight"""
+    builder, client = _make_builder()
+
+    relations = builder.collect_relations_for_document('d0')
+    assert round(relations[0]['confidence'], 6) == 0.75
+
+    builder.collect_relations_for_document('d0')
+    assert client.calls.count('playbook_documents') == 1
+
+
+def main():
+    """Run all tests"""
+    tests = [
+        test_weight_uses_reference_time,
+        test_build_graph_prefetches_metadata_once,
+        test_uncached_document_is_looked_up,
+        test_scoped_loads_chunk_id_lists,
+    ]
+
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            logger.info(f"✅ PASS: {test.__name__}")
+        except AssertionError as e:
+            failed += 1
+            logger.error(f"❌ FAIL: {test.__name__}: {e}")
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the embedding cache and cached SemanticProcessor.get_embeddings (no OpenAI required)
+"""
+import sys
+import logging
+import tempfile
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.core.cache import EmbeddingCache
+from src.core.processors.semantic_processor import SemanticProcessor
+
+# Set up logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+class FakeEmbeddings:
+    """embeddings.create stand-in that records every request"""
+
+    def __init__(self):
+        self.requests = []
+
+    def create(self, model, input):
+        self.requests.append(list(input))
+        return SimpleNamespace(data=[
+            SimpleNamespace(embedding=[float(len(text)), 0.5, -0.25]) for text in input
+        ])
+
+
+def _make_processor(cache):
+    processor = SemanticProcessor.__new__(SemanticProcessor)
+    processor.embedding_model = "text-embedding-3-small"
+    processor.embedding_batch_size = 2
+    processor.max_retries = 1
+    processor.rate_limiter = None
+    processor.embedding_cache = cache
+    processor.client = SimpleNamespace(embeddings=FakeEmbeddings())
+    return processor
+
+
+def test_cache_roundtrip():
+    """Stored vectors come back as float32 and are scoped by model"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = str(Path(tmp) / "cache" / "embeddings.sqlite")
+        cache = EmbeddingCache(path)
+
+        cache.put_many("m1", ["a", "b"], [[0.1, 0.2], None])
+        assert len(cache) == 1
+
+        hits = cache.get_many("m1", ["a", "b", "a"])
+        assert hits[1] is None
+        assert hits[0] == hits[2]
+        assert abs(hits[0][0] - 0.1) < 1e-7 and abs(hits[0][1] - 0.2) < 1e-7
+        assert cache.get_many("m2", ["a"]) == [None]
+        assert cache.get_stats()['hits'] == 2 and cache.get_stats()['misses'] == 2
+        cache.close()
+
+        # Persisted across instances
+        reopened = EmbeddingCache(path)
+        assert reopened.get_many("m1", ["a"])[0] is not None
+        reopened.close()
+
+
+def test_get_embeddings_only_requests_misses():
+    """Second run over unchanged text makes no API calls; partial hits send only misses"""
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = EmbeddingCache(str(Path(tmp) / "embeddings.sqlite"))
+        processor = _make_processor(cache)
+        api = processor.client.embeddings
+
+        first = processor.get_embeddings(["one", "three", "seven"])
+        assert len(api.requests) == 2  # batch size 2
+
+        api.requests.clear()
+        second = processor.get_embeddings(["one", "three", "seven"])
+        assert api.requests == []
+        assert second == first
+
+        mixed = processor.get_embeddings(["seven", "eleven", "one"])
+        assert api.requests == [["eleven"]]
+        assert mixed[0] == first[2] and mixed[2] == first[0] and mixed[1][0] == 6.0
+        cache.close()
+
+
+def test_get_embeddings_without_cache():
+    """Without a cache every text is requested (previous behaviour)"""
+    processor = _make_processor(None)
+    processor.get_embeddings(["x", "y", "z"])
+    processor.get_embeddings(["x"])
+    assert processor.client.embeddings.requests == [["x", "y"], ["z"], ["x"]]
+
+
+def main():
+    """Run all tests"""
+    tests = [
+        test_cache_roundtrip,
+        test_get_embeddings_only_requests_misses,
+        test_get_embeddings_without_cache,
+    ]
+
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            logger.info(f"✅ PASS: {test.__name__}")
+        except AssertionError as e:
+            failed += 1
+            logger.error(f"❌ FAIL: {test.__name__}: {e}")
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Unit tests for fuzzy term matching and the n-gram candidate index
+"""
+import sys
+import random
+import logging
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.core.rules.prompts import SYNONYM_DICTIONARY
+from src.entities.term import (
+    TermNgramIndex,
+    find_matching_terms,
+    fuzzy_similarity,
+    normalize_korean_text,
+)
+
+# Set up logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+TERMS = [
+    {'id': '1', 'term': '클로버', 'category': 'Currency_Soft'},
+    {'id': '2', 'term': '포코코로', 'category': 'Content'},
+    {'id': '3', 'term': '포코숲 리그', 'category': 'Content'},
+    {'id': '4', 'term': '포코숲', 'category': 'Content'},
+    {'id': '5', 'term': '더블폭탄', 'category': 'GameObject'},
+]
+
+QUERIES = [
+    "클로버는어디에쓰나요?",
+    "클로바는 뭐야?",
+    "클로버를 어떻게 얻어?",
+    "포 코 코 로",
+    "포코숲 리그는 뭐야?",
+]
+
+
+def test_guide_examples():
+    """Scenarios from FUZZY_MATCHING_GUIDE.md"""
+    assert normalize_korean_text("클로버를") == "클로버"
+    assert normalize_korean_text("포 코 코 로") == "포코코로"
+    assert round(fuzzy_similarity("클로바", "클로버"), 2) == 0.82
+    # Guide examples corrected to what the documented algorithm produces
+    assert normalize_korean_text("클로버는 어디에서") == "클로버어디"
+    assert fuzzy_similarity("포코로", "포코코로") == 1.0
+
+    expected = {
+        "클로버는어디에쓰나요?": ('클로버', 'exact'),
+        "클로바는 뭐야?": ('클로버', 'fuzzy'),
+        "클로버를 어떻게 얻어?": ('클로버', 'exact'),
+        "포 코 코 로": ('포코코로', 'exact'),
+        "포코숲 리그는 뭐야?": ('포코숲 리그', 'exact'),
+    }
+    for query, (term, match_type) in expected.items():
+        top = find_matching_terms(query, TERMS)[0]
+        assert (top['term'], top['match_type']) == (term, match_type), query
+
+
+def test_index_matches_full_scan():
+    """Index candidates never change the result of a full scan"""
+    rng = random.Random(7)
+    syllables = list("클로버포코숲리그더블폭탄바위체리하트코인상자")
+    vocabulary = [
+        {'id': str(i), 'term': ''.join(rng.choice(syllables) for _ in range(rng.randint(1, 5)))}
+        for i in range(400)
+    ] + TERMS
+    queries = QUERIES + [
+        ' '.join(''.join(rng.choice(syllables) for _ in range(rng.randint(1, 5)))
+                 for _ in range(rng.randint(1, 4)))
+        for _ in range(100)
+    ]
+
+    queries += ["하트는 어디서 얻어?", "Double Bomb 조합", "coin 사용처"]
+
+    index = TermNgramIndex(vocabulary, synonyms=SYNONYM_DICTIONARY)
+    for query in queries:
+        for exact_threshold, fuzzy_threshold in [(0.85, 0.65), (0.9, 0.75), (0.8, 0.6)]:
+            scanned = find_matching_terms(query, vocabulary, exact_threshold, fuzzy_threshold,
+                                          synonyms=SYNONYM_DICTIONARY)
+            indexed = find_matching_terms(query, exact_threshold=exact_threshold,
+                                          fuzzy_threshold=fuzzy_threshold, index=index)
+            assert indexed == scanned, query
+
+
+def test_synonym_match():
+    """Synonyms from SYNONYM_DICTIONARY point to the canonical term"""
+    index = TermNgramIndex(TERMS, synonyms=SYNONYM_DICTIONARY)
+    top = find_matching_terms("하트는 어디서 얻어?", index=index)[0]
+    assert (top['term'], top['match_type']) == ('클로버', 'synonym')
+
+
+def main():
+    """Run all tests"""
+    tests = [
+        ("Guide examples", test_guide_examples),
+        ("Index matches full scan", test_index_matches_full_scan),
+        ("Synonym match", test_synonym_match),
+    ]
+
+    passed = 0
+    for test_name, test_func in tests:
+        try:
+            test_func()
+            logger.info(f"  ✅ PASS: {test_name}")
+            passed += 1
+        except AssertionError as e:
+            logger.error(f"  ❌ FAIL: {test_name}: {e}")
+
+    logger.info(f"Result: {passed}/{len(tests)} tests passed")
+    sys.exit(0 if passed == len(tests) else 1)
+
+
+if __name__ == "__main__":
+    main()
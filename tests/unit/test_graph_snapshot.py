@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the in-memory graph snapshot (no database required)
+"""
+import sys
+import logging
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.core.traversal import GraphSnapshot, GraphTraversal
+from tests.unit.fake_supabase import FakeSupabaseClient
+
+# Set up logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+TERMS = [
+    {'id': 't1', 'term': '4매치', 'category': 'mechanic', 'definition': ''},
+    {'id': 't2', 'term': '더블폭탄', 'category': 'gameobject', 'definition': ''},
+    {'id': 't3', 'term': '바위', 'category': 'gameobject', 'definition': ''},
+    {'id': 't4', 'term': '체리', 'category': 'resource', 'definition': ''},
+]
+
+RELATIONS = [
+    {'source_term_id': 't1', 'target_term_id': 't2', 'predicate': 'triggers', 'confidence': 0.9},
+    {'source_term_id': 't2', 'target_term_id': 't3', 'predicate': 'clears', 'confidence': 0.6},
+    {'source_term_id': 't2', 'target_term_id': 't4', 'predicate': 'rewards', 'confidence': 0.8},
+    {'source_term_id': 't3', 'target_term_id': 'missing', 'predicate': 'clears', 'confidence': 0.9},
+]
+
+
+def _make_snapshot() -> GraphSnapshot:
+    """Build a snapshot from fixture rows without touching Supabase"""
+    snapshot = GraphSnapshot(supabase_client=None)
+    snapshot._graph = GraphSnapshot.build_graph(TERMS, RELATIONS)
+    snapshot.loaded_at = 0.0
+    return snapshot
+
+
+def test_snapshot_csr_layout():
+    """Edges are stored per node, sorted by confidence, dangling edges skipped"""
+    snapshot = _make_snapshot()
+
+    assert snapshot.node_count == 4
+    assert snapshot.edge_count == 3
+
+    outgoing = snapshot.get_outgoing_relations('t2', min_confidence=0.0)
+    assert [r['target_term'] for r in outgoing] == ['체리', '바위']
+    assert outgoing[0]['predicate'] == 'rewards'
+
+    # Confidence filter stops at the first weaker edge
+    assert [r['target_term'] for r in snapshot.get_outgoing_relations('t2', 0.7)] == ['체리']
+
+    incoming = snapshot.get_incoming_relations('t2', min_confidence=0.0)
+    assert incoming == [{
+        'source_term_id': 't1',
+        'source_term': '4매치',
+        'source_category': 'mechanic',
+        'predicate': 'triggers',
+        'confidence': 0.9
+    }]
+    assert snapshot.degree('t2') == 3
+    assert snapshot.get_outgoing_relations('unknown', 0.0) == []
+
+
+def test_traversal_uses_snapshot():
+    """BFS and shortest path run against the snapshot"""
+    traversal = GraphTraversal(supabase_client=None, snapshot=_make_snapshot())
+    ids = {t['term']: t['id'] for t in TERMS}
+    traversal._get_term_id = ids.get
+
+    paths = traversal.bfs_traversal('4매치', target_category='resource', max_depth=3)
+    assert len(paths) == 1
+    assert paths[0].nodes == ['4매치', '더블폭탄', '체리']
+    assert abs(paths[0].total_confidence - 0.72) < 1e-9
+
+    path = traversal.find_shortest_path('4매치', '바위', max_depth=3)
+    assert path is not None and path.edges == ['triggers', 'clears']
+
+    impact = traversal.dfs_traversal('4매치', max_depth=3, min_confidence=0.5)
+    assert impact[1] == ['더블폭탄']
+    assert sorted(impact[2]) == ['바위', '체리']
+
+
+def test_snapshot_refreshes_only_on_change():
+    """refresh_if_changed reloads after new relations and is a no-op otherwise"""
+    terms = [dict(t, created_at=f'2026-01-0{i + 1}') for i, t in enumerate(TERMS)]
+    relations = [
+        dict(r, id=f'r{i}', created_at='2026-02-01', last_verified_at='2026-02-01')
+        for i, r in enumerate(RELATIONS[:2])
+    ]
+    client = FakeSupabaseClient({
+        'playbook_semantic_terms': terms,
+        'playbook_semantic_relations': relations,
+    })
+    snapshot = GraphSnapshot(client, refresh_interval=0).load()
+    assert snapshot.edge_count == 2
+
+    assert snapshot.refresh_if_changed() is False
+
+    # Phase 2 writes a new relation while the API is running
+    relations.append(dict(RELATIONS[2], id='r2', created_at='2026-02-02', last_verified_at='2026-02-02'))
+    assert snapshot.refresh_if_changed() is True
+    assert snapshot.edge_count == 3
+    assert [r['target_term'] for r in snapshot.get_outgoing_relations('t2', 0.7)] == ['체리']
+    assert snapshot.refresh_if_changed() is False
+
+
+def test_snapshot_reloads_reinforced_relations():
+    """Confidence updates in place (no new row, same created_at) trigger a reload"""
+    terms = [dict(t, created_at=f'2026-01-0{i + 1}') for i, t in enumerate(TERMS)]
+    relations = [
+        dict(r, id=f'r{i}', created_at='2026-02-01', last_verified_at='2026-02-01')
+        for i, r in enumerate(RELATIONS)
+    ]
+    client = FakeSupabaseClient({
+        'playbook_semantic_terms': terms,
+        'playbook_semantic_relations': relations,
+    })
+    snapshot = GraphSnapshot(client, refresh_interval=0).load()
+    assert [r['target_term'] for r in snapshot.get_outgoing_relations('t2', 0.7)] == ['체리']
+
+    # Phase 2 reinforcement: confidence and last_verified_at change, nothing else
+    client.table('playbook_semantic_relations')\
+        .update({'confidence': 0.5, 'last_verified_at': '2026-03-01'})\
+        .eq('id', 'r2')\
+        .execute()
+    assert snapshot.refresh_if_changed() is True
+    assert snapshot.get_outgoing_relations('t2', 0.7) == []
+    assert snapshot.refresh_if_changed() is False
+
+    # Writes that move neither column are picked up once max_age has passed
+    relations[2]['confidence'] = 0.9
+    assert snapshot.refresh_if_changed() is False
+    snapshot.max_age = 0
+    assert snapshot.refresh_if_changed() is True
+    assert [r['target_term'] for r in snapshot.get_outgoing_relations('t2', 0.7)] == ['체리']
+
+
+def main():
+    """Run all tests"""
+    tests = [
+        ("Snapshot CSR layout", test_snapshot_csr_layout),
+        ("Traversal with snapshot", test_traversal_uses_snapshot),
+        ("Refresh only on change", test_snapshot_refreshes_only_on_change),
+        ("Reload reinforced relations", test_snapshot_reloads_reinforced_relations),
+    ]
+
+    passed = 0
+    for test_name, test_func in tests:
+        try:
+            test_func()
+            logger.info(f"  ✅ PASS: {test_name}")
+            passed += 1
+        except AssertionError as e:
+            logger.error(f"  ❌ FAIL: {test_name}: {e}")
+
+    logger.info(f"Result: {passed}/{len(tests)} tests passed")
+    sys.exit(0 if passed == len(tests) else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Unit tests for incremental Confluence sync by page version (no external services)
+"""
+import sys
+import logging
+from pathlib import Path
+from types import SimpleNamespace
+
+import httpx
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.main import Pipeline
+from src.core.processors.ontology_builder import OntologyBuilder
+from src.core.loaders.supabase_loader import SupabaseLoader
+from src.core.processors.confluence_processor import ConfluenceProcessor
+from src.core.processors.confluence_client import AsyncConfluenceClient, EventLoopThread
+from tests.unit.fake_supabase import FakeSupabaseClient
+
+# Set up logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+REMOTE_VERSIONS = {'1': 3, '2': 5, '3': 1, '4': 2, '5': 7}
+
+
+class FakeSearch:
+    """CQL search endpoint over REMOTE_VERSIONS, paginated by limit/start"""
+
+    def __init__(self, page_limit=2):
+        self.page_limit = page_limit
+        self.requests = []
+
+    def __call__(self, request):
+        params = dict(request.url.params)
+        self.requests.append(params)
+        ids = params['cql'].split('(')[1].split(')')[0].split(',')
+        found = [pid for pid in ids if pid in REMOTE_VERSIONS]
+        start = int(params['start'])
+        page = found[start:start + self.page_limit]
+        links = {'next': '/next'} if start + self.page_limit < len(found) else {}
+        return httpx.Response(200, json={
+            'results': [
+                {'id': pid, 'version': {'number': REMOTE_VERSIONS[pid], 'when': '2026-10-01T00:00:00Z'}}
+                for pid in page
+            ],
+            '_links': links,
+        })
+
+
+def _make_confluence(search):
+    confluence = ConfluenceProcessor.__new__(ConfluenceProcessor)
+    confluence.base_url = "https://example.atlassian.net/wiki"
+    confluence.max_retries = 1
+    confluence.rate_limit_delay = 0
+    confluence.rate_limiter = None
+    confluence.page_cache = None
+    confluence.offline = False
+    confluence.text_extractor = "soup"
+    confluence.known_versions = {}
+    confluence.client = AsyncConfluenceClient(
+        confluence.base_url, "user@example.com", "token",
+        max_retries=1, transport=httpx.MockTransport(search)
+    )
+    confluence._io = EventLoopThread()
+    return confluence
+
+
+def _make_loader(tables):
+    loader = SupabaseLoader.__new__(SupabaseLoader)
+    loader.client = FakeSupabaseClient(tables)
+    loader.table_documents = 'playbook_documents'
+    loader.table_chunks = 'playbook_chunks'
+    return loader
+
+
+def test_list_page_versions_pages_through_cql_results():
+    """Versions come from CQL search pages; missing pages are absent"""
+    search = FakeSearch(page_limit=2)
+    confluence = _make_confluence(search)
+
+    versions = confluence.list_page_versions(['1', '2', '3', '9', '4', '5'], batch_size=4)
+
+    assert {pid: v['version'] for pid, v in versions.items()} == {
+        '1': 3, '2': 5, '3': 1, '4': 2, '5': 7
+    }
+    assert all(r['expand'] == 'version' for r in search.requests)
+    assert search.requests[0]['cql'] == "id in (1,2,3,9)"
+
+    confluence.list_page_versions(['1'], modified_since="2026-10-01")
+    assert search.requests[-1]['cql'] == 'id in (1) and lastmodified >= "2026-10-01"'
+
+
+def test_select_changed_pages():
+    """New, newer-version and untracked-version pages are selected; unchanged and deleted are not"""
+    pipeline = Pipeline.__new__(Pipeline)
+    pipeline.confluence = _make_confluence(FakeSearch(page_limit=10))
+    pipeline.supabase = _make_loader({'playbook_documents': [
+        {'id': '1', 'version': 3},     # unchanged
+        {'id': '2', 'version': 4},     # edited since
+        {'id': '3', 'version': None},  # loaded before version tracking
+        {'id': '6', 'version': 1},     # not requested
+    ]})
+
+    changed = pipeline.select_changed_pages(['1', '2', '3', '4', '9'])
+
+    # '4' is new, '9' no longer exists in Confluence
+    assert changed == ['2', '3', '4']
+
+
+def test_delete_chunks_only_touches_document():
+    """delete_chunks removes one document's chunks"""
+    loader = _make_loader({'playbook_chunks': [
+        {'id': 'c1', 'doc_id': '1', 'chunk_index': 0},
+        {'id': 'c2', 'doc_id': '1', 'chunk_index': 1},
+        {'id': 'c3', 'doc_id': '2', 'chunk_index': 0},
+    ]})
+
+    assert loader.delete_chunks('1')
+    assert [row['id'] for row in loader.client.tables['playbook_chunks']] == ['c3']
+
+
+def test_incremental_phase2_links_to_unchanged_pages():
+    """A changed page's relation can target a term defined only in an unchanged page"""
+    terms = [
+        # Unchanged page: defines 더블폭탄 (global candidate) and has a relation of its own
+        {'id': 't1', 'doc_id': 'old', 'term': '더블폭탄', 'category': 'gameobject',
+         'definition': '', 'frequency': 3, 'confidence': 0.9, 'raw_relations': []},
+        {'id': 't2', 'doc_id': 'old', 'term': '4매치', 'category': 'mechanic',
+         'definition': '', 'frequency': 1, 'confidence': 0.7,
+         'raw_relations': [{'target': '더블폭탄', 'type': 'triggers', 'confidence': 0.9}]},
+        # Changed page: mentions 더블폭탄 only as a relation target
+        {'id': 't3', 'doc_id': 'new', 'term': '5매치', 'category': 'mechanic',
+         'definition': '', 'frequency': 1, 'confidence': 0.7,
+         'raw_relations': [{'target': '더블폭탄', 'type': 'triggers', 'confidence': 0.9}]},
+        {'id': 't4', 'doc_id': 'new', 'term': '보드', 'category': 'gameobject',
+         'definition': '', 'frequency': 1, 'confidence': 0.7, 'raw_relations': []},
+    ]
+    client = FakeSupabaseClient({
+        'playbook_semantic_terms': terms,
+        'playbook_ontology_rules': [{'id': 'r1', 'subject_type': 'mechanic', 'predicate': 'triggers',
+                                     'object_type': 'gameobject', 'description': ''}],
+        'playbook_documents': [],
+        'playbook_semantic_relations': [],
+    })
+
+    builder = OntologyBuilder(SimpleNamespace(client=client))
+
+    stats = builder.build_graph(doc_ids=['new'], workers=1)
+
+    # Only the changed page is processed, but its edge reaches the unchanged page's term
+    assert stats['total_documents'] == 1
+    assert set(builder.terms_by_doc) == {'new'}
+    relations = client.tables['playbook_semantic_relations']
+    assert [(r['source_term_id'], r['target_term_id']) for r in relations] == [('t3', 't1')]
+
+
+def main():
+    """Run all tests"""
+    tests = [
+        test_list_page_versions_pages_through_cql_results,
+        test_select_changed_pages,
+        test_delete_chunks_only_touches_document,
+        test_incremental_phase2_links_to_unchanged_pages,
+    ]
+
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            logger.info(f"✅ PASS: {test.__name__}")
+        except AssertionError as e:
+            failed += 1
+            logger.error(f"❌ FAIL: {test.__name__}: {e}")
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
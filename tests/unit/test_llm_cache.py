@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the LLM response cache and cached term extraction (no OpenAI required)
+"""
+import sys
+import json
+import time
+import logging
+import tempfile
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.core.cache import LLMResponseCache
+from src.core.processors.semantic_processor import SemanticProcessor
+
+# Set up logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+RESPONSE = json.dumps({"nodes": [
+    {"term": "클로버", "category": "GameObject", "definition": "장애물",
+     "relations": [{"target": "폭탄", "type": "clears", "confidence": 0.9}]},
+]}, ensure_ascii=False)
+
+
+class FakeCompletions:
+    """chat.completions.create stand-in that counts calls"""
+
+    def __init__(self, content):
+        self.content = content
+        self.calls = 0
+
+    def create(self, **kwargs):
+        self.calls += 1
+        message = SimpleNamespace(content=self.content)
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+
+def _make_processor(cache, content=RESPONSE, bypass=False):
+    processor = SemanticProcessor.__new__(SemanticProcessor)
+    processor.rate_limiter = None
+    processor.llm_cache = cache
+    processor.llm_cache_bypass = bypass
+    processor.client = SimpleNamespace(chat=SimpleNamespace(completions=FakeCompletions(content)))
+    return processor
+
+
+def test_key_covers_model_prompts_and_params():
+    """Any change to model, prompts or parameters gives a different key"""
+    base = LLMResponseCache.make_key("sys", "user", model="m", temperature=0.1)
+    assert base == LLMResponseCache.make_key("sys", "user", temperature=0.1, model="m")
+    assert base != LLMResponseCache.make_key("sys2", "user", model="m", temperature=0.1)
+    assert base != LLMResponseCache.make_key("sys", "user2", model="m", temperature=0.1)
+    assert base != LLMResponseCache.make_key("sys", "user", model="m2", temperature=0.1)
+    assert base != LLMResponseCache.make_key("sys", "user", model="m", temperature=0.2)
+
+
+def test_lru_eviction_by_size():
+    """Over max_bytes, least recently used entries go first"""
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = LLMResponseCache(str(Path(tmp) / "llm.sqlite"), max_bytes=300)
+
+        for name in ("a", "b", "c"):
+            cache.put(name, "m", name * 100)
+            time.sleep(0.01)
+        assert cache.get("a") == "a" * 100  # a is now most recently used
+
+        cache.put("d", "m", "d" * 100)
+
+        assert cache.total_size <= 270
+        assert cache.get("b") is None
+        assert cache.get("a") is not None and cache.get("d") is not None
+        assert cache.get_stats()['evictions'] >= 1
+        size = cache.total_size
+        cache.close()
+
+        # Size survives a reopen
+        reopened = LLMResponseCache(str(Path(tmp) / "llm.sqlite"), max_bytes=300)
+        assert reopened.total_size == size
+        reopened.close()
+
+
+def test_request_terms_uses_cache_and_bypass():
+    """Second extraction is served from cache; bypass calls the API again and refreshes"""
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = LLMResponseCache(str(Path(tmp) / "llm.sqlite"))
+        processor = _make_processor(cache)
+        api = processor.client.chat.completions
+
+        first = processor._request_terms("system", "document")
+        second = processor._request_terms("system", "document")
+        assert api.calls == 1
+        assert first == second and first[0]['term'] == "클로버"
+
+        processor.llm_cache_bypass = True
+        api.content = "```json\n[]\n```"
+        assert processor._request_terms("system", "document") == []
+        assert api.calls == 2
+
+        # The bypassed result replaced the old entry
+        processor.llm_cache_bypass = False
+        assert processor._request_terms("system", "document") == []
+        assert api.calls == 2
+        cache.close()
+
+
+def test_unparseable_response_not_cached():
+    """A response that fails to parse is not stored"""
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = LLMResponseCache(str(Path(tmp) / "llm.sqlite"))
+        processor = _make_processor(cache, content="not json")
+
+        for _ in range(2):
+            try:
+                processor._request_terms("system", "document")
+                assert False, "expected a JSON error"
+            except json.JSONDecodeError:
+                pass
+
+        assert processor.client.chat.completions.calls == 2
+        assert len(cache) == 0
+        cache.close()
+
+
+def main():
+    """Run all tests"""
+    tests = [
+        test_key_covers_model_prompts_and_params,
+        test_lru_eviction_by_size,
+        test_request_terms_uses_cache_and_bypass,
+        test_unparseable_response_not_cached,
+    ]
+
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            logger.info(f"✅ PASS: {test.__name__}")
+        except AssertionError as e:
+            failed += 1
+            logger.error(f"❌ FAIL: {test.__name__}: {e}")
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""
+Unit tests for map-reduce semantic term extraction (no OpenAI required)
+"""
+import sys
+import json
+import logging
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.core.processors.semantic_processor import SemanticProcessor, merge_extracted_terms
+from src.main import Pipeline
+from src.shared.rate_limit import ServiceLimiter
+
+# Set up logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+def _term(term, confidence=0.8, definition='', relations=None):
+    return {
+        'term': term,
+        'category': 'GameObject',
+        'definition': definition,
+        'confidence': confidence,
+        'relations': relations if relations is not None else [
+            {'target': '폭탄', 'type': 'clears', 'confidence': 0.9}
+        ],
+    }
+
+
+class WindowCompletions:
+    """Returns the terms whose marker word appears in the window"""
+
+    def __init__(self, fail_marker=None):
+        self.prompts = []
+        self.fail_marker = fail_marker
+        self._lock = threading.Lock()
+
+    def create(self, messages, **kwargs):
+        user_prompt = messages[1]['content']
+        with self._lock:
+            self.prompts.append(user_prompt)
+        if self.fail_marker and self.fail_marker in user_prompt:
+            raise RuntimeError("LLM unavailable")
+
+        nodes = []
+        if '클로버' in user_prompt:
+            nodes.append(_term('클로버', 0.7, definition='첫 정의'))
+        if '체리' in user_prompt:
+            nodes.append(_term('체리', 0.8))
+        if '마지막' in user_prompt:
+            nodes.append(_term('클로버', 0.95, definition='다른 정의', relations=[
+                {'target': '폭탄', 'type': 'clears', 'confidence': 0.99},
+                {'term': '보드', 'type': 'located_in', 'confidence': 0.8},
+            ]))
+        message = SimpleNamespace(content=json.dumps({'nodes': nodes}, ensure_ascii=False))
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+
+def _make_processor(map_reduce=True, window_chars=100, fail_marker=None):
+    processor = SemanticProcessor.__new__(SemanticProcessor)
+    processor.rate_limiter = None
+    processor.llm_cache = None
+    processor.llm_cache_bypass = False
+    processor.extraction_map_reduce = map_reduce
+    processor.extraction_window_chars = window_chars
+    processor.extraction_workers = 3
+    processor.client = SimpleNamespace(chat=SimpleNamespace(completions=WindowCompletions(fail_marker)))
+    return processor
+
+
+CHUNKS = [
+    {'content': '클로버는 보드 위의 장애물이다. ' + '가' * 50},
+    {'content': '나' * 50 + ' 체리를 모으면 점수가 오른다.'},
+    {'content': '설명 ' + '다' * 80},
+    {'content': '마지막 장: 클로버는 폭탄으로 제거한다.'},
+]
+PAGE = {'page_id': 'p1', 'title': '장애물 문서'}
+
+
+def test_merge_dedupes_terms_and_relations():
+    """Same term from several windows becomes one entry with max confidence and unioned relations"""
+    merged = merge_extracted_terms([
+        [_term('클로버', 0.7, definition='첫 정의'), _term('체리', 0.8)],
+        [_term(' 클로버 ', 0.95, definition='다른 정의', relations=[
+            {'target': '폭탄', 'type': 'clears', 'confidence': 0.99},
+            {'term': '보드', 'type': 'located_in', 'confidence': 0.8},
+        ])],
+    ])
+
+    assert [t['term'] for t in merged] == ['클로버', '체리']
+    clover = merged[0]
+    assert clover['confidence'] == 0.95
+    assert clover['definition'] == '첫 정의'
+    relations = {(r.get('target') or r.get('term'), r['type']): r['confidence'] for r in clover['relations']}
+    assert relations == {('폭탄', 'clears'): 0.99, ('보드', 'located_in'): 0.8}
+
+
+def test_windows_cover_all_chunks():
+    """Windows respect the size limit, keep chunk order and lose no chunk"""
+    processor = _make_processor(window_chars=100)
+    texts = [chunk['content'] for chunk in CHUNKS]
+    windows = processor._split_windows(texts)
+
+    assert len(windows) > 1
+    assert all(len(window) <= 100 for window in windows)
+    assert "\n\n".join(windows) == "\n\n".join(texts)
+
+    # Short documents give exactly the single-prompt content
+    short = ['a' * 10, 'b' * 10]
+    assert _make_processor(window_chars=8000)._split_windows(short) == ["\n\n".join(short)]
+
+
+def test_map_reduce_covers_late_content():
+    """Terms only mentioned past the first window are found in map-reduce mode"""
+    single = _make_processor(map_reduce=False, window_chars=100)
+    single_terms = {t['term'] for t in single.extract_semantic_terms(CHUNKS, PAGE)}
+    assert len(single.client.chat.completions.prompts) == 1
+    assert '체리' not in single_terms
+
+    processor = _make_processor(map_reduce=True, window_chars=100)
+    terms = {t['term']: t for t in processor.extract_semantic_terms(CHUNKS, PAGE)}
+
+    assert len(processor.client.chat.completions.prompts) == len(processor._split_windows(
+        [chunk['content'] for chunk in CHUNKS]
+    ))
+    assert set(terms) == {'클로버', '체리'}
+    assert terms['클로버']['confidence'] == 0.95
+    # Evidence spans chunks from different windows
+    evidence_chunks = {e['chunk_id'].split('_')[1] for e in terms['클로버']['evidence']}
+    assert evidence_chunks == {'0', '3'}
+
+
+def test_failed_window_is_skipped():
+    """One failing window does not drop the terms of the others"""
+    processor = _make_processor(map_reduce=True, window_chars=100, fail_marker='마지막')
+    terms = {t['term']: t for t in processor.extract_semantic_terms(CHUNKS, PAGE)}
+
+    assert set(terms) == {'클로버', '체리'}
+    assert terms['클로버']['confidence'] == 0.7
+
+
+class InFlightCompletions(WindowCompletions):
+    """WindowCompletions that records the peak number of concurrent requests"""
+
+    def __init__(self):
+        super().__init__()
+        self.active = 0
+        self.peak = 0
+
+    def create(self, messages, **kwargs):
+        with self._lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        try:
+            time.sleep(0.02)
+            return super().create(messages, **kwargs)
+        finally:
+            with self._lock:
+                self.active -= 1
+
+
+def test_windows_respect_openai_concurrency():
+    """Map-reduce windows of concurrent pages never exceed the shared OpenAI cap"""
+    limiter = ServiceLimiter('openai', max_concurrency=2)
+    processor = _make_processor(map_reduce=True, window_chars=100)
+    processor.rate_limiter = limiter
+    completions = InFlightCompletions()
+    processor.client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+
+    pipeline = Pipeline.__new__(Pipeline)
+    pipeline.limiters = {'openai': limiter}
+    pipeline.semantic = processor
+
+    works = [
+        {'page_id': f'p{i}', 'page_data': dict(PAGE, page_id=f'p{i}'), 'chunks': CHUNKS, 'timings': {}}
+        for i in range(4)
+    ]
+    threads = [threading.Thread(target=pipeline._extract_step, args=(work,)) for work in works]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    windows = len(processor._split_windows([chunk['content'] for chunk in CHUNKS]))
+    assert len(completions.prompts) == 4 * windows
+    assert completions.peak == 2
+    assert all({t['term'] for t in work['semantic_terms']} == {'클로버', '체리'} for work in works)
+
+
+def main():
+    """Run all tests"""
+    tests = [
+        test_merge_dedupes_terms_and_relations,
+        test_windows_cover_all_chunks,
+        test_map_reduce_covers_late_content,
+        test_failed_window_is_skipped,
+        test_windows_respect_openai_concurrency,
+    ]
+
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            logger.info(f"✅ PASS: {test.__name__}")
+        except AssertionError as e:
+            failed += 1
+            logger.error(f"❌ FAIL: {test.__name__}: {e}")
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Unit tests for compiled ontology rule lookup
+"""
+import sys
+import logging
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.core.rules import CompiledOntology
+from src.core.processors.ontology_builder import OntologyBuilder
+
+# Set up logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+RULES = [
+    {'subject_type': 'Mechanic', 'predicate': 'triggers', 'object_type': 'GameObject', 'description': 'a'},
+    {'subject_type': 'Content', 'predicate': 'consumes', 'object_type': 'Currency_Soft', 'description': 'b'},
+    {'subject_type': 'LiveOps', 'predicate': 'converts_to', 'object_type': 'Metric', 'description': 'c'},
+    {'subject_type': 'Marketing', 'predicate': 'diversifies', 'object_type': 'Content', 'description': 'd'},
+    {'subject_type': '*', 'predicate': 'impacts', 'object_type': 'Metric', 'description': 'e'},
+    {'subject_type': 'Obstacle', 'predicate': 'impacts', 'object_type': 'any', 'description': 'f'},
+    {'subject_type': 'Obstacle', 'predicate': 'impacts', 'object_type': 'Metric', 'description': 'g'},
+]
+
+
+def _legacy_validate(rules, source_cat, predicate, target_cat, confidence):
+    """validate_relationship before compilation (tuple-keyed dict)"""
+    keys = {(r['subject_type'].lower(), r['predicate'].lower(), r['object_type'].lower()) for r in rules}
+    predicates = {r['predicate'].lower() for r in rules}
+    source_cat, target_cat, pred = source_cat.lower(), target_cat.lower(), predicate.lower()
+    if pred not in predicates:
+        return False, f"Invalid predicate '{predicate}'"
+    if (source_cat, pred, target_cat) not in keys:
+        return False, f"No rule for {source_cat} -{pred}-> {target_cat}"
+    if confidence < 0.5:
+        return False, f"Confidence {confidence:.2f} below minimum threshold 0.5"
+    return True, "Valid"
+
+
+def test_same_results_as_rule_dict():
+    """Without wildcards, every accept/reject and message matches the former rule dict"""
+    plain = [r for r in RULES if r['subject_type'] != '*' and r['object_type'] != 'any']
+    ontology = CompiledOntology(plain)
+
+    categories = ['mechanic', 'GameObject', 'content', 'currency_soft', 'liveops', 'metric',
+                  'marketing', 'obstacle', 'ux_factor']
+    predicates = ['triggers', 'TRIGGERS', 'trigger', 'consumes', 'consume', 'converts_to',
+                  'converts to', 'convert_to', 'converts-to', 'diversifies', 'diversify',
+                  'impacts', 'impact', 'unknown']
+    for source_cat in categories:
+        for predicate in predicates:
+            for target_cat in categories:
+                for confidence in (0.4, 0.5, 0.9):
+                    case = (source_cat, predicate, target_cat, confidence)
+                    assert ontology.validate(*case) == _legacy_validate(plain, *case), case
+                    # Stored predicate is unchanged as well
+                    assert ontology.canonical_predicate(predicate) == predicate.lower()
+
+
+def test_duplicate_rule_last_wins():
+    """A repeated (subject, predicate, object) key keeps the last rule, like the rule dict"""
+    ontology = CompiledOntology(RULES + [
+        {'subject_type': 'mechanic', 'predicate': 'TRIGGERS', 'object_type': 'gameobject', 'description': 'z'},
+    ])
+    assert ontology.find_rule('mechanic', 'triggers', 'gameobject')['description'] == 'z'
+
+
+def test_wildcards_and_precedence():
+    """'*' and 'any' match every category; exact categories win"""
+    ontology = CompiledOntology(RULES)
+
+    assert ontology.find_rule('ux_factor', 'impacts', 'metric')['description'] == 'e'
+    assert ontology.find_rule('obstacle', 'impacts', 'gameobject')['description'] == 'f'
+    assert ontology.find_rule('obstacle', 'impacts', 'metric')['description'] == 'g'
+    assert ontology.find_rule('ux_factor', 'impacts', 'content') is None
+
+
+def test_predicate_aliases():
+    """Aliases are opt-in: explicit aliases, and derived forms with derive_aliases"""
+    exact = CompiledOntology(RULES, aliases={'leads_to': 'converts_to'})
+    assert exact.canonical_predicate('leads_to') == 'converts_to'
+    assert exact.canonical_predicate('trigger') == 'trigger'
+    assert exact.validate('mechanic', 'trigger', 'gameobject', 0.9) == (False, "Invalid predicate 'trigger'")
+
+    ontology = CompiledOntology(RULES, aliases={'leads_to': 'converts_to'}, derive_aliases=True)
+    assert ontology.canonical_predicate('trigger') == 'triggers'
+    assert ontology.canonical_predicate('Convert to') == 'converts_to'
+    assert ontology.canonical_predicate('diversify') == 'diversifies'
+    assert ontology.canonical_predicate('leads_to') == 'converts_to'
+    assert ontology.validate('mechanic', 'trigger', 'gameobject', 0.9) == (True, "Valid")
+    assert ontology.validate('mechanic', 'explodes', 'gameobject', 0.9) == (False, "Invalid predicate 'explodes'")
+
+
+def test_relevant_rules_first():
+    """Rules behind the given relations come first, then the rest in order"""
+    ontology = CompiledOntology(RULES)
+
+    rules = ontology.relevant_rules([('liveops', 'converts_to', 'metric'), ('x', 'impacts', 'metric')], limit=4)
+    assert [r['description'] for r in rules] == ['c', 'e', 'a', 'b']
+
+
+def test_builder_uses_compiled_rules():
+    """OntologyBuilder.validate_relationship goes through the compiled rules"""
+    builder = OntologyBuilder(SimpleNamespace(client=None))
+    builder.ontology = CompiledOntology(RULES)
+
+    source = {'term': '4매치', 'category': 'Mechanic'}
+    target = {'term': '폭탄', 'category': 'GameObject'}
+    assert builder.validate_relationship(source, 'triggers', target, 0.9) == (True, "Valid")
+    assert builder.validate_relationship(source, 'trigger', target, 0.9) == (
+        False, "Invalid predicate 'trigger'"
+    )
+    assert builder.validate_relationship(target, 'triggers', source, 0.9) == (
+        False, "No rule for gameobject -triggers-> mechanic"
+    )
+
+
+def main():
+    """Run all tests"""
+    tests = [
+        test_same_results_as_rule_dict,
+        test_duplicate_rule_last_wins,
+        test_wildcards_and_precedence,
+        test_predicate_aliases,
+        test_relevant_rules_first,
+        test_builder_uses_compiled_rules,
+    ]
+
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            logger.info(f"✅ PASS: {test.__name__}")
+        except AssertionError as e:
+            failed += 1
+            logger.error(f"❌ FAIL: {test.__name__}: {e}")
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
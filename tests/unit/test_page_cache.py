@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the raw Confluence page cache and offline mode (no network)
+"""
+import sys
+import time
+import logging
+import tempfile
+from pathlib import Path
+
+import httpx
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.core.cache import PageCache
+from src.core.processors.confluence_processor import ConfluenceProcessor
+from src.core.processors.confluence_client import AsyncConfluenceClient, EventLoopThread
+
+# Set up logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+BASE_URL = "https://example.atlassian.net/wiki"
+
+
+def _page_json(page_id, version=1, body="본문"):
+    return {
+        'id': page_id,
+        'title': f"Page {page_id}",
+        'space': {'key': 'DS', 'name': 'Design'},
+        'version': {'number': version, 'when': '2026-10-01T00:00:00Z'},
+        'body': {'storage': {'value': f"<h2>개요</h2><p>{body}</p>"}},
+        'ancestors': [],
+    }
+
+
+class PageServer:
+    """Serves every page at version 2 and counts requests"""
+
+    def __init__(self):
+        self.requested = []
+
+    def __call__(self, request):
+        page_id = request.url.path.rsplit('/', 1)[-1]
+        self.requested.append(page_id)
+        return httpx.Response(200, json=_page_json(page_id, version=2, body="최신"))
+
+
+def _make_confluence(cache, offline=False, server=None):
+    confluence = ConfluenceProcessor.__new__(ConfluenceProcessor)
+    confluence.base_url = BASE_URL
+    confluence.page_cache = cache
+    confluence.offline = offline
+    confluence.text_extractor = "lxml"
+    confluence.known_versions = {}
+    confluence.client = AsyncConfluenceClient(
+        BASE_URL, "user@example.com", "token", max_retries=1,
+        page_builder=confluence._cache_and_build,
+        transport=httpx.MockTransport(server or PageServer())
+    )
+    confluence._io = EventLoopThread()
+    return confluence
+
+
+def test_cache_roundtrip_and_versions():
+    """Pages are stored compressed per version; a newer version replaces the old one"""
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = PageCache(str(Path(tmp) / "pages.sqlite"))
+        page = _page_json('1', version=3, body="표 " * 2000)
+
+        cache.put('1', page)
+        assert cache.get('1', 3) == page
+        assert cache.get('1') == page
+        assert cache.get('1', 2) is None
+        assert cache.total_size < len(str(page)) / 5
+
+        cache.put('1', _page_json('1', version=4))
+        assert cache.versions() == {'1': 4}
+        assert len(cache) == 1
+        cache.close()
+
+
+def test_lru_eviction_by_size():
+    """Over max_bytes, least recently used pages go first"""
+    with tempfile.TemporaryDirectory() as tmp:
+        probe = PageCache(str(Path(tmp) / "probe.sqlite"))
+        probe.put('x', _page_json('x'))
+        entry_size = probe.total_size
+        probe.close()
+
+        cache = PageCache(str(Path(tmp) / "pages.sqlite"), max_bytes=entry_size * 3)
+        for page_id in ('a', 'b', 'c'):
+            cache.put(page_id, _page_json(page_id))
+            time.sleep(0.01)
+        assert cache.get('a') is not None  # a is now most recently used
+
+        cache.put('d', _page_json('d'))
+
+        assert cache.get('b') is None
+        assert cache.get('a') is not None and cache.get('d') is not None
+        assert cache.get_stats()['evictions'] >= 1
+        cache.close()
+
+
+def test_known_version_served_from_cache():
+    """A cached page at the current version is not downloaded; a stale one is"""
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = PageCache(str(Path(tmp) / "pages.sqlite"))
+        cache.put('1', _page_json('1', version=2))
+        cache.put('2', _page_json('2', version=1))
+
+        server = PageServer()
+        confluence = _make_confluence(cache, server=server)
+        confluence.known_versions = {'1': 2, '2': 2}
+
+        assert confluence.get_page('1')['version']['number'] == 2
+        assert server.requested == []
+
+        # Stale cached version: downloaded and the cache updated
+        assert confluence.process_page('2')['content'] == "## 개요\n최신"
+        assert server.requested == ['2']
+        assert cache.versions() == {'1': 2, '2': 2}
+
+        # Unknown version (not listed yet): always downloaded
+        confluence.get_page('1')
+        confluence.known_versions.clear()
+        confluence.get_page('1')
+        assert server.requested == ['2', '1']
+
+        # Concurrent fetches cache what they download
+        fetched = dict(confluence.fetch_pages(['3', '4']))
+        assert fetched['3']['title'] == "Page 3"
+        assert set(cache.versions()) == {'1', '2', '3', '4'}
+        confluence.close()
+
+
+def test_offline_mode_never_contacts_confluence():
+    """Offline, pages and versions come from the cache; uncached pages fail"""
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = PageCache(str(Path(tmp) / "pages.sqlite"))
+        cache.put('1', _page_json('1', version=5))
+
+        server = PageServer()
+        confluence = _make_confluence(cache, offline=True, server=server)
+
+        assert confluence.test_connection()
+        assert confluence.list_page_versions(['1', '9']) == {'1': {'version': 5, 'when': ''}}
+        assert confluence.process_page('1')['version'] == 5
+        assert confluence.process_page('9') is None
+        assert dict(confluence.fetch_pages(['1', '9']))['9'] is None
+        assert server.requested == []
+        confluence.close()
+
+
+def main():
+    """Run all tests"""
+    tests = [
+        test_cache_roundtrip_and_versions,
+        test_lru_eviction_by_size,
+        test_known_version_served_from_cache,
+        test_offline_mode_never_contacts_confluence,
+    ]
+
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            logger.info(f"✅ PASS: {test.__name__}")
+        except AssertionError as e:
+            failed += 1
+            logger.error(f"❌ FAIL: {test.__name__}: {e}")
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Unit tests for keyset-paginated table scans
+"""
+import sys
+import logging
+import threading
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.core.loaders import KeysetPaginator, iter_rows, fetch_all
+from tests.unit.fake_supabase import FakeSupabaseClient
+
+# Set up logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+def _terms(count):
+    return [
+        {'id': f"t{i:03d}", 'term': f"용어{i}", 'doc_id': str(i % 3), 'created_at': f"2025-01-01T00:00:{i // 4:02d}"}
+        for i in range(count)
+    ]
+
+
+def test_scan_reads_every_row_once():
+    """Keyset pages cover the table; a full last page costs one extra empty request"""
+    client = FakeSupabaseClient({'terms': _terms(7)})
+
+    rows = fetch_all(client, 'terms', 'id, term', page_size=3)
+    assert [r['id'] for r in rows] == [f"t{i:03d}" for i in range(7)]
+    assert len(client.calls) == 3
+
+    client.calls.clear()
+    assert len(fetch_all(client, 'terms', page_size=7, prefetch=False)) == 7
+    assert len(client.calls) == 2
+
+
+def test_page_size_is_clamped_to_max_rows():
+    """A page size above the server's max-rows would end the scan after one short page"""
+    client = FakeSupabaseClient({'terms': _terms(7)}, max_rows=3)
+
+    paginator = KeysetPaginator(client, 'terms', page_size=10, max_rows=3)
+    assert paginator.page_size == 3
+    assert [r['id'] for r in paginator] == [f"t{i:03d}" for i in range(7)]
+
+    try:
+        KeysetPaginator(client, 'terms', page_size=10, max_rows=0)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("max_rows=0 must be rejected")
+
+
+def test_key_columns_are_fetched_but_not_returned():
+    """Projection without the key still works; the key is stripped from rows"""
+    client = FakeSupabaseClient({'terms': _terms(5)})
+
+    rows = fetch_all(client, 'terms', 'term', page_size=2)
+    assert [set(r) for r in rows] == [{'term'}] * 5
+    assert [r['term'] for r in rows] == [f"용어{i}" for i in range(5)]
+
+
+def test_composite_order_with_ties():
+    """(created_at, id) keyset keeps creation order across pages with equal timestamps"""
+    terms = _terms(10)
+    terms.reverse()
+    client = FakeSupabaseClient({'terms': terms})
+
+    rows = fetch_all(client, 'terms', 'id, created_at', order_by=('created_at', 'id'), page_size=3)
+    assert [r['id'] for r in rows] == [f"t{i:03d}" for i in range(10)]
+
+
+def test_null_leading_key_is_scanned_nulls_last():
+    """Rows with a NULL created_at are neither skipped nor end the scan early"""
+    terms = _terms(10)
+    for i in (1, 4, 5, 8):
+        terms[i]['created_at'] = None
+    client = FakeSupabaseClient({'terms': terms})
+
+    # Pages end on a non-NULL row, on a NULL row, and inside the NULL run
+    for page_size in (2, 3, 4):
+        rows = fetch_all(client, 'terms', 'id', order_by=('created_at', 'id'), page_size=page_size)
+        assert [r['id'] for r in rows] == ['t000', 't002', 't003', 't006', 't007', 't009',
+                                           't001', 't004', 't005', 't008'], page_size
+
+    terms[3]['id'] = None
+    try:
+        fetch_all(client, 'terms', 'id', order_by=('created_at', 'id'), page_size=3)
+    except ValueError:
+        pass
+    else:
+        assert False, "NULL in the unique key column must be rejected"
+
+
+def test_filters_apply_to_every_page():
+    """Extra filters are combined with the keyset condition"""
+    client = FakeSupabaseClient({'terms': _terms(12)})
+
+    rows = list(iter_rows(client, 'terms', 'id', page_size=2, filters=lambda q: q.eq('doc_id', '1')))
+    assert [r['id'] for r in rows] == ['t001', 't004', 't007', 't010']
+
+
+def test_next_page_is_prefetched():
+    """The next request is issued while the caller still holds the current page"""
+    client = FakeSupabaseClient({'terms': _terms(6)})
+    second_request = threading.Event()
+    table = client.table
+
+    def tracking_table(name):
+        if len(client.calls) == 1:
+            second_request.set()
+        return table(name)
+
+    client.table = tracking_table
+    pages = KeysetPaginator(client, 'terms', 'id', page_size=2).pages()
+
+    first = next(pages)
+    assert [r['id'] for r in first] == ['t000', 't001']
+    assert second_request.wait(timeout=2)
+    assert [len(page) for page in pages] == [2, 2]
+
+
+def main():
+    """Run all tests"""
+    tests = [
+        test_scan_reads_every_row_once,
+        test_page_size_is_clamped_to_max_rows,
+        test_key_columns_are_fetched_but_not_returned,
+        test_composite_order_with_ties,
+        test_null_leading_key_is_scanned_nulls_last,
+        test_filters_apply_to_every_page,
+        test_next_page_is_prefetched,
+    ]
+
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            logger.info(f"✅ PASS: {test.__name__}")
+        except AssertionError as e:
+            failed += 1
+            logger.error(f"❌ FAIL: {test.__name__}: {e}")
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Unit tests for bulk relation loading in OntologyBuilder (no database required)
+"""
+import sys
+import copy
+import logging
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.core.processors.ontology_builder import OntologyBuilder
+from tests.unit.fake_supabase import FakeSupabaseClient
+
+# Set up logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+STORED = [
+    {'id': 'r1', 'source_term_id': 'a', 'target_term_id': 'b', 'predicate': 'triggers',
+     'confidence': 0.5, 'evidence': '["e0"]', 'evidence_chunk_id': None,
+     'occurrence_count': 2, 'last_verified_at': '2025-01-01'},
+]
+
+BATCH = [
+    {'source_term_id': 'a', 'target_term_id': 'b', 'predicate': 'triggers',
+     'confidence': 0.9, 'evidence_chunk_id': None, 'evidence': 'e1'},
+    {'source_term_id': 'a', 'target_term_id': 'c', 'predicate': 'clears',
+     'confidence': 0.8, 'evidence_chunk_id': None, 'evidence': 'e2'},
+    {'source_term_id': 'a', 'target_term_id': 'b', 'predicate': 'triggers',
+     'confidence': 0.7, 'evidence_chunk_id': None, 'evidence': 'e3'},
+    {'source_term_id': 'a', 'target_term_id': 'c', 'predicate': 'clears',
+     'confidence': 0.6, 'evidence_chunk_id': None, 'evidence': 'e2'},
+]
+
+
+def _make_builder():
+    """OntologyBuilder wired to an in-memory relations table"""
+    client = FakeSupabaseClient({
+        'playbook_semantic_relations': copy.deepcopy(STORED),
+        'playbook_documents': [],
+    })
+    builder = OntologyBuilder(SimpleNamespace(client=client))
+    return builder, client
+
+
+def _add_documents(builder):
+    """Documents whose raw_relations repeat keys within and across documents"""
+    builder.ontology_rules = {('mechanic', 'triggers', 'gameobject'): {}}
+    builder.valid_predicates = {'triggers'}
+
+    shared_target = {'id': 'g', 'doc_id': 'd0', 'term': '더블폭탄', 'category': 'gameobject'}
+    for d in range(6):
+        doc_id = f'd{d}'
+        source = {
+            'id': f's{d % 2}', 'doc_id': doc_id, 'term': f'{d % 2}매치', 'category': 'mechanic',
+            'raw_relations': [
+                {'target': '더블폭탄', 'type': 'triggers', 'confidence': 0.6 + 0.05 * d, 'desc': f'ev{d}'},
+                {'target': '더블폭탄', 'type': 'triggers', 'confidence': 0.9, 'desc': f'ev{d}b'},
+            ]
+        }
+        target = dict(shared_target, doc_id=doc_id)
+        for term in (source, target):
+            builder.terms_by_doc[doc_id].append(term)
+            builder.terms_by_name[f"{doc_id}:{term['term'].lower()}"] = term
+
+
+def _snapshot(client):
+    rows = client.tables['playbook_semantic_relations']
+    return sorted(
+        (r['source_term_id'], r['target_term_id'], r['predicate'],
+         round(r['confidence'], 12), r['evidence'], r['occurrence_count'])
+        for r in rows
+    )
+
+
+def test_bulk_matches_sequential():
+    """Bulk mode yields the same confidence, evidence and occurrence_count"""
+    sequential, sequential_client = _make_builder()
+    bulk, bulk_client = _make_builder()
+
+    assert sequential.load_relations(copy.deepcopy(BATCH), bulk=False) == len(BATCH)
+    assert bulk.load_relations(copy.deepcopy(BATCH), bulk=True) == len(BATCH)
+
+    assert _snapshot(bulk_client) == _snapshot(sequential_client)
+    assert len(bulk_client.tables['playbook_semantic_relations']) == 2
+
+
+def test_bulk_round_trips():
+    """One prefetch plus one upsert per row group, independent of batch size"""
+    bulk, client = _make_builder()
+    client.calls.clear()
+
+    bulk.load_relations(copy.deepcopy(BATCH) * 20, bulk=True)
+    assert len(client.calls) == 3
+
+
+def test_concurrent_build_matches_serial():
+    """Key-sharded parallel loading gives the same rows as the serial run"""
+    serial, serial_client = _make_builder()
+    parallel, parallel_client = _make_builder()
+    for builder in (serial, parallel):
+        _add_documents(builder)
+        builder.load_ontology_rules = lambda: 1
+        builder.load_semantic_terms = lambda doc_ids=None: 12
+
+    serial_stats = serial.build_graph(workers=1)
+    parallel_stats = parallel.build_graph(workers=3)
+
+    assert _snapshot(parallel_client) == _snapshot(serial_client)
+    assert parallel_stats['total_relationships'] == serial_stats['total_relationships'] == 12
+    assert parallel_stats['processed_documents'] == 6
+    assert sum(w['documents'] for w in parallel_stats['workers'].values()) == 6
+
+
+def main():
+    """Run all tests"""
+    tests = [
+        ("Bulk matches sequential", test_bulk_matches_sequential),
+        ("Bulk round trips", test_bulk_round_trips),
+        ("Concurrent build matches serial", test_concurrent_build_matches_serial),
+    ]
+
+    passed = 0
+    for test_name, test_func in tests:
+        try:
+            test_func()
+            logger.info(f"  ✅ PASS: {test_name}")
+            passed += 1
+        except AssertionError as e:
+            logger.error(f"  ❌ FAIL: {test_name}: {e}")
+
+    logger.info(f"Result: {passed}/{len(tests)} tests passed")
+    sys.exit(0 if passed == len(tests) else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Unit tests for count-only Supabase statistics
+"""
+import sys
+import logging
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.core.loaders.supabase_loader import SupabaseLoader
+from tests.unit.fake_supabase import FakeSupabaseClient
+
+# Set up logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+class RecordingClient(FakeSupabaseClient):
+    """Remembers how many rows each request returned"""
+
+    def __init__(self, tables):
+        super().__init__(tables)
+        self.rows_returned = []
+
+    def table(self, name):
+        query = super().table(name)
+        execute = query.execute
+
+        def recorded():
+            result = execute()
+            self.rows_returned.append(len(result.data or []))
+            return result
+
+        query.execute = recorded
+        return query
+
+
+def _make_loader(tables):
+    loader = SupabaseLoader.__new__(SupabaseLoader)
+    loader.client = RecordingClient(tables)
+    loader.table_documents = 'playbook_documents'
+    loader.table_chunks = 'playbook_chunks'
+    loader.table_semantic = 'playbook_semantic_terms'
+    loader.table_relations = 'playbook_semantic_relations'
+    return loader
+
+
+def _tables(with_views=True):
+    tables = {
+        'playbook_documents': [{'id': str(i)} for i in range(3)],
+        'playbook_chunks': [{'id': i, 'doc_id': '0'} for i in range(40)],
+        'playbook_semantic_terms': [{'id': i, 'doc_id': '0', 'term': f"t{i}"} for i in range(25)],
+        'playbook_semantic_relations': [{'id': i} for i in range(7)],
+        'playbook_category_stats': [
+            {'category': 'Mechanic', 'term_count': 5},
+            {'category': 'Obstacle', 'term_count': 20},
+        ],
+        'playbook_predicate_stats': [
+            {'predicate': 'blocks', 'relation_count': 2},
+            {'predicate': 'requires', 'relation_count': 5},
+        ],
+    }
+    if with_views:
+        tables['playbook_table_stats'] = [{
+            'total_documents': 3, 'total_chunks': 40, 'total_semantic_terms': 25,
+            'unique_terms': 25, 'total_relations': 7, 'total_ontology_rules': 60,
+            'documents_without_chunks': 2, 'documents_without_terms': 2,
+            'chunks_without_embedding': 0, 'orphan_terms': 18, 'same_doc_duplicate_terms': 0,
+        }]
+    return tables
+
+
+def test_get_stats_uses_head_counts():
+    """One HEAD request per table, no rows transferred"""
+    loader = _make_loader(_tables())
+
+    stats = loader.get_stats()
+
+    assert stats == {
+        'total_documents': 3,
+        'total_chunks': 40,
+        'total_semantic_terms': 25,
+        'total_relations': 7,
+    }
+    assert len(loader.client.calls) == 4
+    assert loader.client.rows_returned == [0, 0, 0, 0]
+
+
+def test_detailed_stats_reads_views():
+    """Counts, orphans and histograms come from three view requests"""
+    loader = _make_loader(_tables())
+
+    stats = loader.get_detailed_stats()
+
+    assert loader.client.calls == [
+        'playbook_table_stats', 'playbook_category_stats', 'playbook_predicate_stats'
+    ]
+    assert stats['counts']['total_chunks'] == 40
+    assert stats['counts']['total_ontology_rules'] == 60
+    assert stats['orphans']['orphan_terms'] == 18
+    assert [row['category'] for row in stats['categories']] == ['Obstacle', 'Mechanic']
+    assert [row['predicate'] for row in stats['predicates']] == ['requires', 'blocks']
+
+
+def test_detailed_stats_without_views():
+    """Missing table stats view falls back to HEAD counts"""
+    loader = _make_loader(_tables(with_views=False))
+
+    stats = loader.get_detailed_stats()
+
+    assert stats['counts']['total_relations'] == 7
+    assert stats['orphans'] == {}
+    assert len(stats['categories']) == 2
+
+
+def main():
+    """Run all tests"""
+    tests = [
+        test_get_stats_uses_head_counts,
+        test_detailed_stats_reads_views,
+        test_detailed_stats_without_views,
+    ]
+
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            logger.info(f"✅ PASS: {test.__name__}")
+        except AssertionError as e:
+            failed += 1
+            logger.error(f"❌ FAIL: {test.__name__}: {e}")
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Unit tests for streaming Confluence storage-format text extraction
+"""
+import sys
+import logging
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.core.processors.confluence_processor import ConfluenceProcessor
+from src.core.processors.semantic_processor import ImprovedChunker
+from src.core.processors.storage_text import storage_to_text
+
+# Set up logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+FIXTURE_DIR = project_root / "tests" / "fixtures" / "confluence"
+
+
+def _fixture(name):
+    return (FIXTURE_DIR / name).read_text(encoding='utf-8')
+
+
+def test_headings_become_sections():
+    """Headings are Markdown markers, so the chunker finds every section (and keeps the intro)"""
+    text = storage_to_text(_fixture("obstacle_spec.html"))
+
+    assert "# 장애물 사양: 클로버" in text.split('\n')
+    assert "## 동작 규칙" in text.split('\n')
+
+    sections = ImprovedChunker().extract_sections(text)
+    headers = [header for header, _, _ in sections]
+    assert headers == ["", "장애물 사양: 클로버", "동작 규칙", "상호작용", "구현 참고", "체크리스트"]
+    assert "최종 수정 2026-09-28" in sections[0][1]
+
+
+def test_tables_lists_and_macros_are_compact():
+    """Rows are one line each; lists, tasks, status, code and titled macros render as text"""
+    lines = storage_to_text(_fixture("obstacle_spec.html")).split('\n')
+
+    assert "대상 | 결과 | 비고" in lines
+    assert "폭탄 | 1단계 제거 | 범위 3x3" in lines
+    assert "2. 특수 블록 효과 범위 내: 1단계 제거" in lines
+    assert "  - 레인보우 조합은 전체 제거" in lines
+    assert "- [x] 아트 리소스 전달" in lines
+    assert "- [ ] 사운드 연결" in lines
+    # Code keeps its line breaks and indentation
+    assert "    obstacle.Hp -= 1;" in lines
+    # Macro titles kept, macro parameters (language, colour) and images dropped
+    assert "주의" in lines and "기획 배경" in lines
+    assert not any(line in ("csharp", "clover.png") for line in lines)
+
+    table = storage_to_text(_fixture("level_balance_table.html")).split('\n')
+    rows = [line for line in table if ' | ' in line][1:]
+    assert len(rows) == 120
+    assert all(line.count(' | ') == 5 and '[' in line for line in rows)
+    assert "수치는 레벨 디자인 가이드의 기준을 따른다." in table[1]
+
+
+def test_inline_markup_and_entities():
+    """Inline tags do not break lines; entities and CDATA are decoded; skipped macros vanish"""
+    html = (
+        '<ac:structured-macro ac:name="toc"><ac:parameter ac:name="maxLevel">2</ac:parameter></ac:structured-macro>'
+        '<p>a&nbsp;&amp;&nbsp;<strong>b</strong>c<br/>d</p>'
+        '<p>상태 <ac:structured-macro ac:name="status"><ac:parameter ac:name="title">DONE</ac:parameter>'
+        '</ac:structured-macro> 완료</p>'
+        '<ac:link><ri:page ri:content-title="Page"/><ac:plain-text-link-body><![CDATA[a < b]]>'
+        '</ac:plain-text-link-body></ac:link>'
+    )
+
+    assert storage_to_text(html) == "a & bc\nd\n상태 [DONE] 완료\na < b"
+    assert storage_to_text("") == ""
+
+
+def test_processor_uses_streaming_extractor_with_fallback():
+    """ConfluenceProcessor uses the streaming extractor when lxml is selected"""
+    processor = ConfluenceProcessor.__new__(ConfluenceProcessor)
+    html = "<h2>제목</h2><p>본문</p>"
+
+    processor.text_extractor = "lxml"
+    assert processor.extract_text_from_html(html) == "## 제목\n본문"
+
+    processor.text_extractor = "soup"
+    assert processor.extract_text_from_html(html) == "제목\n본문"
+
+
+def main():
+    """Run all tests"""
+    tests = [
+        test_headings_become_sections,
+        test_tables_lists_and_macros_are_compact,
+        test_inline_markup_and_entities,
+        test_processor_uses_streaming_extractor_with_fallback,
+    ]
+
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            logger.info(f"✅ PASS: {test.__name__}")
+        except AssertionError as e:
+            failed += 1
+            logger.error(f"❌ FAIL: {test.__name__}: {e}")
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the staged streaming pipeline (no external services)
+"""
+import sys
+import time
+import logging
+import tempfile
+import threading
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.main import Pipeline
+from src.shared.rate_limit import ServiceLimiter
+from src.shared.streaming import Stage, StreamingPipeline
+from src.shared.utils import CheckpointManager
+
+# Set up logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+def test_items_flow_through_all_stages():
+    """Every item passes every stage once; rejected/raising items are reported as failed"""
+    def parse(item):
+        if item['n'] == 3:
+            return False
+        item['trace'].append('parse')
+
+    def square(item):
+        if item['n'] == 5:
+            raise ValueError("boom")
+        item['trace'].append('square')
+        item['value'] = item['n'] ** 2
+
+    pipeline = StreamingPipeline(
+        [Stage('parse', parse, workers=2), Stage('square', square, workers=3)],
+        queue_size=2
+    )
+    results = list(pipeline.run({'n': n, 'trace': []} for n in range(10)))
+
+    assert len(results) == 10
+    ok = {r.item['n']: r.item for r in results if r.ok}
+    failed = {r.item['n']: r for r in results if not r.ok}
+
+    assert set(ok) == {0, 1, 2, 4, 6, 7, 8, 9}
+    assert all(item['trace'] == ['parse', 'square'] and item['value'] == item['n'] ** 2 for item in ok.values())
+    assert failed[3].failed_stage == 'parse' and failed[3].error is None
+    assert failed[5].failed_stage == 'square' and isinstance(failed[5].error, ValueError)
+
+    metrics = pipeline.get_metrics()
+    assert metrics['parse']['processed'] == 9 and metrics['parse']['failed'] == 1
+    assert metrics['square']['processed'] == 8 and metrics['square']['failed'] == 1
+    assert metrics['square']['max_latency'] >= 0.0
+
+
+def test_backpressure_bounds_queues():
+    """A slow downstream stage keeps upstream queues at or below queue_size"""
+    fetched = []
+    finished = []
+    lock = threading.Lock()
+
+    def fetch(item):
+        with lock:
+            fetched.append(item)
+
+    def slow(item):
+        time.sleep(0.01)
+        with lock:
+            finished.append(item)
+
+    pipeline = StreamingPipeline([Stage('fetch', fetch, workers=2), Stage('slow', slow)], queue_size=3)
+    results = pipeline.run(list(range(30)))
+
+    # Fetch can only run a bounded distance ahead of the slow stage
+    next(results)
+    for _ in range(5):
+        time.sleep(0.02)
+        with lock:
+            ahead = len(fetched) - len(finished)
+        # slow queue (3) + in slow (1) + fetch workers blocked on put (2)
+        assert ahead <= 3 + 1 + 2, ahead
+
+    assert len(list(results)) == 29
+    metrics = pipeline.get_metrics()
+    assert metrics['slow']['max_queue_depth'] <= 3
+    assert metrics['fetch']['max_queue_depth'] <= 3
+
+
+def test_stop_drops_unstarted_items():
+    """Stopping early ends all threads without processing the remaining items"""
+    processed = []
+    pipeline = StreamingPipeline([Stage('work', lambda item: processed.append(item))], queue_size=2)
+
+    for result in pipeline.run(iter(range(1000))):
+        break
+
+    assert len(processed) < 1000
+    assert pipeline._threads == []
+
+
+def _make_pipeline(checkpoint_file: str):
+    """Pipeline whose steps are replaced by in-memory fakes"""
+    pipeline = Pipeline.__new__(Pipeline)
+    pipeline.checkpoint = CheckpointManager(checkpoint_file)
+    pipeline.limiters = {
+        name: ServiceLimiter(name, max_concurrency=2) for name in ('confluence', 'openai', 'supabase')
+    }
+
+    def fetch(work):
+        if work['page_id'] == 'missing':
+            return False
+        work['page_data'] = {'page_id': work['page_id']}
+
+    def embed(work):
+        work['chunks'] = [{'doc_id': work['page_id']}] * 2
+
+    def extract(work):
+        if work['page_id'] == 'broken':
+            raise RuntimeError("LLM error")
+        work['semantic_terms'] = [{'term': work['page_id']}]
+
+    def load(work):
+        pipeline.checkpoint.add_chunks(len(work['chunks']))
+
+    pipeline._fetch_step = fetch
+    pipeline._load_document_step = lambda work: True
+    pipeline._embed_step = embed
+    pipeline._extract_step = extract
+    pipeline._load_results_step = load
+    return pipeline
+
+
+def test_streaming_run_updates_checkpoint():
+    """Streaming mode records successes/failures like serial mode"""
+    page_ids = [f"p{i}" for i in range(15)] + ['missing', 'broken']
+
+    with tempfile.TemporaryDirectory() as tmp:
+        pipeline = _make_pipeline(str(Path(tmp) / "checkpoint.json"))
+        counts = pipeline._run_streaming(page_ids)
+
+        assert counts == (15, 2)
+        data = pipeline.checkpoint.data
+        assert set(data['processed_page_ids']) == {f"p{i}" for i in range(15)}
+        assert set(data['failed_page_ids']) == {'missing', 'broken'}
+        assert data['total_chunks'] == 30
+
+
+def main():
+    """Run all tests"""
+    tests = [
+        test_items_flow_through_all_stages,
+        test_backpressure_bounds_queues,
+        test_stop_drops_unstarted_items,
+        test_streaming_run_updates_checkpoint,
+    ]
+
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            logger.info(f"✅ PASS: {test.__name__}")
+        except AssertionError as e:
+            failed += 1
+            logger.error(f"❌ FAIL: {test.__name__}: {e}")
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Unit tests for level-synchronous subgraph extraction (no database required)
+"""
+import sys
+import logging
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.core.traversal import SubgraphExtractor
+from src.shared.config import Config
+from tests.unit.fake_supabase import FakeSupabaseClient
+
+# Set up logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+TERMS = [
+    {'id': 't1', 'term': '4매치', 'category': 'mechanic', 'definition': ''},
+    {'id': 't2', 'term': '더블폭탄', 'category': 'gameobject', 'definition': ''},
+    {'id': 't3', 'term': '바위', 'category': 'gameobject', 'definition': ''},
+    {'id': 't4', 'term': '체리', 'category': 'resource', 'definition': ''},
+]
+
+RELATIONS = [
+    {'id': 'r1', 'source_term_id': 't1', 'target_term_id': 't2', 'predicate': 'triggers', 'confidence': 0.9, 'evidence': 'e1'},
+    {'id': 'r2', 'source_term_id': 't2', 'target_term_id': 't3', 'predicate': 'clears', 'confidence': 0.6, 'evidence': 'e2'},
+    {'id': 'r3', 'source_term_id': 't4', 'target_term_id': 't2', 'predicate': 'requires', 'confidence': 0.8, 'evidence': 'e3'},
+]
+
+
+def test_extract_subgraph_batched():
+    """Whole levels are fetched at once and the traversal log is preserved"""
+    client = FakeSupabaseClient({Config.TABLE_SEMANTIC: TERMS, Config.TABLE_RELATIONS: RELATIONS})
+    extractor = SubgraphExtractor(client)
+    extractor._get_term_id = {t['term']: t['id'] for t in TERMS}.get
+
+    subgraph = extractor.extract_subgraph('4매치', radius=2)
+
+    assert sorted(n['id'] for n in subgraph['nodes']) == ['t1', 't2', 't3', 't4']
+    # Edges come out in BFS order; back edges are reported again from each side
+    assert [(e['source'], e['target']) for e in subgraph['edges']] == [
+        ('t1', 't2'),            # hop 0: 4매치
+        ('t2', 't3'),            # hop 1: 더블폭탄 (outgoing)
+        ('t1', 't2'),            # hop 1: 더블폭탄 (incoming)
+        ('t4', 't2'),
+        ('t2', 't3'),            # hop 2: 바위
+        ('t4', 't2'),            # hop 2: 체리
+    ]
+    assert subgraph['traversal_log'][0] == "🎯 시작: 4매치 (중심 노드)"
+    assert "📍 Hop 1: 더블폭탄 방문" in subgraph['traversal_log']
+    assert "  ✅ 체리 → [requires] → 더블폭탄 (conf=0.80)" in subgraph['traversal_log']
+    assert any('radius 제한 도달' in line for line in subgraph['traversal_log'])
+
+    # center row + out/in/neighbors per level, independent of frontier width
+    assert len(client.calls) <= 1 + 3 * 3
+
+
+def test_select_in_keyset_pages():
+    """Rows past the first page are all returned, highest confidence first"""
+    relations = [
+        {'id': f'r{i:02d}', 'source_term_id': 't1', 'target_term_id': f'x{i}', 'predicate': 'triggers',
+         'confidence': 0.5 + (i % 5) / 10, 'evidence': ''}
+        for i in range(25)
+    ]
+    client = FakeSupabaseClient({Config.TABLE_RELATIONS: relations})
+    extractor = SubgraphExtractor(client)
+
+    rows = extractor._select_in(
+        Config.TABLE_RELATIONS, "target_term_id, confidence", "source_term_id", ['t1', 't2'],
+        min_confidence=0.6, page_size=4
+    )
+
+    expected = sorted((r for r in relations if r['confidence'] >= 0.6), key=lambda r: (-r['confidence'], r['id']))
+    assert [r['target_term_id'] for r in rows] == [r['target_term_id'] for r in expected]
+    assert 'id' not in rows[0]
+    # 20 matching rows: five full pages and the empty one that ends the scan
+    assert len(client.calls) == 6
+
+
+def main():
+    """Run all tests"""
+    tests = [
+        ("Batched subgraph extraction", test_extract_subgraph_batched),
+        ("Keyset-paged in_() selects", test_select_in_keyset_pages),
+    ]
+
+    passed = 0
+    for test_name, test_func in tests:
+        try:
+            test_func()
+            logger.info(f"  ✅ PASS: {test_name}")
+            passed += 1
+        except AssertionError as e:
+            logger.error(f"  ❌ FAIL: {test_name}: {e}")
+
+    logger.info(f"Result: {passed}/{len(tests)} tests passed")
+    sys.exit(0 if passed == len(tests) else 1)
+
+
+if __name__ == "__main__":
+    main()
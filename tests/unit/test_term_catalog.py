@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the shared chat term/rule catalog (no database required)
+"""
+import sys
+import logging
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.entities.term import TermCatalog
+from tests.unit.fake_supabase import FakeSupabaseClient
+
+# Set up logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+def _make_client():
+    terms = [
+        {'id': f't{i}', 'term': f'용어{i}', 'category': 'mechanic', 'definition': '',
+         'created_at': f'2025-01-01T00:00:0{i}'}
+        for i in range(5)
+    ]
+    rules = [
+        {'id': 'r1', 'subject_type': 'mechanic', 'predicate': 'triggers',
+         'object_type': 'gameobject', 'description': '', 'created_at': '2025-01-01T00:00:00'},
+    ]
+    return FakeSupabaseClient({
+        TermCatalog.TABLE_TERMS: terms,
+        TermCatalog.TABLE_RULES: rules,
+    })
+
+
+def test_catalog_pages_through_all_rows():
+    """Rows beyond one page are loaded, in creation order"""
+    catalog = TermCatalog(_make_client(), refresh_interval=0, page_size=2).load()
+
+    assert [t['term'] for t in catalog.terms] == ['용어0', '용어1', '용어2', '용어3', '용어4']
+    assert catalog.rules[0]['predicate'] == 'triggers'
+    assert set(catalog.terms[0]) == {'id', 'term', 'category', 'definition'}
+    assert catalog.snapshot.ontology.find_rule('mechanic', 'triggers', 'gameobject') is catalog.rules[0]
+
+
+def test_catalog_refreshes_only_on_change():
+    """Unchanged tables are not reloaded; new rows are"""
+    client = _make_client()
+    catalog = TermCatalog(client, refresh_interval=0, page_size=2).load()
+
+    assert catalog.refresh_if_changed() is False
+
+    client.tables[TermCatalog.TABLE_TERMS].append(
+        {'id': 't9', 'term': '더블폭탄', 'category': 'gameobject', 'definition': '',
+         'created_at': '2025-01-02T00:00:00'}
+    )
+    old_snapshot = catalog.snapshot
+    assert catalog.refresh_if_changed() is True
+    assert catalog.terms[-1]['term'] == '더블폭탄'
+    # Readers holding the previous snapshot are unaffected
+    assert len(old_snapshot.terms) == 5
+
+
+def main():
+    """Run all tests"""
+    tests = [
+        ("Catalog pagination", test_catalog_pages_through_all_rows),
+        ("Catalog change detection", test_catalog_refreshes_only_on_change),
+    ]
+
+    passed = 0
+    for test_name, test_func in tests:
+        try:
+            test_func()
+            logger.info(f"  ✅ PASS: {test_name}")
+            passed += 1
+        except AssertionError as e:
+            logger.error(f"  ❌ FAIL: {test_name}: {e}")
+
+    logger.info(f"Result: {passed}/{len(tests)} tests passed")
+    sys.exit(0 if passed == len(tests) else 1)
+
+
+if __name__ == "__main__":
+    main()
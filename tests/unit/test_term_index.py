@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the term name resolution index (no database required)
+"""
+import sys
+import logging
+import threading
+import time
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.core.traversal import SubgraphExtractor, TermIndex
+from src.shared.config import Config
+from tests.unit.fake_supabase import FakeSupabaseClient
+
+# Set up logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+def _make_client():
+    """Two '더블폭탄' instances from different documents; the second one has more relations"""
+    terms = [
+        {'id': 'a', 'term': '더블폭탄', 'created_at': '2025-01-01T00:00:00'},
+        {'id': 'b', 'term': '더블폭탄', 'created_at': '2025-01-01T00:00:01'},
+        {'id': 'c', 'term': '바위', 'created_at': '2025-01-01T00:00:02'},
+        {'id': 'd', 'term': 'Booster', 'created_at': '2025-01-01T00:00:03'},
+    ]
+    relations = [
+        {'id': 'r1', 'source_term_id': 'b', 'target_term_id': 'c', 'created_at': '2025-01-01T00:00:04'},
+        {'id': 'r2', 'source_term_id': 'c', 'target_term_id': 'b', 'created_at': '2025-01-01T00:00:05'},
+    ]
+    return FakeSupabaseClient({Config.TABLE_SEMANTIC: terms, Config.TABLE_RELATIONS: relations})
+
+
+def test_resolve_prefers_highest_degree():
+    """Duplicate names resolve to the instance with the most relations"""
+    index = TermIndex(_make_client(), refresh_interval=0).load()
+
+    assert index.get_term_ids('더블폭탄') == ['b', 'a']
+    assert index.resolve('더블폭탄') == 'b'
+    assert index.resolve(' booster ') == 'd'
+    assert index.resolve('없는용어') is None
+    assert index.degree('b') == 2
+
+
+def test_incremental_refresh():
+    """New rows are folded in; deletions trigger a full rebuild"""
+    client = _make_client()
+    index = TermIndex(client, refresh_interval=0).load()
+
+    client.tables[Config.TABLE_RELATIONS].extend([
+        {'id': 'r3', 'source_term_id': 'a', 'target_term_id': 'c', 'created_at': '2025-01-02T00:00:00'},
+        {'id': 'r4', 'source_term_id': 'a', 'target_term_id': 'c', 'created_at': '2025-01-02T00:00:01'},
+        {'id': 'r5', 'source_term_id': 'c', 'target_term_id': 'a', 'created_at': '2025-01-02T00:00:02'},
+    ])
+    index.refresh()
+    assert index.resolve('더블폭탄') == 'a'
+    assert index.degree('c') == 5
+
+    del client.tables[Config.TABLE_SEMANTIC][0]
+    index.refresh()
+    assert index.get_term_ids('더블폭탄') == ['b']
+
+
+def test_lookup_does_not_wait_for_refresh():
+    """An overdue refresh runs in the background; lookups keep the current index"""
+    client = _make_client()
+    index = TermIndex(client, refresh_interval=60).load()
+    client.tables[Config.TABLE_RELATIONS].extend([
+        {'id': 'r3', 'source_term_id': 'a', 'target_term_id': 'c', 'created_at': '2025-01-02T00:00:00'},
+        {'id': 'r4', 'source_term_id': 'a', 'target_term_id': 'c', 'created_at': '2025-01-02T00:00:01'},
+        {'id': 'r5', 'source_term_id': 'c', 'target_term_id': 'a', 'created_at': '2025-01-02T00:00:02'},
+    ])
+
+    release = threading.Event()
+    original_refresh = index.refresh
+    index.refresh = lambda: (release.wait(5), original_refresh())
+    index.loaded_at -= 120
+
+    # The lookup that crosses the interval starts the refresh and answers immediately
+    assert index.resolve('더블폭탄') == 'b'
+    # Later callers neither wait nor start a second refresh
+    assert index.maybe_refresh() is False
+    assert index.resolve('더블폭탄') == 'b'
+
+    release.set()
+    for _ in range(100):
+        if not index._refresh_guard.locked():
+            break
+        time.sleep(0.01)
+    assert index.resolve('더블폭탄') == 'a'
+
+
+def test_extractor_uses_index():
+    """Center node lookup is a dictionary hit without term/relation queries"""
+    client = _make_client()
+    index = TermIndex(client, refresh_interval=0).load()
+    extractor = SubgraphExtractor(client, term_index=index)
+
+    client.calls.clear()
+    assert extractor._get_term_id('더블폭탄') == 'b'
+    assert client.calls == []
+
+
+def main():
+    """Run all tests"""
+    tests = [
+        ("Resolve by degree", test_resolve_prefers_highest_degree),
+        ("Incremental refresh", test_incremental_refresh),
+        ("Lookup does not wait for refresh", test_lookup_does_not_wait_for_refresh),
+        ("Extractor uses index", test_extractor_uses_index),
+    ]
+
+    passed = 0
+    for test_name, test_func in tests:
+        try:
+            test_func()
+            logger.info(f"  ✅ PASS: {test_name}")
+            passed += 1
+        except AssertionError as e:
+            logger.error(f"  ❌ FAIL: {test_name}: {e}")
+
+    logger.info(f"Result: {passed}/{len(tests)} tests passed")
+    sys.exit(0 if passed == len(tests) else 1)
+
+
+if __name__ == "__main__":
+    main()
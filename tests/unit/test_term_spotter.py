@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Unit tests for Aho-Corasick term spotting
+"""
+import sys
+import random
+import logging
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.shared.term_spotter import AhoCorasick, TermSpotter
+
+# Set up logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+def test_automaton_finds_overlapping_matches():
+    """All occurrences are reported, including overlapping and nested ones"""
+    automaton = AhoCorasick(["he", "she", "his", "hers"])
+    matches = sorted(
+        (start, automaton.patterns[pid]) for start, pid in automaton.iter_matches("ushers")
+    )
+    assert matches == [(1, 'she'), (2, 'he'), (2, 'hers')]
+
+
+def test_spotter_matches_find_and_count():
+    """Positions and counts agree with str.find / str.count on lower-cased text"""
+    rng = random.Random(3)
+    alphabet = "폭탄더블aAb "
+    terms = list({''.join(rng.choice(alphabet) for _ in range(rng.randint(1, 3))).strip() or 'a'
+                  for _ in range(30)})
+    spotter = TermSpotter(terms)
+
+    for _ in range(200):
+        text = ''.join(rng.choice(alphabet) for _ in range(rng.randint(0, 40)))
+        hits = spotter.spot(text)
+        lowered = text.lower()
+        for term in spotter.terms:
+            if term in lowered:
+                assert hits[term].first_position == lowered.find(term), (term, text)
+                assert hits[term].count == lowered.count(term), (term, text)
+            else:
+                assert term not in hits
+
+
+def test_spotter_synonyms():
+    """Synonym occurrences are reported under the canonical term"""
+    spotter = TermSpotter(["클로버", "체리"], synonyms={"클로버": ["Heart", "하트"]})
+
+    hits = spotter.spot("하트랑 heart, 그리고 체리")
+    assert hits["클로버"].positions == [0, 4]
+    assert hits["체리"].count == 1
+
+    assert "클로버" not in spotter.spot("하트", include_synonyms=False)
+    assert list(spotter.spot("하트와 체리", include_terms=False)) == ["클로버"]
+
+
+def main():
+    """Run all tests"""
+    tests = [
+        ("Automaton overlapping matches", test_automaton_finds_overlapping_matches),
+        ("Spotter matches find/count", test_spotter_matches_find_and_count),
+        ("Spotter synonyms", test_spotter_synonyms),
+    ]
+
+    passed = 0
+    for test_name, test_func in tests:
+        try:
+            test_func()
+            logger.info(f"  ✅ PASS: {test_name}")
+            passed += 1
+        except AssertionError as e:
+            logger.error(f"  ❌ FAIL: {test_name}: {e}")
+
+    logger.info(f"Result: {passed}/{len(tests)} tests passed")
+    sys.exit(0 if passed == len(tests) else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Unit tests for compact embedding serialization
+"""
+import sys
+import json
+import random
+import struct
+import logging
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.core.loaders import encode_vector, decode_vector, embedding_payload
+from src.core.loaders.supabase_loader import SupabaseLoader
+from tests.unit.fake_supabase import FakeSupabaseClient
+
+# Set up logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+def _vector(dims=1536, seed=0):
+    rng = random.Random(seed)
+    return [rng.gauss(0, 0.03) for _ in range(dims)]
+
+
+def _as_storage(values, code):
+    """Values as the column stores them (float32 'f' / float16 'e')"""
+    fmt = f'{len(values)}{code}'
+    return list(struct.unpack(fmt, struct.pack(fmt, *values)))
+
+
+def test_text_form_matches_pgvector_syntax():
+    """Brackets, comma separated, no spaces"""
+    text = encode_vector([0.5, -0.25, 1e-05, 0.123456789])
+    assert text == "[0.5,-0.25,9.99999975e-06,0.123456791]"
+    assert decode_vector(text) == [0.5, -0.25, 9.99999975e-06, 0.123456791]
+    assert decode_vector("[]") == []
+
+
+def test_text_form_round_trips_column_type():
+    """The column stores exactly what it would store from the full JSON float"""
+    vector = _vector()
+
+    decoded = decode_vector(embedding_payload(vector, "text"))
+    assert len(decoded) == 1536
+    assert _as_storage(decoded, 'f') == _as_storage(vector, 'f')
+
+    decoded = decode_vector(embedding_payload(vector, "text", half_precision=True))
+    assert _as_storage(decoded, 'e') == _as_storage(vector, 'e')
+
+
+def test_payload_is_smaller_than_json_floats():
+    """Text form cuts the vector payload by over a third; half precision shrinks it further"""
+    vector = _vector()
+    as_json = len(json.dumps(embedding_payload(vector, "json")))
+    as_text = len(json.dumps(embedding_payload(vector, "text")))
+    as_half = len(json.dumps(embedding_payload(vector, "text", half_precision=True)))
+
+    assert as_text < as_json * 0.65
+    assert as_half < as_text
+    assert embedding_payload(vector, "json") == vector
+
+
+def test_loader_sends_text_embeddings():
+    """load_chunks writes the configured embedding encoding"""
+    loader = SupabaseLoader.__new__(SupabaseLoader)
+    loader.client = FakeSupabaseClient({'playbook_chunks': []})
+    loader.table_chunks = 'playbook_chunks'
+    loader.chunk_batch_bytes = 2_000_000
+    loader.embedding_format = "text"
+    loader.embedding_half_precision = False
+
+    chunk = {'doc_id': '1', 'chunk_index': 0, 'content': "본문", 'metadata': {}, 'embedding': [0.25, -0.5]}
+    assert loader.load_chunks([chunk]) == 1
+    assert loader.client.tables['playbook_chunks'][0]['embedding'] == "[0.25,-0.5]"
+
+    loader.embedding_format = "json"
+    loader.load_chunks([chunk])
+    assert loader.client.tables['playbook_chunks'][0]['embedding'] == [0.25, -0.5]
+
+
+def main():
+    """Run all tests"""
+    tests = [
+        test_text_form_matches_pgvector_syntax,
+        test_text_form_round_trips_column_type,
+        test_payload_is_smaller_than_json_floats,
+        test_loader_sends_text_embeddings,
+    ]
+
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            logger.info(f"✅ PASS: {test.__name__}")
+        except AssertionError as e:
+            failed += 1
+            logger.error(f"❌ FAIL: {test.__name__}: {e}")
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()